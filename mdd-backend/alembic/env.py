@@ -0,0 +1,61 @@
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy import engine_from_config, pool
+from app.config import get_settings
+from app.database import Base
+import app.models  # noqa: F401  (모든 모델을 metadata 에 등록)
+
+config = context.config
+
+# 샤드별 마이그레이션: alembic -x shard=1 upgrade head (기본: 샤드 0 = DATABASE_URL)
+# 코드에서 실행할 때는 config.attributes["connection"] 으로 연결을 넘길 수 있다 (테스트)
+settings = get_settings()
+shard = int(context.get_x_argument(as_dictionary=True).get("shard", 0))
+config.set_main_option("sqlalchemy.url", ([settings.DATABASE_URL] + settings.SHARD_DATABASE_URLS)[shard])
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline() -> None:
+    """오프라인 모드 (SQL 스크립트 출력)"""
+    context.configure(
+        url=config.get_main_option("sqlalchemy.url"),
+        target_metadata=target_metadata,
+        literal_binds=True,
+        dialect_opts={"paramstyle": "named"},
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """온라인 모드 (DB에 직접 적용)"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
+    connectable = engine_from_config(
+        config.get_section(config.config_ini_section, {}),
+        prefix="sqlalchemy.",
+        poolclass=pool.NullPool,
+    )
+
+    with connectable.connect() as connection:
+        context.configure(connection=connection, target_metadata=target_metadata)
+
+        with context.begin_transaction():
+            context.run_migrations()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
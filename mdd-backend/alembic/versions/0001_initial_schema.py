@@ -0,0 +1,73 @@
+"""initial schema
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-19 00:00:00
+
+create_all 로 만들어진 기존 DB 는 `alembic stamp 0001` 후 upgrade 한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False),
+        sa.Column("username", sa.String(100), nullable=False),
+        sa.Column("password_hash", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+
+    op.create_table(
+        "entries",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("date", sa.Date, nullable=False),
+        sa.Column("title", sa.String(200)),
+        sa.Column("content", sa.Text),
+        sa.Column("mood", sa.String(50)),
+        sa.Column("photos", sa.JSON),
+        sa.Column("tags", sa.JSON),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_entries_date", "entries", ["date"])
+
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("entry_id", sa.Uuid(), sa.ForeignKey("entries.id", ondelete="CASCADE")),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("date", sa.Date, nullable=False),
+        sa.Column("type", sa.Enum("INCOME", "EXPENSE", name="transactiontype"), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+        sa.Column("description", sa.String(500)),
+        sa.Column("payment_method", sa.String(50)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_transactions_date", "transactions", ["date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_transactions_date", table_name="transactions")
+    op.drop_table("transactions")
+    sa.Enum(name="transactiontype").drop(op.get_bind(), checkfirst=True)
+    op.drop_index("ix_entries_date", table_name="entries")
+    op.drop_table("entries")
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_table("users")
@@ -0,0 +1,102 @@
+"""partition transactions by date
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 00:00:00
+
+transactions 를 date 기준 RANGE 파티션 테이블로 재작성한다 (PostgreSQL 전용).
+파티션 키가 PK 에 포함되어야 하므로 PK 는 (id, date) 가 된다.
+
+기존 데이터의 첫 달부터 실행한 달의 3개월 뒤까지 월 파티션과 DEFAULT 파티션을 만든다.
+이후 기간은 app.commands.partitions 가 만든다 (런타임 설정 / 코드가 바뀌어도 이 마이그레이션은 그대로).
+"""
+from typing import Sequence, Union
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 마이그레이션 시점의 파티션 구성 (월 단위, 실행한 달 이후 3개월)
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, entry_id, user_id, date, type, category, amount, "
+    "description, payment_method, created_at, updated_at"
+)
+
+
+def _create_transactions_table(partitioned: bool) -> None:
+    op.create_table(
+        "transactions",
+        sa.Column("id", sa.Uuid(), nullable=False),
+        sa.Column("entry_id", sa.Uuid(), sa.ForeignKey("entries.id", ondelete="CASCADE")),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("date", sa.Date, nullable=False),
+        sa.Column("type", postgresql.ENUM(name="transactiontype", create_type=False), nullable=False),
+        sa.Column("category", sa.String(100), nullable=False),
+        sa.Column("amount", sa.Numeric(12, 2), nullable=False),
+        sa.Column("description", sa.String(500)),
+        sa.Column("payment_method", sa.String(50)),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.PrimaryKeyConstraint(*(("id", "date") if partitioned else ("id",)), name="transactions_pkey"),
+        **({"postgresql_partition_by": "RANGE (date)"} if partitioned else {}),
+    )
+    op.create_index("ix_transactions_date", "transactions", ["date"])
+
+
+def _month_partitions(first_day: date, last_day: date) -> list[tuple[str, date, date]]:
+    """first_day ~ last_day 를 덮는 월 파티션 (이름, 시작, 종료)"""
+    partitions = []
+    start = date(first_day.year, first_day.month, 1)
+    while start <= last_day:
+        end = date(start.year + start.month // 12, start.month % 12 + 1, 1)
+        partitions.append((f"transactions_p{start.year}_{start.month:02d}", start, end))
+        start = end
+    return partitions
+
+
+def _swap_table(partitioned: bool) -> None:
+    op.drop_index("ix_transactions_date", table_name="transactions")
+    op.execute("ALTER TABLE transactions RENAME TO transactions_old")
+    op.execute("ALTER TABLE transactions_old RENAME CONSTRAINT transactions_pkey TO transactions_old_pkey")
+    _create_transactions_table(partitioned)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    _swap_table(partitioned=True)
+
+    # 기존 데이터 범위 전체를 덮는 파티션 생성 후 복사
+    today = date.today()
+    first_day = bind.execute(sa.text("SELECT min(date) FROM transactions_old")).scalar()
+    last_day = date(today.year + (today.month - 1 + MONTHS_AHEAD) // 12, (today.month - 1 + MONTHS_AHEAD) % 12 + 1, 1)
+    op.execute("CREATE TABLE transactions_default PARTITION OF transactions DEFAULT")
+    for name, start, end in _month_partitions(min(first_day or today, today), last_day):
+        op.execute(
+            f"CREATE TABLE {name} PARTITION OF transactions "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_old")
+    op.execute("DROP TABLE transactions_old")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    _swap_table(partitioned=False)
+    op.execute(f"INSERT INTO transactions ({COLUMNS}) SELECT {COLUMNS} FROM transactions_old")
+    op.execute("DROP TABLE transactions_old CASCADE")
@@ -0,0 +1,47 @@
+"""user_id leading composite indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 00:00:00
+
+모든 조회가 user_id 로 필터링되므로 단일 date 인덱스를 user_id 선두 복합 인덱스로 교체한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_entries_user_date", "entries",
+        ["user_id", sa.text("date DESC"), "id"]
+    )
+    op.drop_index("ix_entries_date", table_name="entries")
+
+    op.create_index(
+        "ix_transactions_user_date", "transactions",
+        ["user_id", sa.text("date DESC"), "id"]
+    )
+    op.create_index("ix_transactions_user_type_date", "transactions", ["user_id", "type", "date"])
+    op.create_index("ix_transactions_user_category", "transactions", ["user_id", "category"])
+    op.create_index("ix_transactions_entry_id", "transactions", ["entry_id"])
+    op.drop_index("ix_transactions_date", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_transactions_date", "transactions", ["date"])
+    op.drop_index("ix_transactions_entry_id", table_name="transactions")
+    op.drop_index("ix_transactions_user_category", table_name="transactions")
+    op.drop_index("ix_transactions_user_type_date", table_name="transactions")
+    op.drop_index("ix_transactions_user_date", table_name="transactions")
+
+    op.create_index("ix_entries_date", "entries", ["date"])
+    op.drop_index("ix_entries_user_date", table_name="entries")
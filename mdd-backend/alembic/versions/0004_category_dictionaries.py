@@ -0,0 +1,87 @@
+"""dictionary-encode categories and payment methods
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 00:00:00
+
+transactions.category / payment_method 문자열을 사용자별 사전 테이블의 정수 id 로 교체한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _create_dictionary(table: str, length: int) -> None:
+    op.create_table(
+        table,
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(length), nullable=False),
+        sa.UniqueConstraint("user_id", "name", name=f"uq_{table}_user_name"),
+    )
+
+
+def upgrade() -> None:
+    _create_dictionary("categories", 100)
+    _create_dictionary("payment_methods", 50)
+
+    op.execute(
+        "INSERT INTO categories (user_id, name) "
+        "SELECT DISTINCT user_id, category FROM transactions"
+    )
+    op.execute(
+        "INSERT INTO payment_methods (user_id, name) "
+        "SELECT DISTINCT user_id, payment_method FROM transactions WHERE payment_method IS NOT NULL"
+    )
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("category_id", sa.Integer, sa.ForeignKey("categories.id", name="fk_transactions_category_id")))
+        batch.add_column(sa.Column("payment_method_id", sa.Integer, sa.ForeignKey("payment_methods.id", name="fk_transactions_payment_method_id")))
+
+    op.execute(
+        "UPDATE transactions SET category_id = ("
+        "SELECT c.id FROM categories c "
+        "WHERE c.user_id = transactions.user_id AND c.name = transactions.category)"
+    )
+    op.execute(
+        "UPDATE transactions SET payment_method_id = ("
+        "SELECT p.id FROM payment_methods p "
+        "WHERE p.user_id = transactions.user_id AND p.name = transactions.payment_method)"
+    )
+
+    op.drop_index("ix_transactions_user_category", table_name="transactions")
+    with op.batch_alter_table("transactions") as batch:
+        batch.alter_column("category_id", nullable=False)
+        batch.drop_column("category")
+        batch.drop_column("payment_method")
+    op.create_index("ix_transactions_user_category", "transactions", ["user_id", "category_id"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("category", sa.String(100)))
+        batch.add_column(sa.Column("payment_method", sa.String(50)))
+
+    op.execute(
+        "UPDATE transactions SET "
+        "category = (SELECT c.name FROM categories c WHERE c.id = transactions.category_id), "
+        "payment_method = (SELECT p.name FROM payment_methods p WHERE p.id = transactions.payment_method_id)"
+    )
+
+    op.drop_index("ix_transactions_user_category", table_name="transactions")
+    with op.batch_alter_table("transactions") as batch:
+        batch.alter_column("category", nullable=False)
+        batch.drop_column("category_id")
+        batch.drop_column("payment_method_id")
+    op.create_index("ix_transactions_user_category", "transactions", ["user_id", "category"])
+
+    op.drop_table("payment_methods")
+    op.drop_table("categories")
@@ -0,0 +1,46 @@
+"""store transaction amounts as integer minor units
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 00:00:00
+
+transactions.amount (Numeric(12, 2)) 를 amount_minor (BIGINT, 금액 * 10^CURRENCY_EXPONENT) 로 교체한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from app.config import get_settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    scale = 10 ** get_settings().CURRENCY_EXPONENT
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("amount_minor", sa.BigInteger))
+
+    op.execute(f"UPDATE transactions SET amount_minor = CAST(ROUND(amount * {scale}) AS BIGINT)")
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.alter_column("amount_minor", nullable=False)
+        batch.drop_column("amount")
+
+
+def downgrade() -> None:
+    scale = 10 ** get_settings().CURRENCY_EXPONENT
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column("amount", sa.Numeric(12, 2)))
+
+    op.execute(f"UPDATE transactions SET amount = CAST(amount_minor AS NUMERIC(14, 2)) / {scale}.0")
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.alter_column("amount", nullable=False)
+        batch.drop_column("amount_minor")
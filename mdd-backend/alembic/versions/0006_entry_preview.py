@@ -0,0 +1,31 @@
+"""add entries.preview
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19 00:00:00
+
+목록 응답에서 content 본문 대신 사용할 미리보기 컬럼을 추가한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREVIEW_LENGTH = 200
+
+
+def upgrade() -> None:
+    op.add_column("entries", sa.Column("preview", sa.String(PREVIEW_LENGTH)))
+    op.execute(f"UPDATE entries SET preview = substr(content, 1, {PREVIEW_LENGTH}) WHERE content IS NOT NULL")
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("entries") as batch:
+        batch.drop_column("preview")
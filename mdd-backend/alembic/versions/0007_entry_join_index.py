@@ -0,0 +1,33 @@
+"""covering index for entry-transaction joins
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19 00:00:00
+
+기분별 지출 집계의 entries -> transactions 조인이 인덱스만으로 처리되도록
+entry_id 단일 인덱스를 (entry_id, type) INCLUDE (category_id, amount_minor) 로 교체한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_transactions_entry_type", "transactions", ["entry_id", "type"],
+        postgresql_include=["category_id", "amount_minor"]
+    )
+    op.drop_index("ix_transactions_entry_id", table_name="transactions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_transactions_entry_id", "transactions", ["entry_id"])
+    op.drop_index("ix_transactions_entry_type", table_name="transactions")
@@ -0,0 +1,65 @@
+"""add recurring_rules and transactions.recurring_rule_id
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-19 00:00:00
+
+반복 거래 규칙과, 규칙으로 만든 거래의 (규칙, 날짜) 중복 방지 unique 인덱스.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FREQUENCY = sa.Enum("DAILY", "WEEKLY", "MONTHLY", "YEARLY", "CUSTOM", name="recurrencefrequency")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "recurring_rules",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("type", postgresql.ENUM("INCOME", "EXPENSE", name="transactiontype", create_type=False), nullable=False),
+        sa.Column("category_id", sa.Integer, sa.ForeignKey("categories.id"), nullable=False),
+        sa.Column("amount_minor", sa.BigInteger, nullable=False),
+        sa.Column("description", sa.String(500)),
+        sa.Column("payment_method_id", sa.Integer, sa.ForeignKey("payment_methods.id")),
+        sa.Column("frequency", FREQUENCY, nullable=False),
+        sa.Column("interval", sa.Integer, nullable=False),
+        sa.Column("start_date", sa.Date, nullable=False),
+        sa.Column("end_date", sa.Date),
+        sa.Column("next_index", sa.Integer, nullable=False),
+        sa.Column("next_date", sa.Date),
+        sa.Column("active", sa.Boolean, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+    )
+    op.create_index("ix_recurring_rules_due", "recurring_rules", ["active", "next_date"])
+    op.create_index("ix_recurring_rules_user", "recurring_rules", ["user_id"])
+
+    with op.batch_alter_table("transactions") as batch:
+        batch.add_column(sa.Column(
+            "recurring_rule_id",
+            sa.Uuid(),
+            sa.ForeignKey("recurring_rules.id", ondelete="SET NULL", name="fk_transactions_recurring_rule_id")
+        ))
+    op.create_index("uq_transactions_recurring_occurrence", "transactions", ["recurring_rule_id", "date"], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index("uq_transactions_recurring_occurrence", table_name="transactions")
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_column("recurring_rule_id")
+
+    op.drop_index("ix_recurring_rules_user", table_name="recurring_rules")
+    op.drop_index("ix_recurring_rules_due", table_name="recurring_rules")
+    op.drop_table("recurring_rules")
+    FREQUENCY.drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,58 @@
+"""add budgets and category_monthly_spend tables
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-19 00:00:00
+
+카테고리별 월 예산과, 예산 사용량을 거래 쓰기 시점에 증감하는 월별 지출 카운터.
+기존 거래로 카운터를 채워 둔다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "budgets",
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("category_id", sa.Integer, sa.ForeignKey("categories.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("amount_minor", sa.BigInteger, nullable=False),
+        sa.Column("warning_percent", sa.Integer, nullable=False, server_default="80"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.UniqueConstraint("user_id", "category_id", name="uq_budgets_user_category"),
+    )
+    
+    op.create_table(
+        "category_monthly_spend",
+        sa.Column("user_id", sa.Uuid(), sa.ForeignKey("users.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("category_id", sa.Integer, sa.ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("month", sa.Date, primary_key=True),
+        sa.Column("spent_minor", sa.BigInteger, nullable=False, server_default="0"),
+    )
+    
+    if op.get_bind().dialect.name == "postgresql":
+        month = "CAST(date_trunc('month', date) AS date)"
+    else:
+        month = "strftime('%Y-%m-01', date)"
+    op.execute(
+        "INSERT INTO category_monthly_spend (user_id, category_id, month, spent_minor) "
+        f"SELECT user_id, category_id, {month}, SUM(amount_minor) FROM transactions "
+        "WHERE type = 'EXPENSE' "
+        f"GROUP BY user_id, category_id, {month}"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("category_monthly_spend")
+    op.drop_table("budgets")
@@ -0,0 +1,41 @@
+"""add user_directory table
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-19 00:00:00
+
+사용자 샤딩용 디렉터리 (user_id / 이메일 -> 샤드). 샤드 0 (DATABASE_URL) 에서만 사용하며,
+기존 사용자는 모두 샤드 0 으로 등록한다. 새로 추가하는 샤드는 비어 있으므로 등록되는 행이 없다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014"
+down_revision: Union[str, None] = "0013"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_directory",
+        sa.Column("user_id", sa.Uuid(), primary_key=True),
+        sa.Column("email", sa.String(255), nullable=False, unique=True),
+        sa.Column("shard", sa.Integer, nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.create_index("ix_user_directory_shard", "user_directory", ["shard"])
+
+    op.execute(
+        "INSERT INTO user_directory (user_id, email, shard) "
+        "SELECT id, email, 0 FROM users"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_user_directory_shard", table_name="user_directory")
+    op.drop_table("user_directory")
@@ -0,0 +1,32 @@
+"""add entries.version / transactions.version
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-19 00:00:00
+
+수정할 때마다 증가하는 행 버전. 상세 조회 ETag 에 사용한다 (updated_at 은 SQLite 에서 초 단위,
+PostgreSQL 에서 트랜잭션 시작 시각이라 같은 초에 두 번 수정하면 구분되지 않음).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0015"
+down_revision: Union[str, None] = "0014"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("entries", sa.Column("version", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column("transactions", sa.Column("version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("transactions") as batch:
+        batch.drop_column("version")
+    with op.batch_alter_table("entries") as batch:
+        batch.drop_column("version")
@@ -0,0 +1,33 @@
+"""restore date DESC in ix_transactions_user_date (SQLite)
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-19 00:00:00
+
+SQLite 는 열 변경 마이그레이션(0004, 0005)에서 transactions 를 batch 모드로 다시 만들며 인덱스를 리플렉션해
+다시 만드는데, 이때 date DESC 정렬이 빠져 (user_id, date, id) 가 된다. 목록 정렬(date DESC, id)을 인덱스로
+처리하지 못하고 임시 B-tree 로 정렬하게 되므로 원래 정의로 다시 만든다. PostgreSQL 은 해당 없음.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0016"
+down_revision: Union[str, None] = "0015"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    op.drop_index("ix_transactions_user_date", table_name="transactions")
+    op.create_index("ix_transactions_user_date", "transactions", ["user_id", sa.text("date DESC"), "id"])
+
+
+def downgrade() -> None:
+    # 되돌릴 필요 없음 (같은 인덱스의 올바른 정의)
+    pass
@@ -0,0 +1,31 @@
+"""add jobs.worker_id / jobs.heartbeat_at
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-19 00:00:00
+
+실행 중인 작업의 소유 워커와 heartbeat. 워커 여러 개 / 롤링 재시작 중에 시작한 워커가 다른 워커에서
+아직 실행 중인 작업을 실패 처리하지 않도록, 서버 시작 시 복구는 heartbeat 가 끊긴 작업만 실패 처리한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0017"
+down_revision: Union[str, None] = "0016"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("worker_id", sa.String(100), nullable=True))
+    op.add_column("jobs", sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("jobs") as batch:
+        batch.drop_column("heartbeat_at")
+        batch.drop_column("worker_id")
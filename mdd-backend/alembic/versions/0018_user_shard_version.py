@@ -0,0 +1,29 @@
+"""add users.shard_version
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-19 00:00:00
+
+사용자를 다른 샤드로 옮길 때마다 증가하는 버전. 카테고리 / 결제 수단 정수 id 캐시 키에 넣어
+옮겼다가 되돌아온 사용자가 (다른 프로세스에 남은) 이전 id 를 다시 쓰지 않게 한다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0018"
+down_revision: Union[str, None] = "0017"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("shard_version", sa.Integer(), nullable=False, server_default="0"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch:
+        batch.drop_column("shard_version")
@@ -0,0 +1,82 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from app.utils.dependencies import require_admin
+from app.utils import tracing, profiling
+from app.middleware import admission_stats
+from app.schemas.admin import TracingConfig, ProfilingConfig
+
+router = APIRouter(prefix="/api/admin", tags=["Admin"], dependencies=[Depends(require_admin)])
+
+
+@router.get("/admission")
+async def get_admission_stats():
+    """경로 그룹별 수용 제어 상태 (실행 중 / 대기 중 요청 수, 실행 / 대기 / 거절 누적 수)
+
+    값은 이 요청을 받은 프로세스(uvicorn 워커) 기준이다.
+    """
+    return admission_stats()
+
+
+@router.get("/tracing", response_model=TracingConfig)
+async def get_tracing_config():
+    """요청 추적 샘플링 비율 조회"""
+    return TracingConfig(sample_rate=tracing.get_sample_rate())
+
+
+@router.put("/tracing", response_model=TracingConfig)
+async def update_tracing_config(config: TracingConfig):
+    """요청 추적 샘플링 비율 변경 (이 프로세스에만 적용, 재시작 시 TRACE_SAMPLE_RATE 로 돌아감)"""
+    tracing.set_sample_rate(config.sample_rate)
+    return TracingConfig(sample_rate=tracing.get_sample_rate())
+
+
+@router.get("/traces")
+async def get_traces(
+    limit: int = Query(50, ge=1, le=500),
+    min_duration_ms: float = Query(0, ge=0),
+):
+    """최근 추적 목록 (최신순, 메모리 버퍼 기준)"""
+    return tracing.get_traces(limit, min_duration_ms)
+
+
+@router.get("/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """추적 상세 (span 목록)"""
+    trace = tracing.get_trace(trace_id)
+    if trace is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="추적을 찾을 수 없습니다"
+        )
+    return trace
+
+
+@router.get("/profiling", response_model=ProfilingConfig)
+async def get_profiling_config():
+    """느린 요청 자동 프로파일링 기준 조회"""
+    return ProfilingConfig(slow_request_ms=profiling.get_slow_request_ms())
+
+
+@router.put("/profiling", response_model=ProfilingConfig)
+async def update_profiling_config(config: ProfilingConfig):
+    """느린 요청 자동 프로파일링 기준 변경 (이 프로세스에만 적용, null 이면 끔)"""
+    profiling.set_slow_request_ms(config.slow_request_ms)
+    return ProfilingConfig(slow_request_ms=profiling.get_slow_request_ms())
+
+
+@router.get("/profiles")
+async def get_profiles(limit: int = Query(50, ge=1, le=500)):
+    """저장된 프로파일 목록 (최신순)"""
+    return profiling.list_profiles(limit)
+
+
+@router.get("/profiles/{profile_id}")
+async def download_profile(profile_id: str):
+    """프로파일 다운로드 (folded stack, flamegraph.pl / speedscope 로 열기)"""
+    path = profiling.profile_path(profile_id)
+    if path is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="프로파일을 찾을 수 없습니다"
+        )
+    return FileResponse(path, media_type="text/plain", filename=path.name)
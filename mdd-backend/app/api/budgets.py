@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.utils.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse, BudgetStatusResponse
+from app.schemas.job import JobResponse
+from app.services.budget_service import BudgetService
+from app.services.job_service import JobService
+from datetime import date
+from typing import Optional
+
+router = APIRouter(prefix="/api/budgets", tags=["Budgets"])
+
+
+@router.get("", response_model=BudgetStatusResponse)
+async def get_budget_status(
+    year: Optional[int] = Query(None, ge=1),
+    month: Optional[int] = Query(None, ge=1, le=12),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """월 예산 사용 현황 (기본: 이번 달, level: ok/warning/exceeded)"""
+    today = date.today()
+    return BudgetService.get_status(db, current_user, year or today.year, month or today.month)
+
+
+@router.post("", response_model=BudgetResponse, status_code=status.HTTP_201_CREATED)
+async def create_budget(
+    budget_data: BudgetCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """카테고리 월 예산 생성"""
+    budget = BudgetService.create_budget(db, budget_data, current_user)
+    return BudgetResponse.model_validate(budget)
+
+
+@router.post("/reconcile", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def reconcile_budgets(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """지출 카운터를 거래 원본으로 다시 맞추는 백그라운드 작업 생성"""
+    job = JobService.create_job(db, current_user, "budget_reconcile")
+    return JobResponse.model_validate(job)
+
+
+@router.put("/{budget_id}", response_model=BudgetResponse)
+async def update_budget(
+    budget_id: int,
+    budget_data: BudgetUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """예산 수정 (한도 / 경고 비율)"""
+    budget = BudgetService.update_budget(db, budget_id, budget_data, current_user)
+    return BudgetResponse.model_validate(budget)
+
+
+@router.delete("/{budget_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_budget(
+    budget_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """예산 삭제"""
+    BudgetService.delete_budget(db, budget_id, current_user)
+    return None
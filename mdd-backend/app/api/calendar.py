@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Depends, Path
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.utils.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.calendar import CalendarYearResponse
+from app.services.calendar_service import CalendarService
+
+router = APIRouter(prefix="/api/calendar", tags=["Calendar"])
+
+
+@router.get("/{year}", response_model=CalendarYearResponse)
+def get_calendar_year(
+    year: int = Path(..., ge=1, le=9998),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """연간 캘린더 히트맵 조회"""
+    return CalendarService.get_year(db, current_user, year)
@@ -1,13 +1,19 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, Response, status, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.dependencies import get_current_user
 from app.models.user import User
-from app.schemas.entry import EntryCreate, EntryUpdate, EntryResponse, EntryListResponse
+from app.schemas.entry import (
+    EntryCreate, EntryUpdate, EntryResponse, EntryListItem, EntryListResponse, ENTRY_LIST_FIELDS
+)
 from app.schemas.integrated import EntryWithTransactionsCreate, EntryWithTransactionsResponse
 from app.schemas.transaction import TransactionResponse
 from app.services.entry_service import EntryService
 from app.services.integrated_service import IntegratedService
+from app.utils.fields import parse_fields
+from app.utils.http_cache import (
+    make_etag, request_etag, has_conditional_headers, is_not_modified, not_modified, set_validators
+)
 from typing import Optional
 from datetime import date
 from uuid import UUID
@@ -15,6 +21,16 @@ from uuid import UUID
 router = APIRouter(prefix="/api/entries", tags=["Entries"])
 
 
+def _entry_etag(entry_id: UUID, version: int) -> str:
+    return make_etag(f"entry:{entry_id}:{version}")
+
+
+def _full_etag(entry_id: UUID, version: int, transactions: list[tuple[UUID, int]]) -> str:
+    """일기 버전 + 연관 거래 (id, 버전) 목록"""
+    parts = ",".join(f"{t_id}:{t_version}" for t_id, t_version in sorted(transactions))
+    return make_etag(f"entry-full:{entry_id}:{version}:{parts}")
+
+
 @router.post("", response_model=EntryResponse, status_code=status.HTTP_201_CREATED)
 async def create_entry(
     entry_data: EntryCreate,
@@ -26,23 +42,36 @@ async def create_entry(
     return EntryResponse.model_validate(entry)
 
 
-@router.get("", response_model=EntryListResponse)
+@router.get("", response_model=EntryListResponse, response_model_exclude_unset=True)
 async def get_entries(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    fields: Optional[str] = Query(None, description="반환할 필드 (콤마 구분, 예: date,title,mood)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """일상 기록 목록 조회"""
+    """일상 기록 목록 조회 (본문 대신 preview 제공)
+
+    ETag / Last-Modified 는 사용자 데이터 버전 기준이므로 304 판단에 추가 쿼리가 필요 없다.
+    """
     skip = (page - 1) * page_size
+    field_list = parse_fields(fields, ENTRY_LIST_FIELDS)
+    
+    etag = request_etag(request, current_user.id, current_user.data_version)
+    if is_not_modified(request, etag, current_user.data_updated_at):
+        return not_modified(etag, current_user.data_updated_at)
+    set_validators(response, etag, current_user.data_updated_at)
+    
     entries, total = EntryService.get_entries(
-        db, current_user, skip, page_size, start_date, end_date
+        db, current_user, skip, page_size, start_date, end_date, field_list
     )
     
     return EntryListResponse(
-        entries=[EntryResponse.model_validate(entry) for entry in entries],
+        entries=[EntryListItem.from_model(entry, field_list) for entry in entries],
         total=total,
         page=page,
         page_size=page_size
@@ -52,11 +81,22 @@ async def get_entries(
 @router.get("/{entry_id}", response_model=EntryResponse)
 async def get_entry(
     entry_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """일상 기록 상세 조회"""
+    """일상 기록 상세 조회 (If-None-Match / If-Modified-Since 지원)"""
+    if has_conditional_headers(request):
+        version = EntryService.get_entry_version(db, entry_id, current_user)
+        if version is not None:
+            etag = _entry_etag(entry_id, version[0])
+            if is_not_modified(request, etag, version[1]):
+                return not_modified(etag, version[1])
+    
     entry = EntryService.get_entry(db, entry_id, current_user)
+    last_modified = entry.updated_at or entry.created_at
+    set_validators(response, _entry_etag(entry.id, entry.version), last_modified)
     return EntryResponse.model_validate(entry)
 
 
@@ -85,7 +125,7 @@ async def delete_entry(
 
 # 통합 엔드포인트
 @router.post("/with-transactions", response_model=EntryWithTransactionsResponse, status_code=status.HTTP_201_CREATED)
-async def create_entry_with_transactions(
+def create_entry_with_transactions(
     data: EntryWithTransactionsCreate,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
@@ -102,11 +142,25 @@ async def create_entry_with_transactions(
 @router.get("/{entry_id}/full", response_model=EntryWithTransactionsResponse)
 async def get_entry_with_transactions(
     entry_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """일상 기록과 연관된 경제 기록 함께 조회"""
+    """일상 기록과 연관된 경제 기록 함께 조회 (If-None-Match / If-Modified-Since 지원)"""
+    if has_conditional_headers(request):
+        version = IntegratedService.get_entry_with_transactions_version(db, entry_id, current_user)
+        if version is not None:
+            etag = _full_etag(entry_id, version[0], version[1])
+            if is_not_modified(request, etag, version[2]):
+                return not_modified(etag, version[2])
+    
     entry, transactions = IntegratedService.get_entry_with_transactions(db, entry_id, current_user)
+    last_modified = max(
+        [entry.updated_at or entry.created_at] + [t.updated_at or t.created_at for t in transactions]
+    )
+    etag = _full_etag(entry.id, entry.version, [(t.id, t.version) for t in transactions])
+    set_validators(response, etag, last_modified)
     
     return EntryWithTransactionsResponse(
         entry=EntryResponse.model_validate(entry),
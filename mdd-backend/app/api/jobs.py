@@ -0,0 +1,72 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import FileResponse
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.utils.dependencies import get_current_user
+from app.models.user import User
+from app.models.job import JobStatus
+from app.schemas.job import JobCreate, JobResponse
+from app.services.job_service import JobService
+from app.jobs.handlers import result_path
+from uuid import UUID
+
+router = APIRouter(prefix="/api/jobs", tags=["Jobs"])
+
+
+@router.post("", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_job(
+    job_data: JobCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """백그라운드 작업 생성 (예: kind=export)"""
+    job = JobService.create_job(db, current_user, job_data.kind, job_data.params, public_only=True)
+    return JobResponse.model_validate(job)
+
+
+@router.get("", response_model=list[JobResponse])
+async def get_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """최근 작업 목록 조회"""
+    return [JobResponse.model_validate(job) for job in JobService.get_jobs(db, current_user, limit)]
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """작업 상태 / 진행률 조회"""
+    return JobResponse.model_validate(JobService.get_job(db, job_id, current_user))
+
+
+@router.delete("/{job_id}", response_model=JobResponse)
+async def cancel_job(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """작업 취소 요청"""
+    return JobResponse.model_validate(JobService.cancel_job(db, job_id, current_user))
+
+
+@router.get("/{job_id}/download")
+async def download_job_result(
+    job_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """작업 결과 파일 다운로드 (export 등 파일을 만드는 작업)"""
+    job = JobService.get_job(db, job_id, current_user)
+    path = result_path(job.id)
+    if job.status != JobStatus.SUCCEEDED or not (job.result or {}).get("file") or not path.exists():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="다운로드할 결과가 없습니다"
+        )
+    
+    return FileResponse(path, media_type="application/json", filename=f"{job.kind}-{job.id}.json")
@@ -0,0 +1,63 @@
+from fastapi import APIRouter, Depends, status
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.utils.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.recurring import RecurringRuleCreate, RecurringRuleUpdate, RecurringRuleResponse
+from app.services.recurring_service import RecurringService
+from uuid import UUID
+
+router = APIRouter(prefix="/api/recurring", tags=["Recurring"])
+
+
+@router.post("", response_model=RecurringRuleResponse, status_code=status.HTTP_201_CREATED)
+async def create_rule(
+    rule_data: RecurringRuleCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """반복 거래 규칙 생성 (시작일이 지났으면 오늘까지의 거래를 바로 생성)"""
+    rule = RecurringService.create_rule(db, rule_data, current_user)
+    return RecurringRuleResponse.model_validate(rule)
+
+
+@router.get("", response_model=list[RecurringRuleResponse])
+async def get_rules(
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """반복 거래 규칙 목록 조회"""
+    return [RecurringRuleResponse.model_validate(rule) for rule in RecurringService.get_rules(db, current_user)]
+
+
+@router.get("/{rule_id}", response_model=RecurringRuleResponse)
+async def get_rule(
+    rule_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """반복 거래 규칙 상세 조회"""
+    return RecurringRuleResponse.model_validate(RecurringService.get_rule(db, rule_id, current_user))
+
+
+@router.put("/{rule_id}", response_model=RecurringRuleResponse)
+async def update_rule(
+    rule_id: UUID,
+    rule_data: RecurringRuleUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """반복 거래 규칙 수정 (금액/카테고리/설명/결제 수단/종료일/활성 여부)"""
+    rule = RecurringService.update_rule(db, rule_id, rule_data, current_user)
+    return RecurringRuleResponse.model_validate(rule)
+
+
+@router.delete("/{rule_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_rule(
+    rule_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """반복 거래 규칙 삭제 (이미 생성된 거래는 유지)"""
+    RecurringService.delete_rule(db, rule_id, current_user)
+    return None
@@ -0,0 +1,31 @@
+from fastapi import APIRouter, Depends, Path
+from sqlalchemy.orm import Session
+from app.database import get_db
+from app.utils.dependencies import get_current_user
+from app.models.user import User
+from app.schemas.report import ReportPeriod, ReportResponse
+from app.services.report_service import ReportService
+from datetime import date
+
+router = APIRouter(prefix="/api/reports", tags=["Reports"])
+
+
+@router.get("/monthly/{year}/{month}", response_model=ReportResponse)
+def get_monthly_report(
+    year: int = Path(..., ge=1, le=9998),
+    month: int = Path(..., ge=1, le=12),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """월간 리포트 (지난달 이전은 저장된 스냅샷)"""
+    return ReportService.get_report(db, current_user, ReportPeriod.MONTH, date(year, month, 1))
+
+
+@router.get("/yearly/{year}", response_model=ReportResponse)
+def get_yearly_report(
+    year: int = Path(..., ge=1, le=9998),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """연간 리포트 (지난해 이전은 저장된 스냅샷)"""
+    return ReportService.get_report(db, current_user, ReportPeriod.YEAR, date(year, 1, 1))
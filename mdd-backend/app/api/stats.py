@@ -1,19 +1,51 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.dependencies import get_current_user
 from app.models.user import User
 from app.models.transaction import TransactionType
-from app.schemas.stats import DailyStats, MonthlyStats, CategoryStats
+from app.schemas.stats import (
+    DailyStats, MonthlyStats, CategoryStats, MoodStats, TrendResponse, BalanceResponse,
+    AnalyticsDimension, AnalyticsMeasure, AnalyticsFilters, AnalyticsResult
+)
 from app.services.stats_service import StatsService
+from app.services.analytics_service import AnalyticsService
+from app.services.trend_service import TrendService
+from app.services.stats_cache_service import StatsCacheService
+from app.utils.http_cache import make_etag, etag_matches, not_modified, json_response
+from app.utils.money import to_minor_units
+from app.config import get_settings
 from datetime import date, timedelta
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Callable, Optional
+
+settings = get_settings()
 
 router = APIRouter(prefix="/api/stats", tags=["Statistics"])
 
 
+def _cached(
+    request: Request,
+    user: User,
+    endpoint: str,
+    params: dict[str, Any],
+    compute: Callable[[], Any]
+) -> Response:
+    """데이터 버전 기반 캐시 + ETag
+
+    If-None-Match 가 일치하면 집계 없이 304 를, 아니면 캐시된(또는 새로 계산한) JSON 을 반환한다.
+    """
+    key = StatsCacheService.make_key(user, endpoint, params)
+    etag = make_etag(key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    return json_response(StatsCacheService.get_or_compute(key, compute), etag)
+
+
 @router.get("/daily", response_model=list[DailyStats])
-async def get_daily_stats(
+def get_daily_stats(
+    request: Request,
     start_date: Optional[date] = Query(None),
     end_date: Optional[date] = Query(None),
     db: Session = Depends(get_db),
@@ -27,24 +59,32 @@ async def get_daily_stats(
     if not start_date:
         start_date = end_date - timedelta(days=30)
     
-    stats = StatsService.get_daily_stats(db, current_user, start_date, end_date)
-    return stats
+    return _cached(
+        request, current_user, "daily",
+        {"start_date": start_date, "end_date": end_date},
+        lambda: StatsService.get_daily_stats(db, current_user, start_date, end_date)
+    )
 
 
 @router.get("/monthly", response_model=list[MonthlyStats])
-async def get_monthly_stats(
-    year: Optional[int] = None,
-    month: Optional[int] = None,
+def get_monthly_stats(
+    request: Request,
+    year: Optional[int] = Query(None, ge=1),
+    month: Optional[int] = Query(None, ge=1, le=12),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """월별 통계 조회"""
-    stats = StatsService.get_monthly_stats(db, current_user, year, month)
-    return stats
+    return _cached(
+        request, current_user, "monthly",
+        {"year": year, "month": month},
+        lambda: StatsService.get_monthly_stats(db, current_user, year, month)
+    )
 
 
 @router.get("/category", response_model=list[CategoryStats])
-async def get_category_stats(
+def get_category_stats(
+    request: Request,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     transaction_type: TransactionType = Query(TransactionType.EXPENSE),
@@ -52,8 +92,123 @@ async def get_category_stats(
     current_user: User = Depends(get_current_user)
 ):
     """카테고리별 통계 조회"""
-    stats = StatsService.get_category_stats(
-        db, current_user, start_date, end_date, transaction_type
+    return _cached(
+        request, current_user, "category",
+        {"start_date": start_date, "end_date": end_date, "type": transaction_type},
+        lambda: StatsService.get_category_stats(db, current_user, start_date, end_date, transaction_type)
+    )
+
+
+@router.get("/mood", response_model=list[MoodStats])
+def get_mood_stats(
+    request: Request,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    top_categories: int = Query(3, ge=1, le=10),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """기분별 지출 통계 조회"""
+    
+    # 기본값: 최근 30일
+    if not end_date:
+        end_date = date.today()
+    if not start_date:
+        start_date = end_date - timedelta(days=30)
+    
+    return _cached(
+        request, current_user, "mood",
+        {"start_date": start_date, "end_date": end_date, "top_categories": top_categories},
+        lambda: StatsService.get_mood_stats(db, current_user, start_date, end_date, top_categories)
+    )
+
+
+@router.get("/balance", response_model=BalanceResponse)
+def get_running_balance(
+    request: Request,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    opening_balance: Decimal = Query(Decimal(0)),
+    max_points: int = Query(365, ge=2, le=settings.BALANCE_MAX_POINTS),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """누적 잔액 추이 (opening_balance: 첫 거래 이전 잔액)"""
+    try:
+        opening = to_minor_units(opening_balance)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    
+    return _cached(
+        request, current_user, "balance",
+        {"start_date": start_date, "end_date": end_date, "opening_balance": opening, "max_points": max_points},
+        lambda: StatsService.get_running_balance(db, current_user, start_date, end_date, opening, max_points)
     )
-    return stats
 
+
+@router.get("/trends", response_model=TrendResponse)
+def get_trends(
+    request: Request,
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    window: int = Query(7, ge=2, le=90),
+    anomaly_threshold: float = Query(3.0, ge=1.0, le=10.0),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """지출 추세 (이동 평균, 전월 대비, 이상 지출일, 월말 예상 지출)"""
+    
+    # 기본값: 최근 1년
+    if not end_date:
+        end_date = date.today()
+    if not start_date:
+        start_date = end_date - timedelta(days=365)
+    
+    return _cached(
+        request, current_user, "trends",
+        {"start_date": start_date, "end_date": end_date, "window": window, "anomaly_threshold": anomaly_threshold},
+        lambda: TrendService.get_trends(db, current_user, start_date, end_date, window, anomaly_threshold)
+    )
+
+
+@router.get("/query", response_model=AnalyticsResult)
+def query_stats(
+    request: Request,
+    dimensions: list[AnalyticsDimension] = Query([]),
+    measures: list[AnalyticsMeasure] = Query([AnalyticsMeasure.SUM]),
+    start_date: Optional[date] = Query(None),
+    end_date: Optional[date] = Query(None),
+    transaction_type: Optional[TransactionType] = Query(None),
+    category: list[str] = Query([]),
+    payment_method: list[str] = Query([]),
+    mood: list[str] = Query([]),
+    tag: list[str] = Query([]),
+    limit: int = Query(settings.ANALYTICS_MAX_ROWS, ge=1, le=settings.ANALYTICS_MAX_ROWS),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """집계 쿼리 (예: ?dimensions=month&dimensions=category&measures=sum&measures=count)"""
+    filters = AnalyticsFilters(
+        start_date=start_date,
+        end_date=end_date,
+        type=transaction_type,
+        categories=category,
+        payment_methods=payment_method,
+        moods=mood,
+        tags=tag
+    )
+    
+    def run() -> AnalyticsResult:
+        rows, truncated = AnalyticsService.run(db, current_user, dimensions, measures, filters, limit)
+        return AnalyticsResult(
+            dimensions=dimensions,
+            measures=measures,
+            rows=rows,
+            truncated=truncated
+        )
+    
+    return _cached(
+        request, current_user, "query",
+        {"dimensions": dimensions, "measures": measures, "filters": filters, "limit": limit},
+        run
+    )
@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, status, Query
+from fastapi import APIRouter, Depends, Request, Response, status, Query
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.utils.dependencies import get_current_user
 from app.models.user import User
-from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse
+from app.schemas.transaction import (
+    TransactionCreate, TransactionUpdate, TransactionResponse, TransactionListItem, TRANSACTION_LIST_FIELDS
+)
 from app.services.finance_service import FinanceService
+from app.utils.fields import parse_fields
+from app.utils.http_cache import (
+    make_etag, request_etag, has_conditional_headers, is_not_modified, not_modified, set_validators
+)
 from typing import Optional
 from datetime import date
 from uuid import UUID
@@ -12,6 +18,10 @@ from uuid import UUID
 router = APIRouter(prefix="/api/transactions", tags=["Transactions"])
 
 
+def _transaction_etag(transaction_id: UUID, version: int) -> str:
+    return make_etag(f"transaction:{transaction_id}:{version}")
+
+
 @router.post("", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
 async def create_transaction(
     transaction_data: TransactionCreate,
@@ -23,33 +33,57 @@ async def create_transaction(
     return TransactionResponse.model_validate(transaction)
 
 
-@router.get("", response_model=list[TransactionResponse])
+@router.get("", response_model=list[TransactionListItem], response_model_exclude_unset=True)
 async def get_transactions(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(50, ge=1, le=100),
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     category: Optional[str] = None,
     transaction_type: Optional[str] = None,
+    fields: Optional[str] = Query(None, description="반환할 필드 (콤마 구분, 예: date,amount,category)"),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """경제 기록 목록 조회"""
+    """경제 기록 목록 조회
+
+    ETag / Last-Modified 는 사용자 데이터 버전 기준이므로 304 판단에 추가 쿼리가 필요 없다.
+    """
+    field_list = parse_fields(fields, TRANSACTION_LIST_FIELDS)
+    
+    etag = request_etag(request, current_user.id, current_user.data_version)
+    if is_not_modified(request, etag, current_user.data_updated_at):
+        return not_modified(etag, current_user.data_updated_at)
+    set_validators(response, etag, current_user.data_updated_at)
+    
     transactions, total = FinanceService.get_transactions(
-        db, current_user, skip, limit, start_date, end_date, category, transaction_type
+        db, current_user, skip, limit, start_date, end_date, category, transaction_type, field_list
     )
     
-    return [TransactionResponse.model_validate(t) for t in transactions]
+    return [TransactionListItem.from_model(t, field_list) for t in transactions]
 
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
-    """경제 기록 상세 조회"""
+    """경제 기록 상세 조회 (If-None-Match / If-Modified-Since 지원)"""
+    if has_conditional_headers(request):
+        version = FinanceService.get_transaction_version(db, transaction_id, current_user)
+        if version is not None:
+            etag = _transaction_etag(transaction_id, version[0])
+            if is_not_modified(request, etag, version[1]):
+                return not_modified(etag, version[1])
+    
     transaction = FinanceService.get_transaction(db, transaction_id, current_user)
+    last_modified = transaction.updated_at or transaction.created_at
+    set_validators(response, _transaction_etag(transaction.id, transaction.version), last_modified)
     return TransactionResponse.model_validate(transaction)
 
 
@@ -0,0 +1,64 @@
+"""예산 지출 카운터 재계산 명령
+
+사용법:
+    python -m app.commands.budgets                          # 모든 사용자, 전체 기간
+    python -m app.commands.budgets --since 2026-09-01       # 2026년 9월부터만
+    python -m app.commands.budgets --workers 8
+
+거래 쓰기 중 오류나 수동 데이터 수정으로 category_monthly_spend 가 원본과 어긋났을 때 바로잡는다.
+cron 으로 주기 실행해도 되며, 어긋난 카운터가 없으면 아무것도 바꾸지 않는다.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import select, union
+from app.database import shard_engines, shard_session
+from app.models.budget import CategorySpend
+from app.models.transaction import Transaction
+from app.services.budget_service import BudgetService
+
+
+def target_user_ids() -> list[tuple[int, UUID]]:
+    """거래나 지출 카운터가 있는 (샤드, 사용자)"""
+    query = union(select(Transaction.user_id), select(CategorySpend.user_id))
+    user_ids = []
+    for shard in range(len(shard_engines)):
+        with shard_session(shard) as db:
+            user_ids.extend((shard, row[0]) for row in db.execute(query))
+    return user_ids
+
+
+def reconcile(shard: int, user_id: UUID, since: Optional[date]) -> int:
+    """사용자 한 명 재계산 (스레드마다 별도 세션)"""
+    with shard_session(shard) as db:
+        return BudgetService.reconcile(db, user_id, since)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="예산 지출 카운터를 거래 원본으로 재계산")
+    parser.add_argument("--since", type=date.fromisoformat, default=None, help="이 날짜가 속한 달부터만 비교")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 처리할 사용자 수 (DB 커넥션 풀 크기 이하)")
+    args = parser.parse_args()
+    
+    user_ids = target_user_ids()
+    print(f"대상 사용자 {len(user_ids)}명")
+    
+    corrected = failed = 0
+    with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+        futures = {
+            executor.submit(reconcile, shard, user_id, args.since): user_id for shard, user_id in user_ids
+        }
+        for future in as_completed(futures):
+            try:
+                corrected += future.result()
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ {futures[future]}: {type(e).__name__}: {e}")
+    
+    print(f"✅ 카운터 {corrected}개 수정, {failed}명 실패")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""transactions 파티션 사전 생성 명령
+
+사용법:
+    python -m app.commands.partitions              # 현재 + 미래 파티션 생성
+    python -m app.commands.partitions --ahead 12   # 12개 단위 앞까지 생성
+    python -m app.commands.partitions --since 2023-01-01
+
+cron 등으로 주기적으로 실행해 새 기간의 행이 DEFAULT 파티션에 쌓이지 않도록 한다.
+"""
+import argparse
+from datetime import date
+from app.config import get_settings
+from app.database import shard_engines
+from app.utils.partitions import ensure_transaction_partitions
+
+
+def main() -> None:
+    settings = get_settings()
+
+    parser = argparse.ArgumentParser(description="transactions 범위 파티션 생성")
+    parser.add_argument("--interval", choices=["month", "year"], default=settings.TRANSACTION_PARTITION_INTERVAL)
+    parser.add_argument("--ahead", type=int, default=settings.TRANSACTION_PARTITIONS_AHEAD)
+    parser.add_argument("--since", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    created = []
+    for engine in shard_engines:
+        with engine.begin() as conn:
+            created += ensure_transaction_partitions(conn, args.interval, args.ahead, since=args.since)
+
+    if created:
+        print(f"✅ {len(created)}개 파티션 생성: {', '.join(created)}")
+    else:
+        print("✅ 생성할 파티션이 없습니다")
+
+
+if __name__ == "__main__":
+    main()
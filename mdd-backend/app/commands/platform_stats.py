@@ -0,0 +1,211 @@
+"""전체 사용자 집계 명령 (운영용)
+
+사용법:
+    python -m app.commands.platform_stats                              # 직전 12개월
+    python -m app.commands.platform_stats --start 2026-01-01 --end 2026-07-01
+    python -m app.commands.platform_stats --workers 4 --duty 0.25 --partitions 64
+
+월별 활성 사용자, 카테고리별 지출과 사용자 지출 분포, 가입 월 코호트별 일기 작성 빈도를 집계한다.
+샤드마다 사용자 id 범위를 --partitions 개로 나눠 프로세스 풀에서 읽기 전용 연결로 집계하고, 파티션 결과를
+PLATFORM_STATS_DIR/<start>_<end>/ 에 열 단위 압축 파일(.npz)로 저장한 뒤 summary.npz 로 합친다.
+
+- 사용자 트래픽과 경쟁하지 않도록 각 워커는 집계에 걸린 시간만큼 쉬어 DB 사용 비율을 --duty 이하로 유지한다.
+- 다시 실행하면 데이터 지문(사용자 수 / data_version 합 / 마지막 변경 시각)이 같은 파티션은 저장된 결과를 쓴다.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from pathlib import Path
+from typing import Optional
+import numpy as np
+from sqlalchemy import event
+from app.config import get_settings
+from app.database import shard_engines, shard_session
+from app.services.platform_stats_service import PlatformStatsService, user_ranges, merge, SPEND_BINS
+
+settings = get_settings()
+
+# 파티션 파일 형식 (열 구성이 바뀌면 올려서 이전 파일을 다시 쓰지 않게 함)
+FORMAT_VERSION = 1
+
+
+def _read_only(dbapi_connection, connection_record):
+    """워커 연결을 읽기 전용으로 (실수로라도 쓰지 않도록)"""
+    cursor = dbapi_connection.cursor()
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor.execute("PRAGMA query_only=ON")
+    else:
+        cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+        dbapi_connection.commit()  # 트랜잭션 안의 SET 은 롤백되면 사라짐
+    cursor.close()
+
+
+def init_worker() -> None:
+    """워커 프로세스 초기화"""
+    for engine in shard_engines:
+        event.listen(engine, "connect", _read_only)
+
+
+def partition_path(directory: Path, shard: int, index: int, count: int) -> Path:
+    return directory / f"s{shard}-{index:04d}of{count:04d}.npz"
+
+
+def load_partition(path: Path) -> tuple[Optional[dict], dict[str, np.ndarray]]:
+    """저장된 파티션 -> (메타데이터, 열) (없거나 읽을 수 없으면 (None, {}))"""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            columns = {name: data[name] for name in data.files}
+    except (OSError, ValueError):
+        return None, {}
+    meta = json.loads(str(columns.pop("_meta")))
+    return meta, columns
+
+
+def save_columns(path: Path, columns: dict[str, np.ndarray], meta: dict) -> None:
+    """열 단위 압축 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    temp = path.with_suffix(".tmp.npz")
+    np.savez_compressed(temp, _meta=np.array(json.dumps(meta)), **columns)
+    os.replace(temp, path)
+
+
+def run_partition(
+    shard: int, index: int, count: int, start: date, end: date, directory: str, force: bool, duty: float
+) -> tuple[bool, float]:
+    """파티션 하나 집계 (워커 프로세스) -> (저장된 결과 재사용 여부, 집계 시간)"""
+    path = partition_path(Path(directory), shard, index, count)
+    user_range = user_ranges(count)[index]
+    
+    with shard_session(shard) as db:
+        fingerprint = PlatformStatsService.fingerprint(db, user_range)
+        if not force:
+            meta, _ = load_partition(path)
+            if meta == {"format": FORMAT_VERSION, "fingerprint": fingerprint}:
+                return True, 0.0
+        
+        started = time.perf_counter()
+        columns = PlatformStatsService.aggregate(db, user_range, start, end)
+        elapsed = time.perf_counter() - started
+    
+    save_columns(path, columns, {"format": FORMAT_VERSION, "fingerprint": fingerprint})
+    
+    # 집계 시간에 비례해 쉬어 DB 사용 비율을 duty 로 제한
+    if duty < 1:
+        time.sleep(elapsed * (1 - duty) / duty)
+    return False, elapsed
+
+
+def default_period(today: date, months: int) -> tuple[date, date]:
+    """이번 달 1일 이전 months 개월 [start, end)"""
+    end = today.replace(day=1)
+    total = end.year * 12 + end.month - 1 - months
+    return date(total // 12, total % 12 + 1, 1), end
+
+
+def print_summary(result: dict[str, np.ndarray], top: int = 10) -> None:
+    """합친 결과 요약 출력"""
+    users, active = int(result["total.users"][0]), int(result["total.active_users"][0])
+    print(f"사용자 {users}명, 기간 중 활성 {active}명")
+    
+    print("월별 활성 사용자:")
+    for month, count in zip(result["monthly_active.month"], result["monthly_active.users"]):
+        print(f"  {str(month)[:7]}  {count}")
+    
+    print(f"지출 상위 카테고리 (이름 기준, 상위 {top}개):")
+    order = np.argsort(-result["category.amount"])[:top]
+    total_amount = max(int(result["category.amount"].sum()), 1)
+    for i in order:
+        print(
+            f"  {result['category.category'][i]}: {result['category.amount'][i]} "
+            f"({result['category.amount'][i] * 100 / total_amount:.1f}%), "
+            f"사용자 {result['category.users'][i]}명, 거래 {result['category.transactions'][i]}건"
+        )
+    
+    print("사용자 기간 지출 분포 (최소 화폐 단위):")
+    histogram = np.zeros(SPEND_BINS, dtype=np.int64)
+    histogram[result["user_spend.bin"]] = result["user_spend.users"]
+    for i, count in enumerate(histogram):
+        if count:
+            print(f"  10^{i} 이상: {count}명")
+    
+    # 코호트 x 월 전체 표는 summary.npz 에 있으므로 마지막 달만 출력
+    months = result["cohort_entries.month"]
+    if len(months):
+        last = months.max()
+        print(f"가입 월 코호트별 {str(last)[:7]} 일기 작성 (작성자 / 가입자, 작성자당 일기 수):")
+        cohort_sizes = dict(zip(result["cohort.cohort"], result["cohort.users"]))
+        for i in np.flatnonzero(months == last):
+            cohort, writers, entries = (
+                result["cohort_entries.cohort"][i], result["cohort_entries.writers"][i], result["cohort_entries.entries"][i]
+            )
+            print(f"  {str(cohort)[:7]}: {writers}/{cohort_sizes.get(cohort, 0)}명, {entries / writers:.1f}개")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="전체 사용자 집계 (운영용)")
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="기간 시작일 (기본: 직전 --months 개월)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="기간 종료일 (포함하지 않음, 기본: 이번 달 1일)")
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--partitions", type=int, default=16, help="샤드마다 나눌 사용자 id 범위 수")
+    parser.add_argument("--workers", type=int, default=2, help="동시에 집계할 파티션 수 (프로세스)")
+    parser.add_argument("--duty", type=float, default=0.5, help="워커가 DB 를 쓰는 시간 비율 상한 (0~1, 1: 쉬지 않음)")
+    parser.add_argument("--force", action="store_true", help="저장된 파티션 결과를 무시하고 다시 집계")
+    args = parser.parse_args()
+    
+    start, end = default_period(date.today(), args.months)
+    start, end = args.start or start, args.end or end
+    if start >= end:
+        parser.error("--start 는 --end 보다 앞이어야 합니다")
+    if not 0 < args.duty <= 1:
+        parser.error("--duty 는 0 보다 크고 1 이하여야 합니다")
+    
+    directory = Path(settings.PLATFORM_STATS_DIR) / f"{start}_{end}"
+    directory.mkdir(parents=True, exist_ok=True)
+    tasks = [(shard, index) for shard in range(len(shard_engines)) for index in range(args.partitions)]
+    print(f"{start} ~ {end}: 파티션 {len(tasks)}개 (샤드 {len(shard_engines)}개 x {args.partitions})")
+    
+    reused = failed = 0
+    elapsed = 0.0
+    started = time.perf_counter()
+    with ProcessPoolExecutor(
+        max_workers=max(args.workers, 1),
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker
+    ) as executor:
+        futures = {
+            executor.submit(
+                run_partition, shard, index, args.partitions, start, end, str(directory), args.force, args.duty
+            ): (shard, index)
+            for shard, index in tasks
+        }
+        for future in as_completed(futures):
+            try:
+                was_reused, seconds = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ 샤드 {futures[future][0]} 파티션 {futures[future][1]}: {type(e).__name__}: {e}")
+                continue
+            reused += was_reused
+            elapsed += seconds
+    
+    if failed:
+        print(f"❌ {failed}개 파티션 실패, 결과를 합치지 않음")
+        raise SystemExit(1)
+    
+    parts = [load_partition(partition_path(directory, shard, index, args.partitions))[1] for shard, index in tasks]
+    result = merge(parts)
+    save_columns(directory / "summary.npz", result, {"format": FORMAT_VERSION, "start": str(start), "end": str(end)})
+    
+    print_summary(result)
+    print(
+        f"✅ 집계 {len(tasks) - reused}개 ({elapsed:.1f}초), 재사용 {reused}개, "
+        f"전체 {time.perf_counter() - started:.1f}초 -> {directory / 'summary.npz'}"
+    )
+
+
+if __name__ == "__main__":
+    main()
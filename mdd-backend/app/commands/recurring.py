@@ -0,0 +1,50 @@
+"""반복 거래 생성 명령
+
+사용법:
+    python -m app.commands.recurring                    # 오늘까지 도래한 발생분 생성 후 종료
+    python -m app.commands.recurring --loop             # 1시간마다 반복 실행
+    python -m app.commands.recurring --loop --every 600 --batch-size 1000
+
+모든 사용자의 규칙을 배치 단위로 처리한다. 중단 후 다시 실행하면 밀린 발생분을 중복 없이 따라잡는다.
+PostgreSQL 에서는 여러 인스턴스를 동시에 실행해도 규칙을 나눠 처리한다.
+"""
+import argparse
+import time
+from datetime import date, datetime
+from app.database import shard_engines, shard_session
+from app.services.recurring_service import RecurringService, RULE_BATCH_SIZE
+
+
+def run_once(batch_size: int, today: date = None) -> int:
+    """모든 샤드의 규칙 처리 -> 생성한 거래 수"""
+    created = 0
+    for shard in range(len(shard_engines)):
+        with shard_session(shard) as db:
+            created += RecurringService.materialize(db, today=today, batch_size=batch_size)
+    return created
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="반복 거래 발생분 생성")
+    parser.add_argument("--loop", action="store_true", help="종료하지 않고 주기적으로 실행")
+    parser.add_argument("--every", type=int, default=3600, help="--loop 실행 간격 (초)")
+    parser.add_argument("--batch-size", type=int, default=RULE_BATCH_SIZE, help="한 번에 처리할 규칙 수")
+    parser.add_argument("--today", type=date.fromisoformat, default=None, help="기준일 (기본: 오늘)")
+    args = parser.parse_args()
+    
+    while True:
+        try:
+            created = run_once(args.batch_size, args.today)
+            print(f"✅ [{datetime.now().isoformat(timespec='seconds')}] 반복 거래 {created}건 생성")
+        except Exception as e:
+            if not args.loop:
+                raise
+            print(f"⚠️ 반복 거래 생성 실패: {type(e).__name__}: {e}")
+        
+        if not args.loop:
+            break
+        time.sleep(args.every)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""리포트 스냅샷 사전 생성 명령
+
+사용법:
+    python -m app.commands.reports                          # 지난달 월간 리포트
+    python -m app.commands.reports --period year            # 지난해 연간 리포트
+    python -m app.commands.reports --start 2026-09-01 --workers 8
+
+월/연 마감 직후 cron 으로 실행해, 사용자들이 리포트를 처음 열 때 동시에 계산이 몰리지 않도록 한다.
+해당 기간에 일기나 거래가 있는 사용자만 대상으로 하며 이미 있는 스냅샷은 건너뛴다.
+"""
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, timedelta
+from uuid import UUID
+from sqlalchemy import select, union
+from app.database import shard_engines, shard_session
+from app.models.entry import Entry
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.report import ReportPeriod
+from app.services.report_service import ReportService, period_start, period_end, is_closed
+
+
+def active_user_ids(start: date, end: date) -> list[tuple[int, UUID]]:
+    """기간 안에 일기나 거래가 있는 (샤드, 사용자)"""
+    query = union(
+        select(Transaction.user_id).where(Transaction.date >= start, Transaction.date < end),
+        select(Entry.user_id).where(Entry.date >= start, Entry.date < end)
+    )
+    user_ids = []
+    for shard in range(len(shard_engines)):
+        with shard_session(shard) as db:
+            user_ids.extend((shard, row[0]) for row in db.execute(query))
+    return user_ids
+
+
+def generate(shard: int, user_id: UUID, period: ReportPeriod, start: date) -> None:
+    """사용자 한 명의 스냅샷 생성 (스레드마다 별도 세션)"""
+    with shard_session(shard) as db:
+        user = db.get(User, user_id)
+        if user is not None:
+            ReportService.get_snapshot(db, user, period, start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="마감된 기간의 리포트 스냅샷 생성")
+    parser.add_argument("--period", choices=[p.value for p in ReportPeriod], default=ReportPeriod.MONTH.value)
+    parser.add_argument("--start", type=date.fromisoformat, default=None, help="기간 안의 아무 날짜 (기본: 직전 기간)")
+    parser.add_argument("--workers", type=int, default=4, help="동시에 계산할 사용자 수 (DB 커넥션 풀 크기 이하)")
+    args = parser.parse_args()
+    
+    period = ReportPeriod(args.period)
+    if args.start:
+        start = period_start(args.start, period)
+    else:
+        start = period_start(period_start(date.today(), period) - timedelta(days=1), period)
+    
+    if not is_closed(start, period):
+        parser.error(f"아직 끝나지 않은 기간입니다: {start}")
+    
+    user_ids = active_user_ids(start, period_end(start, period))
+    print(f"{period.value} {start}: 대상 사용자 {len(user_ids)}명")
+    
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(args.workers, 1)) as executor:
+        futures = {
+            executor.submit(generate, shard, user_id, period, start): user_id for shard, user_id in user_ids
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                failed += 1
+                print(f"⚠️ {futures[future]}: {type(e).__name__}: {e}")
+    
+    print(f"✅ {len(user_ids) - failed}명 완료, {failed}명 실패")
+
+
+if __name__ == "__main__":
+    main()
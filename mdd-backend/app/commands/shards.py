@@ -0,0 +1,84 @@
+"""사용자 샤드 관리 명령
+
+사용법:
+    python -m app.commands.shards status                        # 샤드별 사용자 수
+    python -m app.commands.shards move <user_id> --to 2         # 사용자 한 명 이동
+    python -m app.commands.shards move --from 0 --to 2 --count 100   # 샤드 0 사용자 100명 이동
+
+새 샤드를 추가할 때는 SHARD_DATABASE_URLS 에 URL 을 넣고 `alembic -x shard=<번호> upgrade head` 로
+스키마를 만든 뒤, SHARD_NEW_USER_SHARDS 로 새 사용자 배치를 조정하거나 이 명령으로 사용자를 옮긴다.
+"""
+import argparse
+from uuid import UUID
+from fastapi import HTTPException
+from sqlalchemy import func
+from app.database import shard_engines, shard_session
+from app.models.user import User
+from app.models.user_directory import UserDirectory
+from app.services.shard_service import ShardService
+
+
+def status() -> None:
+    """샤드별 디렉터리 등록 수와 실제 저장된 사용자 수"""
+    with shard_session(0) as directory:
+        registered = dict(
+            directory.query(UserDirectory.shard, func.count()).group_by(UserDirectory.shard).all()
+        )
+    
+    for shard in range(len(shard_engines)):
+        with shard_session(shard) as db:
+            stored = db.query(func.count(User.id)).scalar()
+        print(f"샤드 {shard}: 디렉터리 {registered.get(shard, 0)}명, 저장 {stored}명")
+
+
+def pick_users(source: int, count: int) -> list[UUID]:
+    """샤드에서 옮길 사용자 (가입 순)"""
+    with shard_session(0) as directory:
+        rows = directory.query(UserDirectory.user_id).filter(
+            UserDirectory.shard == source
+        ).order_by(UserDirectory.created_at).limit(count).all()
+    return [row[0] for row in rows]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="사용자 샤드 관리")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("status", help="샤드별 사용자 수")
+    
+    move = subparsers.add_parser("move", help="사용자를 다른 샤드로 이동")
+    move.add_argument("user_ids", nargs="*", type=UUID, help="옮길 사용자 id")
+    move.add_argument("--to", type=int, required=True, dest="target", help="대상 샤드")
+    move.add_argument("--from", type=int, default=None, dest="source", help="이 샤드의 사용자를 --count 명 이동")
+    move.add_argument("--count", type=int, default=1)
+    args = parser.parse_args()
+    
+    if args.command == "status":
+        status()
+        return
+    
+    user_ids = list(args.user_ids)
+    if args.source is not None:
+        user_ids += pick_users(args.source, args.count)
+    if not user_ids:
+        parser.error("옮길 사용자 id 또는 --from 을 지정하세요")
+    
+    moved = failed = 0
+    for user_id in user_ids:
+        try:
+            rows = ShardService.move_user(user_id, args.target)
+        except HTTPException as e:
+            failed += 1
+            print(f"⚠️ {user_id}: {e.detail}")
+            continue
+        except Exception as e:
+            failed += 1
+            print(f"⚠️ {user_id}: {type(e).__name__}: {e}")
+            continue
+        moved += 1
+        print(f"  {user_id}: {sum(rows.values())}행")
+    
+    print(f"✅ {moved}명 이동, {failed}명 실패")
+
+
+if __name__ == "__main__":
+    main()
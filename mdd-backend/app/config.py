@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -7,6 +8,19 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    SQL_ECHO: bool = False  # 모든 SQL 을 로그로 출력 (개발용)
+    DB_POOL_WARMUP: int = 2  # 시작 후 미리 열어 둘 연결 수 (/ready 는 예열이 끝난 뒤 준비 완료)
+    
+    # 내장 DB 모드 (DATABASE_URL=sqlite:///파일 경로): 연결마다 적용하는 PRAGMA
+    SQLITE_POOL_SIZE: int = 40  # 유지할 연결 수 (요청 스레드 풀 크기와 같게 두면 스레드마다 연결 하나)
+    SQLITE_SYNCHRONOUS: Literal["OFF", "NORMAL", "FULL", "EXTRA"] = "NORMAL"  # WAL 에서 NORMAL 은 전원 장애 시 마지막 커밋만 잃을 수 있음 (FULL: 매 커밋 fsync)
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # 메모리 매핑 읽기 크기 (바이트, 0: 끔)
+    SQLITE_CACHE_SIZE_KB: int = 64 * 1024  # 연결별 페이지 캐시
+    SQLITE_BUSY_TIMEOUT: float = 5.0  # 다른 연결이 쓰는 중일 때 기다릴 시간 (초)
+    
+    # 사용자 샤딩: 샤드 0 은 DATABASE_URL (사용자 디렉터리 포함), 샤드 1.. 은 SHARD_DATABASE_URLS 순서
+    SHARD_DATABASE_URLS: list[str] = []
+    SHARD_NEW_USER_SHARDS: Optional[list[int]] = None  # 새 사용자를 배치할 샤드 (None: 전체)
     
     # JWT
     SECRET_KEY: str
@@ -16,6 +30,77 @@ class Settings(BaseSettings):
     # CORS
     BACKEND_CORS_ORIGINS: list[str] = ["*"]
     
+    # 금액 저장 단위: 금액 * 10^CURRENCY_EXPONENT 정수로 저장 (KRW: 0, USD: 2)
+    # 데이터가 쌓인 뒤 변경하려면 마이그레이션이 필요하다
+    CURRENCY_EXPONENT: int = 2
+    
+    # 집계 쿼리 API 결과 행 수 상한
+    ANALYTICS_MAX_ROWS: int = 1000
+    
+    # 추세 분석 API 최대 조회 기간 (일, 약 10년)
+    TREND_MAX_DAYS: int = 3660
+    
+    # 누적 잔액 API 최대 반환 점 수
+    BALANCE_MAX_POINTS: int = 2000
+    
+    # 통계 캐시: 기본은 프로세스 내 LRU, STATS_CACHE_URL(redis://...) 지정 시 공유 캐시
+    STATS_CACHE_SIZE: int = 1000
+    STATS_CACHE_URL: Optional[str] = None
+    STATS_CACHE_TTL: int = 86400  # 공유 캐시 항목 만료 (초)
+    
+    # 백그라운드 작업 (app.jobs)
+    JOB_THREAD_WORKERS: int = 4  # I/O 위주 작업 동시 실행 수
+    JOB_PROCESS_WORKERS: int = 2  # CPU 위주 작업 동시 실행 수
+    JOB_MAX_ACTIVE_PER_USER: int = 3  # 사용자별 대기 + 실행 중 작업 상한
+    JOB_HEARTBEAT_SECONDS: int = 30  # 실행 중인 작업의 heartbeat_at 갱신 간격
+    JOB_STALE_AFTER_MINUTES: int = 5  # 서버 시작 시 heartbeat 가 이보다 오래 갱신되지 않은 실행 중 작업은 실패 처리
+    JOB_RESULT_DIR: str = "job_results"  # 결과 파일 저장 위치
+    
+    # 전체 사용자 집계 (python -m app.commands.platform_stats) 결과 저장 위치
+    PLATFORM_STATS_DIR: str = "platform_stats"
+    
+    # 요청 수용 제어 (app.middleware.admission): 경로 그룹별 동시 실행 수 / 대기열 길이 / 최대 대기 시간(초)
+    # 환경 변수로 바꿀 때는 JSON 으로 지정 (예: ADMISSION_LIMITS='{"stats": {"concurrency": 8, "queue": 32, "timeout": 2}}')
+    ADMISSION_CONTROL_ENABLED: bool = True
+    ADMISSION_LIMITS: dict[str, dict[str, float]] = {
+        "stats": {"concurrency": 4, "queue": 16, "timeout": 2.0},
+        "bulk_write": {"concurrency": 4, "queue": 16, "timeout": 5.0},
+        "auth": {"concurrency": 4, "queue": 32, "timeout": 5.0},
+    }
+    
+    # 운영용 API (/api/admin) 토큰, 없으면 운영용 API 비활성화
+    ADMIN_TOKEN: Optional[str] = None
+    
+    # 요청 추적 (app.utils.tracing): 샘플링 비율 (0: 끔), 메모리 버퍼 크기, 요청당 최대 span 수
+    TRACE_SAMPLE_RATE: float = 0.0
+    TRACE_BUFFER_SIZE: int = 200
+    TRACE_MAX_SPANS: int = 1000
+    TRACE_FILE: Optional[str] = None  # 지정 시 끝난 추적을 JSON Lines 로 추가 기록
+    
+    # 요청 프로파일링 (app.utils.profiling): 샘플 간격, 느린 요청 자동 저장 기준 (None: 끔), 저장 위치 / 최대 개수
+    PROFILE_INTERVAL_MS: float = 5.0
+    PROFILE_SLOW_REQUEST_MS: Optional[float] = None
+    PROFILE_DIR: str = "profiles"
+    PROFILE_MAX_FILES: int = 100
+    
+    # 응답 압축 (app.middleware.compression): br / zstd 는 brotli / zstandard 패키지가 설치된 경우에만 사용
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024  # 이보다 작은 응답은 압축하지 않음 (바이트)
+    COMPRESSION_OFFLOAD_SIZE: int = 65536  # 이 크기 이상은 스레드 풀에서 압축 (바이트)
+    COMPRESSION_GZIP_LEVEL: int = 6  # 1~9
+    COMPRESSION_BROTLI_QUALITY: int = 4  # 0~11
+    COMPRESSION_ZSTD_LEVEL: int = 3  # 1~22
+    COMPRESSION_EXCLUDE_PATHS: list[str] = []  # 압축하지 않을 경로 정규식 (예: ["^/api/admin/"])
+    
+    # SQL 모니터 (app.utils.query_monitor)
+    SLOW_QUERY_MS: Optional[float] = 500.0  # 이 시간 이상 걸린 SQL 을 파라미터와 함께 경고 로그 (None: 끔)
+    SLOW_QUERY_EXPLAIN: bool = True  # 느린 쿼리 로그에 실행 계획 포함
+    QUERY_REPEAT_THRESHOLD: int = 0  # 요청 하나에서 같은 형태의 SQL 이 이 횟수 이상이면 N+1 의심 경고 (0: 끔, 테스트 환경 권장)
+    
+    # Transactions 파티셔닝 (PostgreSQL)
+    TRANSACTION_PARTITION_INTERVAL: str = "month"  # month 또는 year
+    TRANSACTION_PARTITIONS_AHEAD: int = 3  # 미리 만들어 둘 미래 파티션 개수
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
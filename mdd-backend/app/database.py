@@ -1,29 +1,104 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.config import get_settings
 
 settings = get_settings()
 
-# SQLAlchemy 엔진 생성
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    echo=True  # 개발 중 SQL 쿼리 로깅
-)
 
-# 세션 팩토리
+def _create_engine(url: str) -> Engine:
+    """SQLAlchemy 엔진 생성"""
+    if make_url(url).get_backend_name() == "sqlite":
+        return _create_sqlite_engine(url)
+    return create_engine(
+        url,
+        pool_pre_ping=True,
+        echo=settings.SQL_ECHO  # 개발 중 SQL 쿼리 로깅
+    )
+
+
+def _create_sqlite_engine(url: str) -> Engine:
+    """내장 DB(SQLite 파일) 엔진 - 단일 노드 배포 / 테스트 / 벤치마크용
+
+    WAL 로 읽기와 쓰기가 서로 막지 않게 하고, 연결은 스레드 간에 넘겨 쓰되 요청 스레드 수만큼 유지한다.
+    SingletonThreadPool 은 같은 스레드의 세션들이 한 연결(한 트랜잭션)을 공유하게 되므로 쓰지 않는다
+    (사용자 디렉터리 / 작업 세션이 요청 세션과 따로 커밋함). 파일 DB 만 지원한다 (:memory: 는 연결마다 다른 DB).
+    """
+    sqlite_engine = create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=settings.SQLITE_POOL_SIZE,
+        max_overflow=settings.SQLITE_POOL_SIZE,
+        connect_args={"check_same_thread": False, "timeout": settings.SQLITE_BUSY_TIMEOUT},
+        echo=settings.SQL_ECHO
+    )
+    
+    @event.listens_for(sqlite_engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA foreign_keys=ON")  # ON DELETE CASCADE 등 FK 제약 (SQLite 기본은 꺼짐)
+        cursor.close()
+    
+    @event.listens_for(sqlite_engine, "savepoint")
+    def _begin_before_savepoint(conn, name):
+        # pysqlite 는 첫 쓰기 직전에야 BEGIN 을 보내므로, 읽기만 한 트랜잭션의 SAVEPOINT 는 트랜잭션 밖에서
+        # 실행되어 RELEASE 가 곧바로 커밋된다 (바깥 트랜잭션을 롤백해도 남음). 그 전에 직접 BEGIN 한다.
+        dbapi_connection = conn.connection.dbapi_connection
+        if not dbapi_connection.in_transaction:
+            dbapi_connection.execute("BEGIN")
+    
+    return sqlite_engine
+
+
+# 샤드 0 (사용자 디렉터리, 샤딩하지 않을 때는 유일한 DB)
+engine = _create_engine(settings.DATABASE_URL)
+
+# 샤드별 엔진 (인덱스 = 샤드 번호)
+shard_engines: list[Engine] = [engine] + [_create_engine(url) for url in settings.SHARD_DATABASE_URLS]
+
+# 세션 팩토리 (기본: 샤드 0)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Base 클래스
 Base = declarative_base()
 
 
+def is_sharded() -> bool:
+    return len(shard_engines) > 1
+
+
+def shard_session(shard: int) -> Session:
+    """샤드에 연결된 새 세션"""
+    db = SessionLocal(bind=shard_engines[shard])
+    db.info["shard"] = shard
+    return db
+
+
+def use_shard(db: Session, shard: int) -> None:
+    """세션을 샤드에 다시 연결 (다른 샤드에서 진행 중인 트랜잭션은 버림)"""
+    if db.info.get("shard", 0) == shard and db.bind is shard_engines[shard]:
+        return
+    if db.in_transaction():
+        db.close()
+    db.bind = shard_engines[shard]
+    db.info["shard"] = shard
+
+
 def get_db():
-    """데이터베이스 세션 의존성"""
-    db = SessionLocal()
+    """데이터베이스 세션 의존성
+
+    샤드 0 에 연결된 세션을 만들고, 인증(get_current_user) 이나 로그인 / 회원가입에서
+    사용자의 샤드로 다시 연결한다.
+    """
+    db = shard_session(0)
     try:
         yield db
     finally:
         db.close()
-
@@ -0,0 +1,14 @@
+"""백그라운드 작업 실행
+
+작업 종류는 app.jobs.registry.register 로 등록하고 JobService.create_job 으로 생성한다.
+상태는 jobs 테이블에 저장되며 GET /api/jobs/{id} 로 조회한다.
+"""
+from app.jobs.registry import register, THREAD, PROCESS
+from app.jobs.context import JobContext, JobCancelled
+from app.jobs.backend import JobBackend, LocalJobBackend, get_backend, set_backend
+
+__all__ = [
+    "register", "THREAD", "PROCESS",
+    "JobContext", "JobCancelled",
+    "JobBackend", "LocalJobBackend", "get_backend", "set_backend",
+]
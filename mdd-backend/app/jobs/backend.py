@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from threading import Lock
+from typing import Optional
+from uuid import UUID
+import multiprocessing
+from app.config import get_settings
+from app.jobs.registry import PROCESS
+from app.jobs.runner import run_job
+
+settings = get_settings()
+
+
+class JobBackend(ABC):
+    """작업 실행 백엔드 인터페이스
+
+    외부 브로커(Celery, RQ 등)를 붙이려면 submit 에서 job_id 를 큐에 넣고,
+    브로커 워커에서 app.jobs.runner.run_job(job_id) 를 호출하는 백엔드를 구현해
+    set_backend 로 교체한다. 작업 상태는 모두 jobs 테이블에 있으므로 API 는 그대로 동작한다.
+    """
+    
+    @abstractmethod
+    def submit(self, job_id: UUID, executor: str) -> None:
+        """job_id 작업 실행 예약 (executor: app.jobs.registry.THREAD / PROCESS)"""
+    
+    def shutdown(self) -> None:
+        pass
+
+
+class LocalJobBackend(JobBackend):
+    """프로세스 내 실행 백엔드 (외부 브로커 없음)
+
+    I/O 위주 작업은 스레드 풀, CPU 위주 작업은 프로세스 풀에서 실행한다. 풀은 처음 필요할 때 만든다.
+    프로세스 풀은 부모의 DB 커넥션을 물려받지 않도록 spawn 방식으로 시작한다.
+    """
+    
+    def __init__(self, thread_workers: int, process_workers: int):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self._threads: Optional[Executor] = None
+        self._processes: Optional[Executor] = None
+        self._lock = Lock()
+    
+    def _pool(self, executor: str) -> Executor:
+        with self._lock:
+            if executor == PROCESS:
+                if self._processes is None:
+                    self._processes = ProcessPoolExecutor(
+                        max_workers=self.process_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                return self._processes
+            
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.thread_workers, thread_name_prefix="job")
+            return self._threads
+    
+    def submit(self, job_id: UUID, executor: str) -> None:
+        self._pool(executor).submit(run_job, str(job_id))
+    
+    def shutdown(self) -> None:
+        with self._lock:
+            for pool in (self._threads, self._processes):
+                if pool is not None:
+                    pool.shutdown(wait=False, cancel_futures=True)
+            self._threads = self._processes = None
+
+
+_backend: Optional[JobBackend] = None
+
+
+def get_backend() -> JobBackend:
+    """현재 작업 실행 백엔드 (기본: LocalJobBackend)"""
+    global _backend
+    if _backend is None:
+        _backend = LocalJobBackend(settings.JOB_THREAD_WORKERS, settings.JOB_PROCESS_WORKERS)
+    return _backend
+
+
+def set_backend(backend: JobBackend) -> None:
+    """작업 실행 백엔드 교체"""
+    global _backend
+    if _backend is not None:
+        _backend.shutdown()
+    _backend = backend
@@ -0,0 +1,43 @@
+from sqlalchemy.orm import Session
+from app.database import shard_session
+from app.models.job import Job
+from typing import Optional
+from uuid import UUID
+
+
+class JobCancelled(Exception):
+    """작업 취소 요청으로 중단"""
+    pass
+
+
+class JobContext:
+    """작업 처리 함수에 전달되는 실행 정보
+
+    db 는 작업 전용 세션(사용자 샤드)이다. 진행률 / 취소 확인은 같은 샤드의 별도 짧은 세션으로 커밋하므로
+    작업 도중의 변경 사항이 진행률 기록과 함께 커밋되지 않는다.
+    """
+    
+    def __init__(self, job_id: UUID, user_id: UUID, db: Session):
+        self.job_id = job_id
+        self.user_id = user_id
+        self.db = db
+        self.shard = db.info.get("shard", 0)
+    
+    def progress(self, fraction: float, message: Optional[str] = None) -> None:
+        """진행률 기록 (0.0 ~ 1.0), 취소 요청이 있으면 JobCancelled"""
+        with shard_session(self.shard) as session:
+            values = {Job.progress: min(max(fraction, 0.0), 1.0)}
+            if message is not None:
+                values[Job.message] = message[:200]
+            session.query(Job).filter(Job.id == self.job_id).update(values, synchronize_session=False)
+            session.commit()
+        
+        self.check_cancelled()
+    
+    def check_cancelled(self) -> None:
+        """취소 요청이 있으면 JobCancelled"""
+        with shard_session(self.shard) as session:
+            cancelled = session.query(Job.cancel_requested).filter(Job.id == self.job_id).scalar()
+        
+        if cancelled:
+            raise JobCancelled()
@@ -0,0 +1,68 @@
+"""기본 제공 작업"""
+from app.models.entry import Entry
+from app.models.transaction import Transaction
+from app.schemas.entry import EntryResponse
+from app.schemas.transaction import TransactionResponse
+from app.services.budget_service import BudgetService
+from app.jobs.registry import register, THREAD
+from app.jobs.context import JobContext
+from app.config import get_settings
+from datetime import date
+from pathlib import Path
+from typing import Any
+import json
+
+settings = get_settings()
+
+# 한 번에 읽어 올 행 수 (진행률 기록 단위)
+EXPORT_BATCH_SIZE = 500
+
+
+def result_path(job_id) -> Path:
+    """작업 결과 파일 경로"""
+    return Path(settings.JOB_RESULT_DIR) / f"{job_id}.json"
+
+
+@register("export", executor=THREAD, public=True)
+def export_user_data(ctx: JobContext, params: dict[str, Any]) -> dict[str, Any]:
+    """사용자의 일기 / 거래 전체를 JSON 파일로 내보내기"""
+    db = ctx.db
+    entries = db.query(Entry).filter(Entry.user_id == ctx.user_id).order_by(Entry.date, Entry.id)
+    transactions = db.query(Transaction).filter(Transaction.user_id == ctx.user_id).order_by(Transaction.date, Transaction.id)
+    total = max(entries.count() + transactions.count(), 1)
+    
+    path = result_path(ctx.job_id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    
+    done = 0
+    counts = {}
+    try:
+        with tmp_path.open("w", encoding="utf-8") as f:
+            f.write("{")
+            for index, (key, query, schema) in enumerate([
+                ("entries", entries, EntryResponse),
+                ("transactions", transactions, TransactionResponse),
+            ]):
+                f.write(("," if index else "") + json.dumps(key) + ":[")
+                counts[key] = 0
+                for row in query.yield_per(EXPORT_BATCH_SIZE):
+                    f.write(("," if counts[key] else "") + schema.model_validate(row).model_dump_json())
+                    counts[key] += 1
+                    done += 1
+                    if done % EXPORT_BATCH_SIZE == 0:
+                        ctx.progress(done / total, f"{done}/{total}")
+                f.write("]")
+            f.write("}")
+        tmp_path.replace(path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    
+    return {"file": path.name, **counts}
+
+
+@register("budget_reconcile", executor=THREAD)
+def reconcile_budgets(ctx: JobContext, params: dict[str, Any]) -> dict[str, Any]:
+    """사용자의 예산 지출 카운터를 거래 원본으로 다시 맞춤 (params.since: 이 달부터만)"""
+    since = date.fromisoformat(params["since"]) if params.get("since") else None
+    return {"corrected": BudgetService.reconcile(ctx.db, ctx.user_id, since)}
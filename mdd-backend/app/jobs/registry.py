@@ -0,0 +1,59 @@
+from typing import Any, Callable, Optional
+import importlib
+
+# 실행 풀 종류
+THREAD = "thread"  # I/O 위주 작업 (DB 조회, 파일 쓰기)
+PROCESS = "process"  # CPU 위주 작업 (GIL 회피)
+
+# 기본 제공 작업 모듈 (프로세스 풀 워커에서도 import 시 등록됨)
+BUILTIN_MODULES = ("app.jobs.handlers",)
+
+
+class JobDefinition:
+    """작업 종류 정의"""
+    
+    def __init__(self, kind: str, func: Callable[..., Optional[dict[str, Any]]], executor: str, public: bool):
+        self.kind = kind
+        self.func = func
+        self.executor = executor
+        self.public = public
+
+
+_definitions: dict[str, JobDefinition] = {}
+_loaded = False
+
+
+def register(kind: str, executor: str = THREAD, public: bool = False):
+    """작업 처리 함수 등록 데코레이터
+
+    처리 함수는 (ctx: JobContext, params: dict) -> Optional[dict] 형태의 모듈 수준 함수여야 한다
+    (프로세스 풀에서 이름으로 다시 찾기 때문). public=True 인 작업만 API 로 생성할 수 있다.
+    """
+    if executor not in (THREAD, PROCESS):
+        raise ValueError(f"지원하지 않는 실행 풀입니다: {executor}")
+    
+    def decorator(func):
+        _definitions[kind] = JobDefinition(kind, func, executor, public)
+        return func
+    
+    return decorator
+
+
+def _load_builtins() -> None:
+    global _loaded
+    if not _loaded:
+        for module in BUILTIN_MODULES:
+            importlib.import_module(module)
+        _loaded = True
+
+
+def get_definition(kind: str) -> Optional[JobDefinition]:
+    """작업 종류 정의 조회 (없으면 None)"""
+    _load_builtins()
+    return _definitions.get(kind)
+
+
+def public_kinds() -> list[str]:
+    """API 로 생성 가능한 작업 종류"""
+    _load_builtins()
+    return sorted(kind for kind, definition in _definitions.items() if definition.public)
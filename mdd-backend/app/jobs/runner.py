@@ -0,0 +1,136 @@
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+from app.config import get_settings
+from app.database import shard_engines, shard_session
+from app.models.job import Job, JobStatus
+from app.jobs.registry import get_definition
+from app.jobs.context import JobContext, JobCancelled
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+from uuid import UUID
+import logging
+import os
+import socket
+import threading
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+
+def worker_id() -> str:
+    """이 프로세스의 워커 식별자 (호스트:pid)"""
+    return f"{socket.gethostname()}:{os.getpid()}"[:100]
+
+
+def _heartbeat(job_id: UUID, shard: int, stop: threading.Event, interval: float) -> None:
+    """작업이 끝날 때까지 interval 초마다 heartbeat_at 갱신 (작업과 같은 프로세스의 스레드)"""
+    while not stop.wait(interval):
+        try:
+            with shard_session(shard) as db:
+                db.query(Job).filter(Job.id == job_id, Job.status == JobStatus.RUNNING).update(
+                    {Job.heartbeat_at: func.now()}, synchronize_session=False
+                )
+                db.commit()
+        except SQLAlchemyError:
+            logger.warning("job %s heartbeat failed", job_id, exc_info=True)
+
+
+def _finish(
+    job_id: UUID,
+    status: JobStatus,
+    result: Optional[dict[str, Any]] = None,
+    error: Optional[str] = None,
+    shard: int = 0
+) -> None:
+    with shard_session(shard) as db:
+        values = {Job.status: status, Job.finished_at: func.now(), Job.result: result, Job.error: error}
+        if status == JobStatus.SUCCEEDED:
+            values[Job.progress] = 1.0
+        db.query(Job).filter(Job.id == job_id).update(values, synchronize_session=False)
+        db.commit()
+
+
+def run_job(job_id: str) -> None:
+    """작업 하나 실행 (스레드 / 프로세스 풀 / 외부 워커 공통 진입점)
+
+    PENDING 상태인 작업만 RUNNING 으로 바꿔 실행하므로 같은 작업이 두 번 제출돼도 한 번만 실행된다.
+    작업은 사용자와 같은 샤드에 있으므로 샤드를 차례로 확인한다. 실행하는 동안 JOB_HEARTBEAT_SECONDS 마다
+    heartbeat_at 을 갱신해 다른 워커의 복구(recover_jobs)가 실행 중인 작업으로 알 수 있게 한다.
+    """
+    job_id = UUID(str(job_id))
+    
+    for shard in range(len(shard_engines)):
+        with shard_session(shard) as db:
+            claimed = db.query(Job).filter(
+                Job.id == job_id,
+                Job.status == JobStatus.PENDING,
+                Job.cancel_requested.is_(False)
+            ).update({
+                Job.status: JobStatus.RUNNING,
+                Job.started_at: func.now(),
+                Job.worker_id: worker_id(),
+                Job.heartbeat_at: func.now()
+            }, synchronize_session=False)
+            db.commit()
+            if claimed:
+                job = db.query(Job.kind, Job.user_id, Job.params).filter(Job.id == job_id).one()
+                break
+    else:
+        return
+    
+    definition = get_definition(job.kind)
+    if definition is None:
+        _finish(job_id, JobStatus.FAILED, error=f"등록되지 않은 작업 종류입니다: {job.kind}", shard=shard)
+        return
+    
+    stop = threading.Event()
+    threading.Thread(
+        target=_heartbeat, args=(job_id, shard, stop, settings.JOB_HEARTBEAT_SECONDS),
+        name=f"job-heartbeat-{job_id}", daemon=True
+    ).start()
+    try:
+        with shard_session(shard) as db:
+            result = definition.func(JobContext(job_id, job.user_id, db), job.params or {})
+    except JobCancelled:
+        _finish(job_id, JobStatus.CANCELLED, shard=shard)
+    except Exception as e:
+        logger.exception("job %s (%s) failed", job_id, job.kind)
+        _finish(job_id, JobStatus.FAILED, error=f"{type(e).__name__}: {e}"[:2000], shard=shard)
+    else:
+        _finish(job_id, JobStatus.SUCCEEDED, result=result, shard=shard)
+    finally:
+        stop.set()
+
+
+def recover_jobs(backend, stale_after: timedelta) -> tuple[int, int]:
+    """서버 시작 시 남아 있는 작업 정리 -> (다시 제출한 작업 수, 실패 처리한 작업 수)
+
+    PENDING 작업은 다시 제출하고, RUNNING 작업 중 heartbeat 가 stale_after 보다 오래 갱신되지 않은 작업은
+    실행하던 워커가 중단된 것으로 보고 실패 처리한다. 다른 워커에서 실행 중인 작업은 heartbeat 가 계속
+    갱신되므로 그대로 둔다 (heartbeat 가 없는 작업은 started_at 기준).
+    """
+    resubmitted = stale = 0
+    for shard in range(len(shard_engines)):
+        with shard_session(shard) as db:
+            stale += db.query(Job).filter(
+                Job.status == JobStatus.RUNNING,
+                func.coalesce(Job.heartbeat_at, Job.started_at) < datetime.now(timezone.utc) - stale_after
+            ).update({
+                Job.status: JobStatus.FAILED,
+                Job.finished_at: func.now(),
+                Job.error: "작업이 중단되었습니다 (실행하던 워커 응답 없음)"
+            }, synchronize_session=False)
+            db.commit()
+            
+            pending = db.query(Job.id, Job.kind).filter(Job.status == JobStatus.PENDING).all()
+        
+        for job_id, kind in pending:
+            definition = get_definition(kind)
+            if definition is None:
+                _finish(job_id, JobStatus.FAILED, error=f"등록되지 않은 작업 종류입니다: {kind}", shard=shard)
+                continue
+            backend.submit(job_id, definition.executor)
+            resubmitted += 1
+    
+    return resubmitted, stale
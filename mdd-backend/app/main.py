@@ -1,8 +1,17 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.config import get_settings
-from app.database import engine, Base
-from app.api import auth, entries, transactions, stats
+from app.api import auth, entries, transactions, stats, calendar, jobs, reports, recurring, budgets, admin
+from app.middleware import (
+    AdmissionMiddleware, TracingMiddleware, ProfilingMiddleware, QueryMonitorMiddleware, CompressionMiddleware,
+    configure as configure_admission
+)
+from app.utils import tracing, profiling, query_monitor
+from app.utils.readiness import check_readiness, start_pool_warmup, start_job_recovery
+from app.jobs.backend import get_backend
+from app.jobs.runner import recover_jobs
+from datetime import timedelta
 
 settings = get_settings()
 
@@ -13,6 +22,36 @@ app = FastAPI(
     version="1.0.0"
 )
 
+# 요청 수용 제어 (CORS 보다 안쪽에 두어 503 응답에도 CORS 헤더가 붙도록)
+if settings.ADMISSION_CONTROL_ENABLED:
+    configure_admission(settings.ADMISSION_LIMITS)
+    app.add_middleware(AdmissionMiddleware)
+
+# 느린 쿼리 로그 / N+1 의심 경고
+query_monitor.instrument_sqlalchemy()
+app.add_middleware(QueryMonitorMiddleware)
+
+# 요청 프로파일링 (X-Profile: 1 또는 PROFILE_SLOW_REQUEST_MS)
+profiling.instrument_fastapi()
+app.add_middleware(ProfilingMiddleware)
+
+# 응답 압축 (압축 시간도 추적되도록 요청 추적 안쪽)
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        offload_size=settings.COMPRESSION_OFFLOAD_SIZE,
+        exclude_paths=settings.COMPRESSION_EXCLUDE_PATHS,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        zstd_level=settings.COMPRESSION_ZSTD_LEVEL
+    )
+
+# 요청 추적 (수용 제어 대기 시간까지 포함하도록 바깥쪽)
+tracing.instrument_fastapi()
+tracing.instrument_sqlalchemy()
+app.add_middleware(TracingMiddleware)
+
 # CORS 설정
 app.add_middleware(
     CORSMiddleware,
@@ -27,14 +66,32 @@ app.include_router(auth.router)
 app.include_router(entries.router)
 app.include_router(transactions.router)
 app.include_router(stats.router)
+app.include_router(calendar.router)
+app.include_router(jobs.router)
+app.include_router(reports.router)
+app.include_router(recurring.router)
+app.include_router(budgets.router)
+app.include_router(admin.router)
 
 
 @app.on_event("startup")
 async def startup_event():
-    """애플리케이션 시작 시 실행"""
-    # 테이블 생성 (개발 환경에서만 사용, 프로덕션에서는 Alembic 사용)
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database tables created")
+    """애플리케이션 시작 시 실행
+    
+    스키마(alembic upgrade head)와 파티션(app.commands.partitions)은 배포 단계에서 한 번 맞추고,
+    워커는 DDL / 리플렉션 없이 바로 요청을 받는다. 준비 상태는 /ready 로 확인한다.
+    """
+    # 커넥션 풀 예열 (백그라운드)
+    start_pool_warmup()
+    
+    # 이전 실행에서 남은 백그라운드 작업 정리 (백그라운드, DB 에 연결될 때까지 재시도)
+    start_job_recovery(lambda: recover_jobs(get_backend(), timedelta(minutes=settings.JOB_STALE_AFTER_MINUTES)))
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 실행"""
+    get_backend().shutdown()
 
 
 @app.get("/")
@@ -49,6 +106,16 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
+    """헬스 체크 엔드포인트 (프로세스 생존 여부)"""
     return {"status": "healthy"}
 
+
+@app.get("/ready")
+def readiness_check():
+    """준비 상태 확인 엔드포인트 (스키마 버전, 커넥션 풀 예열, 작업 복구) - 준비 전에는 503"""
+    ready, detail = check_readiness()
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", **detail}
+    )
+
@@ -0,0 +1,7 @@
+from app.middleware.admission import AdmissionMiddleware, ConcurrencyLimiter, configure, admission_stats
+from app.middleware.tracing import TracingMiddleware, is_admin_request
+from app.middleware.profiling import ProfilingMiddleware
+from app.middleware.query_monitor import QueryMonitorMiddleware
+from app.middleware.compression import CompressionMiddleware
+
+__all__ = ["AdmissionMiddleware", "ConcurrencyLimiter", "configure", "admission_stats", "TracingMiddleware", "is_admin_request", "ProfilingMiddleware", "QueryMonitorMiddleware", "CompressionMiddleware"]
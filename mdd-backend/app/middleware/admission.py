@@ -0,0 +1,165 @@
+"""경로 그룹별 요청 수용 제어 (admission control)
+
+비싼 경로(통계 집계, 일기+거래 일괄 생성, 인증)가 워커 스레드와 DB 커넥션 풀을 모두 차지해
+가벼운 요청까지 느려지지 않도록 그룹마다 동시 실행 수와 대기열 길이를 제한한다.
+
+- 동시 실행 수에 여유가 있으면 바로 실행한다.
+- 여유가 없으면 대기열에서 기다리고, timeout 초 안에 차례가 오지 않으면 503 으로 거절한다.
+- 대기열도 가득 차 있으면 기다리지 않고 바로 503 + Retry-After 로 거절한다.
+
+제한은 프로세스(uvicorn 워커) 단위이며, 그룹에 속하지 않는 경로는 제한하지 않는다.
+"""
+import asyncio
+import math
+import re
+from collections import deque
+from typing import Any, Optional
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.utils.tracing import span
+
+# (그룹 이름, 메서드 (None: 전체), 경로 정규식) - 먼저 일치하는 그룹 적용
+ROUTE_GROUPS: list[tuple[str, Optional[str], re.Pattern]] = [
+    ("stats", None, re.compile(r"^/api/(stats|reports|calendar)(/|$)")),
+    ("bulk_write", "POST", re.compile(r"^/api/entries/with-transactions$")),
+    ("auth", "POST", re.compile(r"^/api/auth/(login|signup)$")),
+]
+
+
+class Overloaded(Exception):
+    """수용 한도 초과"""
+
+
+class ConcurrencyLimiter:
+    """동시 실행 수 + 대기열 길이 + 대기 시간 제한
+
+    이벤트 루프 안에서만 사용하므로 별도 잠금 없이 상태를 바꾼다.
+    """
+    
+    def __init__(self, name: str, concurrency: int, queue: int, timeout: float):
+        self.name = name
+        self.concurrency = concurrency
+        self.queue_size = queue
+        self.timeout = timeout
+        self.active = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        # 누적 카운터
+        self.admitted = 0  # 실행된 요청 (대기 후 실행 포함)
+        self.queued = 0  # 대기열에 들어간 요청
+        self.shed = 0  # 대기열이 가득 차 바로 거절된 요청
+        self.timed_out = 0  # 대기 시간 초과로 거절된 요청
+    
+    @property
+    def retry_after(self) -> int:
+        """거절 응답의 Retry-After (초)"""
+        return max(1, math.ceil(self.timeout))
+    
+    async def acquire(self) -> None:
+        """실행 슬롯 획득 (실패 시 Overloaded)"""
+        if self.active < self.concurrency and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        
+        if len(self._waiters) >= self.queue_size:
+            self.shed += 1
+            raise Overloaded(self.name)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # 시간 초과와 동시에 슬롯을 넘겨받은 경우 다음 대기자에게 양보
+                self.release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.timed_out += 1
+            raise Overloaded(self.name)
+        self.admitted += 1
+    
+    def release(self) -> None:
+        """실행 슬롯 반환 (대기자가 있으면 슬롯을 그대로 넘김)"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+    
+    def stats(self) -> dict[str, Any]:
+        """현재 상태와 누적 카운터"""
+        return {
+            "concurrency": self.concurrency,
+            "queue_size": self.queue_size,
+            "timeout": self.timeout,
+            "active": self.active,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "shed": self.shed,
+            "timed_out": self.timed_out,
+        }
+
+
+_limiters: dict[str, ConcurrencyLimiter] = {}
+
+
+def configure(limits: dict[str, dict[str, float]]) -> None:
+    """그룹별 제한 설정 ({"stats": {"concurrency": 4, "queue": 16, "timeout": 2.0}, ...})"""
+    _limiters.clear()
+    for name, limit in limits.items():
+        _limiters[name] = ConcurrencyLimiter(
+            name, int(limit["concurrency"]), int(limit["queue"]), float(limit["timeout"])
+        )
+
+
+def admission_stats() -> dict[str, dict[str, Any]]:
+    """그룹별 수용 제어 상태"""
+    return {name: limiter.stats() for name, limiter in _limiters.items()}
+
+
+def _match(method: str, path: str) -> Optional[ConcurrencyLimiter]:
+    for name, group_method, pattern in ROUTE_GROUPS:
+        if (group_method is None or group_method == method) and pattern.match(path):
+            return _limiters.get(name)
+    return None
+
+
+class AdmissionMiddleware:
+    """요청 수용 제어 ASGI 미들웨어 (설정은 configure 참고)"""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+        
+        limiter = _match(scope["method"], scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+        
+        try:
+            with span("admission", group=limiter.name):
+                await limiter.acquire()
+        except Overloaded:
+            response = JSONResponse(
+                status_code=503,
+                content={"detail": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해 주세요"},
+                headers={"Retry-After": str(limiter.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+        
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
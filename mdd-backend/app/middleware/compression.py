@@ -0,0 +1,189 @@
+"""응답 압축 ASGI 미들웨어 (Accept-Encoding 협상)
+
+- 지원 인코딩: gzip(기본), br(brotli 패키지 설치 시), zstd(zstandard 패키지 설치 시).
+  클라이언트 q 값이 같으면 zstd > br > gzip 순으로 고른다.
+- COMPRESSION_MIN_SIZE 보다 작은 응답, 압축 대상이 아닌 Content-Type, 이미 Content-Encoding 이 있는 응답,
+  Cache-Control: no-transform 응답, 여러 조각으로 나눠 보내는 스트리밍 응답(파일 다운로드 등)은 그대로 보낸다.
+- 경로 단위 제외는 COMPRESSION_EXCLUDE_PATHS(정규식), 엔드포인트 단위 제외는 응답에
+  Content-Encoding: identity 헤더를 설정한다.
+- COMPRESSION_OFFLOAD_SIZE 이상인 본문은 이벤트 루프를 막지 않도록 스레드 풀에서 압축한다.
+- 압축한 응답의 ETag 는 약한 ETag(W/)로 바꾼다 (If-None-Match 는 약한 비교이므로 304 는 그대로 동작).
+"""
+import gzip
+import re
+from typing import Callable, Iterable, Optional
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.utils.tracing import span
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# 압축할 Content-Type (세미콜론 앞 부분)
+COMPRESSIBLE_TYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+}
+COMPRESSIBLE_PREFIXES = ("text/",)
+
+# 같은 q 값이면 앞에 있는 인코딩 선택
+PREFERENCE = ("zstd", "br", "gzip")
+
+
+def available_encodings() -> list[str]:
+    """이 프로세스에서 사용할 수 있는 인코딩 (선호 순)"""
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return [encoding for encoding in PREFERENCE if installed[encoding]]
+
+
+def negotiate(accept_encoding: str, encodings: Iterable[str]) -> Optional[str]:
+    """Accept-Encoding 헤더와 서버 인코딩(선호 순)으로 응답 인코딩 결정 (압축 안 함: None)"""
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name] = q
+    
+    best, best_q = None, 0.0
+    for encoding in encodings:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def make_compressor(encoding: str, gzip_level: int, brotli_quality: int, zstd_level: int) -> Callable[[bytes], bytes]:
+    """인코딩별 압축 함수"""
+    if encoding == "gzip":
+        return lambda body: gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    if encoding == "br":
+        return lambda body: brotli.compress(body, quality=brotli_quality)
+    if encoding == "zstd":
+        # ZstdCompressor 는 스레드 간 공유하지 않음
+        return lambda body: zstandard.ZstdCompressor(level=zstd_level).compress(body)
+    raise ValueError(f"지원하지 않는 인코딩입니다: {encoding}")
+
+
+def is_compressible(status: int, headers: Headers) -> bool:
+    """압축 대상 응답인지 (본문 크기 제외)"""
+    if status < 200 or status in (204, 304):
+        return False
+    if "content-encoding" in headers:
+        return False
+    if "no-transform" in headers.get("cache-control", "").lower():
+        return False
+    content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+    return content_type in COMPRESSIBLE_TYPES or content_type.startswith(COMPRESSIBLE_PREFIXES)
+
+
+class CompressionMiddleware:
+    """응답 압축 미들웨어"""
+    
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        offload_size: int = 65536,
+        exclude_paths: Iterable[str] = (),
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        zstd_level: int = 3
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.offload_size = offload_size
+        self.exclude_paths = [re.compile(pattern) for pattern in exclude_paths]
+        self.encodings = available_encodings()
+        self.compressors = {
+            encoding: make_compressor(encoding, gzip_level, brotli_quality, zstd_level)
+            for encoding in self.encodings
+        }
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or any(pattern.match(scope["path"]) for pattern in self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        encoding = negotiate(accept_encoding, self.encodings) if accept_encoding else None
+        responder = _CompressionResponder(self, send, encoding)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """응답 하나의 시작 메시지를 본문이 올 때까지 보류했다가 압축 여부를 정함"""
+    
+    def __init__(self, middleware: CompressionMiddleware, send: Send, encoding: Optional[str]):
+        self.middleware = middleware
+        self._send = send
+        self.encoding = encoding
+        self.start: Optional[Message] = None
+        self.started = False
+    
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.started:
+            await self._send(message)
+            return
+        
+        self.started = True
+        start = self.start
+        headers = MutableHeaders(scope=start)
+        if not is_compressible(start["status"], headers):
+            await self._send(start)
+            await self._send(message)
+            return
+        
+        # 인코딩에 따라 표현이 달라지므로 압축하지 않은 응답에도 Vary 추가
+        headers.add_vary_header("Accept-Encoding")
+        
+        body = message.get("body", b"")
+        if self.encoding is None or message.get("more_body", False) or len(body) < self.middleware.minimum_size:
+            await self._send(start)
+            await self._send(message)
+            return
+        
+        compress = self.middleware.compressors[self.encoding]
+        with span("compress", encoding=self.encoding, size=len(body)) as attributes:
+            if len(body) >= self.middleware.offload_size:
+                compressed = await anyio.to_thread.run_sync(compress, body)
+            else:
+                compressed = compress(body)
+            if attributes is not None:
+                attributes["compressed_size"] = len(compressed)
+        
+        if len(compressed) >= len(body):
+            await self._send(start)
+            await self._send(message)
+            return
+        
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = "W/" + etag
+        
+        await self._send(start)
+        await self._send({"type": "http.response.body", "body": compressed})
@@ -0,0 +1,48 @@
+"""요청 프로파일링 ASGI 미들웨어 (app.utils.profiling 참고)
+
+- 요청 시: 운영용 토큰(X-Admin-Token)과 함께 X-Profile: 1 을 보내면 그 요청을 프로파일링해 저장하고
+  응답에 X-Profile-Id 헤더를 붙인다 (/api/admin/profiles/{id} 로 조회).
+- 자동: PROFILE_SLOW_REQUEST_MS 가 설정되어 있으면 모든 요청을 샘플링하고,
+  그 시간 이상 걸린 요청의 프로파일만 저장한다.
+"""
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.middleware.tracing import is_admin_request
+from app.utils.profiling import start_profile, stop_profile, save_profile, get_slow_request_ms
+
+
+class ProfilingMiddleware:
+    """요청 단위 샘플링 프로파일링 미들웨어"""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = dict(scope["headers"])
+        on_demand = headers.get(b"x-profile") == b"1" and is_admin_request(headers)
+        slow_request_ms = get_slow_request_ms()
+        if not on_demand and slow_request_ms is None:
+            await self.app(scope, receive, send)
+            return
+        
+        profile, token = start_profile(
+            "on_demand" if on_demand else "slow", method=scope["method"], path=scope["path"]
+        )
+        
+        async def send_with_profile_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                profile.attributes["status"] = message["status"]
+                if on_demand:
+                    message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile.id.encode())]
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            stop_profile(profile, token)
+            if on_demand or profile.duration_ms >= slow_request_ms:
+                await run_in_threadpool(save_profile, profile)
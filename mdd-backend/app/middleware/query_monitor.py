@@ -0,0 +1,21 @@
+"""요청별 SQL 기록 ASGI 미들웨어 (app.utils.query_monitor 참고)
+
+반복 쿼리 경고(QUERY_REPEAT_THRESHOLD)나 collect_queries() 가 켜져 있을 때만 요청마다 기록을 만든다.
+"""
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.utils.query_monitor import is_active, request_scope
+
+
+class QueryMonitorMiddleware:
+    """요청 단위 SQL 기록 미들웨어"""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not is_active():
+            await self.app(scope, receive, send)
+            return
+        
+        with request_scope(f"{scope['method']} {scope['path']}"):
+            await self.app(scope, receive, send)
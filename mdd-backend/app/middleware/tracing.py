@@ -0,0 +1,62 @@
+"""요청 추적 ASGI 미들웨어 (app.utils.tracing 참고)
+
+TRACE_SAMPLE_RATE 비율로 요청을 샘플링한다. 운영용 토큰(X-Admin-Token)과 함께 X-Trace: 1 을 보내면
+샘플링과 관계없이 추적한다. W3C traceparent 헤더가 있으면 그 trace id 를 이어서 쓰고,
+추적한 요청의 응답에는 X-Trace-Id 헤더를 붙인다.
+"""
+import hmac
+import re
+from typing import Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.config import get_settings
+from app.utils.tracing import should_sample, start_trace, finish_trace, span
+
+settings = get_settings()
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-[0-9a-f]{16}-[0-9a-f]{2}$")
+
+
+def is_admin_request(headers: dict[bytes, bytes]) -> bool:
+    """X-Admin-Token 이 ADMIN_TOKEN 과 일치하는지"""
+    token = headers.get(b"x-admin-token")
+    return bool(settings.ADMIN_TOKEN) and token is not None and hmac.compare_digest(
+        token, settings.ADMIN_TOKEN.encode()
+    )
+
+
+def _incoming_trace_id(headers: dict[bytes, bytes]) -> Optional[str]:
+    match = _TRACEPARENT.match(headers.get(b"traceparent", b"").decode("latin-1"))
+    return match.group(1) if match else None
+
+
+class TracingMiddleware:
+    """샘플링된 요청에 Trace 를 만들고 request span 으로 감싸는 미들웨어"""
+    
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        headers = dict(scope["headers"])
+        forced = headers.get(b"x-trace") == b"1" and is_admin_request(headers)
+        if not forced and not should_sample():
+            await self.app(scope, receive, send)
+            return
+        
+        trace, token = start_trace(_incoming_trace_id(headers), method=scope["method"], path=scope["path"])
+        
+        async def send_with_trace_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                trace.attributes["status"] = message["status"]
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(b"x-trace-id", trace.trace_id.encode())]
+            await send(message)
+        
+        try:
+            with span("request", method=scope["method"], path=scope["path"]):
+                await self.app(scope, receive, send_with_trace_id)
+        finally:
+            finish_trace(trace, token)
@@ -1,6 +1,12 @@
 from app.models.user import User
 from app.models.entry import Entry
 from app.models.transaction import Transaction
+from app.models.category import Category
+from app.models.payment_method import PaymentMethod
+from app.models.job import Job
+from app.models.report import ReportSnapshot
+from app.models.recurring_rule import RecurringRule
+from app.models.budget import Budget, CategorySpend
+from app.models.user_directory import UserDirectory
 
-__all__ = ["User", "Entry", "Transaction"]
-
+__all__ = ["User", "Entry", "Transaction", "Category", "PaymentMethod", "Job", "ReportSnapshot", "RecurringRule", "Budget", "CategorySpend", "UserDirectory"]
@@ -0,0 +1,49 @@
+from sqlalchemy import Column, Integer, BigInteger, Date, DateTime, ForeignKey, UniqueConstraint, Uuid
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Budget(Base):
+    """카테고리별 월 예산"""
+    
+    __tablename__ = "budgets"
+    __table_args__ = (
+        UniqueConstraint("user_id", "category_id", name="uq_budgets_user_category"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), nullable=False)
+    amount_minor = Column(BigInteger, nullable=False)  # 월 한도 (최소 화폐 단위 정수)
+    warning_percent = Column(Integer, nullable=False, server_default="80")  # 이 비율 이상 쓰면 경고
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    category_ref = relationship("Category", lazy="joined")
+    
+    @property
+    def category(self) -> str:
+        """카테고리 이름"""
+        return self.category_ref.name
+    
+    def __repr__(self):
+        return f"<Budget(user_id={self.user_id}, category_id={self.category_id}, amount_minor={self.amount_minor})>"
+
+
+class CategorySpend(Base):
+    """(사용자, 카테고리, 월) 지출 합계 카운터
+
+    거래를 쓰는 트랜잭션 안에서 증감하며 (app.services.budget_service 참고),
+    원본과 어긋난 값은 reconcile 로 바로잡는다.
+    """
+    
+    __tablename__ = "category_monthly_spend"
+    
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    category_id = Column(Integer, ForeignKey("categories.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(Date, primary_key=True)  # 월의 1일
+    spent_minor = Column(BigInteger, nullable=False, server_default="0")
+    
+    def __repr__(self):
+        return f"<CategorySpend(user_id={self.user_id}, category_id={self.category_id}, month={self.month}, spent_minor={self.spent_minor})>"
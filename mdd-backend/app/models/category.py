@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Uuid
+from app.database import Base
+
+
+class Category(Base):
+    """거래 카테고리 사전 (사용자별)"""
+    
+    __tablename__ = "categories"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_categories_user_name"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    name = Column(String(100), nullable=False)  # 식비, 교통비, 급여, etc.
+    
+    def __repr__(self):
+        return f"<Category(id={self.id}, name={self.name})>"
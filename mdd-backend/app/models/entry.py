@@ -1,24 +1,27 @@
-from sqlalchemy import Column, String, Text, Date, DateTime, ForeignKey, JSON
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, Text, Date, DateTime, ForeignKey, Index, JSON, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
 from app.database import Base
 
+PREVIEW_LENGTH = 200  # 목록용 content 미리보기 최대 길이
+
 
 class Entry(Base):
     """일상 기록 모델"""
     
     __tablename__ = "entries"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    date = Column(Date, nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, nullable=False)
     title = Column(String(200), nullable=True)
     content = Column(Text, nullable=True)
+    preview = Column(String(PREVIEW_LENGTH), nullable=True)  # content 앞부분 (목록 응답용)
     mood = Column(String(50), nullable=True)  # happy, sad, neutral, excited, tired, etc.
     photos = Column(JSON, default=list)  # List of photo URLs
     tags = Column(JSON, default=list)  # List of tags
+    version = Column(Integer, nullable=False, default=0, server_default="0")  # 수정할 때마다 증가 (상세 ETag)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -29,3 +32,6 @@ class Entry(Base):
     def __repr__(self):
         return f"<Entry(id={self.id}, date={self.date}, title={self.title})>"
 
+
+# 목록 조회 (user_id 필터 + 최신순 정렬) 용 복합 인덱스
+Index("ix_entries_user_date", Entry.user_id, Entry.date.desc(), Entry.id)
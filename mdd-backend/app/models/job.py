@@ -0,0 +1,47 @@
+from sqlalchemy import Column, String, Text, Float, Boolean, DateTime, ForeignKey, Index, JSON, Uuid, Enum as SQLEnum
+from sqlalchemy.sql import func
+import uuid
+import enum
+from app.database import Base
+
+
+class JobStatus(str, enum.Enum):
+    """작업 상태"""
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+# 더 이상 바뀌지 않는 상태
+FINISHED_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class Job(Base):
+    """백그라운드 작업 모델 (app.jobs 참고)"""
+    
+    __tablename__ = "jobs"
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    kind = Column(String(50), nullable=False)  # 등록된 작업 종류 (export, ...)
+    status = Column(SQLEnum(JobStatus), nullable=False, default=JobStatus.PENDING)
+    params = Column(JSON, default=dict)
+    progress = Column(Float, nullable=False, default=0.0)  # 0.0 ~ 1.0
+    message = Column(String(200), nullable=True)  # 진행 상황 설명
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    worker_id = Column(String(100), nullable=True)  # 실행 중인 워커 (호스트:pid)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)  # 실행 중인 워커가 주기적으로 갱신
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    
+    def __repr__(self):
+        return f"<Job(id={self.id}, kind={self.kind}, status={self.status})>"
+
+
+Index("ix_jobs_user_created", Job.user_id, Job.created_at.desc())
+Index("ix_jobs_status", Job.status)
@@ -0,0 +1,18 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, UniqueConstraint, Uuid
+from app.database import Base
+
+
+class PaymentMethod(Base):
+    """결제 수단 사전 (사용자별)"""
+    
+    __tablename__ = "payment_methods"
+    __table_args__ = (
+        UniqueConstraint("user_id", "name", name="uq_payment_methods_user_name"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    name = Column(String(50), nullable=False)  # 현금, 카드, 계좌이체, etc.
+    
+    def __repr__(self):
+        return f"<PaymentMethod(id={self.id}, name={self.name})>"
@@ -0,0 +1,65 @@
+from sqlalchemy import Column, Integer, BigInteger, String, Date, DateTime, Boolean, ForeignKey, Index, Uuid, Enum as SQLEnum
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from typing import Optional
+import uuid
+import enum
+from app.database import Base
+from app.models.transaction import TransactionType
+
+
+class RecurrenceFrequency(str, enum.Enum):
+    """반복 주기 (interval 배수)"""
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+    CUSTOM = "custom"  # interval 일 간격
+
+
+class RecurringRule(Base):
+    """반복 거래 규칙 모델 (월세, 구독, 급여 등)
+
+    next_index / next_date 는 아직 만들지 않은 다음 발생 (app.services.recurring_service 참고).
+    """
+    
+    __tablename__ = "recurring_rules"
+    
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    type = Column(SQLEnum(TransactionType), nullable=False)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    amount_minor = Column(BigInteger, nullable=False)
+    description = Column(String(500), nullable=True)
+    payment_method_id = Column(Integer, ForeignKey("payment_methods.id"), nullable=True)
+    frequency = Column(SQLEnum(RecurrenceFrequency), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=True)
+    next_index = Column(Integer, nullable=False, default=0)
+    next_date = Column(Date, nullable=True)  # None: 종료됨
+    active = Column(Boolean, nullable=False, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Relationships
+    category_ref = relationship("Category", lazy="joined")
+    payment_method_ref = relationship("PaymentMethod", lazy="joined")
+    
+    @property
+    def category(self) -> str:
+        """카테고리 이름"""
+        return self.category_ref.name
+    
+    @property
+    def payment_method(self) -> Optional[str]:
+        """결제 수단 이름"""
+        return self.payment_method_ref.name if self.payment_method_ref else None
+    
+    def __repr__(self):
+        return f"<RecurringRule(id={self.id}, frequency={self.frequency}, interval={self.interval}, next_date={self.next_date})>"
+
+
+# 스케줄러가 만들 차례인 규칙 조회용
+Index("ix_recurring_rules_due", RecurringRule.active, RecurringRule.next_date)
+Index("ix_recurring_rules_user", RecurringRule.user_id)
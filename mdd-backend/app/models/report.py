@@ -0,0 +1,26 @@
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, UniqueConstraint, JSON, Uuid
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ReportSnapshot(Base):
+    """마감된 기간(월/연)의 리포트 스냅샷
+
+    한 번 만든 행은 수정하지 않는다. 마감된 기간에 소급 기록이 생기면 행을 삭제하고
+    다음 조회 때 새로 만든다 (app.services.report_service 참고).
+    """
+    
+    __tablename__ = "report_snapshots"
+    __table_args__ = (
+        UniqueConstraint("user_id", "period", "period_start", name="uq_report_snapshots_user_period"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    period = Column(String(10), nullable=False)  # month 또는 year
+    period_start = Column(Date, nullable=False)
+    data = Column(JSON, nullable=False)  # 금액은 최소 화폐 단위 정수
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<ReportSnapshot(user_id={self.user_id}, period={self.period}, period_start={self.period_start})>"
@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Numeric, Date, DateTime, ForeignKey, Enum as SQLEnum
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, BigInteger, String, Date, DateTime, ForeignKey, Index, Uuid, Enum as SQLEnum
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
+from typing import Optional
 import uuid
 import enum
 from app.database import Base
@@ -17,23 +17,55 @@ class Transaction(Base):
     """경제 기록 모델"""
     
     __tablename__ = "transactions"
+    __table_args__ = (
+        # date 기준 범위 파티셔닝 (파티션 생성은 app.utils.partitions 참고)
+        {"postgresql_partition_by": "RANGE (date)"},
+    )
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    entry_id = Column(UUID(as_uuid=True), ForeignKey("entries.id", ondelete="CASCADE"), nullable=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    date = Column(Date, nullable=False, index=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    entry_id = Column(Uuid, ForeignKey("entries.id", ondelete="CASCADE"), nullable=True)
+    user_id = Column(Uuid, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    date = Column(Date, primary_key=True)  # 파티션 키는 PK에 포함되어야 함
     type = Column(SQLEnum(TransactionType), nullable=False)
-    category = Column(String(100), nullable=False)  # 식비, 교통비, 급여, etc.
-    amount = Column(Numeric(12, 2), nullable=False)  # 최대 9,999,999,999.99
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=False)
+    amount_minor = Column(BigInteger, nullable=False)  # 최소 화폐 단위 정수 (CURRENCY_EXPONENT 참고)
     description = Column(String(500), nullable=True)
-    payment_method = Column(String(50), nullable=True)  # 현금, 카드, 계좌이체, etc.
+    payment_method_id = Column(Integer, ForeignKey("payment_methods.id"), nullable=True)
+    recurring_rule_id = Column(Uuid, ForeignKey("recurring_rules.id", ondelete="SET NULL"), nullable=True)
+    version = Column(Integer, nullable=False, default=0, server_default="0")  # 수정할 때마다 증가 (상세 ETag)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     user = relationship("User", back_populates="transactions")
     entry = relationship("Entry", back_populates="transactions")
+    category_ref = relationship("Category", lazy="joined")
+    payment_method_ref = relationship("PaymentMethod", lazy="joined")
+    
+    @property
+    def category(self) -> str:
+        """카테고리 이름"""
+        return self.category_ref.name
+    
+    @property
+    def payment_method(self) -> Optional[str]:
+        """결제 수단 이름"""
+        return self.payment_method_ref.name if self.payment_method_ref else None
     
     def __repr__(self):
-        return f"<Transaction(id={self.id}, type={self.type}, amount={self.amount}, category={self.category})>"
+        return f"<Transaction(id={self.id}, type={self.type}, amount_minor={self.amount_minor}, category_id={self.category_id})>"
+
 
+# 모든 조회가 user_id 로 시작하므로 user_id 선두 복합 인덱스 사용
+Index("ix_transactions_user_date", Transaction.user_id, Transaction.date.desc(), Transaction.id)
+Index("ix_transactions_user_type_date", Transaction.user_id, Transaction.type, Transaction.date)
+Index("ix_transactions_user_category", Transaction.user_id, Transaction.category_id)
+# 일기-거래 조인 (entry_id 조회, 기분별 지출 집계) 용 커버링 인덱스
+Index(
+    "ix_transactions_entry_type",
+    Transaction.entry_id,
+    Transaction.type,
+    postgresql_include=["category_id", "amount_minor"]
+)
+# 반복 거래는 (규칙, 발생일) 당 한 건만 (파티션 키 date 포함이라 파티션 테이블에서도 unique 가능)
+Index("uq_transactions_recurring_occurrence", Transaction.recurring_rule_id, Transaction.date, unique=True)
@@ -1,5 +1,4 @@
-from sqlalchemy import Column, String, DateTime
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, Integer, String, DateTime, Uuid
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import uuid
@@ -11,10 +10,13 @@ class User(Base):
     
     __tablename__ = "users"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     username = Column(String(100), nullable=False)
     password_hash = Column(String(255), nullable=False)
+    data_version = Column(Integer, nullable=False, default=0, server_default="0")  # 기록이 바뀔 때마다 증가 (통계 캐시 키)
+    shard_version = Column(Integer, nullable=False, default=0, server_default="0")  # 샤드를 옮길 때마다 증가 (정수 id 캐시 키)
+    data_updated_at = Column(DateTime(timezone=True), nullable=True)  # 마지막 기록 변경 시각 (목록 Last-Modified)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
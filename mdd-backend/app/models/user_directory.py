@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime, Uuid
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class UserDirectory(Base):
+    """사용자 디렉터리 (user_id / 이메일 -> 샤드)
+
+    샤드 0 에만 기록한다. 이메일 unique 제약으로 모든 샤드에 걸친 이메일 중복을 막는다.
+    """
+    
+    __tablename__ = "user_directory"
+    
+    user_id = Column(Uuid, primary_key=True)
+    email = Column(String(255), unique=True, nullable=False)
+    shard = Column(Integer, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    def __repr__(self):
+        return f"<UserDirectory(user_id={self.user_id}, shard={self.shard})>"
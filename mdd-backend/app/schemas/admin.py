@@ -0,0 +1,12 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class TracingConfig(BaseModel):
+    """요청 추적 설정"""
+    sample_rate: float = Field(..., ge=0, le=1)  # 0: 끔, 1: 모든 요청
+
+
+class ProfilingConfig(BaseModel):
+    """느린 요청 자동 프로파일링 설정"""
+    slow_request_ms: Optional[float] = Field(None, gt=0)  # None: 끔
@@ -0,0 +1,75 @@
+from pydantic import BaseModel, Field, AliasChoices, field_validator
+from datetime import datetime
+from typing import Optional
+from decimal import Decimal
+import enum
+from app.schemas.transaction import MinorUnitAmount, _check_minor_units
+from app.utils.money import to_minor_units
+
+
+class BudgetCreate(BaseModel):
+    """예산 생성 스키마"""
+    category: str = Field(..., min_length=1, max_length=100)
+    amount: Decimal = Field(..., gt=0, decimal_places=2)  # 월 한도
+    warning_percent: int = Field(80, ge=1, le=100)
+    
+    _check_amount = field_validator("amount")(_check_minor_units)
+    
+    @property
+    def amount_minor(self) -> int:
+        """저장용 정수 금액"""
+        return to_minor_units(self.amount)
+
+
+class BudgetUpdate(BaseModel):
+    """예산 수정 스키마"""
+    amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
+    warning_percent: Optional[int] = Field(None, ge=1, le=100)
+    
+    _check_amount = field_validator("amount")(_check_minor_units)
+    
+    def model_fields_for_update(self) -> dict:
+        """설정된 필드만 모델 컬럼 기준으로 반환 (amount -> amount_minor, null 은 무시)"""
+        update_data = {k: v for k, v in self.model_dump(exclude_unset=True).items() if v is not None}
+        if "amount" in update_data:
+            update_data["amount_minor"] = to_minor_units(update_data.pop("amount"))
+        return update_data
+
+
+class BudgetResponse(BaseModel):
+    """예산 응답 스키마"""
+    id: int
+    category: str
+    amount: MinorUnitAmount = Field(..., validation_alias=AliasChoices("amount_minor", "amount"))
+    warning_percent: int
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
+
+
+class BudgetLevel(str, enum.Enum):
+    """예산 사용 상태"""
+    OK = "ok"
+    WARNING = "warning"  # warning_percent 이상 사용
+    EXCEEDED = "exceeded"  # 한도 초과
+
+
+class BudgetStatus(BaseModel):
+    """카테고리 예산 사용 현황"""
+    id: int
+    category: str
+    amount: MinorUnitAmount
+    spent: MinorUnitAmount
+    remaining: MinorUnitAmount  # 초과 시 음수
+    used_percent: float
+    warning_percent: int
+    level: BudgetLevel
+
+
+class BudgetStatusResponse(BaseModel):
+    """월 예산 사용 현황 응답"""
+    year: int
+    month: int
+    budgets: list[BudgetStatus]
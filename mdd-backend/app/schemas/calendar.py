@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class CalendarYearResponse(BaseModel):
+    """연간 캘린더 히트맵 (열 지향 배열, 인덱스 = 1월 1일부터의 일수)"""
+    year: int
+    days: int  # 365 또는 366
+    currency_exponent: int  # 금액 배열은 최소 화폐 단위 정수 (금액 = 값 / 10^currency_exponent)
+    moods: list[str]  # mood 코드 사전 (코드 n -> moods[n - 1])
+    has_entry: list[int]  # 1: 일기 있음, 0: 없음
+    mood: list[int]  # 0: 기분 기록 없음
+    expense: list[int]
+    income: list[int]
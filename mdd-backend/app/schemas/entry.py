@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
 from datetime import date, datetime
+from datetime import date as date_type  # date 필드 기본값이 타입 이름을 가리지 않도록
 from uuid import UUID
 from typing import Optional
 
@@ -21,7 +22,7 @@ class EntryCreate(EntryBase):
 
 class EntryUpdate(BaseModel):
     """일상 기록 수정 스키마"""
-    date: Optional[date] = None
+    date: Optional[date_type] = None
     title: Optional[str] = None
     content: Optional[str] = None
     mood: Optional[str] = None
@@ -33,6 +34,7 @@ class EntryResponse(EntryBase):
     """일상 기록 응답 스키마"""
     id: UUID
     user_id: UUID
+    preview: Optional[str] = None
     created_at: datetime
     updated_at: Optional[datetime] = None
     
@@ -40,9 +42,32 @@ class EntryResponse(EntryBase):
         from_attributes = True
 
 
+class EntryListItem(BaseModel):
+    """일상 기록 목록 항목 스키마 (content 대신 preview, fields= 로 선택한 필드만 포함)"""
+    id: UUID
+    user_id: Optional[UUID] = None
+    date: Optional[date_type] = None
+    title: Optional[str] = None
+    preview: Optional[str] = None
+    mood: Optional[str] = None
+    photos: Optional[list[str]] = None
+    tags: Optional[list[str]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_model(cls, entry, fields: list[str]) -> "EntryListItem":
+        """선택한 필드만 읽어 생성 (로드하지 않은 컬럼에는 접근하지 않음)"""
+        return cls.model_validate({field: getattr(entry, field) for field in fields})
+
+
+# 목록에서 선택 가능한 필드 (content 는 목록에 포함하지 않음)
+ENTRY_LIST_FIELDS = tuple(EntryListItem.model_fields)
+
+
 class EntryListResponse(BaseModel):
     """일상 기록 목록 응답 스키마"""
-    entries: list[EntryResponse]
+    entries: list[EntryListItem]
     total: int
     page: int
     page_size: int
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from uuid import UUID
+from typing import Any, Optional
+from app.models.job import JobStatus
+
+
+class JobCreate(BaseModel):
+    """작업 생성 스키마"""
+    kind: str = Field(..., min_length=1, max_length=50)
+    params: dict[str, Any] = Field(default_factory=dict)
+
+
+class JobResponse(BaseModel):
+    """작업 상태 응답 스키마"""
+    id: UUID
+    kind: str
+    status: JobStatus
+    progress: float
+    message: Optional[str] = None
+    result: Optional[dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
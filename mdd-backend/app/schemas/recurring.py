@@ -0,0 +1,77 @@
+from pydantic import BaseModel, Field, AliasChoices, field_validator, model_validator
+from datetime import date, datetime
+from datetime import date as date_type  # date 필드 기본값이 타입 이름을 가리지 않도록
+from uuid import UUID
+from typing import Optional
+from decimal import Decimal
+from app.models.transaction import TransactionType
+from app.models.recurring_rule import RecurrenceFrequency
+from app.schemas.transaction import MinorUnitAmount, _check_minor_units
+from app.utils.money import to_minor_units
+
+
+class RecurringRuleCreate(BaseModel):
+    """반복 거래 규칙 생성 스키마"""
+    type: TransactionType
+    category: str = Field(..., min_length=1, max_length=100)
+    amount: Decimal = Field(..., gt=0, decimal_places=2)
+    description: Optional[str] = Field(None, max_length=500)
+    payment_method: Optional[str] = Field(None, max_length=50)
+    frequency: RecurrenceFrequency
+    interval: int = Field(1, ge=1, le=366)  # custom: 일 간격, 그 외: 주기 배수 (예: 2주마다)
+    start_date: date
+    end_date: Optional[date_type] = None
+    
+    _check_amount = field_validator("amount")(_check_minor_units)
+    
+    @model_validator(mode="after")
+    def _check_dates(self) -> "RecurringRuleCreate":
+        if self.end_date is not None and self.end_date < self.start_date:
+            raise ValueError("종료일은 시작일보다 빠를 수 없습니다")
+        return self
+    
+    @property
+    def amount_minor(self) -> int:
+        """저장용 정수 금액"""
+        return to_minor_units(self.amount)
+
+
+class RecurringRuleUpdate(BaseModel):
+    """반복 거래 규칙 수정 스키마 (이후 생성분부터 적용, 주기를 바꾸려면 새 규칙 생성)"""
+    category: Optional[str] = Field(None, min_length=1, max_length=100)
+    amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
+    description: Optional[str] = Field(None, max_length=500)
+    payment_method: Optional[str] = Field(None, max_length=50)
+    end_date: Optional[date_type] = None
+    active: Optional[bool] = None
+    
+    _check_amount = field_validator("amount")(_check_minor_units)
+    
+    def model_fields_for_update(self) -> dict:
+        """설정된 필드만 모델 컬럼 기준으로 반환 (amount -> amount_minor)"""
+        update_data = self.model_dump(exclude_unset=True)
+        amount = update_data.pop("amount", None)
+        if amount is not None:
+            update_data["amount_minor"] = to_minor_units(amount)
+        return update_data
+
+
+class RecurringRuleResponse(BaseModel):
+    """반복 거래 규칙 응답 스키마"""
+    id: UUID
+    type: TransactionType
+    category: str
+    amount: MinorUnitAmount = Field(..., validation_alias=AliasChoices("amount_minor", "amount"))
+    description: Optional[str] = None
+    payment_method: Optional[str] = None
+    frequency: RecurrenceFrequency
+    interval: int
+    start_date: date
+    end_date: Optional[date_type] = None
+    next_date: Optional[date_type] = None  # 다음 생성 예정일 (None: 종료)
+    active: bool
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    
+    class Config:
+        from_attributes = True
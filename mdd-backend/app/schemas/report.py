@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from datetime import date, datetime
+from app.schemas.stats import CategoryStats
+from app.schemas.transaction import MinorUnitAmount
+import enum
+
+
+class ReportPeriod(str, enum.Enum):
+    """리포트 기간 단위"""
+    MONTH = "month"
+    YEAR = "year"
+
+
+class ReportResponse(BaseModel):
+    """월간 / 연간 리포트"""
+    period: ReportPeriod
+    start_date: date
+    end_date: date
+    total_income: MinorUnitAmount
+    total_expense: MinorUnitAmount
+    net: MinorUnitAmount
+    transaction_count: int
+    entry_count: int
+    mood_counts: dict[str, int]  # 기분별 일기 수
+    top_categories: list[CategoryStats]  # 지출 상위 카테고리
+    generated_at: datetime
+    snapshot: bool  # 저장된 스냅샷이면 True (진행 중인 기간은 매번 계산)
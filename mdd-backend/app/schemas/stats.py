@@ -1,37 +1,179 @@
-from pydantic import BaseModel
-from decimal import Decimal
+from pydantic import BaseModel, Field, model_validator
 from datetime import date
+from typing import Any, Optional
+from app.models.transaction import TransactionType
+from app.schemas.transaction import MinorUnitAmount
+from app.utils.money import from_minor_units
+import enum
 
 
 class DailyStats(BaseModel):
     """일별 통계"""
     date: date
-    total_income: Decimal
-    total_expense: Decimal
-    net: Decimal  # 순수익 (income - expense)
+    total_income: MinorUnitAmount
+    total_expense: MinorUnitAmount
+    net: MinorUnitAmount  # 순수익 (income - expense)
 
 
 class MonthlyStats(BaseModel):
     """월별 통계"""
     year: int
     month: int
-    total_income: Decimal
-    total_expense: Decimal
-    net: Decimal
+    total_income: MinorUnitAmount
+    total_expense: MinorUnitAmount
+    net: MinorUnitAmount
     transaction_count: int
 
 
 class CategoryStats(BaseModel):
     """카테고리별 통계"""
     category: str
-    total_amount: Decimal
+    total_amount: MinorUnitAmount
     transaction_count: int
     percentage: float  # 전체 지출 대비 비율
 
 
+class MoodCategoryStats(BaseModel):
+    """기분별 상위 지출 카테고리"""
+    category: str
+    total_amount: MinorUnitAmount
+
+
+class MoodStats(BaseModel):
+    """기분별 지출 통계"""
+    mood: str
+    day_count: int  # 해당 기분으로 기록한 날 수
+    transaction_count: int
+    total_expense: MinorUnitAmount
+    average_expense: MinorUnitAmount  # 해당 기분인 날의 하루 평균 지출
+    top_categories: list[MoodCategoryStats]
+
+
+class TrendPoint(BaseModel):
+    """일별 지출 추세"""
+    date: date
+    expense: MinorUnitAmount
+    moving_average: MinorUnitAmount  # 최근 window 일 평균 지출
+
+
+class MonthOverMonth(BaseModel):
+    """월별 지출과 전월 대비 변화"""
+    year: int
+    month: int
+    total_expense: MinorUnitAmount
+    change: Optional[MinorUnitAmount] = None  # 전월 대비 증감액 (첫 달은 None)
+    change_rate: Optional[float] = None  # 전월 대비 증감률 % (전월 지출이 0 이면 None)
+
+
+class SpendingAnomaly(BaseModel):
+    """평소보다 지출이 크게 많은 날"""
+    date: date
+    expense: MinorUnitAmount
+    baseline: MinorUnitAmount  # 직전 기간 하루 평균 지출
+    z_score: float
+
+
+class MonthProjection(BaseModel):
+    """이번 달 말 예상 지출"""
+    year: int
+    month: int
+    spent: MinorUnitAmount  # 지금까지 지출
+    projected: MinorUnitAmount  # 월말 예상 지출
+    days_elapsed: int
+    days_in_month: int
+
+
+class TrendResponse(BaseModel):
+    """지출 추세 분석 결과"""
+    start_date: date
+    end_date: date
+    window: int
+    daily: list[TrendPoint]
+    monthly: list[MonthOverMonth]
+    anomalies: list[SpendingAnomaly]
+    projection: MonthProjection
+
+
+class BalancePoint(BaseModel):
+    """누적 잔액"""
+    date: date
+    balance: MinorUnitAmount  # 해당 날짜까지의 누적 (수입 - 지출) + 시작 잔액
+
+
+class BalanceResponse(BaseModel):
+    """누적 잔액 추이"""
+    opening_balance: MinorUnitAmount
+    points: list[BalancePoint]
+    total_points: int  # 다운샘플링 전 (거래가 있는) 날짜 수
+    downsampled: bool
+
+
 class StatsResponse(BaseModel):
     """통계 응답"""
     daily_stats: list[DailyStats] = []
     monthly_stats: list[MonthlyStats] = []
     category_stats: list[CategoryStats] = []
 
+
+class AnalyticsDimension(str, enum.Enum):
+    """집계 차원"""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+    YEAR = "year"
+    CATEGORY = "category"
+    PAYMENT_METHOD = "payment_method"
+    TYPE = "type"
+    TAG = "tag"  # 연결된 일기의 태그
+    MOOD = "mood"  # 연결된 일기의 기분
+
+
+class AnalyticsMeasure(str, enum.Enum):
+    """집계 함수 (금액 기준, count 는 거래 수)"""
+    SUM = "sum"
+    COUNT = "count"
+    AVG = "avg"
+    MIN = "min"
+    MAX = "max"
+
+
+# 금액 값을 반환하는 집계 함수
+AMOUNT_MEASURES = {AnalyticsMeasure.SUM, AnalyticsMeasure.AVG, AnalyticsMeasure.MIN, AnalyticsMeasure.MAX}
+
+
+class AnalyticsFilters(BaseModel):
+    """집계 필터"""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    month: Optional[int] = Field(None, ge=1, le=12)  # 연도와 무관한 월
+    type: Optional[TransactionType] = None
+    categories: list[str] = Field(default_factory=list)
+    payment_methods: list[str] = Field(default_factory=list)
+    moods: list[str] = Field(default_factory=list)
+    tags: list[str] = Field(default_factory=list)
+
+
+class AnalyticsResult(BaseModel):
+    """집계 결과 (rows: 차원 값 + 집계 값)"""
+    dimensions: list[AnalyticsDimension]
+    measures: list[AnalyticsMeasure]
+    rows: list[dict[str, Any]]
+    truncated: bool  # 결과 행 수 상한에 걸려 잘렸는지 여부
+    
+    @model_validator(mode="before")
+    @classmethod
+    def _convert_amounts(cls, data: Any) -> Any:
+        """정수(최소 화폐 단위) 금액 집계 값을 Decimal 로 변환"""
+        if not isinstance(data, dict):
+            return data
+        
+        amount_keys = [AnalyticsMeasure(m).value for m in data.get("measures", []) if AnalyticsMeasure(m) in AMOUNT_MEASURES]
+        data = dict(data)
+        data["rows"] = [
+            {
+                key: from_minor_units(value) if key in amount_keys and isinstance(value, int) else value
+                for key, value in row.items()
+            }
+            for row in data.get("rows", [])
+        ]
+        return data
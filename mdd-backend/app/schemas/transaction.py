@@ -1,9 +1,29 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, AliasChoices, BeforeValidator, field_validator
 from datetime import date, datetime
+from datetime import date as date_type  # date 필드 기본값이 타입 이름을 가리지 않도록
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Any, Optional
 from decimal import Decimal
 from app.models.transaction import TransactionType
+from app.utils.money import to_minor_units, from_minor_units
+
+
+def _minor_units_to_decimal(value: Any) -> Any:
+    """DB/집계에서 온 정수(최소 화폐 단위)를 Decimal 금액으로 변환"""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return from_minor_units(value)
+    return value
+
+
+# 응답 전용: 정수 최소 화폐 단위 값을 받아 Decimal 금액으로 내보냄
+MinorUnitAmount = Annotated[Decimal, BeforeValidator(_minor_units_to_decimal)]
+
+
+def _check_minor_units(value: Optional[Decimal]) -> Optional[Decimal]:
+    """CURRENCY_EXPONENT 자리수로 표현 가능한 금액인지 검증"""
+    if value is not None:
+        to_minor_units(value)
+    return value
 
 
 class TransactionBase(BaseModel):
@@ -19,26 +39,71 @@ class TransactionBase(BaseModel):
 class TransactionCreate(TransactionBase):
     """경제 기록 생성 스키마"""
     entry_id: Optional[UUID] = None
+    
+    _check_amount = field_validator("amount")(_check_minor_units)
+    
+    @property
+    def amount_minor(self) -> int:
+        """저장용 정수 금액"""
+        return to_minor_units(self.amount)
 
 
 class TransactionUpdate(BaseModel):
     """경제 기록 수정 스키마"""
-    date: Optional[date] = None
+    date: Optional[date_type] = None
     type: Optional[TransactionType] = None
     category: Optional[str] = Field(None, min_length=1, max_length=100)
     amount: Optional[Decimal] = Field(None, gt=0, decimal_places=2)
     description: Optional[str] = Field(None, max_length=500)
     payment_method: Optional[str] = Field(None, max_length=50)
+    
+    _check_amount = field_validator("amount")(_check_minor_units)
+    
+    def model_fields_for_update(self) -> dict:
+        """설정된 필드만 모델 컬럼 기준으로 반환 (amount -> amount_minor)"""
+        update_data = self.model_dump(exclude_unset=True)
+        amount = update_data.pop("amount", None)
+        if amount is not None:
+            update_data["amount_minor"] = to_minor_units(amount)
+        return update_data
 
 
 class TransactionResponse(TransactionBase):
     """경제 기록 응답 스키마"""
+    amount: MinorUnitAmount = Field(..., validation_alias=AliasChoices("amount_minor", "amount"))
     id: UUID
     entry_id: Optional[UUID] = None
     user_id: UUID
+    recurring_rule_id: Optional[UUID] = None  # 반복 거래 규칙으로 생성된 경우
     created_at: datetime
     updated_at: Optional[datetime] = None
     
     class Config:
         from_attributes = True
 
+
+class TransactionListItem(BaseModel):
+    """경제 기록 목록 항목 스키마 (fields= 로 선택한 필드만 포함)"""
+    id: UUID
+    date: Optional[date_type] = None
+    type: Optional[TransactionType] = None
+    category: Optional[str] = None
+    amount: Optional[MinorUnitAmount] = None
+    description: Optional[str] = None
+    payment_method: Optional[str] = None
+    entry_id: Optional[UUID] = None
+    user_id: Optional[UUID] = None
+    recurring_rule_id: Optional[UUID] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    
+    @classmethod
+    def from_model(cls, transaction, fields: list[str]) -> "TransactionListItem":
+        """선택한 필드만 읽어 생성 (로드하지 않은 컬럼에는 접근하지 않음)"""
+        return cls.model_validate({
+            field: getattr(transaction, "amount_minor" if field == "amount" else field)
+            for field in fields
+        })
+
+
+TRANSACTION_LIST_FIELDS = tuple(TransactionListItem.model_fields)
@@ -0,0 +1,157 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, cast, extract, true, BigInteger
+from fastapi import HTTPException, status
+from app.models.entry import Entry
+from app.models.transaction import Transaction
+from app.models.category import Category
+from app.models.payment_method import PaymentMethod
+from app.models.user import User
+from app.schemas.stats import AnalyticsDimension, AnalyticsMeasure, AnalyticsFilters
+from app.services.category_service import CategoryService
+from app.utils.sql import date_bucket, json_array_values
+from app.utils.tracing import trace_methods
+from typing import Any, Optional
+import enum
+
+# 한 쿼리에 허용하는 최대 차원 수
+MAX_DIMENSIONS = 3
+
+# 일기 조인이 필요한 차원
+ENTRY_DIMENSIONS = {AnalyticsDimension.TAG, AnalyticsDimension.MOOD}
+
+
+def _time_bucket(unit: str):
+    """date 를 unit 단위 시작일로 내림"""
+    return date_bucket(unit, Transaction.date)
+
+
+def _measure_expression(measure: AnalyticsMeasure):
+    """집계 함수 -> SQL 식 (금액은 정수 최소 화폐 단위)"""
+    if measure == AnalyticsMeasure.COUNT:
+        return func.count(Transaction.id)
+    if measure == AnalyticsMeasure.SUM:
+        return cast(func.sum(Transaction.amount_minor), BigInteger)
+    if measure == AnalyticsMeasure.AVG:
+        return func.avg(Transaction.amount_minor)
+    if measure == AnalyticsMeasure.MIN:
+        return func.min(Transaction.amount_minor)
+    return func.max(Transaction.amount_minor)
+
+
+@trace_methods
+class AnalyticsService:
+    """선언적 집계 쿼리 서비스
+
+    차원/집계 함수/필터를 화이트리스트된 SQL 식으로만 조합해 하나의 GROUP BY 쿼리로 실행한다.
+    사용자 입력 값은 모두 바인드 파라미터로 전달된다.
+    """
+    
+    @staticmethod
+    def run(
+        db: Session,
+        user: User,
+        dimensions: list[AnalyticsDimension],
+        measures: list[AnalyticsMeasure],
+        filters: Optional[AnalyticsFilters] = None,
+        limit: Optional[int] = None
+    ) -> tuple[list[dict[str, Any]], bool]:
+        """집계 실행 -> (행 목록, limit 초과로 잘렸는지 여부)
+
+        금액 값은 정수 최소 화폐 단위로 반환한다. limit 이 None 이면 행 수를 제한하지 않는다
+        (API 요청은 라우터에서 ANALYTICS_MAX_ROWS 이하로 제한).
+        """
+        filters = filters or AnalyticsFilters()
+        
+        dimensions = list(dict.fromkeys(dimensions))
+        measures = list(dict.fromkeys(measures))
+        if len(dimensions) > MAX_DIMENSIONS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"차원은 최대 {MAX_DIMENSIONS}개까지 지정할 수 있습니다"
+            )
+        if not measures:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="집계 함수를 하나 이상 지정해야 합니다"
+            )
+        
+        # 태그는 일기의 JSON 배열을 펼친 테이블 값 함수에서 가져옴
+        tags = json_array_values(Entry.tags).table_valued("value").alias("entry_tags")
+        
+        # 차원별 (SELECT 식, GROUP BY 식)
+        dimension_columns = {
+            AnalyticsDimension.DAY: (Transaction.date, Transaction.date),
+            AnalyticsDimension.WEEK: (_time_bucket("week"), _time_bucket("week")),
+            AnalyticsDimension.MONTH: (_time_bucket("month"), _time_bucket("month")),
+            AnalyticsDimension.YEAR: (_time_bucket("year"), _time_bucket("year")),
+            AnalyticsDimension.CATEGORY: (Category.name, Category.id),
+            AnalyticsDimension.PAYMENT_METHOD: (PaymentMethod.name, PaymentMethod.id),
+            AnalyticsDimension.TYPE: (Transaction.type, Transaction.type),
+            AnalyticsDimension.TAG: (tags.c.value, tags.c.value),
+            AnalyticsDimension.MOOD: (Entry.mood, Entry.mood),
+        }
+        
+        columns = [dimension_columns[d][0].label(d.value) for d in dimensions]
+        columns += [_measure_expression(m).label(m.value) for m in measures]
+        group_by = [dimension_columns[d][1] for d in dimensions]
+        
+        stmt = select(*columns).select_from(Transaction)
+        
+        # 필요한 테이블만 조인
+        if AnalyticsDimension.CATEGORY in dimensions:
+            stmt = stmt.join(Category, Category.id == Transaction.category_id)
+        if AnalyticsDimension.PAYMENT_METHOD in dimensions:
+            stmt = stmt.outerjoin(PaymentMethod, PaymentMethod.id == Transaction.payment_method_id)
+        if ENTRY_DIMENSIONS.intersection(dimensions) or filters.moods or filters.tags:
+            stmt = stmt.outerjoin(Entry, Entry.id == Transaction.entry_id)
+        if AnalyticsDimension.TAG in dimensions:
+            stmt = stmt.join(tags, true())
+        
+        # 필터
+        stmt = stmt.where(Transaction.user_id == user.id)
+        if filters.start_date:
+            stmt = stmt.where(Transaction.date >= filters.start_date)
+        if filters.end_date:
+            stmt = stmt.where(Transaction.date <= filters.end_date)
+        if filters.month:
+            stmt = stmt.where(extract('month', Transaction.date) == filters.month)
+        if filters.type:
+            stmt = stmt.where(Transaction.type == filters.type)
+        if filters.categories:
+            ids = [CategoryService.find_category_id(db, user, name) for name in filters.categories]
+            stmt = stmt.where(Transaction.category_id.in_([i for i in ids if i is not None]))
+        if filters.payment_methods:
+            ids = [CategoryService.find_payment_method_id(db, user, name) for name in filters.payment_methods]
+            stmt = stmt.where(Transaction.payment_method_id.in_([i for i in ids if i is not None]))
+        if filters.moods:
+            stmt = stmt.where(Entry.mood.in_(filters.moods))
+        if filters.tags:
+            if AnalyticsDimension.TAG in dimensions:
+                stmt = stmt.where(tags.c.value.in_(filters.tags))
+            else:
+                tag_values = json_array_values(Entry.tags).table_valued("value")
+                stmt = stmt.where(
+                    select(tag_values.c.value).where(tag_values.c.value.in_(filters.tags)).exists()
+                )
+        
+        stmt = stmt.group_by(*group_by).order_by(*group_by)
+        
+        # 상한 + 1 행을 가져와 잘림 여부 판단
+        if limit is not None:
+            stmt = stmt.limit(limit + 1)
+        result = db.execute(stmt).all()
+        truncated = limit is not None and len(result) > limit
+        if truncated:
+            result = result[:limit]
+        
+        rows = []
+        for row in result:
+            values = dict(row._mapping)
+            for key, value in values.items():
+                if isinstance(value, enum.Enum):
+                    values[key] = value.value
+            if AnalyticsMeasure.AVG.value in values and values[AnalyticsMeasure.AVG.value] is not None:
+                values[AnalyticsMeasure.AVG.value] = int(round(values[AnalyticsMeasure.AVG.value]))
+            rows.append(values)
+        
+        return rows, truncated
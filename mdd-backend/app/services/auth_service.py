@@ -3,12 +3,17 @@ from fastapi import HTTPException, status
 from app.models.user import User
 from app.schemas.user import UserCreate, UserLogin
 from app.utils.auth import get_password_hash, verify_password, create_access_token
+from app.database import use_shard
+from app.services.shard_service import ShardService
 from datetime import timedelta
 from app.config import get_settings
+from app.utils.tracing import trace_methods
+import uuid
 
 settings = get_settings()
 
 
+@trace_methods
 class AuthService:
     """인증 서비스"""
     
@@ -16,26 +21,28 @@ class AuthService:
     def create_user(db: Session, user_data: UserCreate) -> User:
         """새 사용자 생성"""
         
-        # 이메일 중복 체크
-        existing_user = db.query(User).filter(User.email == user_data.email).first()
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 등록된 이메일입니다"
-            )
-        
         # 비밀번호 해싱
         hashed_password = get_password_hash(user_data.password)
         
-        # 사용자 생성
+        # 디렉터리 등록 (모든 샤드에 걸친 이메일 중복 체크) 후 배치된 샤드에 생성
+        user_id = uuid.uuid4()
+        shard = ShardService.register(user_id, user_data.email)
+        use_shard(db, shard)
+        
         new_user = User(
+            id=user_id,
             email=user_data.email,
             username=user_data.username,
             password_hash=hashed_password
         )
         
         db.add(new_user)
-        db.commit()
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+            ShardService.unregister(user_id)
+            raise
         db.refresh(new_user)
         
         return new_user
@@ -44,8 +51,12 @@ class AuthService:
     def authenticate_user(db: Session, login_data: UserLogin) -> tuple[User, str]:
         """사용자 인증 및 토큰 발급"""
         
-        # 사용자 조회
-        user = db.query(User).filter(User.email == login_data.email).first()
+        # 사용자 조회 (디렉터리에서 샤드를 찾은 뒤 해당 샤드에서)
+        shard = ShardService.shard_of_email(login_data.email)
+        user = None
+        if shard is not None:
+            use_shard(db, shard)
+            user = db.query(User).filter(User.email == login_data.email).first()
         if not user:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
@@ -59,12 +70,14 @@ class AuthService:
                 detail="이메일 또는 비밀번호가 올바르지 않습니다"
             )
         
-        # JWT 토큰 생성
+        return user, AuthService.issue_token(user)
+    
+    @staticmethod
+    def issue_token(user: User) -> str:
+        """JWT 토큰 생성"""
         access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
+        return create_access_token(
             data={"sub": str(user.id)},
             expires_delta=access_token_expires
         )
-        
-        return user, access_token
 
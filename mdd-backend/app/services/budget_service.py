@@ -0,0 +1,261 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, delete, func, cast, and_, BigInteger
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException, status
+from app.models.budget import Budget, CategorySpend
+from app.models.category import Category
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.schemas.budget import (
+    BudgetCreate, BudgetUpdate, BudgetLevel, BudgetStatus, BudgetStatusResponse
+)
+from app.services.category_service import CategoryService
+from app.utils.sql import date_bucket, lock_rows
+from app.utils.tracing import trace_methods
+from datetime import date
+from typing import Iterable, Optional
+from uuid import UUID
+
+# (category_id, 월 1일, 금액)
+Spend = tuple[int, date, int]
+
+
+def month_start(day: date) -> date:
+    """day 가 속한 달의 1일"""
+    return day.replace(day=1)
+
+
+def spend_of(transaction) -> Optional[Spend]:
+    """거래가 예산 카운터에 더하는 값 (지출이 아니면 None)
+
+    Transaction 객체나 같은 이름의 컬럼을 가진 Row 모두 받는다.
+    """
+    if transaction.type != TransactionType.EXPENSE:
+        return None
+    return transaction.category_id, month_start(transaction.date), transaction.amount_minor
+
+
+def _month_bucket():
+    """Transaction.date -> 월 1일"""
+    return date_bucket("month", Transaction.date)
+
+
+def _level(spent: int, amount: int, warning_percent: int) -> BudgetLevel:
+    if spent > amount:
+        return BudgetLevel.EXCEEDED
+    if spent * 100 >= amount * warning_percent:
+        return BudgetLevel.WARNING
+    return BudgetLevel.OK
+
+
+@trace_methods
+class BudgetService:
+    """예산 서비스
+
+    예산 사용량은 (사용자, 카테고리, 월) 카운터(category_monthly_spend)에서 읽는다.
+    거래를 쓰는 서비스는 같은 트랜잭션 안에서 apply_spend 로 카운터를 증감하므로
+    사용량 조회 시 거래를 다시 집계하지 않는다.
+    """
+    
+    @staticmethod
+    def apply_spend(
+        db: Session,
+        user_id: UUID,
+        added: Iterable[Optional[Spend]] = (),
+        removed: Iterable[Optional[Spend]] = ()
+    ) -> None:
+        """지출 카운터 증감 (커밋 전에, StatsCacheService.bump_data_version 다음에 호출)
+
+        사용자 행 잠금(bump_data_version) 뒤에 카운터를 잠가야 reconcile 과 잠금 순서가 같아진다.
+        """
+        deltas: dict[tuple[int, date], int] = {}
+        for spends, sign in ((added, 1), (removed, -1)):
+            for spend in spends:
+                if spend is not None:
+                    category_id, month, amount = spend
+                    deltas[(category_id, month)] = deltas.get((category_id, month), 0) + sign * amount
+        
+        # 동시 쓰기끼리 같은 순서로 행을 잠그도록 정렬
+        rows = [
+            {"user_id": user_id, "category_id": category_id, "month": month, "spent_minor": delta}
+            for (category_id, month), delta in sorted(deltas.items())
+            if delta
+        ]
+        if not rows:
+            return
+        
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            stmt = (pg_insert if dialect == "postgresql" else sqlite_insert)(CategorySpend).values(rows)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["user_id", "category_id", "month"],
+                set_={"spent_minor": CategorySpend.spent_minor + stmt.excluded.spent_minor}
+            )
+            db.execute(stmt)
+            return
+        
+        for row in rows:
+            updated = db.execute(
+                update(CategorySpend).where(
+                    CategorySpend.user_id == user_id,
+                    CategorySpend.category_id == row["category_id"],
+                    CategorySpend.month == row["month"]
+                ).values(spent_minor=CategorySpend.spent_minor + row["spent_minor"])
+            ).rowcount
+            if not updated:
+                db.execute(insert(CategorySpend).values(row))
+    
+    @staticmethod
+    def create_budget(db: Session, budget_data: BudgetCreate, user: User) -> Budget:
+        """예산 생성 (카테고리당 하나)"""
+        budget = Budget(
+            user_id=user.id,
+            category_id=CategoryService.get_or_create_category_id(db, user, budget_data.category),
+            amount_minor=budget_data.amount_minor,
+            warning_percent=budget_data.warning_percent
+        )
+        
+        db.add(budget)
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 예산이 있는 카테고리입니다"
+            )
+        db.refresh(budget)
+        
+        return budget
+    
+    @staticmethod
+    def get_budget(db: Session, budget_id: int, user: User) -> Budget:
+        """예산 조회"""
+        budget = db.query(Budget).filter(
+            Budget.id == budget_id,
+            Budget.user_id == user.id
+        ).first()
+        
+        if not budget:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="예산을 찾을 수 없습니다"
+            )
+        
+        return budget
+    
+    @staticmethod
+    def update_budget(db: Session, budget_id: int, budget_data: BudgetUpdate, user: User) -> Budget:
+        """예산 수정"""
+        budget = BudgetService.get_budget(db, budget_id, user)
+        
+        for field, value in budget_data.model_fields_for_update().items():
+            setattr(budget, field, value)
+        
+        db.commit()
+        db.refresh(budget)
+        
+        return budget
+    
+    @staticmethod
+    def delete_budget(db: Session, budget_id: int, user: User) -> None:
+        """예산 삭제"""
+        budget = BudgetService.get_budget(db, budget_id, user)
+        
+        db.delete(budget)
+        db.commit()
+    
+    @staticmethod
+    def get_status(db: Session, user: User, year: int, month: int) -> BudgetStatusResponse:
+        """월 예산 사용 현황 (예산 수만큼의 행만 읽음)"""
+        month_date = date(year, month, 1)
+        rows = db.execute(
+            select(
+                Budget.id,
+                Category.name,
+                Budget.amount_minor,
+                Budget.warning_percent,
+                func.coalesce(CategorySpend.spent_minor, 0).label("spent")
+            )
+            .join(Category, Category.id == Budget.category_id)
+            .outerjoin(CategorySpend, and_(
+                CategorySpend.user_id == Budget.user_id,
+                CategorySpend.category_id == Budget.category_id,
+                CategorySpend.month == month_date
+            ))
+            .where(Budget.user_id == user.id)
+            .order_by(Category.name)
+        ).all()
+        
+        return BudgetStatusResponse(
+            year=year,
+            month=month,
+            budgets=[
+                BudgetStatus(
+                    id=row.id,
+                    category=row.name,
+                    amount=row.amount_minor,
+                    spent=row.spent,
+                    remaining=row.amount_minor - row.spent,
+                    used_percent=round(row.spent * 100 / row.amount_minor, 2),
+                    warning_percent=row.warning_percent,
+                    level=_level(row.spent, row.amount_minor, row.warning_percent)
+                )
+                for row in rows
+            ]
+        )
+    
+    @staticmethod
+    def reconcile(db: Session, user_id: UUID, since: Optional[date] = None) -> int:
+        """거래 원본으로 지출 카운터를 다시 계산해 어긋난 값을 고침 -> 고친 카운터 수
+
+        사용자 행을 잠가 같은 사용자의 거래 쓰기(bump_data_version)와 겹치지 않게 한다.
+        since 가 주어지면 그 달부터만 비교한다.
+        """
+        lock_rows(db, User, User.id == user_id)
+        
+        month = _month_bucket()
+        raw_query = select(
+            Transaction.category_id, month, cast(func.sum(Transaction.amount_minor), BigInteger)
+        ).where(
+            Transaction.user_id == user_id,
+            Transaction.type == TransactionType.EXPENSE
+        ).group_by(Transaction.category_id, month)
+        counter_query = select(
+            CategorySpend.category_id, CategorySpend.month, CategorySpend.spent_minor
+        ).where(CategorySpend.user_id == user_id)
+        if since is not None:
+            raw_query = raw_query.where(Transaction.date >= month_start(since))
+            counter_query = counter_query.where(CategorySpend.month >= month_start(since))
+        
+        expected = {(category_id, month): spent for category_id, month, spent in db.execute(raw_query)}
+        actual = {(category_id, month): spent for category_id, month, spent in db.execute(counter_query)}
+        
+        inserts, updates, deletes = [], [], []
+        for key in sorted(expected.keys() | actual.keys()):
+            if expected.get(key, 0) == actual.get(key, 0):  # 거래가 모두 삭제되어 0 이 된 카운터는 그대로 둠
+                continue
+            category_id, month = key
+            row = {"user_id": user_id, "category_id": category_id, "month": month, "spent_minor": expected.get(key)}
+            if key not in expected:
+                deletes.append(key)
+            elif key not in actual:
+                inserts.append(row)
+            else:
+                updates.append(row)
+        
+        if inserts:
+            db.execute(insert(CategorySpend), inserts)
+        if updates:
+            db.execute(update(CategorySpend), updates)
+        for category_id, month in deletes:
+            db.execute(delete(CategorySpend).where(
+                CategorySpend.user_id == user_id,
+                CategorySpend.category_id == category_id,
+                CategorySpend.month == month
+            ))
+        db.commit()
+        
+        return len(inserts) + len(updates) + len(deletes)
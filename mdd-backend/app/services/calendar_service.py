@@ -0,0 +1,78 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, cast, BigInteger
+from app.models.entry import Entry
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.schemas.calendar import CalendarYearResponse
+from app.config import get_settings
+from app.utils.tracing import trace_methods
+from datetime import date
+
+settings = get_settings()
+
+
+@trace_methods
+class CalendarService:
+    """캘린더 서비스"""
+    
+    @staticmethod
+    def get_year(db: Session, user: User, year: int) -> CalendarYearResponse:
+        """연간 캘린더 히트맵 조회 (entries, transactions 각각 인덱스 범위 스캔 1회)"""
+        start = date(year, 1, 1)
+        end = date(year + 1, 1, 1)
+        days = (end - start).days
+        
+        has_entry = [0] * days
+        mood = [0] * days
+        expense = [0] * days
+        income = [0] * days
+        moods: list[str] = []
+        mood_codes: dict[str, int] = {}
+        
+        # 일기: 같은 날 여러 개면 마지막으로 작성한 일기의 mood 사용 (마지막 일기에 mood 가 없으면 기록 없음)
+        entry_rows = db.query(Entry.date, Entry.mood).filter(
+            Entry.user_id == user.id,
+            Entry.date >= start,
+            Entry.date < end
+        ).order_by(Entry.date, Entry.created_at).all()
+        
+        day_moods = {(row.date - start).days: row.mood for row in entry_rows}
+        for index, day_mood in day_moods.items():
+            has_entry[index] = 1
+            if day_mood:
+                if day_mood not in mood_codes:
+                    moods.append(day_mood)
+                    mood_codes[day_mood] = len(moods)
+                mood[index] = mood_codes[day_mood]
+        
+        # 거래: 날짜/유형별 합계
+        transaction_rows = db.query(
+            Transaction.date,
+            Transaction.type,
+            cast(func.sum(Transaction.amount_minor), BigInteger).label("total")
+        ).filter(
+            Transaction.user_id == user.id,
+            Transaction.date >= start,
+            Transaction.date < end
+        ).group_by(
+            Transaction.date,
+            Transaction.type
+        ).all()
+        
+        for row in transaction_rows:
+            index = (row.date - start).days
+            if row.type == TransactionType.INCOME:
+                income[index] = row.total
+            else:
+                expense[index] = row.total
+        
+        return CalendarYearResponse(
+            year=year,
+            days=days,
+            currency_exponent=settings.CURRENCY_EXPONENT,
+            moods=moods,
+            has_entry=has_entry,
+            mood=mood,
+            expense=expense,
+            income=income
+        )
@@ -0,0 +1,119 @@
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.models.category import Category
+from app.models.payment_method import PaymentMethod
+from app.models.user import User
+from app.utils.cache import LRUCache
+from app.utils.tracing import trace_methods
+from typing import Optional
+
+# (샤드, 테이블, user_id, shard_version, 이름) -> id 프로세스 내 캐시
+# (샤드를 옮기면 id 가 바뀌고, 옮겼다가 돌아와도 버전이 달라 이전 id 를 쓰지 않음)
+_id_cache = LRUCache(maxsize=10000)
+
+# 커밋 전 생성된 id 는 세션에만 보관했다가 커밋 후 캐시에 반영
+_PENDING_KEY = "pending_lookup_ids"
+
+
+@event.listens_for(Session, "after_commit")
+def _promote_pending_ids(session: Session) -> None:
+    for key, value in session.info.pop(_PENDING_KEY, {}).items():
+        _id_cache.set(key, value)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_ids(session: Session, transaction) -> None:
+    # savepoint 롤백은 바깥 트랜잭션에서 만든 id 를 버리지 않음 (커밋된 경우는 after_commit 에서 이미 비움)
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+
+@trace_methods
+class CategoryService:
+    """카테고리 / 결제 수단 사전 서비스 (이름 <-> 정수 id)"""
+    
+    @staticmethod
+    def _cache_key(db: Session, model, user: User, name: str) -> tuple:
+        return (db.info.get("shard", 0), model.__tablename__, user.id, user.shard_version, name)
+    
+    @staticmethod
+    def _find_id(db: Session, model, user: User, name: str) -> Optional[int]:
+        """이름으로 id 조회 (없으면 None)"""
+        key = CategoryService._cache_key(db, model, user, name)
+        
+        pending = db.info.get(_PENDING_KEY, {})
+        if key in pending:
+            return pending[key]
+        
+        cached = _id_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        found = db.query(model.id).filter(
+            model.user_id == user.id,
+            model.name == name
+        ).scalar()
+        
+        if found is not None:
+            _id_cache.set(key, found)
+        
+        return found
+    
+    @staticmethod
+    def _get_or_create_id(db: Session, model, user: User, name: str) -> int:
+        """이름으로 id 조회, 없으면 생성"""
+        found = CategoryService._find_id(db, model, user, name)
+        if found is not None:
+            return found
+        
+        # 동시 생성 시 unique 제약 위반은 savepoint 롤백 후 재조회
+        try:
+            with db.begin_nested():
+                obj = model(user_id=user.id, name=name)
+                db.add(obj)
+            created = obj.id
+        except IntegrityError:
+            created = CategoryService._find_id(db, model, user, name)
+        else:
+            db.info.setdefault(_PENDING_KEY, {})[CategoryService._cache_key(db, model, user, name)] = created
+        
+        return created
+    
+    @staticmethod
+    def get_or_create_category_id(db: Session, user: User, name: str) -> int:
+        """카테고리 id 조회 또는 생성"""
+        return CategoryService._get_or_create_id(db, Category, user, name)
+    
+    @staticmethod
+    def find_category_id(db: Session, user: User, name: str) -> Optional[int]:
+        """카테고리 id 조회"""
+        return CategoryService._find_id(db, Category, user, name)
+    
+    @staticmethod
+    def find_payment_method_id(db: Session, user: User, name: str) -> Optional[int]:
+        """결제 수단 id 조회"""
+        return CategoryService._find_id(db, PaymentMethod, user, name)
+    
+    @staticmethod
+    def get_or_create_payment_method_id(db: Session, user: User, name: Optional[str]) -> Optional[int]:
+        """결제 수단 id 조회 또는 생성 (이름이 없으면 None)"""
+        if not name:
+            return None
+        return CategoryService._get_or_create_id(db, PaymentMethod, user, name)
+    
+    @staticmethod
+    def resolve_names(db: Session, user: User, data: dict) -> dict:
+        """category / payment_method 이름을 category_id / payment_method_id 로 변환"""
+        resolved = dict(data)
+        
+        if "category" in resolved:
+            name = resolved.pop("category")
+            if name is not None:  # 필수 값이므로 null 은 무시
+                resolved["category_id"] = CategoryService.get_or_create_category_id(db, user, name)
+        if "payment_method" in resolved:
+            resolved["payment_method_id"] = CategoryService.get_or_create_payment_method_id(
+                db, user, resolved.pop("payment_method")
+            )
+        
+        return resolved
@@ -1,34 +1,56 @@
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from app.models.entry import Entry
+from sqlalchemy.orm import load_only
+from app.models.entry import Entry, PREVIEW_LENGTH
 from app.models.user import User
 from app.schemas.entry import EntryCreate, EntryUpdate
+from app.services.stats_cache_service import StatsCacheService
+from app.services.report_service import ReportService
+from app.services.budget_service import BudgetService, spend_of
+from app.utils.tracing import trace_methods
+from sqlalchemy import func
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 
 
+@trace_methods
 class EntryService:
     """일상 기록 서비스"""
     
+    @staticmethod
+    def make_preview(content: Optional[str]) -> Optional[str]:
+        """목록용 미리보기 생성"""
+        if content is None:
+            return None
+        return content[:PREVIEW_LENGTH]
+    
     @staticmethod
     def create_entry(db: Session, entry_data: EntryCreate, user: User) -> Entry:
         """일상 기록 생성"""
-        new_entry = Entry(
+        new_entry = EntryService.build_entry(entry_data, user)
+        
+        db.add(new_entry)
+        StatsCacheService.bump_data_version(db, user.id)
+        ReportService.invalidate(db, user.id, [new_entry.date])
+        db.commit()
+        db.refresh(new_entry)
+        
+        return new_entry
+    
+    @staticmethod
+    def build_entry(entry_data: EntryCreate, user: User) -> Entry:
+        """일상 기록 객체 생성 (세션 추가 / 커밋은 호출자)"""
+        return Entry(
             user_id=user.id,
             date=entry_data.date,
             title=entry_data.title,
             content=entry_data.content,
+            preview=EntryService.make_preview(entry_data.content),
             mood=entry_data.mood,
             photos=entry_data.photos,
             tags=entry_data.tags
         )
-        
-        db.add(new_entry)
-        db.commit()
-        db.refresh(new_entry)
-        
-        return new_entry
     
     @staticmethod
     def get_entries(
@@ -37,11 +59,15 @@ class EntryService:
         skip: int = 0,
         limit: int = 20,
         start_date: Optional[date] = None,
-        end_date: Optional[date] = None
+        end_date: Optional[date] = None,
+        fields: Optional[list[str]] = None
     ) -> tuple[list[Entry], int]:
-        """일상 기록 목록 조회"""
+        """일상 기록 목록 조회 (fields 가 주어지면 해당 컬럼만 로드)"""
         query = db.query(Entry).filter(Entry.user_id == user.id)
         
+        if fields:
+            query = query.options(load_only(*[getattr(Entry, field) for field in fields]))
+        
         # 날짜 필터링
         if start_date:
             query = query.filter(Entry.date >= start_date)
@@ -52,7 +78,7 @@ class EntryService:
         total = query.count()
         
         # 페이징 및 정렬 (최신순)
-        entries = query.order_by(Entry.date.desc()).offset(skip).limit(limit).all()
+        entries = query.order_by(Entry.date.desc(), Entry.id).offset(skip).limit(limit).all()
         
         return entries, total
     
@@ -72,6 +98,18 @@ class EntryService:
         
         return entry
     
+    @staticmethod
+    def get_entry_version(db: Session, entry_id: UUID, user: User) -> Optional[tuple[int, datetime]]:
+        """조건부 요청 검증용 (행 버전, 마지막 수정 시각) (본문은 로드하지 않음, 없으면 None)"""
+        row = db.query(
+            Entry.version,
+            func.coalesce(Entry.updated_at, Entry.created_at)
+        ).filter(
+            Entry.id == entry_id,
+            Entry.user_id == user.id
+        ).first()
+        return tuple(row) if row is not None else None
+    
     @staticmethod
     def update_entry(
         db: Session,
@@ -81,12 +119,19 @@ class EntryService:
     ) -> Entry:
         """일상 기록 수정"""
         entry = EntryService.get_entry(db, entry_id, user)
+        previous_date = entry.date
         
         # 업데이트할 필드만 수정
         update_data = entry_data.model_dump(exclude_unset=True)
         for field, value in update_data.items():
             setattr(entry, field, value)
         
+        if "content" in update_data:
+            entry.preview = EntryService.make_preview(entry.content)
+        entry.version = Entry.version + 1
+        
+        StatsCacheService.bump_data_version(db, user.id)
+        ReportService.invalidate(db, user.id, [previous_date, entry.date])
         db.commit()
         db.refresh(entry)
         
@@ -98,5 +143,9 @@ class EntryService:
         entry = EntryService.get_entry(db, entry_id, user)
         
         db.delete(entry)
+        StatsCacheService.bump_data_version(db, user.id)
+        # 함께 삭제되는 연관 거래의 날짜도 포함
+        ReportService.invalidate(db, user.id, [entry.date] + [t.date for t in entry.transactions])
+        BudgetService.apply_spend(db, user.id, removed=[spend_of(t) for t in entry.transactions])
         db.commit()
 
@@ -1,13 +1,27 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only, lazyload
 from fastapi import HTTPException, status
 from app.models.transaction import Transaction
 from app.models.user import User
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.services.category_service import CategoryService
+from app.services.stats_cache_service import StatsCacheService
+from app.services.report_service import ReportService
+from app.services.budget_service import BudgetService, spend_of
+from app.utils.tracing import trace_methods
+from sqlalchemy import func
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 from uuid import UUID
 
+# fields= 이름 -> 로드할 모델 속성 (이름이 같은 컬럼은 생략)
+FIELD_ATTRIBUTES = {
+    "amount": "amount_minor",
+    "category": "category_id",
+    "payment_method": "payment_method_id",
+}
 
+
+@trace_methods
 class FinanceService:
     """경제 관리 서비스"""
     
@@ -23,13 +37,20 @@ class FinanceService:
             entry_id=transaction_data.entry_id,
             date=transaction_data.date,
             type=transaction_data.type,
-            category=transaction_data.category,
-            amount=transaction_data.amount,
+            category_id=CategoryService.get_or_create_category_id(
+                db, user, transaction_data.category
+            ),
+            amount_minor=transaction_data.amount_minor,
             description=transaction_data.description,
-            payment_method=transaction_data.payment_method
+            payment_method_id=CategoryService.get_or_create_payment_method_id(
+                db, user, transaction_data.payment_method
+            )
         )
         
         db.add(new_transaction)
+        StatsCacheService.bump_data_version(db, user.id)
+        ReportService.invalidate(db, user.id, [new_transaction.date])
+        BudgetService.apply_spend(db, user.id, added=[spend_of(new_transaction)])
         db.commit()
         db.refresh(new_transaction)
         
@@ -44,9 +65,10 @@ class FinanceService:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         category: Optional[str] = None,
-        transaction_type: Optional[str] = None
+        transaction_type: Optional[str] = None,
+        fields: Optional[list[str]] = None
     ) -> tuple[list[Transaction], int]:
-        """경제 기록 목록 조회"""
+        """경제 기록 목록 조회 (fields 가 주어지면 해당 컬럼만 로드)"""
         query = db.query(Transaction).filter(Transaction.user_id == user.id)
         
         # 날짜 필터링
@@ -55,9 +77,12 @@ class FinanceService:
         if end_date:
             query = query.filter(Transaction.date <= end_date)
         
-        # 카테고리 필터링
+        # 카테고리 필터링 (사전에 없는 이름이면 결과 없음)
         if category:
-            query = query.filter(Transaction.category == category)
+            category_id = CategoryService.find_category_id(db, user, category)
+            if category_id is None:
+                return [], 0
+            query = query.filter(Transaction.category_id == category_id)
         
         # 타입 필터링
         if transaction_type:
@@ -66,8 +91,17 @@ class FinanceService:
         # 총 개수
         total = query.count()
         
+        # 요청하지 않은 컬럼과 사전 테이블 조인 제외
+        if fields:
+            attributes = [getattr(Transaction, FIELD_ATTRIBUTES.get(f, f)) for f in fields]
+            query = query.options(load_only(*attributes))
+            if "category" not in fields:
+                query = query.options(lazyload(Transaction.category_ref))
+            if "payment_method" not in fields:
+                query = query.options(lazyload(Transaction.payment_method_ref))
+        
         # 페이징 및 정렬 (최신순)
-        transactions = query.order_by(Transaction.date.desc()).offset(skip).limit(limit).all()
+        transactions = query.order_by(Transaction.date.desc(), Transaction.id).offset(skip).limit(limit).all()
         
         return transactions, total
     
@@ -87,6 +121,18 @@ class FinanceService:
         
         return transaction
     
+    @staticmethod
+    def get_transaction_version(db: Session, transaction_id: UUID, user: User) -> Optional[tuple[int, datetime]]:
+        """조건부 요청 검증용 (행 버전, 마지막 수정 시각) (행은 로드하지 않음, 없으면 None)"""
+        row = db.query(
+            Transaction.version,
+            func.coalesce(Transaction.updated_at, Transaction.created_at)
+        ).filter(
+            Transaction.id == transaction_id,
+            Transaction.user_id == user.id
+        ).first()
+        return tuple(row) if row is not None else None
+    
     @staticmethod
     def update_transaction(
         db: Session,
@@ -96,12 +142,20 @@ class FinanceService:
     ) -> Transaction:
         """경제 기록 수정"""
         transaction = FinanceService.get_transaction(db, transaction_id, user)
+        previous_date = transaction.date
+        previous_spend = spend_of(transaction)
         
         # 업데이트할 필드만 수정
-        update_data = transaction_data.model_dump(exclude_unset=True)
+        update_data = CategoryService.resolve_names(
+            db, user, transaction_data.model_fields_for_update()
+        )
         for field, value in update_data.items():
             setattr(transaction, field, value)
+        transaction.version = Transaction.version + 1
         
+        StatsCacheService.bump_data_version(db, user.id)
+        ReportService.invalidate(db, user.id, [previous_date, transaction.date])
+        BudgetService.apply_spend(db, user.id, added=[spend_of(transaction)], removed=[previous_spend])
         db.commit()
         db.refresh(transaction)
         
@@ -113,5 +167,8 @@ class FinanceService:
         transaction = FinanceService.get_transaction(db, transaction_id, user)
         
         db.delete(transaction)
+        StatsCacheService.bump_data_version(db, user.id)
+        ReportService.invalidate(db, user.id, [transaction.date])
+        BudgetService.apply_spend(db, user.id, removed=[spend_of(transaction)])
         db.commit()
 
@@ -1,12 +1,21 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, func
 from app.models.user import User
 from app.models.entry import Entry
 from app.models.transaction import Transaction
 from app.schemas.integrated import EntryWithTransactionsCreate
 from app.services.entry_service import EntryService
+from app.services.category_service import CategoryService
+from app.services.stats_cache_service import StatsCacheService
+from app.services.report_service import ReportService
+from app.services.budget_service import BudgetService, spend_of
+from app.utils.tracing import trace_methods
+from datetime import datetime
+from typing import Optional
 from uuid import UUID
 
 
+@trace_methods
 class IntegratedService:
     """통합 서비스 (일상 기록 + 경제 기록)"""
     
@@ -16,10 +25,12 @@ class IntegratedService:
         data: EntryWithTransactionsCreate,
         user: User
     ) -> tuple[Entry, list[Transaction]]:
-        """일상 기록과 경제 기록 동시 생성"""
+        """일상 기록과 경제 기록 동시 생성 (한 트랜잭션)"""
         
-        # 1. Entry 생성
-        entry = EntryService.create_entry(db, data.entry, user)
+        # 1. Entry 생성 (id 를 얻기 위해 flush 만)
+        entry = EntryService.build_entry(data.entry, user)
+        db.add(entry)
+        db.flush()
         
         # 2. Transactions 생성 (Entry와 연결)
         transactions = []
@@ -29,19 +40,33 @@ class IntegratedService:
                 entry_id=entry.id,  # Entry와 연결
                 date=trans_data.date,
                 type=trans_data.type,
-                category=trans_data.category,
-                amount=trans_data.amount,
+                category_id=CategoryService.get_or_create_category_id(
+                    db, user, trans_data.category
+                ),
+                amount_minor=trans_data.amount_minor,
                 description=trans_data.description,
-                payment_method=trans_data.payment_method
+                payment_method_id=CategoryService.get_or_create_payment_method_id(
+                    db, user, trans_data.payment_method
+                )
             )
-            db.add(transaction)
             transactions.append(transaction)
+        # 카테고리 생성(savepoint)이 끝난 뒤 한꺼번에 추가해야 INSERT 가 한 번에 나간다
+        db.add_all(transactions)
         
+        StatsCacheService.bump_data_version(db, user.id)
+        ReportService.invalidate(db, user.id, [entry.date] + [t.date for t in transactions])
+        BudgetService.apply_spend(db, user.id, added=[spend_of(t) for t in transactions])
+        db.flush()
+        ids = [t.id for t in transactions]  # 커밋 후에 읽으면 거래마다 다시 조회됨
         db.commit()
         
-        # 모든 트랜잭션 refresh
-        for transaction in transactions:
-            db.refresh(transaction)
+        # 커밋으로 만료된 객체를 한 번에 다시 읽음 (거래마다 refresh 하지 않음)
+        db.refresh(entry)
+        if ids:
+            loaded = {
+                t.id: t for t in db.query(Transaction).filter(Transaction.id.in_(ids)).populate_existing()
+            }
+            transactions = [loaded[i] for i in ids]
         
         return entry, transactions
     
@@ -62,4 +87,41 @@ class IntegratedService:
         ).all()
         
         return entry, transactions
+    
+    @staticmethod
+    def get_entry_with_transactions_version(
+        db: Session,
+        entry_id: UUID,
+        user: User
+    ) -> Optional[tuple[int, list[tuple[UUID, int]], datetime]]:
+        """조건부 요청 검증용 (일기 버전, [(거래 id, 거래 버전)], 마지막 수정 시각) (없으면 None)
 
+        거래가 수정 / 삭제되거나 다른 일기로 옮겨지면 거래 id / 버전 목록이 바뀐다. 본문은 로드하지 않는다.
+        """
+        rows = db.execute(
+            select(
+                Entry.version,
+                func.coalesce(Entry.updated_at, Entry.created_at),
+                Transaction.id,
+                Transaction.version,
+                func.coalesce(Transaction.updated_at, Transaction.created_at)
+            ).outerjoin(
+                Transaction, Transaction.entry_id == Entry.id
+            ).where(
+                Entry.id == entry_id,
+                Entry.user_id == user.id
+            )
+        ).all()
+        
+        if not rows:
+            return None
+        
+        entry_version, last_modified = rows[0][0], rows[0][1]
+        transactions = []
+        for _, _, transaction_id, transaction_version, transaction_modified in rows:
+            if transaction_id is None:
+                continue
+            transactions.append((transaction_id, transaction_version))
+            last_modified = max(last_modified, transaction_modified)
+        
+        return entry_version, transactions, last_modified
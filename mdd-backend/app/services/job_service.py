@@ -0,0 +1,108 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi import HTTPException, status
+from app.models.job import Job, JobStatus, FINISHED_STATUSES
+from app.models.user import User
+from app.jobs.registry import get_definition
+from app.jobs.backend import get_backend
+from app.config import get_settings
+from app.utils.tracing import trace_methods
+from typing import Any, Optional
+from uuid import UUID
+
+settings = get_settings()
+
+
+@trace_methods
+class JobService:
+    """백그라운드 작업 서비스"""
+    
+    @staticmethod
+    def create_job(
+        db: Session,
+        user: User,
+        kind: str,
+        params: Optional[dict[str, Any]] = None,
+        public_only: bool = False
+    ) -> Job:
+        """작업 생성 후 실행 백엔드에 제출"""
+        definition = get_definition(kind)
+        if definition is None or (public_only and not definition.public):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"지원하지 않는 작업 종류입니다: {kind}"
+            )
+        
+        active = db.query(func.count(Job.id)).filter(
+            Job.user_id == user.id,
+            Job.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+        ).scalar()
+        if active >= settings.JOB_MAX_ACTIVE_PER_USER:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"동시에 실행할 수 있는 작업은 최대 {settings.JOB_MAX_ACTIVE_PER_USER}개입니다"
+            )
+        
+        job = Job(
+            user_id=user.id,
+            kind=kind,
+            status=JobStatus.PENDING,
+            params=params or {},
+            progress=0.0,
+            cancel_requested=False
+        )
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        
+        # 커밋 후 제출해야 워커가 행을 볼 수 있음
+        get_backend().submit(job.id, definition.executor)
+        
+        return job
+    
+    @staticmethod
+    def get_jobs(db: Session, user: User, limit: int = 20) -> list[Job]:
+        """최근 작업 목록 조회"""
+        return db.query(Job).filter(
+            Job.user_id == user.id
+        ).order_by(Job.created_at.desc()).limit(limit).all()
+    
+    @staticmethod
+    def get_job(db: Session, job_id: UUID, user: User) -> Job:
+        """작업 상태 조회"""
+        job = db.query(Job).filter(
+            Job.id == job_id,
+            Job.user_id == user.id
+        ).first()
+        
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="작업을 찾을 수 없습니다"
+            )
+        
+        return job
+    
+    @staticmethod
+    def cancel_job(db: Session, job_id: UUID, user: User) -> Job:
+        """작업 취소
+
+        대기 중인 작업은 바로 취소되고, 실행 중인 작업은 다음 진행률 기록 / 취소 확인 시점에 중단된다.
+        """
+        job = JobService.get_job(db, job_id, user)
+        if job.status in FINISHED_STATUSES:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="이미 종료된 작업입니다"
+            )
+        
+        job.cancel_requested = True
+        # 아직 시작 전이면 바로 취소 (워커는 cancel_requested 인 작업을 시작하지 않음)
+        db.query(Job).filter(
+            Job.id == job.id,
+            Job.status == JobStatus.PENDING
+        ).update({Job.status: JobStatus.CANCELLED, Job.finished_at: func.now()}, synchronize_session=False)
+        db.commit()
+        db.refresh(job)
+        
+        return job
@@ -0,0 +1,180 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, union, BigInteger, cast
+from app.models.category import Category
+from app.models.entry import Entry
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.utils.sql import date_bucket
+from app.utils.tracing import trace_methods
+from datetime import date
+from typing import Optional
+from uuid import UUID
+import numpy as np
+
+# 사용자 기간 지출 분포 구간: i 번째 구간은 [10^i, 10^(i+1)) 최소 화폐 단위 (마지막 구간은 그 이상 전부)
+SPEND_BINS = 12
+
+# 집계 테이블: 이름 -> (키 열, 합계 열). 파티션끼리 사용자가 겹치지 않으므로 모든 값은 더해서 합친다.
+TABLES: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {
+    "total": ((), ("users", "active_users")),
+    "monthly_active": (("month",), ("users",)),
+    "category": (("category",), ("users", "transactions", "amount")),
+    "category_spend": (("category", "bin"), ("users",)),
+    "user_spend": (("bin",), ("users",)),
+    "cohort": (("cohort",), ("users",)),
+    "cohort_entries": (("cohort", "month"), ("writers", "entries")),
+}
+
+# 사용자 id 범위 [하한, 상한) (상한 None: 끝까지)
+UserRange = tuple[UUID, Optional[UUID]]
+
+
+def user_ranges(count: int) -> list[UserRange]:
+    """UUID 공간을 count 개의 같은 크기 범위로 나눔"""
+    step = (1 << 128) // count
+    bounds = [UUID(int=step * i) for i in range(count)]
+    return [(bounds[i], bounds[i + 1] if i + 1 < count else None) for i in range(count)]
+
+
+def _in_range(column, user_range: UserRange):
+    lower, upper = user_range
+    condition = column >= lower
+    if upper is not None:
+        condition = condition & (column < upper)
+    return condition
+
+
+def spend_bin(amounts: np.ndarray) -> np.ndarray:
+    """금액(최소 화폐 단위) -> 분포 구간 번호"""
+    return np.clip(np.floor(np.log10(np.maximum(amounts, 1))), 0, SPEND_BINS - 1).astype(np.int64)
+
+
+def _column(values: list, dtype) -> np.ndarray:
+    return np.array(values, dtype=dtype) if values else np.empty(0, dtype=dtype)
+
+
+def merge(parts: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """파티션 결과(열 이름 "<테이블>.<열>") 를 키별 합계로 합침"""
+    merged: dict[str, np.ndarray] = {}
+    for table, (keys, values) in TABLES.items():
+        key_columns = [np.concatenate([part[f"{table}.{k}"] for part in parts]) for k in keys]
+        value_columns = [np.concatenate([part[f"{table}.{v}"] for part in parts]) for v in values]
+        
+        if not keys:
+            for name, column in zip(values, value_columns):
+                merged[f"{table}.{name}"] = column.sum(keepdims=True)
+            continue
+        
+        records = np.rec.fromarrays(key_columns, names=list(keys))
+        unique, inverse = np.unique(records, return_inverse=True)
+        for name in keys:
+            merged[f"{table}.{name}"] = np.asarray(unique[name])
+        for name, column in zip(values, value_columns):
+            total = np.zeros(len(unique), dtype=np.int64)
+            np.add.at(total, inverse, column)
+            merged[f"{table}.{name}"] = total
+    return merged
+
+
+@trace_methods
+class PlatformStatsService:
+    """전체 사용자 집계 (운영용)
+
+    사용자 id 범위 하나(파티션)를 집계해 열 배열로 반환한다. 결과는 사용자 단위로 나뉘므로 파티션 결과를
+    merge 로 더하면 전체 결과가 된다 (서로 다른 사용자 수도 그대로 더할 수 있음).
+    """
+    
+    @staticmethod
+    def fingerprint(db: Session, user_range: UserRange) -> list:
+        """파티션 데이터 지문 (사용자 수, 데이터 버전 합, 마지막 변경 / 가입 시각)
+
+        거래 / 일기를 쓰면 사용자의 data_version 이 오르므로 지문이 같으면 이전 집계를 다시 쓸 수 있다.
+        """
+        row = db.execute(
+            select(
+                func.count(User.id),
+                func.coalesce(func.sum(User.data_version), 0),
+                func.max(User.data_updated_at),
+                func.max(User.created_at)
+            ).where(_in_range(User.id, user_range))
+        ).one()
+        return [row[0], int(row[1]), *(value.isoformat() if value else None for value in row[2:])]
+    
+    @staticmethod
+    def aggregate(db: Session, user_range: UserRange, start: date, end: date) -> dict[str, np.ndarray]:
+        """파티션 집계 -> {"<테이블>.<열>": 배열} (기간 [start, end))"""
+        columns: dict[str, np.ndarray] = {}
+        
+        def in_period(model):
+            return (model.date >= start) & (model.date < end) & _in_range(model.user_id, user_range)
+        
+        # 월별 활성 사용자 (거래나 일기를 남긴 사용자)
+        activity = union(
+            select(Transaction.user_id, date_bucket("month", Transaction.date).label("month")).where(in_period(Transaction)),
+            select(Entry.user_id, date_bucket("month", Entry.date).label("month")).where(in_period(Entry))
+        ).subquery()
+        rows = db.execute(
+            select(activity.c.month, func.count(activity.c.user_id.distinct()))
+            .group_by(activity.c.month).order_by(activity.c.month)
+        ).all()
+        columns["monthly_active.month"] = _column([r[0] for r in rows], "datetime64[D]")
+        columns["monthly_active.users"] = _column([r[1] for r in rows], np.int64)
+        
+        users = db.execute(select(func.count(User.id)).where(_in_range(User.id, user_range))).scalar()
+        active = db.execute(select(func.count(activity.c.user_id.distinct()))).scalar()
+        columns["total.users"] = np.array([users], dtype=np.int64)
+        columns["total.active_users"] = np.array([active], dtype=np.int64)
+        
+        # 카테고리별 지출 (사용자별 합계에서 카테고리 합계와 사용자 지출 분포를 함께 계산)
+        rows = db.execute(
+            select(Transaction.user_id, Category.name, func.count(Transaction.id),
+                   cast(func.sum(Transaction.amount_minor), BigInteger))
+            .join(Category, Category.id == Transaction.category_id)
+            .where(in_period(Transaction), Transaction.type == TransactionType.EXPENSE)
+            .group_by(Transaction.user_id, Category.name)
+        ).all()
+        categories = _column([r[1] for r in rows], np.str_)
+        counts = _column([r[2] for r in rows], np.int64)
+        amounts = _column([r[3] for r in rows], np.int64)
+        user_ids = _column([r[0].hex for r in rows], np.str_)
+        ones = np.ones(len(rows), dtype=np.int64)
+        
+        columns["category.category"] = categories
+        columns["category.users"] = ones
+        columns["category.transactions"] = counts
+        columns["category.amount"] = amounts
+        columns["category_spend.category"] = categories
+        columns["category_spend.bin"] = spend_bin(amounts)
+        columns["category_spend.users"] = ones
+        
+        # 사용자 기간 지출 합계 분포
+        per_user = np.zeros(0, dtype=np.int64)
+        if len(rows):
+            unique_users, inverse = np.unique(user_ids, return_inverse=True)
+            per_user = np.zeros(len(unique_users), dtype=np.int64)
+            np.add.at(per_user, inverse, amounts)
+        columns["user_spend.bin"] = spend_bin(per_user)
+        columns["user_spend.users"] = np.ones(len(per_user), dtype=np.int64)
+        
+        # 가입 월 코호트별 사용자 수와 월별 일기 작성자 / 일기 수
+        cohort = date_bucket("month", User.created_at)
+        rows = db.execute(
+            select(cohort, func.count(User.id)).where(_in_range(User.id, user_range)).group_by(cohort)
+        ).all()
+        columns["cohort.cohort"] = _column([r[0] for r in rows], "datetime64[D]")
+        columns["cohort.users"] = _column([r[1] for r in rows], np.int64)
+        
+        month = date_bucket("month", Entry.date)
+        rows = db.execute(
+            select(cohort, month, func.count(Entry.user_id.distinct()), func.count(Entry.id))
+            .join(User, User.id == Entry.user_id)
+            .where(in_period(Entry))
+            .group_by(cohort, month)
+        ).all()
+        columns["cohort_entries.cohort"] = _column([r[0] for r in rows], "datetime64[D]")
+        columns["cohort_entries.month"] = _column([r[1] for r in rows], "datetime64[D]")
+        columns["cohort_entries.writers"] = _column([r[2] for r in rows], np.int64)
+        columns["cohort_entries.entries"] = _column([r[3] for r in rows], np.int64)
+        
+        # 파티션 안에서도 키별로 합쳐 파일 크기를 줄임
+        return merge([columns])
@@ -0,0 +1,225 @@
+from sqlalchemy.orm import Session, lazyload
+from sqlalchemy import insert, Row
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from fastapi import HTTPException, status
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.recurring import RecurringRuleCreate, RecurringRuleUpdate
+from app.services.category_service import CategoryService
+from app.services.stats_cache_service import StatsCacheService
+from app.services.report_service import ReportService
+from app.services.budget_service import BudgetService, spend_of
+from app.utils.recurrence import occurrence_date, due_occurrences, first_index_on_or_after
+from app.utils.tracing import trace_methods
+from datetime import date
+from typing import Any, Optional
+from uuid import UUID
+import uuid
+
+# 한 번에 처리할 규칙 수 (배치마다 커밋)
+RULE_BATCH_SIZE = 500
+# INSERT 한 문장에 넣을 거래 수 (바인드 파라미터 수 제한)
+INSERT_CHUNK_SIZE = 1000
+# 규칙 하나에서 배치마다 만들 최대 발생 수 (오래 밀린 규칙은 다음 배치에서 이어서)
+MAX_OCCURRENCES_PER_RULE = 366
+
+
+def _insert_occurrences(db: Session, rows: list[dict[str, Any]]) -> list[Row]:
+    """(recurring_rule_id, date) 가 이미 있으면 건너뛰며 일괄 INSERT -> 실제 추가된 행"""
+    dialect = db.get_bind().dialect.name
+    inserted = []
+    for i in range(0, len(rows), INSERT_CHUNK_SIZE):
+        chunk = rows[i:i + INSERT_CHUNK_SIZE]
+        if dialect == "postgresql":
+            stmt = pg_insert(Transaction).values(chunk).on_conflict_do_nothing(index_elements=["recurring_rule_id", "date"])
+        elif dialect == "sqlite":
+            stmt = sqlite_insert(Transaction).values(chunk).on_conflict_do_nothing(index_elements=["recurring_rule_id", "date"])
+        else:
+            stmt = insert(Transaction).values(chunk)
+        inserted.extend(db.execute(stmt.returning(
+            Transaction.user_id, Transaction.date, Transaction.type, Transaction.category_id, Transaction.amount_minor
+        )).all())
+    return inserted
+
+
+def _next_date(rule: RecurringRule) -> Optional[date]:
+    """next_index 에 해당하는 발생일 (종료일을 넘으면 None)"""
+    day = occurrence_date(rule.start_date, rule.frequency.value, rule.interval, rule.next_index)
+    if rule.end_date and day > rule.end_date:
+        return None
+    return day
+
+
+@trace_methods
+class RecurringService:
+    """반복 거래 서비스"""
+    
+    @staticmethod
+    def create_rule(db: Session, rule_data: RecurringRuleCreate, user: User) -> RecurringRule:
+        """반복 거래 규칙 생성 (오늘까지의 발생분은 바로 생성)"""
+        rule = RecurringRule(
+            user_id=user.id,
+            type=rule_data.type,
+            category_id=CategoryService.get_or_create_category_id(db, user, rule_data.category),
+            amount_minor=rule_data.amount_minor,
+            description=rule_data.description,
+            payment_method_id=CategoryService.get_or_create_payment_method_id(
+                db, user, rule_data.payment_method
+            ),
+            frequency=rule_data.frequency,
+            interval=rule_data.interval,
+            start_date=rule_data.start_date,
+            end_date=rule_data.end_date,
+            next_index=0,
+            next_date=rule_data.start_date,
+            active=True
+        )
+        
+        db.add(rule)
+        db.commit()
+        
+        RecurringService.materialize(db, rule_ids=[rule.id])
+        db.refresh(rule)
+        
+        return rule
+    
+    @staticmethod
+    def get_rules(db: Session, user: User) -> list[RecurringRule]:
+        """반복 거래 규칙 목록 조회"""
+        return db.query(RecurringRule).filter(
+            RecurringRule.user_id == user.id
+        ).order_by(RecurringRule.created_at).all()
+    
+    @staticmethod
+    def get_rule(db: Session, rule_id: UUID, user: User) -> RecurringRule:
+        """반복 거래 규칙 상세 조회"""
+        rule = db.query(RecurringRule).filter(
+            RecurringRule.id == rule_id,
+            RecurringRule.user_id == user.id
+        ).first()
+        
+        if not rule:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="반복 거래 규칙을 찾을 수 없습니다"
+            )
+        
+        return rule
+    
+    @staticmethod
+    def update_rule(
+        db: Session,
+        rule_id: UUID,
+        rule_data: RecurringRuleUpdate,
+        user: User,
+        today: Optional[date] = None
+    ) -> RecurringRule:
+        """반복 거래 규칙 수정 (이미 만든 거래는 바꾸지 않음)
+
+        멈췄던 규칙을 다시 켜면 멈춘 동안의 발생분은 만들지 않고 today 당일 또는 그 뒤 첫 발생부터 이어간다.
+        """
+        today = today or date.today()
+        rule = RecurringService.get_rule(db, rule_id, user)
+        
+        update_data = CategoryService.resolve_names(db, user, rule_data.model_fields_for_update())
+        if update_data.get("end_date") is not None and update_data["end_date"] < rule.start_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="종료일은 시작일보다 빠를 수 없습니다"
+            )
+        resumed = update_data.get("active") is True and not rule.active
+        for field, value in update_data.items():
+            setattr(rule, field, value)
+        
+        if resumed:
+            rule.next_index = first_index_on_or_after(
+                rule.start_date, rule.frequency.value, rule.interval, rule.next_index, today
+            )
+        if resumed or "end_date" in update_data:
+            rule.next_date = _next_date(rule)
+        
+        db.commit()
+        
+        RecurringService.materialize(db, today=today, rule_ids=[rule.id])
+        db.refresh(rule)
+        
+        return rule
+    
+    @staticmethod
+    def delete_rule(db: Session, rule_id: UUID, user: User) -> None:
+        """반복 거래 규칙 삭제 (이미 만든 거래는 남김)"""
+        rule = RecurringService.get_rule(db, rule_id, user)
+        
+        db.query(Transaction).filter(
+            Transaction.user_id == user.id,
+            Transaction.recurring_rule_id == rule.id
+        ).update({Transaction.recurring_rule_id: None}, synchronize_session=False)
+        db.delete(rule)
+        db.commit()
+    
+    @staticmethod
+    def materialize(
+        db: Session,
+        today: Optional[date] = None,
+        rule_ids: Optional[list[UUID]] = None,
+        batch_size: int = RULE_BATCH_SIZE
+    ) -> int:
+        """today 까지 도래한 발생분을 거래로 생성 -> 생성한 거래 수
+
+        규칙을 batch_size 개씩 잠그고(PostgreSQL: SKIP LOCKED 로 여러 실행기가 나눠 처리) 발생분을
+        일괄 INSERT 한 뒤 next_index 를 옮기고 커밋한다. (규칙, 날짜) unique 인덱스에 걸리는 행은
+        건너뛰므로 중간에 중단된 뒤 다시 실행해도 중복이 생기지 않고, 밀린 기간은 그대로 따라잡는다.
+        """
+        today = today or date.today()
+        created = 0
+        
+        while True:
+            query = db.query(RecurringRule).options(lazyload("*")).filter(
+                RecurringRule.active.is_(True),
+                RecurringRule.next_date.isnot(None),
+                RecurringRule.next_date <= today
+            )
+            if rule_ids is not None:
+                query = query.filter(RecurringRule.id.in_(rule_ids))
+            rules = query.order_by(RecurringRule.next_date, RecurringRule.id).limit(batch_size).with_for_update(
+                skip_locked=True, of=RecurringRule
+            ).all()
+            if not rules:
+                break
+            
+            rows = []
+            for rule in rules:
+                occurrences = due_occurrences(
+                    rule.start_date, rule.frequency.value, rule.interval, rule.next_index,
+                    today, rule.end_date, MAX_OCCURRENCES_PER_RULE
+                )
+                for _, day in occurrences:
+                    rows.append({
+                        "id": uuid.uuid4(),
+                        "user_id": rule.user_id,
+                        "date": day,
+                        "type": rule.type,
+                        "category_id": rule.category_id,
+                        "amount_minor": rule.amount_minor,
+                        "description": rule.description,
+                        "payment_method_id": rule.payment_method_id,
+                        "recurring_rule_id": rule.id,
+                    })
+                
+                if occurrences:
+                    rule.next_index = occurrences[-1][0] + 1
+                rule.next_date = _next_date(rule)
+            
+            inserted_by_user: dict[UUID, list[Row]] = {}
+            for row in _insert_occurrences(db, rows):
+                inserted_by_user.setdefault(row.user_id, []).append(row)
+            for user_id, inserted in sorted(inserted_by_user.items()):  # 사용자 행 잠금 순서 고정
+                StatsCacheService.bump_data_version(db, user_id)
+                ReportService.invalidate(db, user_id, [row.date for row in inserted])
+                BudgetService.apply_spend(db, user_id, added=[spend_of(row) for row in inserted])
+                created += len(inserted)
+            db.commit()
+        
+        return created
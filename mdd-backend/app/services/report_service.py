@@ -0,0 +1,174 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func, or_, and_
+from sqlalchemy.exc import IntegrityError
+from app.models.entry import Entry
+from app.models.transaction import TransactionType
+from app.models.report import ReportSnapshot
+from app.models.user import User
+from app.schemas.report import ReportPeriod, ReportResponse
+from app.schemas.stats import AnalyticsDimension, AnalyticsMeasure, AnalyticsFilters
+from app.services.analytics_service import AnalyticsService
+from app.services.stats_cache_service import StatsCacheService
+from app.utils.tracing import trace_methods
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+# 리포트에 포함할 지출 상위 카테고리 수
+TOP_CATEGORIES = 5
+
+
+def period_start(day: date, period: ReportPeriod) -> date:
+    """day 가 속한 기간의 시작일"""
+    if period == ReportPeriod.YEAR:
+        return date(day.year, 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def period_end(start: date, period: ReportPeriod) -> date:
+    """기간의 다음 날 (종료 경계, 미포함)"""
+    if period == ReportPeriod.YEAR or start.month == 12:
+        return date(start.year + 1, 1, 1)
+    return date(start.year, start.month + 1, 1)
+
+
+def is_closed(start: date, period: ReportPeriod, today: Optional[date] = None) -> bool:
+    """기간이 끝났는지 (끝난 기간만 스냅샷으로 저장)"""
+    return period_end(start, period) <= (today or date.today())
+
+
+@trace_methods
+class ReportService:
+    """월간 / 연간 리포트 서비스"""
+    
+    @staticmethod
+    def compute(db: Session, user: User, period: ReportPeriod, start: date) -> dict[str, Any]:
+        """리포트 데이터 계산 (금액은 최소 화폐 단위 정수)"""
+        end = period_end(start, period) - timedelta(days=1)
+        filters = AnalyticsFilters(start_date=start, end_date=end)
+        
+        # 수입 / 지출 합계
+        totals, _ = AnalyticsService.run(
+            db, user,
+            dimensions=[AnalyticsDimension.TYPE],
+            measures=[AnalyticsMeasure.SUM, AnalyticsMeasure.COUNT],
+            filters=filters
+        )
+        amounts = {row["type"]: row["sum"] for row in totals}
+        total_income = amounts.get(TransactionType.INCOME.value, 0)
+        total_expense = amounts.get(TransactionType.EXPENSE.value, 0)
+        
+        # 지출 상위 카테고리
+        categories, _ = AnalyticsService.run(
+            db, user,
+            dimensions=[AnalyticsDimension.CATEGORY],
+            measures=[AnalyticsMeasure.SUM, AnalyticsMeasure.COUNT],
+            filters=AnalyticsFilters(start_date=start, end_date=end, type=TransactionType.EXPENSE)
+        )
+        categories.sort(key=lambda row: row["sum"], reverse=True)
+        
+        # 기분별 일기 수
+        moods = db.query(Entry.mood, func.count(Entry.id)).filter(
+            Entry.user_id == user.id,
+            Entry.date >= start,
+            Entry.date <= end
+        ).group_by(Entry.mood).all()
+        
+        return {
+            "total_income": total_income,
+            "total_expense": total_expense,
+            "net": total_income - total_expense,
+            "transaction_count": sum(row["count"] for row in totals),
+            "entry_count": sum(count for _, count in moods),
+            "mood_counts": {mood: count for mood, count in moods if mood is not None},
+            "top_categories": [
+                {
+                    "category": row["category"],
+                    "total_amount": row["sum"],
+                    "transaction_count": row["count"],
+                    "percentage": round(row["sum"] * 100 / total_expense, 2) if total_expense > 0 else 0
+                }
+                for row in categories[:TOP_CATEGORIES]
+            ]
+        }
+    
+    @staticmethod
+    def _response(period: ReportPeriod, start: date, data: dict[str, Any], generated_at: datetime, snapshot: bool) -> ReportResponse:
+        return ReportResponse(
+            period=period,
+            start_date=start,
+            end_date=period_end(start, period) - timedelta(days=1),
+            generated_at=generated_at,
+            snapshot=snapshot,
+            **data
+        )
+    
+    @staticmethod
+    def _find_snapshot(db: Session, user: User, period: ReportPeriod, start: date) -> Optional[ReportSnapshot]:
+        return db.query(ReportSnapshot).filter(
+            ReportSnapshot.user_id == user.id,
+            ReportSnapshot.period == period.value,
+            ReportSnapshot.period_start == start
+        ).first()
+    
+    @staticmethod
+    def get_snapshot(db: Session, user: User, period: ReportPeriod, start: date) -> ReportSnapshot:
+        """마감된 기간의 스냅샷 조회, 없으면 계산해 저장
+
+        계산부터 저장까지 사용자 행을 잠근다. 잠그지 않으면 계산 중에 커밋된 소급 기록의 invalidate 가
+        아직 없는 스냅샷을 지우고 지나가 이전 데이터로 계산한 스냅샷이 남는다. 기록 쓰기는 invalidate 전에
+        bump_data_version 으로 같은 행을 잠그므로 스냅샷 저장이 커밋될 때까지 기다렸다가 지운다.
+        """
+        snapshot = ReportService._find_snapshot(db, user, period, start)
+        if snapshot:
+            return snapshot
+        
+        StatsCacheService.lock_user(db, user.id)
+        snapshot = ReportService._find_snapshot(db, user, period, start)  # 잠금을 기다리는 사이 저장되었을 수 있음
+        if snapshot:
+            db.commit()
+            return snapshot
+        
+        data = ReportService.compute(db, user, period, start)
+        
+        # 동시에 같은 리포트를 만든 경우 unique 제약 위반 -> 먼저 저장된 행 사용
+        try:
+            with db.begin_nested():
+                snapshot = ReportSnapshot(user_id=user.id, period=period.value, period_start=start, data=data)
+                db.add(snapshot)
+        except IntegrityError:
+            snapshot = ReportService._find_snapshot(db, user, period, start)
+        db.commit()
+        db.refresh(snapshot)
+        
+        return snapshot
+    
+    @staticmethod
+    def get_report(db: Session, user: User, period: ReportPeriod, start: date) -> ReportResponse:
+        """리포트 조회 (마감된 기간은 스냅샷, 진행 중인 기간은 매번 계산)"""
+        if not is_closed(start, period):
+            data = ReportService.compute(db, user, period, start)
+            return ReportService._response(period, start, data, datetime.now(timezone.utc), snapshot=False)
+        
+        snapshot = ReportService.get_snapshot(db, user, period, start)
+        return ReportService._response(period, start, snapshot.data, snapshot.created_at, snapshot=True)
+    
+    @staticmethod
+    def invalidate(db: Session, user_id: UUID, days: Iterable[Optional[date]]) -> None:
+        """소급 기록이 생긴 마감 기간의 스냅샷 삭제 (커밋은 호출한 쪽에서)
+
+        진행 중인 기간은 스냅샷이 없으므로 쿼리하지 않는다.
+        """
+        today = date.today()
+        conditions = []
+        for day in {d for d in days if d is not None}:
+            for period in ReportPeriod:
+                start = period_start(day, period)
+                if is_closed(start, period, today):
+                    conditions.append(and_(ReportSnapshot.period == period.value, ReportSnapshot.period_start == start))
+        
+        if conditions:
+            db.query(ReportSnapshot).filter(
+                ReportSnapshot.user_id == user_id,
+                or_(*conditions)
+            ).delete(synchronize_session=False)
@@ -0,0 +1,210 @@
+from sqlalchemy import Integer, select, delete
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import Table
+from fastapi import HTTPException, status
+from app.config import get_settings
+from app.database import Base, shard_engines, shard_session, is_sharded
+from app.models.job import Job, JobStatus
+from app.models.user import User
+from app.models.user_directory import UserDirectory
+from app.utils.cache import LRUCache
+from app.utils.tracing import trace_methods
+from typing import Optional
+from uuid import UUID
+import app.models  # noqa: F401  (모든 모델을 metadata 에 등록)
+
+settings = get_settings()
+
+# user_id -> 샤드 프로세스 내 캐시 (사용자를 옮긴 뒤 오래된 항목은 get_current_user 에서 다시 조회)
+_shard_cache = LRUCache(maxsize=100000)
+
+
+def _user_tables() -> list[Table]:
+    """사용자에 속한 테이블 (FK 순서, users / user_directory 제외)"""
+    return [
+        table for table in Base.metadata.sorted_tables
+        if "user_id" in table.c and table.name != UserDirectory.__tablename__
+    ]
+
+
+def _has_serial_id(table: Table) -> bool:
+    """샤드마다 새로 발급되는 정수 id 를 쓰는 테이블인지 (옮길 때 id 가 바뀜)"""
+    primary_key = list(table.primary_key.columns)
+    return len(primary_key) == 1 and primary_key[0].name == "id" and isinstance(primary_key[0].type, Integer)
+
+
+def _delete_user_rows(conn: Connection, user_id: UUID) -> None:
+    """사용자 데이터 삭제 (FK 역순)"""
+    for table in reversed(_user_tables()):
+        conn.execute(delete(table).where(table.c.user_id == user_id))
+    conn.execute(delete(User.__table__).where(User.__table__.c.id == user_id))
+
+
+@trace_methods
+class ShardService:
+    """사용자 샤드 배치 / 조회 / 이동
+
+    샤드가 하나면 디렉터리를 조회하지 않고 항상 샤드 0 을 사용한다.
+    """
+    
+    @staticmethod
+    def placement(user_id: UUID) -> int:
+        """새 사용자를 배치할 샤드"""
+        shards = settings.SHARD_NEW_USER_SHARDS or list(range(len(shard_engines)))
+        return shards[user_id.int % len(shards)]
+    
+    @staticmethod
+    def shard_of(user_id: UUID) -> Optional[int]:
+        """사용자의 샤드 (디렉터리에 없으면 None)"""
+        if not is_sharded():
+            return 0
+        
+        cached = _shard_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
+        with shard_session(0) as directory:
+            shard = directory.query(UserDirectory.shard).filter(UserDirectory.user_id == user_id).scalar()
+        
+        if shard is not None:
+            _shard_cache.set(user_id, shard)
+        return shard
+    
+    @staticmethod
+    def forget(user_id: UUID) -> None:
+        """캐시된 샤드 삭제"""
+        _shard_cache.delete(user_id)
+    
+    @staticmethod
+    def shard_of_email(email: str) -> Optional[int]:
+        """이메일로 사용자의 샤드 조회 (로그인용, 없으면 None)"""
+        if not is_sharded():
+            return 0
+        
+        with shard_session(0) as directory:
+            return directory.query(UserDirectory.shard).filter(UserDirectory.email == email).scalar()
+    
+    @staticmethod
+    def register(user_id: UUID, email: str) -> int:
+        """디렉터리에 새 사용자 등록 후 배치할 샤드 반환 (모든 샤드에 걸친 이메일 중복 검사)"""
+        shard = ShardService.placement(user_id)
+        
+        with shard_session(0) as directory:
+            directory.add(UserDirectory(user_id=user_id, email=email, shard=shard))
+            try:
+                directory.commit()
+            except IntegrityError:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="이미 등록된 이메일입니다"
+                )
+        
+        return shard
+    
+    @staticmethod
+    def unregister(user_id: UUID) -> None:
+        """디렉터리에서 삭제 (사용자 생성 실패 시 되돌리기)"""
+        with shard_session(0) as directory:
+            directory.query(UserDirectory).filter(UserDirectory.user_id == user_id).delete()
+            directory.commit()
+        ShardService.forget(user_id)
+    
+    @staticmethod
+    def move_user(user_id: UUID, target: int) -> dict[str, int]:
+        """사용자 데이터를 다른 샤드로 이동 -> 테이블별 이동한 행 수
+
+        원본 샤드의 사용자 행을 잠근 채(FOR UPDATE) 대상 샤드에 복사하고, 디렉터리를 바꾼 뒤 원본을 삭제한다.
+        기록을 쓰는 요청은 사용자 행을 갱신하므로 이동이 끝날 때까지 기다렸다가 실패한다 (재시도하면 새 샤드로 감).
+        카테고리 / 결제 수단 / 예산 / 리포트 스냅샷처럼 정수 id 를 쓰는 행은 대상 샤드에서 새 id 를 받고,
+        이를 참조하는 열도 함께 바꾼다. 사용자의 shard_version 을 올려 이름 -> id 캐시도 무효화한다.
+        """
+        if not 0 <= target < len(shard_engines):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"없는 샤드입니다: {target}")
+        
+        ShardService.forget(user_id)
+        source = ShardService.shard_of(user_id)
+        if source is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다")
+        if source == target:
+            return {}
+        
+        users = User.__table__
+        jobs = Job.__table__
+        tables = _user_tables()
+        moved: dict[str, int] = {}
+        
+        with shard_engines[source].connect() as src, shard_engines[target].connect() as dst:
+            src.begin()
+            user_row = src.execute(
+                select(users).where(users.c.id == user_id).with_for_update()
+            ).mappings().first()
+            if user_row is None:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="사용자를 찾을 수 없습니다")
+            
+            active_jobs = src.execute(
+                select(jobs.c.id).where(
+                    jobs.c.user_id == user_id,
+                    jobs.c.status.in_([JobStatus.PENDING, JobStatus.RUNNING])
+                ).limit(1)
+            ).first()
+            if active_jobs is not None:
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="진행 중인 작업이 있어 옮길 수 없습니다")
+            
+            # 1. 대상 샤드에 복사
+            with dst.begin():
+                # 버전을 올려 이전 샤드에서 캐시한 정수 id 를 어느 프로세스에서도 다시 쓰지 않게 함
+                dst.execute(users.insert(), [{**user_row, "shard_version": user_row["shard_version"] + 1}])
+                moved[users.name] = 1
+                
+                id_maps: dict[str, dict[int, int]] = {}
+                for table in tables:
+                    rows = [dict(row) for row in src.execute(select(table).where(table.c.user_id == user_id)).mappings()]
+                    moved[table.name] = len(rows)
+                    if not rows:
+                        continue
+                    
+                    for fk in table.foreign_keys:
+                        id_map = id_maps.get(fk.column.table.name)
+                        if id_map is None:
+                            continue
+                        for row in rows:
+                            if row[fk.parent.name] is not None:
+                                row[fk.parent.name] = id_map[row[fk.parent.name]]
+                    
+                    if _has_serial_id(table):
+                        old_ids = [row.pop("id") for row in rows]
+                        new_ids = dst.execute(
+                            table.insert().returning(table.c.id, sort_by_parameter_order=True), rows
+                        ).scalars().all()
+                        id_maps[table.name] = dict(zip(old_ids, new_ids))
+                    else:
+                        dst.execute(table.insert(), rows)
+            
+            # 2. 디렉터리 변경 (원본이 샤드 0 이면 원본 삭제와 같은 트랜잭션)
+            directory_table = UserDirectory.__table__
+            switch = directory_table.update().where(directory_table.c.user_id == user_id)
+            switched = False
+            try:
+                if source == 0:
+                    src.execute(switch.values(shard=target))
+                else:
+                    with shard_engines[0].begin() as directory:
+                        directory.execute(switch.values(shard=target))
+                    switched = True
+                
+                # 3. 원본 삭제
+                _delete_user_rows(src, user_id)
+                src.commit()
+            except Exception:
+                # 복사본과 디렉터리 변경을 되돌림
+                src.rollback()
+                if switched:
+                    with shard_engines[0].begin() as directory:
+                        directory.execute(switch.values(shard=source))
+                with dst.begin():
+                    _delete_user_rows(dst, user_id)
+                raise
+        
+        _shard_cache.set(user_id, target)
+        return moved
@@ -0,0 +1,69 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from fastapi.encoders import jsonable_encoder
+from app.models.user import User
+from app.utils.cache import LRUCache, RedisCache
+from app.utils.sql import lock_rows
+from app.config import get_settings
+from app.utils.tracing import trace_methods
+from typing import Any, Callable, Optional
+from uuid import UUID
+import hashlib
+import json
+
+settings = get_settings()
+
+
+def _create_backend():
+    """설정에 따른 캐시 백엔드 (STATS_CACHE_URL 이 있으면 Redis 공유 캐시)"""
+    if settings.STATS_CACHE_URL:
+        return RedisCache(settings.STATS_CACHE_URL, prefix="stats:", ttl=settings.STATS_CACHE_TTL)
+    return LRUCache(maxsize=settings.STATS_CACHE_SIZE)
+
+
+# get / set / delete / clear 를 제공하는 백엔드면 교체 가능 (set_backend 참고)
+_backend = _create_backend()
+
+
+@trace_methods
+class StatsCacheService:
+    """통계 결과 캐시
+
+    키는 (사용자, 데이터 버전, 엔드포인트, 파라미터) 이므로 기록이 바뀌어 버전이 올라가면
+    이전 결과는 더 이상 조회되지 않고 LRU / TTL 로 자연히 정리된다.
+    """
+    
+    @staticmethod
+    def set_backend(backend) -> None:
+        """캐시 백엔드 교체"""
+        global _backend
+        _backend = backend
+    
+    @staticmethod
+    def bump_data_version(db: Session, user_id: UUID) -> None:
+        """사용자 데이터 버전 증가 (기록을 바꾸는 트랜잭션 안에서 커밋 전에 호출)"""
+        db.query(User).filter(User.id == user_id).update(
+            {User.data_version: User.data_version + 1, User.data_updated_at: func.now()},
+            synchronize_session=False
+        )
+    
+    @staticmethod
+    def lock_user(db: Session, user_id: UUID) -> None:
+        """bump_data_version 과 같은 users 행을 커밋까지 잠금 (그 사이 사용자 기록 쓰기는 대기)"""
+        lock_rows(db, User, User.id == user_id)
+    
+    @staticmethod
+    def make_key(user: User, endpoint: str, params: dict[str, Any]) -> str:
+        """캐시 키 (파라미터는 정렬 후 해시)"""
+        encoded = json.dumps(jsonable_encoder(params), sort_keys=True, separators=(",", ":"))
+        digest = hashlib.sha1(encoded.encode()).hexdigest()
+        return f"{user.id}:{user.data_version}:{endpoint}:{digest}"
+    
+    @staticmethod
+    def get_or_compute(key: str, compute: Callable[[], Any]) -> bytes:
+        """캐시된 JSON 본문 반환, 없으면 compute() 결과를 JSON 으로 직렬화해 저장"""
+        body: Optional[bytes] = _backend.get(key)
+        if body is None:
+            body = json.dumps(jsonable_encoder(compute()), ensure_ascii=False, separators=(",", ":")).encode()
+            _backend.set(key, body)
+        return body
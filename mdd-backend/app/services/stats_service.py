@@ -1,13 +1,34 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func, extract
+from sqlalchemy import select, func, case, cast, or_, BigInteger
+from app.models.entry import Entry
 from app.models.transaction import Transaction, TransactionType
+from app.models.category import Category
 from app.models.user import User
-from app.schemas.stats import DailyStats, MonthlyStats, CategoryStats
-from datetime import date
-from decimal import Decimal
+from app.schemas.stats import (
+    DailyStats, MonthlyStats, CategoryStats, MoodStats, MoodCategoryStats, BalancePoint, BalanceResponse,
+    AnalyticsDimension, AnalyticsMeasure, AnalyticsFilters
+)
+from app.services.analytics_service import AnalyticsService
+from app.utils.tracing import trace_methods
+from datetime import date, timedelta
 from typing import Optional
+import numpy as np
 
 
+def _sum_amount():
+    """금액 합계 (정수 최소 화폐 단위, PostgreSQL sum(bigint)의 numeric 결과를 다시 bigint 로)"""
+    return cast(func.sum(Transaction.amount_minor), BigInteger)
+
+
+def _signed_amount():
+    """수입은 +, 지출은 - 금액"""
+    return case(
+        (Transaction.type == TransactionType.INCOME, Transaction.amount_minor),
+        else_=-Transaction.amount_minor
+    )
+
+
+@trace_methods
 class StatsService:
     """통계 서비스"""
     
@@ -21,33 +42,27 @@ class StatsService:
         """일별 통계 조회"""
         
         # 날짜별 수입/지출 집계
-        query = db.query(
-            Transaction.date,
-            Transaction.type,
-            func.sum(Transaction.amount).label("total")
-        ).filter(
-            Transaction.user_id == user.id,
-            Transaction.date >= start_date,
-            Transaction.date <= end_date
-        ).group_by(
-            Transaction.date,
-            Transaction.type
-        ).all()
+        rows, _ = AnalyticsService.run(
+            db, user,
+            dimensions=[AnalyticsDimension.DAY, AnalyticsDimension.TYPE],
+            measures=[AnalyticsMeasure.SUM],
+            filters=AnalyticsFilters(start_date=start_date, end_date=end_date)
+        )
         
         # 날짜별로 그룹화
         daily_data = {}
-        for row in query:
-            date_key = row.date
+        for row in rows:
+            date_key = row["day"]
             if date_key not in daily_data:
                 daily_data[date_key] = {
-                    "income": Decimal("0"),
-                    "expense": Decimal("0")
+                    "income": 0,
+                    "expense": 0
                 }
             
-            if row.type == TransactionType.INCOME:
-                daily_data[date_key]["income"] = row.total
+            if row["type"] == TransactionType.INCOME.value:
+                daily_data[date_key]["income"] = row["sum"]
             else:
-                daily_data[date_key]["expense"] = row.total
+                daily_data[date_key]["expense"] = row["sum"]
         
         # DailyStats 객체 생성
         stats = []
@@ -61,6 +76,41 @@ class StatsService:
         
         return sorted(stats, key=lambda x: x.date)
     
+    @staticmethod
+    def get_daily_series(
+        db: Session,
+        user: User,
+        start_date: date,
+        end_date: date
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """일별 수입/지출 시계열 -> (날짜, 수입, 지출) 밀집 배열
+
+        거래가 없는 날도 0 으로 채운 start_date ~ end_date 전체 길이의 배열을 반환한다.
+        금액은 정수 최소 화폐 단위 (int64).
+        """
+        days = np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+        income = np.zeros(len(days), dtype=np.int64)
+        expense = np.zeros(len(days), dtype=np.int64)
+        
+        rows, _ = AnalyticsService.run(
+            db, user,
+            dimensions=[AnalyticsDimension.DAY, AnalyticsDimension.TYPE],
+            measures=[AnalyticsMeasure.SUM],
+            filters=AnalyticsFilters(start_date=start_date, end_date=end_date)
+        )
+        if not rows:
+            return days, income, expense
+        
+        # 날짜 -> 배열 인덱스로 변환해 한 번에 채움
+        offsets = (np.array([row["day"] for row in rows], dtype="datetime64[D]") - days[0]).astype(np.int64)
+        sums = np.array([row["sum"] for row in rows], dtype=np.int64)
+        is_income = np.array([row["type"] == TransactionType.INCOME.value for row in rows])
+        
+        income[offsets[is_income]] = sums[is_income]
+        expense[offsets[~is_income]] = sums[~is_income]
+        
+        return days, income, expense
+    
     @staticmethod
     def get_monthly_stats(
         db: Session,
@@ -70,45 +120,42 @@ class StatsService:
     ) -> list[MonthlyStats]:
         """월별 통계 조회"""
         
-        query = db.query(
-            extract('year', Transaction.date).label('year'),
-            extract('month', Transaction.date).label('month'),
-            Transaction.type,
-            func.sum(Transaction.amount).label('total'),
-            func.count(Transaction.id).label('count')
-        ).filter(
-            Transaction.user_id == user.id
-        )
-        
-        # 년/월 필터링
-        if year:
-            query = query.filter(extract('year', Transaction.date) == year)
-        if month:
-            query = query.filter(extract('month', Transaction.date) == month)
+        # 년/월 필터링 (파티션 프루닝이 되도록 date 범위 조건으로 변환)
+        filters = AnalyticsFilters()
+        if year and month:
+            filters.start_date = date(year, month, 1)
+            filters.end_date = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+            filters.end_date -= timedelta(days=1)
+        elif year:
+            filters.start_date = date(year, 1, 1)
+            filters.end_date = date(year, 12, 31)
+        elif month:
+            filters.month = month
         
-        query = query.group_by(
-            extract('year', Transaction.date),
-            extract('month', Transaction.date),
-            Transaction.type
-        ).all()
+        rows, _ = AnalyticsService.run(
+            db, user,
+            dimensions=[AnalyticsDimension.MONTH, AnalyticsDimension.TYPE],
+            measures=[AnalyticsMeasure.SUM, AnalyticsMeasure.COUNT],
+            filters=filters
+        )
         
         # 월별로 그룹화
         monthly_data = {}
-        for row in query:
-            key = (int(row.year), int(row.month))
+        for row in rows:
+            key = (row["month"].year, row["month"].month)
             if key not in monthly_data:
                 monthly_data[key] = {
-                    "income": Decimal("0"),
-                    "expense": Decimal("0"),
+                    "income": 0,
+                    "expense": 0,
                     "count": 0
                 }
             
-            if row.type == TransactionType.INCOME:
-                monthly_data[key]["income"] = row.total
+            if row["type"] == TransactionType.INCOME.value:
+                monthly_data[key]["income"] = row["sum"]
             else:
-                monthly_data[key]["expense"] = row.total
+                monthly_data[key]["expense"] = row["sum"]
             
-            monthly_data[key]["count"] += row.count
+            monthly_data[key]["count"] += row["count"]
         
         # MonthlyStats 객체 생성
         stats = []
@@ -134,36 +181,165 @@ class StatsService:
     ) -> list[CategoryStats]:
         """카테고리별 통계 조회"""
         
-        query = db.query(
-            Transaction.category,
-            func.sum(Transaction.amount).label('total'),
-            func.count(Transaction.id).label('count')
-        ).filter(
-            Transaction.user_id == user.id,
-            Transaction.type == transaction_type
+        rows, _ = AnalyticsService.run(
+            db, user,
+            dimensions=[AnalyticsDimension.CATEGORY],
+            measures=[AnalyticsMeasure.SUM, AnalyticsMeasure.COUNT],
+            filters=AnalyticsFilters(start_date=start_date, end_date=end_date, type=transaction_type)
         )
         
-        # 날짜 필터링
-        if start_date:
-            query = query.filter(Transaction.date >= start_date)
-        if end_date:
-            query = query.filter(Transaction.date <= end_date)
-        
-        query = query.group_by(Transaction.category).all()
-        
         # 전체 금액 계산
-        total_amount = sum(row.total for row in query)
+        total_amount = sum(row["sum"] for row in rows)
         
-        # CategoryStats 객체 생성
+        # CategoryStats 객체 생성 (정수 금액 기준 정렬/비율 계산)
         stats = []
-        for row in query:
-            percentage = float((row.total / total_amount * 100) if total_amount > 0 else 0)
+        for row in sorted(rows, key=lambda r: r["sum"], reverse=True):
+            percentage = row["sum"] * 100 / total_amount if total_amount > 0 else 0
             stats.append(CategoryStats(
-                category=row.category,
-                total_amount=row.total,
-                transaction_count=row.count,
+                category=row["category"],
+                total_amount=row["sum"],
+                transaction_count=row["count"],
                 percentage=round(percentage, 2)
             ))
         
-        return sorted(stats, key=lambda x: x.total_amount, reverse=True)
+        return stats
+    
+    @staticmethod
+    def get_mood_stats(
+        db: Session,
+        user: User,
+        start_date: date,
+        end_date: date,
+        top_categories: int = 3
+    ) -> list[MoodStats]:
+        """기분별 지출 통계 조회
+
+        entries 에 연결된 지출(transactions.entry_id)을 한 번의 그룹 쿼리로 (기분, 날짜, 카테고리)
+        단위까지 집계한 뒤 기분별로 합친다. 기간 밖 날짜의 거래는 포함하지 않는다.
+        """
+        
+        query = db.query(
+            Entry.mood,
+            Entry.date,
+            Category.name.label('category'),
+            _sum_amount().label('total'),
+            func.count(Transaction.id).label('count')
+        ).outerjoin(
+            Transaction,
+            (Transaction.entry_id == Entry.id)
+            & (Transaction.type == TransactionType.EXPENSE)
+            & (Transaction.date >= start_date)
+            & (Transaction.date <= end_date)
+        ).outerjoin(
+            Category, Category.id == Transaction.category_id
+        ).filter(
+            Entry.user_id == user.id,
+            Entry.date >= start_date,
+            Entry.date <= end_date,
+            Entry.mood.isnot(None)
+        ).group_by(
+            Entry.mood,
+            Entry.date,
+            Transaction.category_id,
+            Category.name
+        ).all()
+        
+        # 기분별로 그룹화
+        mood_data = {}
+        for row in query:
+            if row.mood not in mood_data:
+                mood_data[row.mood] = {
+                    "days": set(),
+                    "total": 0,
+                    "count": 0,
+                    "categories": {}
+                }
+            
+            data = mood_data[row.mood]
+            data["days"].add(row.date)
+            if row.category is not None:
+                data["total"] += row.total
+                data["count"] += row.count
+                data["categories"][row.category] = data["categories"].get(row.category, 0) + row.total
+        
+        # MoodStats 객체 생성
+        stats = []
+        for mood, data in mood_data.items():
+            day_count = len(data["days"])
+            categories = sorted(data["categories"].items(), key=lambda x: x[1], reverse=True)
+            stats.append(MoodStats(
+                mood=mood,
+                day_count=day_count,
+                transaction_count=data["count"],
+                total_expense=data["total"],
+                average_expense=round(data["total"] / day_count),
+                top_categories=[
+                    MoodCategoryStats(category=name, total_amount=total)
+                    for name, total in categories[:top_categories]
+                ]
+            ))
+        
+        return sorted(stats, key=lambda x: x.day_count, reverse=True)
+    
+    @staticmethod
+    def get_running_balance(
+        db: Session,
+        user: User,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        opening_balance: int = 0,
+        max_points: int = 365
+    ) -> BalanceResponse:
+        """누적 잔액 추이 조회
 
+        날짜별 순수익을 SUM(...) OVER (ORDER BY date) 로 누적한다. start_date 이전 거래의 합계는
+        시작 잔액에 더해진다. 날짜 수가 max_points 를 넘으면 DB 에서 균등 간격으로 max_points 개만
+        골라 반환한다 (첫 날짜와 마지막 날짜는 항상 포함).
+        """
+        
+        conditions = [Transaction.user_id == user.id]
+        if start_date:
+            conditions.append(Transaction.date >= start_date)
+        if end_date:
+            conditions.append(Transaction.date <= end_date)
+        
+        daily = select(
+            Transaction.date.label("date"),
+            cast(func.sum(_signed_amount()), BigInteger).label("net")
+        ).where(*conditions).group_by(Transaction.date).subquery()
+        
+        # 조회 기간 이전 거래는 시작 잔액으로 합산
+        carried = 0
+        if start_date:
+            carried = select(
+                cast(func.coalesce(func.sum(_signed_amount()), 0), BigInteger)
+            ).where(
+                Transaction.user_id == user.id,
+                Transaction.date < start_date
+            ).scalar_subquery()
+        
+        running = select(
+            daily.c.date,
+            (cast(func.sum(daily.c.net).over(order_by=daily.c.date), BigInteger) + carried + opening_balance).label("balance"),
+            func.row_number().over(order_by=daily.c.date).label("position"),
+            func.count().over().label("total")
+        ).subquery()
+        
+        # 행 번호 i (0 부터) 의 floor(i * (max_points - 1) / (total - 1)) 값이 바뀌는 행과 첫 행만 남기면
+        # 첫 날짜와 마지막 날짜를 포함해 정확히 max_points 개가 남음 (total 이 1 이면 첫 행만)
+        index = running.c.position - 1
+        span = func.nullif(running.c.total - 1, 0)
+        rows = db.execute(
+            select(running.c.date, running.c.balance, running.c.total).where(
+                or_(index == 0, index * (max_points - 1) // span != (index - 1) * (max_points - 1) // span)
+            ).order_by(running.c.date)
+        ).all()
+        
+        total_points = rows[0].total if rows else 0
+        
+        return BalanceResponse(
+            opening_balance=opening_balance,
+            points=[BalancePoint(date=row.date, balance=row.balance) for row in rows],
+            total_points=total_points,
+            downsampled=total_points > len(rows)
+        )
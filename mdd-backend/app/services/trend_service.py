@@ -0,0 +1,143 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from numpy.lib.stride_tricks import sliding_window_view
+from app.models.user import User
+from app.schemas.stats import TrendPoint, MonthOverMonth, SpendingAnomaly, MonthProjection, TrendResponse
+from app.services.stats_service import StatsService
+from app.config import get_settings
+from app.utils.tracing import trace_methods
+from datetime import date, timedelta
+import calendar
+import numpy as np
+
+settings = get_settings()
+
+# 이상 지출 판단 기준이 되는 직전 기간 (일)
+ANOMALY_BASELINE_DAYS = 28
+
+
+def moving_average(values: np.ndarray, window: int) -> np.ndarray:
+    """최근 window 일 이동 평균 (앞부분은 있는 날짜만으로 평균)"""
+    csum = np.concatenate(([0], np.cumsum(values)))
+    end = np.arange(1, len(values) + 1)
+    start = np.maximum(end - window, 0)
+    return (csum[end] - csum[start]) / (end - start)
+
+
+def month_over_month(days: np.ndarray, values: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """일별 값을 월별 합계로 묶음 -> (월, 합계)"""
+    months = days.astype("datetime64[M]")
+    boundaries = np.flatnonzero(np.r_[True, months[1:] != months[:-1]])
+    return months[boundaries], np.add.reduceat(values, boundaries)
+
+
+def anomaly_scores(values: np.ndarray, baseline_days: int) -> tuple[np.ndarray, np.ndarray]:
+    """각 날의 직전 baseline_days 일 대비 (평균, z 점수)
+
+    앞의 baseline_days 일은 직전 기간이 없으므로 결과 배열에서 제외된다
+    (반환 배열의 i 번째 값은 values[i + baseline_days] 에 대한 값).
+    """
+    windows = sliding_window_view(values[:-1].astype(np.float64), baseline_days)
+    mean = windows.mean(axis=1)
+    std = windows.std(axis=1)
+    
+    current = values[baseline_days:]
+    z = np.zeros(len(current))
+    np.divide(current - mean, std, out=z, where=std > 0)
+    return mean, z
+
+
+@trace_methods
+class TrendService:
+    """지출 추세 / 예측 서비스 (NumPy 벡터 연산)"""
+    
+    @staticmethod
+    def get_trends(
+        db: Session,
+        user: User,
+        start_date: date,
+        end_date: date,
+        window: int = 7,
+        anomaly_threshold: float = 3.0
+    ) -> TrendResponse:
+        """이동 평균, 전월 대비 증감, 이상 지출일, 월말 예상 지출 계산
+
+        전월 대비는 start_date 가 속한 달의 1일부터, 이상 지출 기준은 start_date 이전
+        ANOMALY_BASELINE_DAYS 일부터 함께 조회해 계산한다.
+        """
+        if start_date > end_date:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="시작일이 종료일보다 늦을 수 없습니다"
+            )
+        if (end_date - start_date).days + 1 > settings.TREND_MAX_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"조회 기간은 최대 {settings.TREND_MAX_DAYS}일입니다"
+            )
+        
+        fetch_start = min(start_date.replace(day=1), start_date - timedelta(days=ANOMALY_BASELINE_DAYS))
+        days, _, expense = StatsService.get_daily_series(db, user, fetch_start, end_date)
+        offset = (start_date - fetch_start).days
+        
+        # 이동 평균 (조회 구간 앞쪽 데이터도 평균에 포함)
+        averages = np.rint(moving_average(expense, window)).astype(np.int64)
+        
+        # 전월 대비 증감
+        in_months = days >= np.datetime64(start_date.replace(day=1))
+        months, totals = month_over_month(days[in_months], expense[in_months])
+        previous = totals[:-1]
+        changes = np.diff(totals)
+        rates = np.full(len(changes), np.nan)
+        np.divide(changes * 100, previous, out=rates, where=previous > 0)
+        
+        # 이상 지출일: 직전 기간 평균보다 anomaly_threshold 표준편차 이상 많은 날
+        baseline, z = anomaly_scores(expense, ANOMALY_BASELINE_DAYS)
+        report = slice(offset - ANOMALY_BASELINE_DAYS, None)
+        baseline, z = baseline[report], z[report]
+        flagged = np.flatnonzero(z >= anomaly_threshold)
+        
+        # 월말 예상 지출: 지금까지 지출 + 최근 이동 평균 * 남은 일수
+        days_in_month = calendar.monthrange(end_date.year, end_date.month)[1]
+        spent = int(expense[days >= np.datetime64(end_date.replace(day=1))].sum())
+        projected = spent + int(averages[-1]) * (days_in_month - end_date.day)
+        
+        report_days = days[offset:].tolist()
+        report_expense = expense[offset:].tolist()
+        
+        return TrendResponse(
+            start_date=start_date,
+            end_date=end_date,
+            window=window,
+            daily=[
+                TrendPoint(date=day, expense=amount, moving_average=average)
+                for day, amount, average in zip(report_days, report_expense, averages[offset:].tolist())
+            ],
+            monthly=[
+                MonthOverMonth(
+                    year=month.year,
+                    month=month.month,
+                    total_expense=total,
+                    change=changes[i - 1].item() if i > 0 else None,
+                    change_rate=round(rates[i - 1].item(), 2) if i > 0 and not np.isnan(rates[i - 1]) else None
+                )
+                for i, (month, total) in enumerate(zip(months.astype("datetime64[D]").tolist(), totals.tolist()))
+            ],
+            anomalies=[
+                SpendingAnomaly(
+                    date=report_days[i],
+                    expense=report_expense[i],
+                    baseline=round(baseline[i].item()),
+                    z_score=round(z[i].item(), 2)
+                )
+                for i in flagged.tolist()
+            ],
+            projection=MonthProjection(
+                year=end_date.year,
+                month=end_date.month,
+                spent=spent,
+                projected=projected,
+                days_elapsed=end_date.day,
+                days_in_month=days_in_month
+            )
+        )
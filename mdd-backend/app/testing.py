@@ -0,0 +1,37 @@
+"""테스트 도우미 (pytest 플러그인)
+
+conftest.py 에 다음을 추가하면 query_budget 픽스처를 쓸 수 있다.
+
+    pytest_plugins = ["app.testing"]
+
+    def test_entry_detail(client, query_budget):
+        with query_budget(3):
+            client.get(f"/api/entries/{entry_id}", headers=headers)
+"""
+from contextlib import contextmanager
+import pytest
+from app.utils.query_monitor import collect_queries, LOG_MAX_LENGTH
+
+
+@pytest.fixture
+def query_budget():
+    """블록 안의 요청마다 SQL 수와 반복 쿼리를 검사하는 컨텍스트 매니저
+
+    요청 하나가 max_queries 개보다 많은 SQL 을 실행하거나, 구조가 같은 SQL 을 repeat_threshold 번 이상
+    실행하면(N+1 의심) 테스트를 실패시킨다. 요청 밖(서비스 직접 호출)의 SQL 은 한 묶음으로 검사한다.
+    """
+    @contextmanager
+    def budget(max_queries: int, repeat_threshold: int = 3):
+        with collect_queries() as collector:
+            yield collector
+        
+        for log in collector.logs:
+            label = log.label or "요청 밖"
+            if log.count > max_queries:
+                pytest.fail(f"{label}: SQL {log.count}개 실행 (허용 {max_queries}개)")
+            repeated = log.repeated(repeat_threshold)
+            if repeated:
+                sql, n = repeated[0]
+                pytest.fail(f"{label}: 같은 형태의 SQL {n}회 실행 (N+1 의심): {sql[:LOG_MAX_LENGTH]}")
+    
+    return budget
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Hashable, Optional
+
+
+class LRUCache:
+    """스레드 안전한 크기 제한 LRU 캐시"""
+    
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self._lock = Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """값 조회 (없으면 None)"""
+        with self._lock:
+            if key not in self._data:
+                return None
+            self._data.move_to_end(key)
+            return self._data[key]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """값 저장 (가장 오래 사용되지 않은 항목부터 제거)"""
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def delete(self, key: Hashable) -> None:
+        """값 삭제"""
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """전체 삭제"""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisCache:
+    """Redis 공유 캐시 (여러 워커/서버가 같은 캐시를 사용할 때)
+
+    값은 bytes 만 저장한다. redis 패키지가 필요하다 (pip install redis).
+    """
+    
+    def __init__(self, url: str, prefix: str = "mdd:", ttl: Optional[int] = None):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("RedisCache 를 사용하려면 redis 패키지를 설치해야 합니다") from e
+        
+        self._client = redis.Redis.from_url(url)
+        self.prefix = prefix
+        self.ttl = ttl
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """값 조회 (없으면 None)"""
+        return self._client.get(self.prefix + key)
+    
+    def set(self, key: str, value: bytes) -> None:
+        """값 저장 (ttl 초 후 만료)"""
+        self._client.set(self.prefix + key, value, ex=self.ttl)
+    
+    def delete(self, key: str) -> None:
+        """값 삭제"""
+        self._client.delete(self.prefix + key)
+    
+    def clear(self) -> None:
+        """prefix 로 시작하는 값 전체 삭제"""
+        for key in self._client.scan_iter(match=self.prefix + "*"):
+            self._client.delete(key)
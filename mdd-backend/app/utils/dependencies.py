@@ -1,10 +1,15 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, use_shard, is_sharded
 from app.utils.auth import decode_access_token
 from app.models.user import User
+from app.config import get_settings
+from app.services.shard_service import ShardService
+from app.utils.tracing import span
 from typing import Optional
+from uuid import UUID
+import hmac
 
 security = HTTPBearer()
 
@@ -30,10 +35,41 @@ async def get_current_user(
     user_id: Optional[str] = payload.get("sub")
     if user_id is None:
         raise credentials_exception
+    try:
+        user_id = UUID(str(user_id))
+    except ValueError:
+        raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    with span("auth.user_lookup"):
+        # 세션을 사용자의 샤드에 연결한 뒤 조회
+        shard = ShardService.shard_of(user_id)
+        if shard is None:
+            raise credentials_exception
+        use_shard(db, shard)
+        user = db.query(User).filter(User.id == user_id).first()
+        
+        if user is None and is_sharded():
+            # 다른 프로세스가 사용자를 옮겨 캐시된 샤드가 오래된 경우 디렉터리에서 다시 조회
+            ShardService.forget(user_id)
+            moved_to = ShardService.shard_of(user_id)
+            if moved_to is not None and moved_to != shard:
+                use_shard(db, moved_to)
+                user = db.query(User).filter(User.id == user_id).first()
     if user is None:
         raise credentials_exception
     
     return user
 
+
+
+async def require_admin(x_admin_token: Optional[str] = Header(None)) -> None:
+    """운영용 API 인증 (X-Admin-Token 헤더, ADMIN_TOKEN 미설정 시 404)"""
+    admin_token = get_settings().ADMIN_TOKEN
+    if not admin_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    
+    if x_admin_token is None or not hmac.compare_digest(x_admin_token, admin_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="운영용 토큰이 유효하지 않습니다"
+        )
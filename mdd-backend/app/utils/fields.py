@@ -0,0 +1,23 @@
+from fastapi import HTTPException, status
+from typing import Iterable, Optional
+
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str], always: Iterable[str] = ("id",)) -> list[str]:
+    """fields= 쿼리 파라미터 (콤마 구분) 파싱
+
+    값이 없으면 allowed 전체, 있으면 요청한 필드 + always 필드를 allowed 순서대로 반환한다.
+    """
+    allowed = list(allowed)
+    if not fields:
+        return allowed
+    
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 필드입니다: {', '.join(sorted(unknown))}"
+        )
+    
+    requested.update(always)
+    return [field for field in allowed if field in requested]
@@ -0,0 +1,87 @@
+from fastapi import Request, Response, status
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+import hashlib
+
+# 사용자별 응답이므로 공유 캐시 금지, 사용할 때마다 ETag 로 재검증
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(key: str) -> str:
+    """캐시 키로부터 ETag 생성"""
+    return '"' + hashlib.sha1(key.encode()).hexdigest() + '"'
+
+
+def request_etag(request: Request, *parts) -> str:
+    """경로 + 정렬된 쿼리 파라미터 + parts 로 ETag 생성 (목록 응답용)"""
+    query = sorted(request.query_params.multi_items())
+    return make_etag(":".join([request.url.path, *map(str, parts), str(query)]))
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 etag 와 일치하는지 (약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def has_conditional_headers(request: Request) -> bool:
+    """If-None-Match / If-Modified-Since 헤더가 있는지"""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def _as_utc(value: datetime) -> datetime:
+    """시간대 없는 값은 UTC 로 간주 (SQLite)"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def http_date(value: datetime) -> str:
+    """Last-Modified 헤더 형식 (초 단위)"""
+    return format_datetime(_as_utc(value).replace(microsecond=0), usegmt=True)
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """조건부 요청이 캐시된 표현과 일치하는지
+
+    If-None-Match 가 있으면 ETag 만 비교하고, 없을 때만 If-Modified-Since 를 본다 (RFC 9110).
+    """
+    if "if-none-match" in request.headers:
+        return etag_matches(request, etag)
+    
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime] = None) -> None:
+    """응답에 ETag / Last-Modified / Cache-Control 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified is not None:
+        response.headers["Last-Modified"] = http_date(last_modified)
+
+
+def not_modified(etag: str, last_modified: Optional[datetime] = None) -> Response:
+    """304 응답"""
+    response = Response(status_code=status.HTTP_304_NOT_MODIFIED)
+    set_validators(response, etag, last_modified)
+    return response
+
+
+def json_response(body: bytes, etag: str) -> Response:
+    """직렬화된 JSON 본문 응답 (ETag 포함)"""
+    return Response(content=body, media_type="application/json", headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
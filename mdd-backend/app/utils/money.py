@@ -0,0 +1,17 @@
+from decimal import Decimal
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def to_minor_units(amount: Decimal) -> int:
+    """금액을 최소 화폐 단위 정수로 변환 (예: 12.50 -> 1250)"""
+    scaled = Decimal(amount).scaleb(settings.CURRENCY_EXPONENT)
+    if scaled != scaled.to_integral_value():
+        raise ValueError(f"금액은 소수점 {settings.CURRENCY_EXPONENT}자리까지만 입력할 수 있습니다")
+    return int(scaled)
+
+
+def from_minor_units(value: int) -> Decimal:
+    """최소 화폐 단위 정수를 금액으로 변환 (예: 1250 -> 12.50)"""
+    return Decimal(value).scaleb(-settings.CURRENCY_EXPONENT)
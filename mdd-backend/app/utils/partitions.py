@@ -0,0 +1,134 @@
+from datetime import date
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from typing import Optional
+
+PARENT_TABLE = "transactions"
+DEFAULT_PARTITION = "transactions_default"
+INTERVALS = ("month", "year")
+
+
+def partition_start(day: date, interval: str) -> date:
+    """day가 속한 파티션의 시작일"""
+    if interval == "year":
+        return date(day.year, 1, 1)
+    return date(day.year, day.month, 1)
+
+
+def next_partition_start(start: date, interval: str) -> date:
+    """다음 파티션의 시작일 (현재 파티션의 종료 경계)"""
+    if interval == "year":
+        return date(start.year + 1, 1, 1)
+    if start.month == 12:
+        return date(start.year + 1, 1, 1)
+    return date(start.year, start.month + 1, 1)
+
+
+def partition_name(start: date, interval: str) -> str:
+    """파티션 테이블 이름 (예: transactions_p2024_03, transactions_p2024)"""
+    if interval == "year":
+        return f"{PARENT_TABLE}_p{start.year}"
+    return f"{PARENT_TABLE}_p{start.year}_{start.month:02d}"
+
+
+def partition_ranges(first_day: date, last_day: date, interval: str) -> list[tuple[str, date, date]]:
+    """first_day ~ last_day 구간을 덮는 (이름, 시작, 종료) 목록"""
+    if interval not in INTERVALS:
+        raise ValueError(f"지원하지 않는 파티션 단위입니다: {interval}")
+
+    ranges = []
+    start = partition_start(first_day, interval)
+    while start <= last_day:
+        end = next_partition_start(start, interval)
+        ranges.append((partition_name(start, interval), start, end))
+        start = end
+
+    return ranges
+
+
+def add_partition_periods(day: date, count: int, interval: str) -> date:
+    """day가 속한 파티션에서 count개 뒤 파티션의 시작일"""
+    start = partition_start(day, interval)
+    for _ in range(count):
+        start = next_partition_start(start, interval)
+    return start
+
+
+def existing_partitions(conn: Connection) -> set[str]:
+    """transactions에 붙어 있는 파티션 이름 목록"""
+    rows = conn.execute(text(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "WHERE i.inhparent = CAST(:parent AS regclass)"
+    ), {"parent": PARENT_TABLE})
+    return {row[0] for row in rows}
+
+
+def _quote(conn: Connection, name: str) -> str:
+    """DDL 에 넣을 식별자 인용 (방언 규칙)"""
+    return conn.dialect.identifier_preparer.quote(name)
+
+
+def ensure_default_partition(conn: Connection) -> bool:
+    """범위 밖의 행을 받아 줄 DEFAULT 파티션 생성"""
+    if DEFAULT_PARTITION in existing_partitions(conn):
+        return False
+
+    conn.execute(text(
+        f"CREATE TABLE {_quote(conn, DEFAULT_PARTITION)} PARTITION OF {_quote(conn, PARENT_TABLE)} DEFAULT"
+    ))
+    return True
+
+
+def create_partition(conn: Connection, name: str, start: date, end: date) -> None:
+    """범위 파티션 생성
+
+    DEFAULT 파티션에 이미 해당 범위의 행이 있으면 PARTITION OF 로는 만들 수 없으므로,
+    빈 테이블을 만든 뒤 DEFAULT 에서 행을 옮기고 ATTACH 한다.
+    """
+    parent, partition = _quote(conn, PARENT_TABLE), _quote(conn, name)
+    conn.execute(text(
+        f"CREATE TABLE {partition} (LIKE {parent} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+    ))
+
+    if DEFAULT_PARTITION in existing_partitions(conn):
+        conn.execute(text(
+            f"WITH moved AS ("
+            f"DELETE FROM {_quote(conn, DEFAULT_PARTITION)} WHERE date >= :start AND date < :end RETURNING *"
+            f") INSERT INTO {partition} SELECT * FROM moved"
+        ), {"start": start, "end": end})
+
+    conn.execute(text(
+        f"ALTER TABLE {parent} ATTACH PARTITION {partition} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    ))
+
+
+def ensure_transaction_partitions(
+    conn: Connection,
+    interval: str,
+    ahead: int,
+    since: Optional[date] = None,
+    today: Optional[date] = None
+) -> list[str]:
+    """since(기본: 오늘) 부터 ahead 개 미래 파티션까지 없는 파티션을 생성
+
+    PostgreSQL 이 아니면 아무것도 하지 않는다. 생성한 파티션 이름 목록을 반환한다.
+    """
+    if conn.dialect.name != "postgresql":
+        return []
+
+    today = today or date.today()
+    last_day = add_partition_periods(today, ahead, interval)
+
+    ensure_default_partition(conn)
+    existing = existing_partitions(conn)
+
+    created = []
+    for name, start, end in partition_ranges(since or today, last_day, interval):
+        if name in existing:
+            continue
+        create_partition(conn, name, start, end)
+        created.append(name)
+
+    return created
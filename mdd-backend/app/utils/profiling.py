@@ -0,0 +1,224 @@
+"""요청 단위 샘플링 프로파일러
+
+프로파일 중인 요청이 실행되는 스레드(이벤트 루프 스레드 + 동기 엔드포인트/의존성이 도는 스레드 풀
+스레드)의 스택을 PROFILE_INTERVAL_MS 마다 sys._current_frames() 로 읽어 folded stack
+("root;caller;callee 샘플 수") 형식으로 모은다. flamegraph.pl, speedscope 등에서 바로 열 수 있다.
+
+샘플러 스레드는 하나이며 프로파일 중인 요청이 없으면 대기한다. 이벤트 루프 스레드는 요청끼리
+공유하므로 동시에 실행 중인 다른 요청의 비동기 코드가 섞일 수 있다 (이벤트 대기 중인 샘플은 제외).
+
+저장된 프로파일은 PROFILE_DIR 에 <id>.folded + <id>.json(메타데이터) 으로 남고,
+PROFILE_MAX_FILES 개를 넘으면 오래된 것부터 지운다.
+"""
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional
+from uuid import uuid4
+from starlette.concurrency import run_in_threadpool
+from app.config import get_settings
+
+settings = get_settings()
+
+# 스택 최대 깊이
+MAX_STACK_DEPTH = 128
+
+_current_profile: ContextVar[Optional["Profile"]] = ContextVar("current_profile", default=None)
+
+_slow_request_ms = settings.PROFILE_SLOW_REQUEST_MS
+
+
+class Profile:
+    """요청 하나의 샘플 모음"""
+    
+    def __init__(self, reason: str, **attributes):
+        self.id = uuid4().hex
+        self.reason = reason  # on_demand 또는 slow
+        self.attributes = attributes
+        self.created_at = datetime.now(timezone.utc)
+        self.start_ns = time.perf_counter_ns()
+        self.duration_ms: Optional[float] = None
+        self.threads: set[int] = set()
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+    
+    def run_in_thread(self, func, *args, **kwargs):
+        """현재 스레드를 샘플링 대상에 넣고 func 실행 (스레드 풀에서 호출)"""
+        ident = threading.get_ident()
+        self.threads.add(ident)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.threads.discard(ident)
+    
+    def folded(self) -> str:
+        """folded stack 텍스트 (샘플 수 내림차순)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+    
+    def metadata(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "reason": self.reason,
+            "created_at": self.created_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "samples": self.samples,
+            "interval_ms": settings.PROFILE_INTERVAL_MS,
+            **self.attributes,
+        }
+
+
+@functools.lru_cache(maxsize=8192)
+def _frame_label(code) -> str:
+    filename = code.co_filename
+    for prefix in (os.getcwd() + os.sep, sys.prefix + os.sep):
+        if filename.startswith(prefix):
+            filename = filename[len(prefix):]
+            break
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _fold(frame) -> Optional[str]:
+    """스레드의 현재 스택 -> "root;...;leaf" (이벤트 루프가 I/O 대기 중이면 None)"""
+    if frame.f_code.co_filename.endswith("selectors.py"):
+        return None
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class _Sampler(threading.Thread):
+    """프로파일 중인 요청이 있을 때만 도는 샘플러 스레드"""
+    
+    def __init__(self):
+        super().__init__(name="request-profiler", daemon=True)
+        self._profiles: set[Profile] = set()
+        self._condition = threading.Condition()
+    
+    def add(self, profile: Profile) -> None:
+        with self._condition:
+            self._profiles.add(profile)
+            self._condition.notify()
+    
+    def remove(self, profile: Profile) -> None:
+        with self._condition:
+            self._profiles.discard(profile)
+    
+    def run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._profiles:
+                    self._condition.wait()
+                profiles = list(self._profiles)
+            
+            frames = sys._current_frames()
+            folded: dict[int, Optional[str]] = {}
+            for profile in profiles:
+                for ident in list(profile.threads):
+                    if ident not in folded:
+                        frame = frames.get(ident)
+                        folded[ident] = _fold(frame) if frame is not None else None
+                    stack = folded[ident]
+                    if stack is not None:
+                        profile.stacks[stack] += 1
+                        profile.samples += 1
+            del frames
+            
+            time.sleep(settings.PROFILE_INTERVAL_MS / 1000)
+
+
+_sampler: Optional[_Sampler] = None
+_sampler_lock = threading.Lock()
+
+
+def _get_sampler() -> _Sampler:
+    global _sampler
+    with _sampler_lock:
+        if _sampler is None:
+            _sampler = _Sampler()
+            _sampler.start()
+        return _sampler
+
+
+def get_slow_request_ms() -> Optional[float]:
+    return _slow_request_ms
+
+
+def set_slow_request_ms(threshold: Optional[float]) -> None:
+    """느린 요청 자동 저장 기준 변경 (None: 끔)"""
+    global _slow_request_ms
+    _slow_request_ms = threshold
+
+
+def start_profile(reason: str, **attributes) -> tuple[Profile, Any]:
+    """현재 스레드를 샘플링하는 프로파일 시작 -> (Profile, stop_profile 에 넘길 토큰)"""
+    profile = Profile(reason, **attributes)
+    profile.threads.add(threading.get_ident())
+    token = _current_profile.set(profile)
+    _get_sampler().add(profile)
+    return profile, token
+
+
+def stop_profile(profile: Profile, token: Any) -> None:
+    """프로파일 종료 (저장은 save_profile)"""
+    _get_sampler().remove(profile)
+    _current_profile.reset(token)
+    profile.duration_ms = round((time.perf_counter_ns() - profile.start_ns) / 1e6, 3)
+
+
+def save_profile(profile: Profile) -> None:
+    """PROFILE_DIR 에 저장 후 오래된 프로파일 정리"""
+    directory = Path(settings.PROFILE_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{profile.id}.folded").write_text(profile.folded(), encoding="utf-8")
+    (directory / f"{profile.id}.json").write_text(json.dumps(profile.metadata(), ensure_ascii=False), encoding="utf-8")
+    
+    saved = sorted(directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+    for old in saved[:max(len(saved) - settings.PROFILE_MAX_FILES, 0)]:
+        old.with_suffix(".folded").unlink(missing_ok=True)
+        old.unlink(missing_ok=True)
+
+
+def list_profiles(limit: int = 50) -> list[dict[str, Any]]:
+    """저장된 프로파일 메타데이터 (최신순)"""
+    directory = Path(settings.PROFILE_DIR)
+    if not directory.is_dir():
+        return []
+    saved = sorted(directory.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
+    return [json.loads(path.read_text(encoding="utf-8")) for path in saved[:limit]]
+
+
+def profile_path(profile_id: str) -> Optional[Path]:
+    """저장된 folded stack 파일 경로 (없으면 None)"""
+    if not profile_id.isalnum():
+        return None
+    path = Path(settings.PROFILE_DIR) / f"{profile_id}.folded"
+    return path if path.is_file() else None
+
+
+async def _profiled_run_in_threadpool(func, *args, **kwargs):
+    profile = _current_profile.get()
+    if profile is None:
+        return await run_in_threadpool(func, *args, **kwargs)
+    return await run_in_threadpool(profile.run_in_thread, func, *args, **kwargs)
+
+
+def instrument_fastapi() -> None:
+    """동기 엔드포인트 / 의존성 / 직렬화가 도는 스레드 풀 스레드도 샘플링되도록 함
+
+    fastapi.routing, fastapi.dependencies.utils 가 모듈 전역으로 호출하는 run_in_threadpool 을
+    감싼다 (fastapi 0.110 기준).
+    """
+    import fastapi.routing as routing
+    import fastapi.dependencies.utils as dependency_utils
+    
+    for module in (routing, dependency_utils):
+        module.run_in_threadpool = _profiled_run_in_threadpool
@@ -0,0 +1,188 @@
+"""SQL 모니터 (느린 쿼리 로그, N+1 의심 경고, 쿼리 수 제한)
+
+- 느린 쿼리: SLOW_QUERY_MS 이상 걸린 SQL 을 파라미터, 실행 계획(EXPLAIN)과 함께 app.queries 로거에 경고로 남긴다.
+- 반복 쿼리: QUERY_REPEAT_THRESHOLD 가 설정되어 있으면(테스트 환경 권장) 요청 하나에서 구조가 같은 SQL
+  (리터럴 / IN 목록 길이만 다른 SQL) 이 그 횟수 이상 실행될 때 N+1 의심으로 경고한다.
+- collect_queries(): 블록 안에서 실행된 SQL 을 요청별로 모은다 (app.testing 의 query_budget 픽스처 참고).
+"""
+import functools
+import logging
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config import get_settings
+
+settings = get_settings()
+
+logger = logging.getLogger("app.queries")
+
+# 로그에 남길 SQL / 파라미터 최대 길이
+LOG_MAX_LENGTH = 2000
+# 실행 계획을 볼 수 있는 문장
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+_IN_LIST = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+|\$\d+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+|\$\d+))*\s*\)")
+_NUMBER = re.compile(r"\b\d+\b")
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_POSTCOMPILE = re.compile(r"__\[POSTCOMPILE_\w+\]")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize(statement: str) -> str:
+    """구조가 같은 SQL 이 같은 문자열이 되도록 리터럴과 IN 목록을 치환"""
+    normalized = _STRING.sub("?", statement)
+    normalized = _POSTCOMPILE.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _IN_LIST.sub("(?)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+class QueryLog:
+    """SQL 실행 기록 (구조별 횟수)"""
+    
+    def __init__(self, label: Optional[str] = None):
+        self.label = label  # 요청이면 "GET /api/..."
+        self.count = 0
+        self.statements: Counter[str] = Counter()
+    
+    def record(self, statement: str) -> None:
+        self.count += 1
+        self.statements[normalize(statement)] += 1
+    
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold 번 이상 실행된 (SQL, 횟수)"""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+class QueryCollector:
+    """collect_queries() 블록 안의 SQL 기록 (요청별 + 요청 밖)"""
+    
+    def __init__(self):
+        self.requests: list[QueryLog] = []
+        self.outside = QueryLog()  # 요청 밖 (서비스 직접 호출 등)
+    
+    @property
+    def logs(self) -> list[QueryLog]:
+        return self.requests + ([self.outside] if self.outside.count else [])
+    
+    @property
+    def count(self) -> int:
+        return sum(log.count for log in self.logs)
+
+
+_current_log: ContextVar[Optional[QueryLog]] = ContextVar("current_query_log", default=None)
+_collectors: list[QueryCollector] = []
+_collectors_lock = threading.Lock()
+
+
+def is_active() -> bool:
+    """요청별 기록이 필요한지 (반복 쿼리 경고 또는 수집 중)"""
+    return settings.QUERY_REPEAT_THRESHOLD > 0 or bool(_collectors)
+
+
+@contextmanager
+def request_scope(label: str) -> Iterator[QueryLog]:
+    """요청 하나의 SQL 기록 (app.middleware.query_monitor 에서 사용)"""
+    log = QueryLog(label)
+    token = _current_log.set(log)
+    try:
+        yield log
+    finally:
+        _current_log.reset(token)
+        
+        threshold = settings.QUERY_REPEAT_THRESHOLD
+        if threshold > 0:
+            for sql, n in log.repeated(threshold):
+                logger.warning("N+1 의심: %s 에서 같은 형태의 SQL %d회 실행: %s", label, n, sql[:LOG_MAX_LENGTH])
+        
+        with _collectors_lock:
+            for collector in _collectors:
+                collector.requests.append(log)
+
+
+@contextmanager
+def collect_queries() -> Iterator[QueryCollector]:
+    """블록 안에서 실행된 SQL 수집 (모든 스레드)"""
+    collector = QueryCollector()
+    with _collectors_lock:
+        _collectors.append(collector)
+    try:
+        yield collector
+    finally:
+        with _collectors_lock:
+            _collectors.remove(collector)
+
+
+def _explain(conn, cursor, statement: str, parameters: Any) -> Optional[str]:
+    """같은 연결에서 실행 계획 조회 (실패해도 원래 트랜잭션에 영향 없도록 savepoint 사용)"""
+    if not statement.lstrip().upper().startswith(EXPLAINABLE):
+        return None
+    
+    dialect = conn.dialect.name
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    explain_cursor = cursor.connection.cursor()
+    try:
+        if dialect == "postgresql":
+            explain_cursor.execute("SAVEPOINT query_monitor_explain")
+        try:
+            explain_cursor.execute(prefix + statement, parameters)
+            rows = explain_cursor.fetchall()
+        except Exception as e:
+            if dialect == "postgresql":
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT query_monitor_explain")
+            return f"(EXPLAIN 실패: {type(e).__name__}: {e})"
+        finally:
+            if dialect == "postgresql":
+                explain_cursor.execute("RELEASE SAVEPOINT query_monitor_explain")
+    finally:
+        explain_cursor.close()
+    
+    return "\n".join(" | ".join(str(value) for value in row) for row in rows)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_monitor_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    log = _current_log.get()
+    if log is not None:
+        log.record(statement)
+    elif _collectors:
+        with _collectors_lock:
+            for collector in _collectors:
+                collector.outside.record(statement)
+    
+    slow_query_ms = settings.SLOW_QUERY_MS
+    start = getattr(context, "_query_monitor_start", None)
+    if slow_query_ms is None or start is None:
+        return
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms < slow_query_ms:
+        return
+    
+    plan = None
+    if settings.SLOW_QUERY_EXPLAIN and not executemany:
+        plan = _explain(conn, cursor, statement, parameters)
+    logger.warning(
+        "느린 쿼리 %.1fms%s\n%s\n파라미터: %s%s",
+        elapsed_ms,
+        f" ({log.label})" if log is not None and log.label else "",
+        statement[:LOG_MAX_LENGTH],
+        repr(parameters)[:LOG_MAX_LENGTH],
+        f"\n실행 계획:\n{plan}" if plan else ""
+    )
+
+
+def instrument_sqlalchemy() -> None:
+    """모든 엔진에 모니터 등록"""
+    if not event.contains(Engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,155 @@
+"""준비 상태 확인 (/ready)
+
+워커는 시작할 때 DDL 이나 스키마 리플렉션을 하지 않는다. 스키마는 배포 단계에서 한 번
+`alembic upgrade head` 로 맞추고, 워커는 /ready 에서 다음을 확인한다.
+
+- 스키마 버전 (샤드마다): alembic_version 이 이 코드의 head 와 같은지. 코드가 모르는 리비전이면 새 버전 코드의
+  마이그레이션이 먼저 적용된 것(롤링 배포 중)으로 보고 준비된 것으로 본다. 코드가 아는 이전 리비전이면
+  마이그레이션 누락이므로 준비되지 않은 것으로 본다.
+- 커넥션 풀 예열: 시작 후 백그라운드에서 샤드마다 DB_POOL_WARMUP 개 연결을 미리 열어 두었는지.
+- 작업 복구: 이전 실행에서 남은 백그라운드 작업 정리가 끝났는지. DB 에 연결할 수 없으면 워커는 그대로
+  요청을 받고(/ready 는 503), 복구는 연결될 때까지 백그라운드에서 다시 시도한다.
+"""
+import functools
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+from app.config import get_settings
+from app.database import shard_engines, is_sharded
+
+settings = get_settings()
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+_pool_warmed = threading.Event()
+_pool_warmup_error: list[str] = []
+
+_jobs_recovered = threading.Event()
+_job_recovery_error: list[str] = []
+
+# 작업 복구 실패 후 다시 시도하기까지 (초)
+JOB_RECOVERY_RETRY_SECONDS = 5
+
+
+@functools.lru_cache(maxsize=1)
+def known_revisions() -> tuple[frozenset[str], frozenset[str]]:
+    """(이 코드의 head 리비전, 모든 리비전) - 첫 호출 때 마이그레이션 스크립트를 읽음"""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    
+    config = Config(str(ALEMBIC_INI))
+    # script_location 은 alembic.ini 기준 상대 경로 (작업 디렉터리와 무관하게)
+    config.set_main_option("script_location", str(ALEMBIC_INI.parent / config.get_main_option("script_location")))
+    script = ScriptDirectory.from_config(config)
+    heads = frozenset(script.get_heads())
+    revisions = frozenset(rev.revision for rev in script.walk_revisions())
+    return heads, revisions
+
+
+def current_revisions(engine: Engine) -> set[str]:
+    """DB 에 적용된 리비전 (alembic_version 이 없으면 빈 집합)"""
+    with engine.connect() as conn:
+        try:
+            return {row[0] for row in conn.execute(text("SELECT version_num FROM alembic_version"))}
+        except SQLAlchemyError:
+            return set()
+
+
+def warm_pool(size: int) -> None:
+    """샤드마다 size 개 연결을 동시에 열었다가 풀에 반납 (백그라운드 스레드에서 호출)"""
+    connections = []
+    try:
+        for engine in shard_engines:
+            for _ in range(size):
+                conn = engine.connect()
+                connections.append(conn)
+                conn.execute(text("SELECT 1"))
+    except SQLAlchemyError as e:
+        _pool_warmup_error.append(f"{type(e).__name__}: {e}")
+    finally:
+        for conn in connections:
+            conn.close()
+        _pool_warmed.set()
+
+
+def start_pool_warmup() -> None:
+    """풀 예열을 백그라운드로 시작 (시작 이벤트를 막지 않음)"""
+    if settings.DB_POOL_WARMUP <= 0:
+        _pool_warmed.set()
+        return
+    threading.Thread(
+        target=warm_pool, args=(settings.DB_POOL_WARMUP,), name="db-pool-warmup", daemon=True
+    ).start()
+
+
+def recover_until_done(recover: Callable[[], Any], retry_seconds: float) -> None:
+    """recover 가 성공할 때까지 retry_seconds 간격으로 다시 시도 (백그라운드 스레드에서 호출)"""
+    while True:
+        try:
+            recover()
+        except SQLAlchemyError as e:
+            _job_recovery_error[:] = [f"{type(e).__name__}: {e}"]
+            time.sleep(retry_seconds)
+        else:
+            _job_recovery_error.clear()
+            _jobs_recovered.set()
+            return
+
+
+def start_job_recovery(recover: Callable[[], Any]) -> None:
+    """작업 복구를 백그라운드로 시작 (시작 이벤트를 막지 않음)"""
+    threading.Thread(
+        target=recover_until_done, args=(recover, JOB_RECOVERY_RETRY_SECONDS), name="job-recovery", daemon=True
+    ).start()
+
+
+def schema_status(engine: Engine) -> dict[str, Any]:
+    """DB 하나의 스키마 버전 상태"""
+    try:
+        current = current_revisions(engine)
+    except SQLAlchemyError as e:
+        return {"ready": False, "error": f"{type(e).__name__}: {e}"}
+    
+    heads, revisions = known_revisions()
+    if not current:
+        schema_state = "missing"  # 마이그레이션이 적용되지 않음
+    elif current == heads:
+        schema_state = "current"
+    elif current <= revisions:
+        schema_state = "behind"  # 이 코드보다 오래된 스키마
+    else:
+        schema_state = "ahead"  # 새 버전 마이그레이션이 먼저 적용됨
+    return {
+        "ready": schema_state in ("current", "ahead"),
+        "state": schema_state,
+        "current": sorted(current),
+        "expected": sorted(heads),
+    }
+
+
+def check_readiness() -> tuple[bool, dict[str, Any]]:
+    """(준비 여부, 상세)"""
+    pool_ready = _pool_warmed.is_set() and not _pool_warmup_error
+    pool = {
+        "ready": pool_ready,
+        "warmup": settings.DB_POOL_WARMUP,
+        "checked_in": sum(engine.pool.checkedin() for engine in shard_engines if hasattr(engine.pool, "checkedin")),
+        **({"error": _pool_warmup_error[0]} if _pool_warmup_error else {}),
+    }
+    
+    jobs = {
+        "ready": _jobs_recovered.is_set(),
+        **({"error": _job_recovery_error[0]} if _job_recovery_error else {}),
+    }
+    
+    schemas = [schema_status(engine) for engine in shard_engines]
+    if is_sharded():
+        schema = {"ready": all(s["ready"] for s in schemas), "shards": schemas}
+    else:
+        schema = schemas[0]
+    
+    return schema["ready"] and pool_ready and jobs["ready"], {"schema": schema, "pool": pool, "jobs": jobs}
@@ -0,0 +1,56 @@
+from datetime import date, timedelta
+from typing import Optional
+import calendar
+
+
+def add_months(start: date, months: int) -> date:
+    """start 에서 months 개월 뒤 같은 날 (말일을 넘으면 그 달 말일)"""
+    month_index = start.month - 1 + months
+    year = start.year + month_index // 12
+    month = month_index % 12 + 1
+    return date(year, month, min(start.day, calendar.monthrange(year, month)[1]))
+
+
+def occurrence_date(start: date, frequency: str, interval: int, index: int) -> date:
+    """index 번째 (0부터) 발생일
+
+    항상 start 기준으로 계산하므로 31일 시작 월간 규칙이 2월 이후 28일로 밀리지 않는다.
+    custom 은 interval 일 간격이다.
+    """
+    if frequency == "weekly":
+        return start + timedelta(weeks=interval * index)
+    if frequency == "monthly":
+        return add_months(start, interval * index)
+    if frequency == "yearly":
+        return add_months(start, 12 * interval * index)
+    return start + timedelta(days=interval * index)  # daily, custom
+
+
+def due_occurrences(
+    start: date,
+    frequency: str,
+    interval: int,
+    next_index: int,
+    until: date,
+    end_date: Optional[date] = None,
+    limit: int = 366
+) -> list[tuple[int, date]]:
+    """next_index 부터 until (과 end_date) 까지의 (index, 날짜) 목록 (최대 limit 개)"""
+    last = min(until, end_date) if end_date else until
+    occurrences = []
+    index = next_index
+    while len(occurrences) < limit:
+        day = occurrence_date(start, frequency, interval, index)
+        if day > last:
+            break
+        occurrences.append((index, day))
+        index += 1
+    return occurrences
+
+
+def first_index_on_or_after(start: date, frequency: str, interval: int, next_index: int, day: date) -> int:
+    """next_index 이후 발생 중 day 당일 또는 그 뒤인 첫 발생의 index"""
+    index = next_index
+    while occurrence_date(start, frequency, interval, index) < day:
+        index += 1
+    return index
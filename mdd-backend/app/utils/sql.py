@@ -0,0 +1,89 @@
+"""PostgreSQL / SQLite 양쪽에서 동작하는 SQL 식
+
+방언마다 다른 SQL 은 @compiles 로 나눠 만든다. 서비스는 이 모듈의 식만 쓰고 방언을 직접 확인하지 않는다.
+"""
+from sqlalchemy import Date, select, update
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
+
+
+class _DateBucket(FunctionElement):
+    """date 를 unit 시작일로 내림 (주는 월요일 시작) -> date"""
+    type = Date()
+    inherit_cache = True
+    unit: str
+
+
+class _WeekBucket(_DateBucket):
+    unit = "week"
+    inherit_cache = True
+
+
+class _MonthBucket(_DateBucket):
+    unit = "month"
+    inherit_cache = True
+
+
+class _YearBucket(_DateBucket):
+    unit = "year"
+    inherit_cache = True
+
+
+_BUCKETS = {bucket.unit: bucket for bucket in (_WeekBucket, _MonthBucket, _YearBucket)}
+
+# SQLite: date 는 'YYYY-MM-DD' 문자열 ('weekday 0' 은 다음 일요일(일요일이면 그날)로 이동)
+_SQLITE_MODIFIERS = {
+    "week": "'weekday 0', '-6 days'",
+    "month": "'start of month'",
+    "year": "'start of year'",
+}
+
+
+def date_bucket(unit: str, expression):
+    """expression(date) 이 속한 unit(week / month / year) 의 시작일"""
+    if unit not in _BUCKETS:
+        raise ValueError(f"지원하지 않는 단위입니다: {unit}")
+    return _BUCKETS[unit](expression)
+
+
+@compiles(_DateBucket)
+def _compile_date_bucket(element, compiler, **kw):
+    return f"CAST(date_trunc('{element.unit}', {compiler.process(element.clauses, **kw)}) AS DATE)"
+
+
+@compiles(_DateBucket, "sqlite")
+def _compile_date_bucket_sqlite(element, compiler, **kw):
+    return f"date({compiler.process(element.clauses, **kw)}, {_SQLITE_MODIFIERS[element.unit]})"
+
+
+class json_array_values(FunctionElement):
+    """JSON 배열 열의 원소를 텍스트 행으로 펼치는 테이블 값 함수 (.table_valued("value") 로 사용)
+
+    FROM 의 함수는 두 DB 모두 LATERAL 없이 앞 테이블 열을 참조할 수 있다 (SQLite 는 LATERAL 을 지원하지 않음).
+    """
+    inherit_cache = True
+
+
+@compiles(json_array_values)
+def _compile_json_array_values(element, compiler, **kw):
+    return f"json_array_elements_text({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_values, "sqlite")
+def _compile_json_array_values_sqlite(element, compiler, **kw):
+    return f"json_each({compiler.process(element.clauses, **kw)})"
+
+
+def lock_rows(db: Session, model, *criteria) -> None:
+    """criteria 에 맞는 model 행을 커밋까지 잠금 (SELECT ... FOR UPDATE)
+
+    SQLite 는 FOR UPDATE 가 없으므로 값을 그대로 두는 UPDATE 로 DB 쓰기 잠금을 잡는다. 잠근 뒤의 조회는
+    두 DB 모두 먼저 커밋된 쓰기를 본다.
+    """
+    if db.get_bind().dialect.name == "sqlite":
+        # onupdate 가 있는 열(updated_at 등)도 그대로 두어야 값이 바뀌지 않음
+        unchanged = [model.__mapper__.primary_key[0]] + [c for c in model.__table__.c if c.onupdate is not None]
+        db.execute(update(model).where(*criteria).values({c.name: c for c in unchanged}))
+    else:
+        db.execute(select(model.__mapper__.primary_key[0]).where(*criteria).with_for_update()).all()
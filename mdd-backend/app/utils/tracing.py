@@ -0,0 +1,246 @@
+"""가벼운 요청 추적 (trace / span)
+
+샘플링된 요청만 Trace 를 만들고 contextvars 로 요청 안(스레드 풀 포함)에 전달한다.
+span() 은 추적 중이 아니면 ContextVar 조회 한 번으로 끝나므로 추적을 끄면 비용이 거의 없다.
+
+계층별 span:
+- request: app.middleware.tracing.TracingMiddleware (경로, 상태 코드)
+- admission: 수용 제어 대기 (app.middleware.admission)
+- auth.jwt_decode / auth.user_lookup: app.utils.auth, app.utils.dependencies
+- endpoint / serialize: FastAPI 엔드포인트 실행과 응답 모델 직렬화 (instrument_fastapi)
+- <Service>.<method>: trace_methods 를 붙인 서비스 클래스
+- db.query: SQL 문 실행 (instrument_sqlalchemy)
+
+끝난 Trace 는 메모리 링 버퍼(/api/admin/traces)와, 설정 시 JSON Lines 파일로 내보낸다.
+"""
+import functools
+import itertools
+import json
+import random
+import secrets
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.config import get_settings
+
+settings = get_settings()
+
+# SQL 문은 앞부분만 기록
+STATEMENT_MAX_LENGTH = 500
+
+_current_trace: ContextVar[Optional["Trace"]] = ContextVar("current_trace", default=None)
+_current_span: ContextVar[Optional[int]] = ContextVar("current_span", default=None)
+
+_sample_rate = settings.TRACE_SAMPLE_RATE
+_buffer: deque["Trace"] = deque(maxlen=settings.TRACE_BUFFER_SIZE)
+_file_lock = threading.Lock()
+_NOOP = nullcontext()
+
+
+class Trace:
+    """요청 하나의 span 모음"""
+    
+    def __init__(self, trace_id: str, attributes: dict[str, Any]):
+        self.trace_id = trace_id
+        self.attributes = attributes
+        self.started_at = datetime.now(timezone.utc)
+        self.start_ns = time.perf_counter_ns()
+        self.duration_ms: Optional[float] = None
+        self.spans: list[dict[str, Any]] = []
+        self.dropped = 0  # TRACE_MAX_SPANS 를 넘어 버린 span 수
+        self._ids = itertools.count(1)
+    
+    def next_span_id(self) -> int:
+        return next(self._ids)
+    
+    def add_span(
+        self,
+        name: str,
+        span_id: int,
+        parent_id: Optional[int],
+        start_ns: int,
+        end_ns: int,
+        attributes: dict[str, Any]
+    ) -> None:
+        if len(self.spans) >= settings.TRACE_MAX_SPANS:
+            self.dropped += 1
+            return
+        self.spans.append({
+            "id": span_id,
+            "parent_id": parent_id,
+            "name": name,
+            "start_ms": round((start_ns - self.start_ns) / 1e6, 3),
+            "duration_ms": round((end_ns - start_ns) / 1e6, 3),
+            **({"attributes": attributes} if attributes else {}),
+        })
+    
+    def summary(self) -> dict[str, Any]:
+        """목록용 요약"""
+        return {
+            "trace_id": self.trace_id,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": self.duration_ms,
+            "span_count": len(self.spans),
+            **self.attributes,
+        }
+    
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            **self.summary(),
+            "dropped_spans": self.dropped,
+            "spans": sorted(self.spans, key=lambda s: s["start_ms"]),
+        }
+
+
+def get_sample_rate() -> float:
+    return _sample_rate
+
+
+def set_sample_rate(rate: float) -> None:
+    """샘플링 비율 변경 (0: 끔, 1: 모든 요청)"""
+    global _sample_rate
+    _sample_rate = min(max(rate, 0.0), 1.0)
+
+
+def should_sample() -> bool:
+    return _sample_rate > 0 and random.random() < _sample_rate
+
+
+def new_trace_id() -> str:
+    return secrets.token_hex(16)
+
+
+def start_trace(trace_id: Optional[str] = None, **attributes) -> tuple[Trace, Any]:
+    """현재 컨텍스트에서 추적 시작 -> (Trace, finish_trace 에 넘길 토큰)"""
+    trace = Trace(trace_id or new_trace_id(), attributes)
+    return trace, _current_trace.set(trace)
+
+
+def finish_trace(trace: Trace, token: Any) -> None:
+    """추적 종료 후 내보내기"""
+    _current_trace.reset(token)
+    trace.duration_ms = round((time.perf_counter_ns() - trace.start_ns) / 1e6, 3)
+    _buffer.append(trace)
+    
+    if settings.TRACE_FILE:
+        line = json.dumps(trace.to_dict(), ensure_ascii=False, default=str)
+        with _file_lock, open(settings.TRACE_FILE, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+def current_trace() -> Optional[Trace]:
+    return _current_trace.get()
+
+
+@contextmanager
+def _span(trace: Trace, name: str, attributes: dict[str, Any]):
+    span_id = trace.next_span_id()
+    parent_id = _current_span.get()
+    token = _current_span.set(span_id)
+    start_ns = time.perf_counter_ns()
+    try:
+        yield attributes
+    finally:
+        end_ns = time.perf_counter_ns()
+        _current_span.reset(token)
+        trace.add_span(name, span_id, parent_id, start_ns, end_ns, attributes)
+
+
+def span(name: str, **attributes):
+    """span 컨텍스트 매니저 (추적 중이 아니면 아무것도 하지 않음)
+
+    with 문에서 받은 dict 에 값을 넣으면 span 속성으로 기록된다.
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOOP
+    return _span(trace, name, attributes)
+
+
+def trace_methods(cls):
+    """서비스 클래스의 공개 정적 메서드마다 "<클래스>.<메서드>" span 을 씌우는 클래스 데코레이터"""
+    for attr, value in list(vars(cls).items()):
+        if attr.startswith("_") or not isinstance(value, staticmethod):
+            continue
+        setattr(cls, attr, staticmethod(_traced(f"{cls.__name__}.{attr}", value.__func__)))
+    return cls
+
+
+def _traced(name: str, func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        trace = _current_trace.get()
+        if trace is None:
+            return func(*args, **kwargs)
+        with _span(trace, name, {}):
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def get_traces(limit: int = 50, min_duration_ms: float = 0) -> list[dict[str, Any]]:
+    """최근 추적 요약 (최신순)"""
+    traces = [t for t in reversed(_buffer) if (t.duration_ms or 0) >= min_duration_ms]
+    return [t.summary() for t in traces[:limit]]
+
+
+def get_trace(trace_id: str) -> Optional[dict[str, Any]]:
+    """추적 상세 (버퍼에 없으면 None)"""
+    for trace in reversed(_buffer):
+        if trace.trace_id == trace_id:
+            return trace.to_dict()
+    return None
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_trace.get() is not None:
+        context._trace_start_ns = time.perf_counter_ns()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    trace = _current_trace.get()
+    start_ns = getattr(context, "_trace_start_ns", None)
+    if trace is None or start_ns is None:
+        return
+    trace.add_span(
+        "db.query", trace.next_span_id(), _current_span.get(), start_ns, time.perf_counter_ns(),
+        {"statement": statement[:STATEMENT_MAX_LENGTH], "rowcount": cursor.rowcount}
+    )
+
+
+def instrument_sqlalchemy() -> None:
+    """모든 엔진의 SQL 실행을 db.query span 으로 기록"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def instrument_fastapi() -> None:
+    """엔드포인트 실행과 응답 직렬화를 endpoint / serialize span 으로 기록
+
+    FastAPI 가 요청 처리 중 모듈 전역으로 호출하는 run_endpoint_function / serialize_response 를
+    감싼다 (fastapi 0.110 기준).
+    """
+    import fastapi.routing as routing
+    
+    if getattr(routing.run_endpoint_function, "_traced", False):
+        return
+    run_endpoint_function = routing.run_endpoint_function
+    serialize_response = routing.serialize_response
+    
+    async def traced_run_endpoint_function(*, dependant, **kwargs):
+        with span("endpoint", function=getattr(dependant.call, "__name__", None)):
+            return await run_endpoint_function(dependant=dependant, **kwargs)
+    
+    async def traced_serialize_response(**kwargs):
+        with span("serialize"):
+            return await serialize_response(**kwargs)
+    
+    traced_run_endpoint_function._traced = True
+    routing.run_endpoint_function = traced_run_endpoint_function
+    routing.serialize_response = traced_serialize_response
@@ -0,0 +1,88 @@
+"""금액 집계 측정 (Numeric 금액 vs 정수 최소 화폐 단위)
+
+사용법 (mdd-backend 에서):
+    python -m bench.aggregation                      # 임시 SQLite, 거래 20만 건 / 사용자 1000명
+    python -m bench.aggregation --rows 1000000 --users 5000
+    python -m bench.aggregation --url postgresql://postgres@localhost:5432/mdd_bench   # 측정 전용 DB
+
+0004 스키마(transactions.amount Numeric(12, 2))에서 SUM / GROUP BY 를 재고, 0005 마이그레이션
+(amount_minor BIGINT 로 교체)을 적용해 같은 집계를 다시 잰다. 시간에는 결과를 금액(Decimal)으로 바꾸는 데까지 포함한다.
+- 이전: SUM(amount) 를 Numeric 으로 받음 (SQLite 는 REAL 합계 -> Decimal 변환)
+- 이후: CAST(SUM(amount_minor) AS BIGINT) 를 정수로 받아 from_minor_units
+두 방식의 전체 합계가 정확히 같은지와, 변환 없이 받은 SQLite REAL 합계의 오차도 함께 출력한다.
+"""
+import argparse
+import random
+from decimal import Decimal
+from sqlalchemy import BigInteger, Numeric, text
+from app.utils.money import from_minor_units
+from bench.common import (
+    scratch_engine, migrate, seed_legacy_transactions, bind_uuid, compact, table_bytes, timed, summary, megabytes
+)
+
+# 단계별 (금액 합계 식, 결과 타입, 금액 변환)
+STAGES = {
+    "Numeric 금액 (0004)": ("SUM(amount)", Numeric(14, 2), lambda value: value),
+    "정수 최소 단위 (0005)": ("CAST(SUM(amount_minor) AS BIGINT)", BigInteger(), from_minor_units),
+}
+
+
+def measure(engine, stage: str, user_ids: list, repeat: int) -> Decimal:
+    """단계 하나 측정 -> 전체 지출 합계"""
+    total, result_type, convert = STAGES[stage]
+    per_user = text(
+        f"SELECT date, type, {total} AS total FROM transactions WHERE user_id = :user_id GROUP BY date, type"
+    ).columns(total=result_type)
+    by_category = text(
+        f"SELECT user_id, category_id, {total} AS total FROM transactions GROUP BY user_id, category_id"
+    ).columns(total=result_type)
+    overall = text(f"SELECT {total} AS total FROM transactions WHERE type = 'EXPENSE'").columns(total=result_type)
+    rng = random.Random(1)
+
+    def one_user():
+        with engine.connect() as conn:
+            rows = conn.execute(per_user, {"user_id": bind_uuid(engine, rng.choice(user_ids))}).all()
+        return [convert(row.total) for row in rows]
+
+    def everyone():
+        with engine.connect() as conn:
+            return [convert(row.total) for row in conn.execute(by_category)]
+
+    compact(engine)
+    print(f"\n{stage}")
+    print("  " + megabytes(table_bytes(engine, "transactions"), "transactions"))
+    print("  " + summary("사용자 1명 일별 / 유형별 합계", timed(one_user, repeat * 10)))
+    print("  " + summary("전체 사용자 x 카테고리 합계", timed(everyone, repeat)))
+    with engine.connect() as conn:
+        return convert(conn.execute(overall).scalar())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Numeric 금액 / 정수 최소 화폐 단위 집계 시간 비교")
+    parser.add_argument("--url", default=None, help="측정 전용 DB (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = scratch_engine(args.url)
+    print(f"{engine.dialect.name}: 거래 {args.rows}건, 사용자 {args.users}명")
+    migrate(engine, "0003")
+    user_ids = seed_legacy_transactions(engine, args.rows, args.users)
+    migrate(engine, "0004")
+
+    before = measure(engine, "Numeric 금액 (0004)", user_ids, args.repeat)
+    if engine.dialect.name == "sqlite":
+        with engine.connect() as conn:
+            raw = conn.execute(text("SELECT SUM(amount) FROM transactions WHERE type = 'EXPENSE'")).scalar()
+    print(f"\n0005 마이그레이션 {migrate(engine, '0005'):.1f}초")
+    after = measure(engine, "정수 최소 단위 (0005)", user_ids, args.repeat)
+
+    print(f"\n전체 지출 합계: 이전 {before}, 이후 {after} ({'같음' if before == after else '다름'})")
+    if engine.dialect.name == "sqlite":
+        print(f"SQLite REAL 합계 {raw!r} (정확한 값과 차이 {Decimal(raw) - after:.2E})")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""카테고리 / 결제 수단 사전 인코딩 측정 (문자열 열 vs 사전 테이블 정수 id)
+
+사용법 (mdd-backend 에서):
+    python -m bench.categories                       # 임시 SQLite, 거래 20만 건 / 사용자 1000명
+    python -m bench.categories --rows 1000000 --users 5000
+    python -m bench.categories --url postgresql://postgres@localhost:5432/mdd_bench   # 측정 전용 DB
+
+0003 스키마(transactions.category / payment_method 문자열)에 거래를 만든 뒤
+- 테이블 크기: transactions (인덱스 포함)
+- GROUP BY: 사용자 한 명의 카테고리별 합계 (앱의 카테고리 통계 형태), 전체 사용자의 카테고리 이름별 합계
+를 측정하고, 0004 마이그레이션(사전 테이블 categories / payment_methods 로 교체)을 적용해 같은 항목을 다시 잰다.
+사전 인코딩 후 크기에는 categories / payment_methods 테이블도 더한다.
+"""
+import argparse
+import random
+from sqlalchemy import text
+from bench.common import (
+    scratch_engine, migrate, seed_legacy_transactions, bind_uuid, compact, table_bytes, timed, summary, megabytes
+)
+
+# 단계별 쿼리: (이름, 사용자 한 명 카테고리별 합계, 전체 카테고리 이름별 합계)
+QUERIES = {
+    "문자열 열 (0003)": (
+        "SELECT category, SUM(amount) FROM transactions WHERE user_id = :user_id GROUP BY category",
+        "SELECT category, SUM(amount), COUNT(*) FROM transactions GROUP BY category",
+    ),
+    "사전 id (0004)": (
+        "SELECT c.name, s.total FROM ("
+        "SELECT category_id, SUM(amount) AS total FROM transactions WHERE user_id = :user_id GROUP BY category_id"
+        ") s JOIN categories c ON c.id = s.category_id",
+        "SELECT c.name, SUM(s.total), SUM(s.count) FROM ("
+        "SELECT category_id, SUM(amount) AS total, COUNT(*) AS count FROM transactions GROUP BY category_id"
+        ") s JOIN categories c ON c.id = s.category_id GROUP BY c.name",
+    ),
+}
+
+
+def measure(engine, stage: str, user_ids: list, repeat: int, tables: list[str]) -> None:
+    per_user, overall = QUERIES[stage]
+    compact(engine)
+    sizes = {table: table_bytes(engine, table) for table in tables}
+    rng = random.Random(1)
+
+    def one_user():
+        with engine.connect() as conn:
+            return conn.execute(text(per_user), {"user_id": bind_uuid(engine, rng.choice(user_ids))}).all()
+
+    def everyone():
+        with engine.connect() as conn:
+            return conn.execute(text(overall)).all()
+
+    print(f"\n{stage}")
+    for table, size in sizes.items():
+        print("  " + megabytes(size, table))
+    print("  " + megabytes(sum(sizes.values()), "합계"))
+    print("  " + summary("사용자 1명 카테고리별 합계", timed(one_user, repeat * 10)))
+    print("  " + summary("전체 카테고리 이름별 합계", timed(everyone, repeat)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="카테고리 / 결제 수단 사전 인코딩 전후 크기와 GROUP BY 시간")
+    parser.add_argument("--url", default=None, help="측정 전용 DB (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = scratch_engine(args.url)
+    print(f"{engine.dialect.name}: 거래 {args.rows}건, 사용자 {args.users}명")
+    migrate(engine, "0003")
+    user_ids = seed_legacy_transactions(engine, args.rows, args.users)
+
+    measure(engine, "문자열 열 (0003)", user_ids, args.repeat, ["transactions"])
+    print(f"\n0004 마이그레이션 {migrate(engine, '0004'):.1f}초")
+    measure(engine, "사전 id (0004)", user_ids, args.repeat, ["transactions", "categories", "payment_methods"])
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""bench 스크립트 공통 (측정용 DB 준비, 마이그레이션, 시간 / 크기 측정)
+
+측정용 DB 는 --url 로 지정한다 (기본: 임시 SQLite 파일). PostgreSQL URL 을 주면 public 스키마를 지우고
+다시 만들므로 측정 전용 DB 를 지정해야 한다. 앱 설정(SECRET_KEY 등)은 .env / 환경 변수를 그대로 쓴다.
+"""
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.database import _create_engine
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CATEGORIES = ["식비", "교통", "카페", "생활용품", "문화", "의료", "통신", "주거", "교육", "경조사", "여행", "쇼핑"]
+PAYMENT_METHODS = ["card", "cash", "transfer", "point"]
+
+
+def scratch_engine(url: Optional[str]) -> Engine:
+    """빈 측정용 DB 엔진"""
+    if url is None:
+        url = f"sqlite:///{tempfile.mkdtemp(prefix='mdd-bench-')}/bench.db"
+    engine = _create_engine(url)
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as conn:
+            conn.execute(text("DROP SCHEMA public CASCADE"))
+            conn.execute(text("CREATE SCHEMA public"))
+    return engine
+
+
+def migrate(engine: Engine, revision: str, downgrade: bool = False) -> float:
+    """alembic upgrade (또는 downgrade) -> 걸린 시간 (초)"""
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        config.attributes["connection"] = conn
+        (command.downgrade if downgrade else command.upgrade)(config, revision)
+    return time.perf_counter() - started
+
+
+def seed_legacy_transactions(engine: Engine, rows: int, users: int, seed: int = 0) -> list[uuid.UUID]:
+    """0003 스키마(카테고리 / 결제 수단 문자열, Numeric 금액)에 거래 rows 건 생성 -> 사용자 id 목록
+
+    사용자마다 CATEGORIES 중 일부를 쓰고, 금액은 0.01 ~ 1000.00, 날짜는 최근 2년에 고르게 흩어 놓는다.
+    """
+    rng = random.Random(seed)
+    user_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(users)]
+    first_day = date.today() - timedelta(days=730)
+
+    with engine.begin() as conn:
+        conn.execute(
+            text("INSERT INTO users (id, email, username, password_hash) VALUES (:id, :email, 'bench', 'x')"),
+            [{"id": bind_uuid(engine, user_id), "email": f"bench{i}@example.com"} for i, user_id in enumerate(user_ids)]
+        )
+
+        insert = text(
+            "INSERT INTO transactions (id, user_id, date, type, category, amount, payment_method) "
+            "VALUES (:id, :user_id, :date, :type, :category, :amount, :payment_method)"
+        )
+        categories = {user_id: rng.sample(CATEGORIES, rng.randint(4, len(CATEGORIES))) for user_id in user_ids}
+        batch = []
+        for _ in range(rows):
+            user_id = rng.choice(user_ids)
+            income = rng.random() < 0.1
+            batch.append({
+                "id": bind_uuid(engine, uuid.UUID(int=rng.getrandbits(128))),
+                "user_id": bind_uuid(engine, user_id),
+                "date": first_day + timedelta(days=rng.randrange(730)),
+                "type": "INCOME" if income else "EXPENSE",
+                "category": "월급" if income else rng.choice(categories[user_id]),
+                "amount": f"{rng.randint(1, 100000) / 100:.2f}",
+                "payment_method": rng.choice(PAYMENT_METHODS + [None]),
+            })
+            if len(batch) == 10000:
+                conn.execute(insert, batch)
+                batch = []
+        if batch:
+            conn.execute(insert, batch)
+    return user_ids
+
+
+def bind_uuid(engine: Engine, value: uuid.UUID):
+    """text() 바인드 값 (SQLite 는 Uuid 타입이 쓰는 32자리 hex 문자열)"""
+    return value.hex if engine.dialect.name == "sqlite" else value
+
+
+def compact(engine: Engine) -> None:
+    """크기 측정 전 정리 (마이그레이션이 남긴 빈 공간 / 삭제한 열을 실제로 비움)"""
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM" if engine.dialect.name == "sqlite" else "VACUUM FULL ANALYZE"))
+        if engine.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+
+
+def table_bytes(engine: Engine, table: str) -> int:
+    """테이블과 인덱스가 차지하는 바이트 (PostgreSQL 파티션 테이블은 파티션 합계)"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "sqlite":
+            return conn.execute(text(
+                "SELECT coalesce(sum(pgsize), 0) FROM dbstat "
+                "WHERE name IN (SELECT name FROM sqlite_master WHERE tbl_name = :table)"
+            ), {"table": table}).scalar()
+        return conn.execute(text(
+            "SELECT pg_total_relation_size(CAST(:table AS regclass)) + coalesce(("
+            "SELECT sum(pg_total_relation_size(relid)) FROM pg_partition_tree(CAST(:table AS regclass)) WHERE level > 0"
+            "), 0)"
+        ), {"table": table}).scalar()
+
+
+def timed(run: Callable[[], object], repeat: int) -> list[float]:
+    """run 을 repeat 번 실행한 시간 목록 (초, 첫 실행은 캐시 예열로 제외)"""
+    run()
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def summary(name: str, values: list[float]) -> str:
+    ms = [value * 1000 for value in values]
+    return f"median {statistics.median(ms):9.2f} ms   min {min(ms):9.2f} ms   {name}"
+
+
+def megabytes(size: int, name: str) -> str:
+    return f"{size / 1024 / 1024:9.2f} MB   {name}"
@@ -0,0 +1,112 @@
+"""응답 압축 비용 측정 (줄어든 바이트 / CPU 시간)
+
+사용법 (mdd-backend 에서):
+    python -m bench.compression                  # /api/transactions 형태 JSON, 1 / 16 / 64 / 256KB
+    python -m bench.compression --sizes 4 64 --repeat 50
+    python -m bench.compression --file response.json
+
+/api/transactions 응답과 같은 스키마(TransactionResponse)로 직렬화한 JSON 을 인코딩 / 수준별로 압축해
+- ratio: 압축 후 크기 / 원본 크기
+- saved: 응답 하나당 줄어든 바이트
+- cpu: 응답 하나를 압축하는 데 쓴 CPU 시간 (process_time, 반복 평균)
+- MB/s: 원본 기준 처리량
+을 출력한다. 압축 함수는 미들웨어와 같은 make_compressor 를 쓰고, 설치되지 않은 인코딩(br / zstd)은 건너뛴다.
+--file 을 주면 저장해 둔 실제 응답 본문을 그대로 측정한다.
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import UUID
+from pydantic import TypeAdapter
+from app.config import get_settings
+from app.middleware.compression import available_encodings, make_compressor
+from app.schemas.transaction import TransactionResponse
+
+# 인코딩별로 비교할 수준 (가운데 값이 기본 설정과 같은 정도)
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 11), "zstd": (1, 3, 10)}
+
+CATEGORIES = ["식비", "교통", "카페", "생활용품", "문화", "의료", "통신", "월급"]
+DESCRIPTIONS = ["점심", "편의점", "지하철", "택시", "커피", "마트 장보기", "영화", "약국", "", None]
+PAYMENT_METHODS = ["card", "cash", "transfer", None]
+
+
+def transactions_payload(size: int, seed: int = 0) -> bytes:
+    """/api/transactions 응답 형태의 JSON 을 size 바이트가 넘을 때까지 만듦"""
+    rng = random.Random(seed)
+    adapter = TypeAdapter(list[TransactionResponse])
+    user_id = UUID(int=rng.getrandbits(128))
+    created = datetime(2026, 1, 1, 9, 0, 0)
+    items = []
+    body = b"[]"
+    while len(body) < size:
+        # 한 번에 조금씩 늘려 직렬화 횟수를 줄임
+        for _ in range(max(1, (size - len(body)) // 400)):
+            created += timedelta(minutes=rng.randint(1, 600))
+            income = rng.random() < 0.1
+            items.append(TransactionResponse(
+                id=UUID(int=rng.getrandbits(128)),
+                user_id=user_id,
+                date=created.date(),
+                type="income" if income else "expense",
+                category="월급" if income else rng.choice(CATEGORIES[:-1]),
+                amount=Decimal(rng.randint(100, 100000)) / 100,
+                description=rng.choice(DESCRIPTIONS),
+                payment_method=rng.choice(PAYMENT_METHODS),
+                created_at=created,
+                updated_at=None if rng.random() < 0.7 else created + timedelta(hours=1),
+            ))
+        body = adapter.dump_json(items)
+    return body
+
+
+def measure(compress, body: bytes, repeat: int) -> tuple[int, float]:
+    """(압축 후 크기, 1회 평균 CPU 시간 초)"""
+    compressed = compress(body)
+    start = time.process_time()
+    for _ in range(repeat):
+        compress(body)
+    return len(compressed), (time.process_time() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="응답 압축 인코딩 / 수준별 크기와 CPU 시간 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 16, 64, 256], help="본문 크기 (KB)")
+    parser.add_argument("--file", type=Path, help="측정할 응답 본문 파일 (--sizes 대신)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.file:
+        payloads = [(args.file.name, args.file.read_bytes())]
+    else:
+        payloads = [(f"{size}KB", transactions_payload(size * 1024)) for size in args.sizes]
+
+    settings = get_settings()
+    defaults = {
+        "gzip": settings.COMPRESSION_GZIP_LEVEL,
+        "br": settings.COMPRESSION_BROTLI_QUALITY,
+        "zstd": settings.COMPRESSION_ZSTD_LEVEL,
+    }
+    encodings = available_encodings()
+    print(f"인코딩: {', '.join(encodings)} (기본 수준 {defaults}), 반복 {args.repeat}회")
+    print(f"최소 크기 {settings.COMPRESSION_MIN_SIZE} B, 스레드 풀 압축 {settings.COMPRESSION_OFFLOAD_SIZE} B 이상")
+
+    for name, body in payloads:
+        print(f"\n{name} ({len(body)} B)")
+        print(f"{'encoding':<10}{'level':>6}{'size':>10}{'ratio':>8}{'saved':>10}{'cpu':>12}{'MB/s':>9}")
+        for encoding in encodings:
+            for level in sorted({*LEVELS[encoding], defaults[encoding]}):
+                compress = make_compressor(encoding, gzip_level=level, brotli_quality=level, zstd_level=level)
+                size, cpu = measure(compress, body, args.repeat)
+                marker = "*" if level == defaults[encoding] else " "
+                throughput = len(body) / cpu / 1e6 if cpu else float("inf")
+                print(
+                    f"{encoding:<10}{level:>5}{marker}{size:>10}{size / len(body):>8.3f}{len(body) - size:>10}"
+                    f"{cpu * 1000:>10.3f}ms{throughput:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""워커 시작 시간 측정
+
+사용법 (mdd-backend 에서, 마이그레이션을 적용한 DB 로):
+    python -m bench.startup                 # 5회 측정
+    python -m bench.startup --runs 10 --top 15
+
+매 회 새 프로세스에서 측정한다.
+- import: `import app.main` 에 걸린 시간
+- health: uvicorn 프로세스 시작부터 /health 가 처음 200 을 응답할 때까지
+- ready: 같은 기준으로 /ready 가 처음 200 을 응답할 때까지 (스키마 확인 + 커넥션 풀 예열)
+
+--top 을 주면 python -X importtime 으로 누적 import 시간이 큰 모듈을 함께 출력한다.
+DB 는 .env / 환경 변수의 DATABASE_URL 을 그대로 쓴다.
+"""
+import argparse
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import app.main; print(time.perf_counter() - start)"
+
+
+def measure_import() -> float:
+    """새 프로세스에서 import app.main 에 걸린 시간 (초)"""
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SNIPPET], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _status(url: str) -> int:
+    try:
+        with urllib.request.urlopen(url, timeout=1) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except OSError:
+        return 0
+
+
+def measure_first_requests(timeout: float) -> tuple[float, float]:
+    """uvicorn 시작부터 (/health 200, /ready 200) 까지 걸린 시간 (초)"""
+    port = _free_port()
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT
+    )
+    try:
+        times = {}
+        for path in ("/health", "/ready"):
+            while _status(base + path) != 200:
+                if server.poll() is not None:
+                    raise RuntimeError(f"서버가 종료되었습니다 (exit {server.returncode})")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"{timeout}초 안에 {path} 가 200 을 응답하지 않았습니다")
+                time.sleep(0.005)
+            times[path] = time.perf_counter() - start
+        return times["/health"], times["/ready"]
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def import_profile(top: int) -> list[tuple[int, str]]:
+    """python -X importtime 의 누적 시간 상위 모듈 -> [(마이크로초, 모듈)]"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"], cwd=ROOT, check=True, capture_output=True, text=True
+    ).stderr
+    rows = []
+    for line in stderr.splitlines():
+        parts = line.removeprefix("import time:").split("|")
+        if len(parts) == 3 and parts[1].strip().isdigit():
+            rows.append((int(parts[1]), parts[2].strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def _summary(name: str, values: list[float]) -> str:
+    ms = [value * 1000 for value in values]
+    return f"{name:<8} median {statistics.median(ms):8.1f} ms   min {min(ms):8.1f} ms   max {max(ms):8.1f} ms"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="워커 import / 첫 요청까지 걸리는 시간 측정")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--timeout", type=float, default=30.0, help="회당 /ready 대기 한도 (초)")
+    parser.add_argument("--top", type=int, default=0, help="누적 import 시간 상위 모듈 수")
+    args = parser.parse_args()
+
+    imports, health, ready = [], [], []
+    for _ in range(args.runs):
+        imports.append(measure_import())
+        first_health, first_ready = measure_first_requests(args.timeout)
+        health.append(first_health)
+        ready.append(first_ready)
+
+    print(f"{args.runs}회 측정")
+    print(_summary("import", imports))
+    print(_summary("health", health))
+    print(_summary("ready", ready))
+
+    if args.top:
+        print(f"\n누적 import 시간 상위 {args.top}개 모듈")
+        for microseconds, module in import_profile(args.top):
+            print(f"{microseconds / 1000:8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
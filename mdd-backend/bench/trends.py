@@ -0,0 +1,103 @@
+"""추세 조회 측정 (조회 기간 1 / 5 / 10년)
+
+사용법 (mdd-backend 에서):
+    python -m bench.trends                           # 임시 SQLite, 하루 평균 거래 3건, 다른 사용자 거래 10만 건
+    python -m bench.trends --per-day 10 --others 1000000
+    python -m bench.trends --url postgresql://postgres@localhost:5432/mdd_bench   # 측정 전용 DB
+
+최신 스키마에 사용자 한 명의 거래를 오늘부터 가장 긴 기간(기본 3650일)만큼 거슬러 만들고,
+같은 테이블에 다른 사용자 거래도 섞어 둔 뒤 오늘로 끝나는 기간마다
+- StatsService.get_daily_series: 일별 GROUP BY 쿼리 + 밀집 배열 채우기
+- TrendService.get_trends: 위 조회(이상 지출 기준 기간 포함) + 이동 평균 / 전월 대비 / 이상 지출 / 응답 생성
+을 잰다. 기간은 TREND_MAX_DAYS 이하여야 한다.
+"""
+import argparse
+import random
+import uuid
+from datetime import date, timedelta
+from app.database import SessionLocal
+from app.models.category import Category
+from app.models.transaction import Transaction, TransactionType
+from app.models.user import User
+from app.services.stats_service import StatsService
+from app.services.trend_service import TrendService
+from bench.common import CATEGORIES, scratch_engine, migrate, compact, timed, summary
+
+# 측정하는 조회 기간 (일)
+PERIODS = [365, 1825, 3650]
+
+
+def seed(engine, days: int, per_day: int, others: int, users: int, seed: int = 0) -> uuid.UUID:
+    """측정 사용자(오늘부터 days 일 전까지 하루 평균 per_day 건)와 다른 사용자 거래 others 건 생성
+
+    -> 측정 사용자 id
+    """
+    rng = random.Random(seed)
+    user_ids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(users + 1)]
+    first_day = date.today() - timedelta(days=days - 1)
+
+    with engine.begin() as conn:
+        conn.execute(User.__table__.insert(), [
+            {"id": user_id, "email": f"bench{i}@example.com", "username": "bench", "password_hash": "x"}
+            for i, user_id in enumerate(user_ids)
+        ])
+        conn.execute(Category.__table__.insert(), [
+            {"user_id": user_id, "name": name} for user_id in user_ids for name in CATEGORIES + ["월급"]
+        ])
+        category_ids = {
+            (row.user_id, row.name): row.id
+            for row in conn.execute(Category.__table__.select())
+        }
+
+        def transaction(user_id: uuid.UUID) -> dict:
+            income = rng.random() < 0.1
+            return {
+                "id": uuid.UUID(int=rng.getrandbits(128)),
+                "user_id": user_id,
+                "date": first_day + timedelta(days=rng.randrange(days)),
+                "type": TransactionType.INCOME if income else TransactionType.EXPENSE,
+                "category_id": category_ids[user_id, "월급" if income else rng.choice(CATEGORIES)],
+                "amount_minor": rng.randint(100, 10000000),
+            }
+
+        rows = [transaction(user_ids[0]) for _ in range(days * per_day)]
+        rows += [transaction(rng.choice(user_ids[1:])) for _ in range(others)]
+        for start in range(0, len(rows), 10000):
+            conn.execute(Transaction.__table__.insert(), rows[start:start + 10000])
+    return user_ids[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="조회 기간별 일별 시계열 / 추세 계산 시간")
+    parser.add_argument("--url", default=None, help="측정 전용 DB (기본: 임시 SQLite 파일)")
+    parser.add_argument("--per-day", type=int, default=3, help="측정 사용자의 하루 평균 거래 수")
+    parser.add_argument("--others", type=int, default=100000, help="다른 사용자 거래 수")
+    parser.add_argument("--users", type=int, default=100, help="다른 사용자 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = scratch_engine(args.url)
+    print(f"{engine.dialect.name}: 측정 사용자 거래 {max(PERIODS) * args.per_day}건, 다른 사용자 거래 {args.others}건")
+    migrate(engine, "head")
+    user_id = seed(engine, max(PERIODS), args.per_day, args.others, args.users)
+    compact(engine)
+
+    today = date.today()
+    with SessionLocal(bind=engine) as db:
+        user = db.get(User, user_id)
+        for days in PERIODS:
+            start = today - timedelta(days=days - 1)
+            print(f"\n{days}일 ({start} ~ {today})")
+            print("  " + summary(
+                "StatsService.get_daily_series",
+                timed(lambda: StatsService.get_daily_series(db, user, start, today), args.repeat)
+            ))
+            print("  " + summary(
+                "TrendService.get_trends",
+                timed(lambda: TrendService.get_trends(db, user, start, today), args.repeat)
+            ))
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""테스트 공통 픽스처
+
+DB 를 쓰는 테스트는 database 픽스처를 통해 SQLite 파일 DB 에서 실행되고, TEST_POSTGRES_URL 을 지정하면
+PostgreSQL 에서도 한 번 더 실행된다. 파티션 / SKIP LOCKED 처럼 PostgreSQL 에만 있는 동작은 postgres_database
+픽스처를 쓰며 SQLite 에서는 건너뛴다. PostgreSQL 테스트 DB 의 public 스키마는 지우고 다시 만들므로 전용 DB 를 지정해야 한다.
+
+    TEST_POSTGRES_URL=postgresql://postgres@localhost:5432/mdd_test python -m pytest
+"""
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+# app 을 import 하기 전에 설정 (.env 의 운영 DB 에 연결하지 않도록)
+_placeholder_dir = tempfile.mkdtemp(prefix="mdd-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_placeholder_dir}/unused.db"
+os.environ["SHARD_DATABASE_URLS"] = "[]"
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.config import get_settings
+from app.database import Base, _create_engine, shard_engines, shard_session
+from app.main import app
+from app.services import category_service, shard_service, stats_cache_service
+
+pytest_plugins = ["app.testing"]
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def migrate(engine: Engine, revision: str = "head") -> None:
+    """alembic 마이그레이션을 engine 에 적용"""
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "alembic"))
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, revision)
+
+
+def reset_postgres(engine: Engine) -> None:
+    """public 스키마를 비움"""
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+
+
+def clear_tables(engine: Engine) -> None:
+    """모든 테이블의 행 삭제 (스키마 / alembic_version 은 유지)"""
+    tables = [table.name for table in reversed(Base.metadata.sorted_tables)]
+    with engine.begin() as connection:
+        if engine.dialect.name == "postgresql":
+            connection.execute(text(f"TRUNCATE {', '.join(tables)} CASCADE"))
+        else:
+            for table in tables:
+                connection.execute(text(f"DELETE FROM {table}"))
+
+
+def clear_caches() -> None:
+    """프로세스 내 캐시 비움 (테스트끼리 id 캐시 등을 공유하지 않도록)"""
+    category_service._id_cache.clear()
+    shard_service._shard_cache.clear()
+    stats_cache_service._backend.clear()
+
+
+# TEST_POSTGRES_URL 이 없으면 SQLite 에서만 실행 (건너뛴 PostgreSQL 사본을 만들지 않음)
+DATABASES = ["sqlite", "postgresql"] if os.environ.get("TEST_POSTGRES_URL") else ["sqlite"]
+
+
+@pytest.fixture(scope="session", params=DATABASES)
+def database_url(request, tmp_path_factory) -> str:
+    """테스트 DB URL"""
+    if request.param == "sqlite":
+        return f"sqlite:///{tmp_path_factory.mktemp('sqlite')}/test.db"
+    return os.environ["TEST_POSTGRES_URL"]
+
+
+@pytest.fixture(scope="session")
+def migrated_engine(database_url):
+    """head 까지 마이그레이션한 엔진 (세션 동안 재사용)"""
+    engine = _create_engine(database_url)
+    if engine.dialect.name == "postgresql":
+        reset_postgres(engine)
+    migrate(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def database(migrated_engine, database_url, monkeypatch):
+    """샤드 0 을 테스트 DB 로 교체 (테스트가 끝나면 행을 모두 지움)
+
+    프로세스 풀 작업은 spawn 된 자식이 환경 변수로 설정을 다시 읽으므로 DATABASE_URL 도 바꾼다.
+    """
+    saved = shard_engines[:]
+    shard_engines[:] = [migrated_engine]
+    monkeypatch.setenv("DATABASE_URL", database_url)
+    clear_caches()
+    yield migrated_engine
+    shard_engines[:] = saved
+    clear_tables(migrated_engine)
+    clear_caches()
+
+
+@pytest.fixture
+def postgres_database(database):
+    """PostgreSQL 에만 있는 동작 검증용 (SQLite 이면 건너뜀)"""
+    if database.dialect.name != "postgresql":
+        pytest.skip("PostgreSQL 전용 (TEST_POSTGRES_URL 지정 시 실행)")
+    return database
+
+
+@pytest.fixture
+def shards(tmp_path, monkeypatch):
+    """마이그레이션한 SQLite 파일 3개를 샤드 0~2 로 교체 (샤드 0 에 사용자 디렉터리)"""
+    engines = [_create_engine(f"sqlite:///{tmp_path}/shard{shard}.db") for shard in range(3)]
+    for engine in engines:
+        migrate(engine)
+    
+    saved = shard_engines[:]
+    shard_engines[:] = engines
+    monkeypatch.setenv("DATABASE_URL", str(engines[0].url))
+    clear_caches()
+    yield engines
+    shard_engines[:] = saved
+    clear_caches()
+    for engine in engines:
+        engine.dispose()
+
+
+@pytest.fixture
+def db(database):
+    """샤드 0 세션"""
+    session = shard_session(0)
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(database):
+    with TestClient(app) as test_client:
+        # 시작 이벤트의 백그라운드 작업 복구가 테스트에서 만든 작업과 겹치지 않도록 끝날 때까지 대기
+        for thread in threading.enumerate():
+            if thread.name == "job-recovery":
+                thread.join(timeout=30)
+        yield test_client
+
+
+@pytest.fixture
+def signup(client):
+    """회원가입 후 인증 헤더를 반환하는 함수"""
+    count = 0
+    
+    def _signup(email: str = None, password: str = "password1") -> dict[str, str]:
+        nonlocal count
+        count += 1
+        email = email or f"user{count}@example.com"
+        response = client.post(
+            "/api/auth/signup",
+            json={"email": email, "username": email.split("@")[0], "password": password}
+        )
+        assert response.status_code == 201, response.text
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    
+    return _signup
+
+
+@pytest.fixture
+def admin_headers(monkeypatch) -> dict[str, str]:
+    """ADMIN_TOKEN 을 설정하고 운영용 토큰 헤더를 반환"""
+    monkeypatch.setattr(get_settings(), "ADMIN_TOKEN", "test-admin-token")
+    return {"X-Admin-Token": "test-admin-token"}
@@ -0,0 +1,183 @@
+"""요청 수용 제어 (ConcurrencyLimiter 단위 테스트, /api/stats 포화 시 다른 경로의 지연)"""
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+import pytest
+from app.config import get_settings
+from app.middleware import admission
+from app.middleware.admission import ConcurrencyLimiter, Overloaded
+from app.services.stats_service import StatsService
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_admits_up_to_concurrency_then_queues_in_order():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", concurrency=2, queue=2, timeout=5)
+        await limiter.acquire()
+        await limiter.acquire()
+        assert limiter.stats()["active"] == 2
+        
+        order = []
+        
+        async def wait(name):
+            await limiter.acquire()
+            order.append(name)
+        
+        waiters = [asyncio.create_task(wait("a")), asyncio.create_task(wait("b"))]
+        await asyncio.sleep(0)
+        assert limiter.stats()["waiting"] == 2 and order == []
+        
+        # 슬롯을 반환하면 대기자에게 그대로 넘어감 (active 유지)
+        limiter.release()
+        limiter.release()
+        await asyncio.gather(*waiters)
+        assert order == ["a", "b"]
+        assert limiter.active == 2
+        
+        limiter.release()
+        limiter.release()
+        assert limiter.active == 0
+        assert limiter.stats()["admitted"] == 4 and limiter.stats()["queued"] == 2
+    
+    run(scenario())
+
+
+def test_full_queue_is_shed_immediately():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", concurrency=1, queue=1, timeout=5)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        
+        started = time.perf_counter()
+        with pytest.raises(Overloaded):
+            await limiter.acquire()
+        assert time.perf_counter() - started < 0.1
+        assert limiter.shed == 1
+        
+        limiter.release()
+        await waiter
+        limiter.release()
+        assert limiter.active == 0
+    
+    run(scenario())
+
+
+def test_waiter_times_out_at_deadline():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", concurrency=1, queue=4, timeout=0.05)
+        await limiter.acquire()
+        
+        started = time.perf_counter()
+        with pytest.raises(Overloaded):
+            await limiter.acquire()
+        assert 0.05 <= time.perf_counter() - started < 1
+        assert limiter.timed_out == 1
+        assert limiter.stats()["waiting"] == 0
+        
+        # 시간 초과된 대기자는 대기열에서 빠졌으므로 반환하면 슬롯이 비어야 함
+        limiter.release()
+        assert limiter.active == 0
+        assert limiter.retry_after == 1
+    
+    run(scenario())
+
+
+def test_slot_handed_over_during_timeout_goes_to_next_waiter(monkeypatch):
+    """시간 초과와 동시에 슬롯을 넘겨받은 대기자는 슬롯을 다음 대기자에게 넘기고 거절됨"""
+    wait_for = asyncio.wait_for
+    
+    async def handed_over_then_timed_out(awaitable, timeout):
+        await awaitable  # release() 가 슬롯을 넘긴 직후 시간 초과가 난 상황
+        raise asyncio.TimeoutError
+    
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", concurrency=1, queue=4, timeout=5)
+        await limiter.acquire()
+        
+        monkeypatch.setattr(admission.asyncio, "wait_for", handed_over_then_timed_out)
+        first = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        monkeypatch.setattr(admission.asyncio, "wait_for", wait_for)
+        second = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        assert limiter.stats()["waiting"] == 2
+        
+        limiter.release()
+        with pytest.raises(Overloaded):
+            await first
+        await asyncio.wait_for(second, 1)  # 슬롯이 사라지지 않고 두 번째 대기자에게 감
+        assert limiter.active == 1 and limiter.timed_out == 1
+        
+        limiter.release()
+        assert limiter.active == 0
+    
+    run(scenario())
+
+
+def test_cancelled_waiter_leaves_queue():
+    async def scenario():
+        limiter = ConcurrencyLimiter("test", concurrency=1, queue=1, timeout=5)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+        
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.stats()["waiting"] == 0
+        
+        limiter.release()
+        assert limiter.active == 0
+    
+    run(scenario())
+
+
+@pytest.fixture
+def stats_limit():
+    """stats 그룹: 동시 2 / 대기 2 / 0.3초 (테스트가 끝나면 설정 복원)"""
+    admission.configure({"stats": {"concurrency": 2, "queue": 2, "timeout": 0.3}})
+    yield admission._limiters["stats"]
+    admission.configure(get_settings().ADMISSION_LIMITS)
+
+
+def test_saturated_stats_do_not_slow_other_routes(client, signup, stats_limit, monkeypatch):
+    headers = signup()
+    get_daily_stats = StatsService.get_daily_stats
+    
+    def slow_daily_stats(*args):
+        result = get_daily_stats(*args)
+        time.sleep(1)  # 집계가 오래 걸려 워커 스레드와 DB 커넥션을 붙잡고 있는 상황
+        return result
+    
+    monkeypatch.setattr(StatsService, "get_daily_stats", staticmethod(slow_daily_stats))
+    
+    def get(url):
+        started = time.perf_counter()
+        response = client.get(url, headers=headers)
+        return response, time.perf_counter() - started
+    
+    # 캐시에 걸리지 않도록 요청마다 다른 기간
+    stats_urls = [f"/api/stats/daily?start_date={date(2026, 1, 1) + timedelta(days=i)}" for i in range(12)]
+    with ThreadPoolExecutor(max_workers=len(stats_urls)) as pool:
+        stats = [pool.submit(get, url) for url in stats_urls]
+        time.sleep(0.1)
+        health = [get("/health") for _ in range(5)]
+        entries = [get("/api/entries") for _ in range(5)]
+        stats = [future.result() for future in stats]
+    
+    assert all(response.status_code == 200 for response, _ in health + entries)
+    assert max(elapsed for _, elapsed in health) < 0.5
+    assert max(elapsed for _, elapsed in entries) < 0.5
+    
+    # 실행 2 + 대기열에서 시간 초과 / 대기열이 가득 차 바로 거절
+    rejected = [response for response, _ in stats if response.status_code == 503]
+    assert sum(response.status_code == 200 for response, _ in stats) == 2
+    assert len(rejected) == 10
+    assert all(response.headers["Retry-After"] == "1" for response in rejected)
+    assert stats_limit.shed == 8 and stats_limit.timed_out == 2
+    assert stats_limit.active == 0
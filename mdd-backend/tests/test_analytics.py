@@ -0,0 +1,122 @@
+"""선언적 집계 API (/api/stats/query: 차원 / 집계 함수별 결과, 필요한 조인만, 행 수 상한, 잘못된 요청)"""
+import pytest
+from app.config import get_settings
+from app.utils.query_monitor import collect_queries
+
+
+@pytest.fixture
+def headers(client, signup):
+    """2026년 3~4월 거래 4건 (일기 2개에 연결된 지출 2건, 연결되지 않은 지출 1건, 수입 1건)"""
+    headers = signup()
+    happy = client.post("/api/entries", json={
+        "date": "2026-03-02", "title": "월요일", "mood": "happy", "tags": ["a", "b"]
+    }, headers=headers).json()["id"]
+    sad = client.post("/api/entries", json={
+        "date": "2026-04-10", "title": "금요일", "mood": "sad", "tags": ["b"]
+    }, headers=headers).json()["id"]
+    for day, kind, category, amount, payment_method, entry_id in [
+        ("2026-03-02", "expense", "식비", "10.00", "card", happy),
+        ("2026-03-04", "expense", "교통", "2.50", "cash", None),
+        ("2026-04-10", "expense", "식비", "4.00", None, sad),
+        ("2026-03-25", "income", "월급", "100", None, None),
+    ]:
+        response = client.post("/api/transactions", json={
+            "date": day, "type": kind, "category": category, "amount": amount,
+            "payment_method": payment_method, "entry_id": entry_id
+        }, headers=headers)
+        assert response.status_code == 201, response.text
+    return headers
+
+
+def _query(client, headers, **params):
+    return client.get("/api/stats/query", params=params, headers=headers)
+
+
+def _rows(client, headers, **params) -> list[dict]:
+    response = _query(client, headers, **params)
+    assert response.status_code == 200, response.text
+    return response.json()["rows"]
+
+
+@pytest.mark.parametrize("dimension, expected", [
+    ("day", {"2026-03-02": ("10.00", 1), "2026-03-04": ("2.50", 1), "2026-04-10": ("4.00", 1)}),
+    ("week", {"2026-03-02": ("12.50", 2), "2026-04-06": ("4.00", 1)}),  # 월요일 시작
+    ("month", {"2026-03-01": ("12.50", 2), "2026-04-01": ("4.00", 1)}),
+    ("year", {"2026-01-01": ("16.50", 3)}),
+    ("category", {"식비": ("14.00", 2), "교통": ("2.50", 1)}),
+    ("payment_method", {"card": ("10.00", 1), "cash": ("2.50", 1), None: ("4.00", 1)}),
+    ("tag", {"a": ("10.00", 1), "b": ("14.00", 2)}),  # 일기 태그마다 한 번씩
+    ("mood", {"happy": ("10.00", 1), "sad": ("4.00", 1), None: ("2.50", 1)}),
+])
+def test_group_by_dimension(client, headers, dimension, expected):
+    rows = _rows(
+        client, headers, dimensions=dimension, measures=["sum", "count"], transaction_type="expense"
+    )
+    assert {row[dimension]: (row["sum"], row["count"]) for row in rows} == expected
+    assert len(rows) == len(expected)
+
+
+def test_measures_and_multiple_dimensions(client, headers):
+    rows = _rows(client, headers, dimensions="category", measures=["avg", "min", "max", "count"])
+    assert {row["category"]: (row["avg"], row["min"], row["max"], row["count"]) for row in rows} == {
+        "식비": ("7.00", "4.00", "10.00", 2),
+        "교통": ("2.50", "2.50", "2.50", 1),
+        "월급": ("100.00", "100.00", "100.00", 1),
+    }
+    
+    # 차원 없이 전체 합계, 유형 x 월
+    assert _rows(client, headers, measures="sum") == [{"sum": "116.50"}]
+    rows = _rows(client, headers, dimensions=["type", "month"])
+    assert {(row["type"], row["month"]): row["sum"] for row in rows} == {
+        ("expense", "2026-03-01"): "12.50", ("expense", "2026-04-01"): "4.00", ("income", "2026-03-01"): "100.00"
+    }
+
+
+def test_filters(client, headers):
+    assert _rows(client, headers, category="식비", measures="count") == [{"count": 2}]
+    assert _rows(client, headers, payment_method=["card", "cash"], measures="count") == [{"count": 2}]
+    assert _rows(client, headers, mood="sad", measures="sum") == [{"sum": "4.00"}]
+    assert _rows(client, headers, tag="a", measures="sum") == [{"sum": "10.00"}]
+    assert _rows(client, headers, start_date="2026-03-03", end_date="2026-03-31", measures="count") == [{"count": 2}]
+    assert _rows(client, headers, category="없는 카테고리", measures="count") == [{"count": 0}]
+
+
+@pytest.mark.parametrize("dimensions, joined, not_joined", [
+    (["month"], [], ["categories", "payment_methods", "entries"]),
+    (["category"], ["categories"], ["payment_methods", "entries"]),
+    (["payment_method"], ["payment_methods"], ["categories", "entries"]),
+    (["mood"], ["entries"], ["categories", "payment_methods"]),
+])
+def test_query_joins_only_needed_tables(client, headers, dimensions, joined, not_joined):
+    with collect_queries() as collector:
+        assert _query(client, headers, dimensions=dimensions).status_code == 200
+    [sql] = [statement for statement in collector.requests[0].statements if "GROUP BY" in statement]
+    for table in joined:
+        assert f"JOIN {table}" in sql
+    for table in not_joined:
+        assert f"JOIN {table}" not in sql
+
+
+def test_row_cap_and_truncated_flag(client, headers):
+    response = _query(client, headers, dimensions="day", limit=2)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["truncated"] is True
+    assert [row["day"] for row in body["rows"]] == ["2026-03-02", "2026-03-04"]
+    
+    body = _query(client, headers, dimensions="day", limit=4).json()
+    assert body["truncated"] is False and len(body["rows"]) == 4
+    
+    # 요청 상한은 ANALYTICS_MAX_ROWS
+    assert _query(client, headers, dimensions="day", limit=get_settings().ANALYTICS_MAX_ROWS + 1).status_code == 422
+    assert _query(client, headers, dimensions="day", limit=0).status_code == 422
+
+
+@pytest.mark.parametrize("params, status_code", [
+    ({"dimensions": "hour"}, 422),  # 알 수 없는 차원
+    ({"dimensions": "user_id"}, 422),
+    ({"measures": "median"}, 422),  # 알 수 없는 집계 함수
+    ({"dimensions": ["day", "type", "category", "mood"]}, 400),  # 차원 수 초과
+])
+def test_invalid_query_is_rejected(client, headers, params, status_code):
+    assert _query(client, headers, **params).status_code == status_code
@@ -0,0 +1,116 @@
+"""예산 지출 카운터 (거래 쓰기마다 증감, reconcile 로 원본과 맞춤)"""
+from datetime import date
+from decimal import Decimal
+import pytest
+from app.database import shard_session
+from app.models.budget import CategorySpend
+from app.models.user import User
+from app.services.budget_service import BudgetService
+
+
+@pytest.fixture
+def user(client, signup):
+    """food / transport 예산이 있는 사용자 -> 인증 헤더"""
+    headers = signup()
+    for category in ("food", "transport"):
+        response = client.post("/api/budgets", json={"category": category, "amount": "100"}, headers=headers)
+        assert response.status_code == 201, response.text
+    return headers
+
+
+def spent(client, headers, year: int = 2026, month: int = 3) -> dict[str, Decimal]:
+    response = client.get(f"/api/budgets?year={year}&month={month}", headers=headers)
+    assert response.status_code == 200, response.text
+    return {budget["category"]: Decimal(str(budget["spent"])) for budget in response.json()["budgets"]}
+
+
+def reconcile(since: date = None) -> int:
+    """모든 사용자의 카운터를 원본과 비교해 고친 수 (0 이면 카운터가 정확)"""
+    with shard_session(0) as db:
+        return sum(BudgetService.reconcile(db, user_id, since) for (user_id,) in db.query(User.id).all())
+
+
+def create(client, headers, **fields) -> str:
+    data = {"date": "2026-03-10", "type": "expense", "category": "food", "amount": "10", **fields}
+    response = client.post("/api/transactions", json=data, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def update(client, headers, transaction_id: str, **fields) -> None:
+    response = client.put(f"/api/transactions/{transaction_id}", json=fields, headers=headers)
+    assert response.status_code == 200, response.text
+
+
+def test_counters_follow_transaction_writes(client, user):
+    first = create(client, user)
+    create(client, user, amount="5.50")
+    create(client, user, type="income", amount="1000")  # 수입은 예산에 포함하지 않음
+    assert spent(client, user) == {"food": Decimal("15.50"), "transport": 0}
+    
+    update(client, user, first, amount="20")
+    assert spent(client, user) == {"food": Decimal("25.50"), "transport": 0}
+    
+    # 카테고리 변경 -> 이전 카테고리에서 빼고 새 카테고리에 더함
+    update(client, user, first, category="transport")
+    assert spent(client, user) == {"food": Decimal("5.50"), "transport": Decimal("20")}
+    
+    # 월 변경
+    update(client, user, first, date="2026-04-01")
+    assert spent(client, user) == {"food": Decimal("5.50"), "transport": 0}
+    assert spent(client, user, month=4) == {"food": 0, "transport": Decimal("20")}
+    
+    # 지출 <-> 수입
+    update(client, user, first, type="income")
+    assert spent(client, user, month=4) == {"food": 0, "transport": 0}
+    update(client, user, first, type="expense")
+    
+    assert client.delete(f"/api/transactions/{first}", headers=user).status_code == 204
+    assert spent(client, user, month=4) == {"food": 0, "transport": 0}
+    assert reconcile() == 0
+
+
+def test_entry_writes_update_counters(client, user):
+    response = client.post(
+        "/api/entries/with-transactions",
+        json={
+            "entry": {"date": "2026-03-10"},
+            "transactions": [
+                {"date": "2026-03-10", "type": "expense", "category": "food", "amount": "7"},
+                {"date": "2026-03-11", "type": "expense", "category": "transport", "amount": "3"},
+            ]
+        },
+        headers=user
+    )
+    assert response.status_code == 201, response.text
+    assert spent(client, user) == {"food": Decimal("7"), "transport": Decimal("3")}
+    
+    # 일기와 함께 삭제되는 거래도 빠짐
+    entry_id = response.json()["entry"]["id"]
+    assert client.delete(f"/api/entries/{entry_id}", headers=user).status_code == 204
+    assert spent(client, user) == {"food": 0, "transport": 0}
+    assert reconcile() == 0
+
+
+def test_reconcile_fixes_drifted_counters(client, user, db):
+    create(client, user)
+    create(client, user, date="2026-04-10", category="transport")
+    create(client, user, date="2026-05-10")
+    
+    # 틀린 값 / 빠진 행 / 원본이 없는 행
+    counters = {(row.month, row.category_id): row for row in db.query(CategorySpend)}
+    march, april, may = sorted(counters)
+    counters[march].spent_minor = 1
+    db.delete(counters[april])
+    db.add(CategorySpend(user_id=counters[may].user_id, category_id=april[1], month=date(2026, 6, 1), spent_minor=99))
+    db.commit()
+    
+    # since 이전 달은 건드리지 않음
+    assert reconcile(since=date(2026, 4, 15)) == 2
+    assert spent(client, user, month=4)["transport"] == Decimal("10")
+    assert spent(client, user, month=6)["transport"] == 0
+    assert spent(client, user)["food"] == Decimal("0.01")
+    
+    assert reconcile() == 1
+    assert spent(client, user)["food"] == Decimal("10")
+    assert reconcile() == 0
@@ -0,0 +1,90 @@
+"""연간 캘린더 (날짜 인덱스 배열, 빈 날, 같은 날 여러 일기의 mood)"""
+from datetime import date, datetime
+from decimal import Decimal
+import pytest
+from app.models.entry import Entry
+from app.models.user import User
+from app.schemas.transaction import TransactionCreate
+from app.services.calendar_service import CalendarService
+from app.services.finance_service import FinanceService
+
+
+@pytest.fixture
+def user(db) -> User:
+    user = User(email="calendar@example.com", username="calendar", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _entry(db, user: User, day: date, mood, written: datetime) -> None:
+    db.add(Entry(user_id=user.id, date=day, title="일기", mood=mood, created_at=written))
+    db.commit()
+
+
+def _transaction(db, user: User, day: date, transaction_type: str, amount: str) -> None:
+    FinanceService.create_transaction(
+        db, TransactionCreate(date=day, type=transaction_type, category="식비", amount=Decimal(amount)), user
+    )
+
+
+def test_year_grid(db, user):
+    _entry(db, user, date(2024, 1, 1), "happy", datetime(2024, 1, 1, 9))
+    _entry(db, user, date(2024, 2, 29), "sad", datetime(2024, 2, 29, 9))
+    _entry(db, user, date(2024, 12, 31), None, datetime(2024, 12, 31, 9))
+    _entry(db, user, date(2023, 12, 31), "angry", datetime(2023, 12, 31, 9))  # 기간 밖
+    _transaction(db, user, date(2024, 1, 1), "expense", "10.5")
+    _transaction(db, user, date(2024, 1, 1), "expense", "2.25")
+    _transaction(db, user, date(2024, 1, 1), "income", "100")
+    _transaction(db, user, date(2024, 12, 31), "expense", "0.01")
+    _transaction(db, user, date(2025, 1, 1), "expense", "999")  # 기간 밖
+    
+    calendar = CalendarService.get_year(db, user, 2024)
+    assert calendar.days == 366
+    assert calendar.currency_exponent == 2
+    assert all(len(column) == 366 for column in (calendar.has_entry, calendar.mood, calendar.expense, calendar.income))
+    
+    # 인덱스 = 1월 1일부터의 일수 (2월 29일 = 59, 12월 31일 = 365)
+    assert [i for i, value in enumerate(calendar.has_entry) if value] == [0, 59, 365]
+    assert calendar.moods == ["happy", "sad"]
+    assert {i: code for i, code in enumerate(calendar.mood) if code} == {0: 1, 59: 2}
+    assert {i: amount for i, amount in enumerate(calendar.expense) if amount} == {0: 1275, 365: 1}
+    assert {i: amount for i, amount in enumerate(calendar.income) if amount} == {0: 10000}
+
+
+def test_empty_year(db, user):
+    _entry(db, user, date(2024, 6, 1), "happy", datetime(2024, 6, 1, 9))
+    
+    calendar = CalendarService.get_year(db, user, 2023)
+    assert calendar.days == 365
+    assert calendar.moods == []
+    for column in (calendar.has_entry, calendar.mood, calendar.expense, calendar.income):
+        assert column == [0] * 365
+
+
+def test_latest_entry_mood_wins(db, user):
+    # 1월 1일: 마지막 일기에 mood 가 없으면 이전 일기의 mood 도 쓰지 않음
+    _entry(db, user, date(2024, 1, 1), "happy", datetime(2024, 1, 1, 9))
+    _entry(db, user, date(2024, 1, 1), None, datetime(2024, 1, 1, 21))
+    # 1월 2일: mood 없는 일기 뒤에 기록한 mood
+    _entry(db, user, date(2024, 1, 2), None, datetime(2024, 1, 2, 9))
+    _entry(db, user, date(2024, 1, 2), "angry", datetime(2024, 1, 2, 21))
+    # 1월 3일: 작성 시각 순서 (저장 순서와 반대)
+    _entry(db, user, date(2024, 1, 3), "sad", datetime(2024, 1, 3, 21))
+    _entry(db, user, date(2024, 1, 3), "happy", datetime(2024, 1, 3, 9))
+    
+    calendar = CalendarService.get_year(db, user, 2024)
+    assert calendar.has_entry[:4] == [1, 1, 1, 0]
+    assert calendar.moods == ["angry", "sad"]
+    assert calendar.mood[:4] == [0, 1, 2, 0]
+
+
+def test_calendar_api(client, signup):
+    headers = signup()
+    client.post("/api/entries", json={"date": "2024-03-01", "title": "일기", "mood": "happy"}, headers=headers)
+    
+    response = client.get("/api/calendar/2024", headers=headers)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["days"] == 366 and body["moods"] == ["happy"] and body["mood"][60] == 1
+    assert client.get("/api/calendar/0", headers=headers).status_code == 422
@@ -0,0 +1,73 @@
+"""카테고리 사전 id 캐시 (커밋 후 반영, 롤백 시 폐기)"""
+from app.database import shard_session
+from app.models.category import Category
+from app.models.user import User
+from app.services import category_service
+from app.services.category_service import CategoryService
+
+
+def _user(db) -> User:
+    user = User(email="category@example.com", username="category", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _cached(db, user: User, name: str):
+    return category_service._id_cache.get(CategoryService._cache_key(db, Category, user, name))
+
+
+def test_created_id_is_cached_after_commit(db):
+    user = _user(db)
+    
+    category_id = CategoryService.get_or_create_category_id(db, user, "food")
+    assert _cached(db, user, "food") is None  # 커밋 전에는 세션에만 보관
+    assert CategoryService.get_or_create_category_id(db, user, "food") == category_id
+    
+    db.commit()
+    assert _cached(db, user, "food") == category_id
+    
+    # 다른 세션도 캐시에서 같은 id 를 얻음
+    with shard_session(0) as other:
+        assert CategoryService.find_category_id(other, user, "food") == category_id
+
+
+def test_rolled_back_id_is_not_cached(db):
+    user = _user(db)
+    
+    CategoryService.get_or_create_category_id(db, user, "food")
+    db.rollback()
+    assert _cached(db, user, "food") is None
+    assert CategoryService.find_category_id(db, user, "food") is None
+    
+    # 다시 만들면 실제로 저장된 id 가 캐시됨
+    category_id = CategoryService.get_or_create_category_id(db, user, "food")
+    db.commit()
+    assert db.get(Category, category_id).name == "food"
+    assert _cached(db, user, "food") == category_id
+
+
+def test_concurrent_create_uses_existing_row(db, monkeypatch):
+    """다른 세션이 먼저 만든 이름은 unique 위반 후 재조회한 id 사용 (바깥 트랜잭션은 유지)"""
+    user = _user(db)
+    with shard_session(0) as other:
+        existing = CategoryService.get_or_create_category_id(other, user, "food")
+        other.commit()
+    category_service._id_cache.clear()
+    
+    pending = CategoryService.get_or_create_category_id(db, user, "transport")
+    
+    # 조회와 생성 사이에 다른 세션이 커밋한 상황: 첫 조회만 없는 것으로 처리
+    find_id = CategoryService._find_id
+    calls = []
+    
+    def find_after_race(*args):
+        calls.append(args)
+        return None if len(calls) == 1 else find_id(*args)
+    
+    monkeypatch.setattr(CategoryService, "_find_id", staticmethod(find_after_race))
+    assert CategoryService.get_or_create_category_id(db, user, "food") == existing
+    
+    db.commit()
+    assert db.get(Category, pending).name == "transport"
+    assert _cached(db, user, "transport") == pending
@@ -0,0 +1,160 @@
+"""응답 압축 (Accept-Encoding 협상, 최소 크기, identity 제외, 약한 ETag, 스레드 풀 압축)"""
+import threading
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from app.middleware.compression import CompressionMiddleware, negotiate
+
+ENCODINGS = ["zstd", "br", "gzip"]
+
+BIG = {"items": ["x" * 100] * 100}  # 약 10KB
+MEDIUM = {"items": ["x" * 100] * 20}  # 약 2KB
+SMALL = {"ok": True}
+
+
+@pytest.mark.parametrize("accept_encoding, encodings, expected", [
+    ("gzip", ENCODINGS, "gzip"),
+    ("gzip, br", ENCODINGS, "br"),  # q 값이 같으면 서버 선호 순
+    ("gzip;q=1.0, br;q=0.5", ENCODINGS, "gzip"),
+    (" GZIP ; q=0.8 , deflate", ENCODINGS, "gzip"),
+    ("*", ENCODINGS, "zstd"),
+    ("zstd;q=0, br;q=0, *;q=0.5", ENCODINGS, "gzip"),
+    ("*;q=0", ENCODINGS, None),
+    ("br, gzip;q=0.5", ["gzip"], "gzip"),  # 설치되지 않은 인코딩은 고르지 않음
+    ("gzip, identity;q=0", ENCODINGS, "gzip"),
+    ("identity;q=0", ENCODINGS, None),
+    ("identity", ENCODINGS, None),
+    ("gzip;q=0", ENCODINGS, None),
+    ("gzip;q=abc", ENCODINGS, None),  # 잘못된 q 값은 0
+    ("deflate", ENCODINGS, None),
+    ("", ENCODINGS, None),
+])
+def test_negotiate(accept_encoding, encodings, expected):
+    assert negotiate(accept_encoding, encodings) == expected
+
+
+@pytest.fixture
+def compressed():
+    """테스트용 앱 + 미들웨어 (최소 1KB, 4KB 이상은 스레드 풀) -> (클라이언트, 미들웨어, 압축한 스레드 기록)"""
+    app = FastAPI()
+    threads = {}
+    
+    @app.get("/big")
+    async def big():
+        threads["endpoint"] = threading.get_ident()
+        return JSONResponse(BIG, headers={"ETag": '"v1"'})
+    
+    @app.get("/medium")
+    async def medium():
+        threads["endpoint"] = threading.get_ident()
+        return JSONResponse(MEDIUM)
+    
+    @app.get("/small")
+    async def small():
+        return SMALL
+    
+    @app.get("/identity")
+    async def identity():
+        return JSONResponse(BIG, headers={"Content-Encoding": "identity"})
+    
+    @app.get("/no-transform")
+    async def no_transform():
+        return JSONResponse(BIG, headers={"Cache-Control": "no-transform"})
+    
+    @app.get("/stream")
+    async def stream():
+        return StreamingResponse((b"x" * 1000 for _ in range(10)), media_type="text/plain")
+    
+    @app.get("/excluded/big")
+    async def excluded():
+        return BIG
+    
+    middleware = CompressionMiddleware(app, minimum_size=1024, offload_size=4096, exclude_paths=[r"/excluded/"])
+    gzip_compress = middleware.compressors["gzip"]
+    
+    def recording_compress(body):
+        threads["compress"] = threading.get_ident()
+        return gzip_compress(body)
+    
+    middleware.compressors["gzip"] = recording_compress
+    with TestClient(middleware) as client:
+        yield client, middleware, threads
+
+
+def test_large_json_is_gzipped(compressed):
+    client, _, _ = compressed
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < 1000
+    assert response.json() == BIG
+    
+    # 클라이언트가 gzip 을 받지 않으면 그대로
+    for accept_encoding in ("identity", "gzip;q=0"):
+        response = client.get("/big", headers={"Accept-Encoding": accept_encoding})
+        assert "content-encoding" not in response.headers
+        assert response.json() == BIG
+
+
+def test_body_below_minimum_size_is_not_compressed(compressed):
+    client, _, threads = compressed
+    response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert "Accept-Encoding" in response.headers["vary"]  # 크기와 무관하게 인코딩별 표현이 다를 수 있음
+    assert "compress" not in threads
+
+
+@pytest.mark.parametrize("path", ["/identity", "/no-transform", "/stream", "/excluded/big"])
+def test_opted_out_responses_are_sent_as_is(compressed, path):
+    client, _, threads = compressed
+    response = client.get(path, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") in (None, "identity")
+    assert "compress" not in threads
+
+
+def test_compressed_etag_is_weak(compressed):
+    client, _, _ = compressed
+    assert client.get("/big", headers={"Accept-Encoding": "identity"}).headers["etag"] == '"v1"'
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["etag"] == 'W/"v1"'
+
+
+def test_large_body_is_compressed_off_the_event_loop(compressed):
+    client, _, threads = compressed
+    
+    client.get("/medium", headers={"Accept-Encoding": "gzip"})
+    assert threads["compress"] == threads["endpoint"]  # offload_size 미만은 이벤트 루프에서 바로
+    
+    threads.clear()
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert threads["compress"] != threads["endpoint"]
+
+
+def test_incompressible_body_is_sent_uncompressed(compressed):
+    client, middleware, _ = compressed
+    middleware.compressors["gzip"] = lambda body: body + b"!"  # 압축해도 줄지 않는 본문
+    response = client.get("/big", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] == '"v1"'
+    assert response.json() == BIG
+
+
+def test_api_list_is_compressed_and_revalidates_with_weak_etag(client, signup):
+    headers = signup()
+    for i in range(15):
+        response = client.post("/api/entries", json={"date": "2026-10-01", "title": f"일기 {i}"}, headers=headers)
+        assert response.status_code == 201, response.text
+    
+    response = client.get("/api/entries", headers={**headers, "Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(response.content)  # content 는 풀어낸 본문
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    
+    # 약한 ETag 로 보낸 If-None-Match 도 304 (약한 비교)
+    revalidated = client.get("/api/entries", headers={**headers, "Accept-Encoding": "gzip", "If-None-Match": etag})
+    assert revalidated.status_code == 304
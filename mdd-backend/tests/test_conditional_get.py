@@ -0,0 +1,94 @@
+"""상세 조회 조건부 요청 (ETag / 304)
+
+수정이 같은 초 안에 연달아 일어나도 ETag 가 바뀌어야 한다 (updated_at 은 초 단위일 수 있음).
+"""
+
+
+def _entry(client, headers) -> str:
+    response = client.post("/api/entries", json={"date": "2026-10-01", "title": "v0"}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _transaction(client, headers, entry_id: str = None) -> str:
+    response = client.post(
+        "/api/transactions",
+        json={"date": "2026-10-01", "type": "expense", "category": "food", "amount": "3", "entry_id": entry_id},
+        headers=headers
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _assert_edit_changes_etag(client, headers, url: str, edit) -> None:
+    """edit -> GET -> edit -> 조건부 GET 이 새 본문(200)을 반환하는지"""
+    edit(1)
+    first = client.get(url, headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    
+    assert client.get(url, headers={**headers, "If-None-Match": etag}).status_code == 304
+    
+    edit(2)
+    second = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert second.status_code == 200
+    assert second.headers["ETag"] != etag
+    assert second.json() != first.json()
+    assert client.get(url, headers={**headers, "If-None-Match": second.headers["ETag"]}).status_code == 304
+
+
+def test_entry_etag_changes_on_every_edit(client, signup):
+    headers = signup()
+    entry_id = _entry(client, headers)
+    
+    def edit(n):
+        assert client.put(f"/api/entries/{entry_id}", json={"title": f"v{n}"}, headers=headers).status_code == 200
+    
+    _assert_edit_changes_etag(client, headers, f"/api/entries/{entry_id}", edit)
+
+
+def test_transaction_etag_changes_on_every_edit(client, signup):
+    headers = signup()
+    transaction_id = _transaction(client, headers)
+    
+    def edit(n):
+        response = client.put(f"/api/transactions/{transaction_id}", json={"amount": str(10 + n)}, headers=headers)
+        assert response.status_code == 200
+    
+    _assert_edit_changes_etag(client, headers, f"/api/transactions/{transaction_id}", edit)
+
+
+def test_full_etag_changes_on_transaction_edit(client, signup):
+    headers = signup()
+    entry_id = _entry(client, headers)
+    transaction_id = _transaction(client, headers, entry_id)
+    
+    def edit(n):
+        response = client.put(f"/api/transactions/{transaction_id}", json={"description": f"v{n}"}, headers=headers)
+        assert response.status_code == 200
+    
+    _assert_edit_changes_etag(client, headers, f"/api/entries/{entry_id}/full", edit)
+
+
+def test_full_etag_changes_when_transactions_are_replaced(client, signup):
+    """거래 하나를 지우고 다른 거래를 붙여 거래 수가 같아도 ETag 가 바뀜"""
+    headers = signup()
+    entry_id = _entry(client, headers)
+    removed = _transaction(client, headers, entry_id)
+    url = f"/api/entries/{entry_id}/full"
+    etag = client.get(url, headers=headers).headers["ETag"]
+    
+    assert client.delete(f"/api/transactions/{removed}", headers=headers).status_code == 204
+    added = _transaction(client, headers, entry_id)
+    
+    response = client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert [t["id"] for t in response.json()["transactions"]] == [added]
+
+
+def test_missing_entry_with_conditional_header(client, signup):
+    headers = signup()
+    response = client.get(
+        "/api/entries/00000000-0000-0000-0000-000000000000", headers={**headers, "If-None-Match": '"x"'}
+    )
+    assert response.status_code == 404
@@ -0,0 +1,92 @@
+"""목록 fields= 선택 (반환 키, 로드하는 컬럼 / 조인, 알 수 없는 필드) 와 일기 preview 저장"""
+import pytest
+from app.models.entry import PREVIEW_LENGTH
+from app.utils.query_monitor import collect_queries
+
+
+def _list_sql(client, headers, url: str) -> tuple:
+    """목록 응답과 목록 SELECT 문 (ORDER BY 가 있는 SQL)"""
+    with collect_queries() as collector:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    [statement] = [sql for sql in collector.requests[0].statements if "ORDER BY" in sql]
+    return response.json(), statement
+
+
+@pytest.fixture
+def filled(client, signup):
+    headers = signup()
+    entry = client.post("/api/entries", json={
+        "date": "2026-10-01", "title": "산책", "content": "공원" * 150, "mood": "happy", "tags": ["a"]
+    }, headers=headers)
+    assert entry.status_code == 201, entry.text
+    for category, payment_method in [("식비", "card"), ("교통", None)]:
+        response = client.post("/api/transactions", json={
+            "date": "2026-10-01", "type": "expense", "category": category, "amount": "3.5",
+            "payment_method": payment_method, "entry_id": entry.json()["id"],
+        }, headers=headers)
+        assert response.status_code == 201, response.text
+    return headers
+
+
+def test_entry_fields(client, filled):
+    body, sql = _list_sql(client, filled, "/api/entries?fields=date,title")
+    assert [set(item) for item in body["entries"]] == [{"id", "date", "title"}]
+    assert body["entries"][0]["title"] == "산책"
+    assert "entries.content" not in sql and "entries.tags" not in sql
+    
+    # fields 가 없으면 content 를 제외한 목록 필드 전체 (본문 대신 preview)
+    body, sql = _list_sql(client, filled, "/api/entries")
+    item = body["entries"][0]
+    assert "content" not in item and item["preview"] == ("공원" * 150)[:PREVIEW_LENGTH]
+    assert item["mood"] == "happy" and item["tags"] == ["a"]
+
+
+def test_transaction_fields(client, filled):
+    body, sql = _list_sql(client, filled, "/api/transactions?fields=date,amount")
+    assert [set(item) for item in body] == [{"id", "date", "amount"}] * 2
+    assert [item["amount"] for item in body] == ["3.50", "3.50"]
+    # 요청하지 않은 사전 테이블은 조인하지 않음
+    assert "categories" not in sql and "payment_methods" not in sql and "description" not in sql
+    
+    body, sql = _list_sql(client, filled, "/api/transactions?fields=category, payment_method")
+    assert sorted((item["category"], item.get("payment_method")) for item in body) == [
+        ("교통", None), ("식비", "card")
+    ]
+    assert "categories" in sql and "payment_methods" in sql
+
+
+@pytest.mark.parametrize("url", [
+    "/api/entries?fields=date,content",  # 목록에서 제외한 본문
+    "/api/entries?fields=password_hash",
+    "/api/transactions?fields=date,amount_minor",
+])
+def test_unknown_fields_are_rejected(client, filled, url):
+    response = client.get(url, headers=filled)
+    assert response.status_code == 400
+    assert "지원하지 않는 필드" in response.json()["detail"]
+
+
+def test_preview_is_stored_and_recomputed(client, signup):
+    headers = signup()
+    entry_id = client.post("/api/entries", json={
+        "date": "2026-10-02", "title": "일기", "content": "가" * (PREVIEW_LENGTH + 50)
+    }, headers=headers).json()["id"]
+    
+    def preview():
+        return client.get("/api/entries?fields=preview", headers=headers).json()["entries"][0]["preview"]
+    
+    assert preview() == "가" * PREVIEW_LENGTH
+    assert client.get(f"/api/entries/{entry_id}", headers=headers).json()["preview"] == "가" * PREVIEW_LENGTH
+    
+    # content 를 바꾸면 preview 도 다시 계산, 다른 필드만 바꾸면 그대로
+    response = client.put(f"/api/entries/{entry_id}", json={"content": "짧은 본문"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["preview"] == "짧은 본문"
+    assert preview() == "짧은 본문"
+    
+    client.put(f"/api/entries/{entry_id}", json={"title": "제목만"}, headers=headers)
+    assert preview() == "짧은 본문"
+    
+    client.put(f"/api/entries/{entry_id}", json={"content": None}, headers=headers)
+    assert preview() is None
@@ -0,0 +1,243 @@
+"""백그라운드 작업 (한 번만 실행, 취소, 서버 재시작 후 복구, 실행 중 heartbeat)"""
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from app.database import _create_engine, shard_engines, shard_session
+from app.jobs import JobBackend, register, set_backend
+from app.config import get_settings
+from app.jobs.runner import recover_jobs, run_job, worker_id
+from app.main import app
+from app.models.job import Job, JobStatus
+from app.models.user import User
+from app.services.job_service import JobService
+from app.utils import readiness
+
+calls = []
+started = threading.Event()
+resume = threading.Event()
+
+
+@register("test_count")
+def count_runs(ctx, params):
+    calls.append(ctx.job_id)
+    return {"runs": len(calls)}
+
+
+@register("test_wait")
+def wait_for_cancel(ctx, params):
+    started.set()
+    assert resume.wait(timeout=30)
+    ctx.progress(0.5, "절반")
+    return {}
+
+
+@register("test_fail")
+def fail(ctx, params):
+    raise ValueError("실패")
+
+
+class RecordingBackend(JobBackend):
+    """제출된 작업을 실행하지 않고 기록만 하는 백엔드"""
+    
+    def __init__(self):
+        self.submitted = []
+    
+    def submit(self, job_id, executor):
+        self.submitted.append(job_id)
+
+
+@pytest.fixture
+def backend(database):
+    backend = RecordingBackend()
+    set_backend(backend)
+    calls.clear()
+    started.clear()
+    resume.clear()
+    yield backend
+    resume.set()
+    set_backend(None)
+
+
+@pytest.fixture
+def user(db) -> User:
+    user = User(email="jobs@example.com", username="jobs", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _status(job_id) -> Job:
+    with shard_session(0) as db:
+        job = db.get(Job, job_id)
+        db.expunge(job)
+        return job
+
+
+def test_job_runs_once(db, user, backend):
+    job = JobService.create_job(db, user, "test_count")
+    assert backend.submitted == [job.id]
+    
+    # 같은 작업이 여러 번 제출되어도 PENDING -> RUNNING 으로 바꾼 한 번만 실행
+    threads = [threading.Thread(target=run_job, args=(str(job.id),)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=30)
+    run_job(str(job.id))
+    
+    assert calls == [job.id]
+    finished = _status(job.id)
+    assert finished.status == JobStatus.SUCCEEDED
+    assert finished.result == {"runs": 1} and finished.progress == 1.0
+
+
+def test_failed_job_records_error(db, user, backend):
+    job = JobService.create_job(db, user, "test_fail")
+    run_job(str(job.id))
+    
+    failed = _status(job.id)
+    assert failed.status == JobStatus.FAILED
+    assert failed.error == "ValueError: 실패"
+
+
+def test_cancel_pending_job(db, user, backend):
+    job = JobService.create_job(db, user, "test_count")
+    assert JobService.cancel_job(db, job.id, user).status == JobStatus.CANCELLED
+    
+    run_job(str(job.id))
+    assert calls == []
+    assert _status(job.id).status == JobStatus.CANCELLED
+    
+    # 종료된 작업은 다시 취소할 수 없음
+    with pytest.raises(HTTPException) as error:
+        JobService.cancel_job(db, job.id, user)
+    assert error.value.status_code == 409
+
+
+def test_cancel_running_job(db, user, backend):
+    job = JobService.create_job(db, user, "test_wait")
+    worker = threading.Thread(target=run_job, args=(str(job.id),))
+    worker.start()
+    assert started.wait(timeout=30)
+    
+    cancelled = JobService.cancel_job(db, job.id, user)
+    assert cancelled.status == JobStatus.RUNNING and cancelled.cancel_requested
+    
+    # 다음 진행률 기록에서 중단
+    resume.set()
+    worker.join(timeout=30)
+    assert _status(job.id).status == JobStatus.CANCELLED
+
+
+def test_recover_jobs(db, user, backend):
+    now = datetime.now(timezone.utc)
+    pending = Job(user_id=user.id, kind="test_count", status=JobStatus.PENDING)
+    stale = Job(user_id=user.id, kind="test_count", status=JobStatus.RUNNING, started_at=now - timedelta(hours=2))
+    running = Job(user_id=user.id, kind="test_count", status=JobStatus.RUNNING, started_at=now)
+    # 오래전에 시작했지만 다른 워커가 아직 heartbeat 를 갱신 중
+    busy = Job(
+        user_id=user.id, kind="test_count", status=JobStatus.RUNNING, started_at=now - timedelta(hours=2),
+        worker_id="other-host:1", heartbeat_at=now
+    )
+    lost = Job(
+        user_id=user.id, kind="test_count", status=JobStatus.RUNNING, started_at=now - timedelta(hours=2),
+        worker_id="other-host:2", heartbeat_at=now - timedelta(hours=1)
+    )
+    unknown = Job(user_id=user.id, kind="removed_kind", status=JobStatus.PENDING)
+    db.add_all([pending, stale, running, busy, lost, unknown])
+    db.commit()
+    
+    restarted = RecordingBackend()
+    assert recover_jobs(restarted, timedelta(minutes=30)) == (1, 2)
+    assert restarted.submitted == [pending.id]
+    
+    assert _status(stale.id).status == JobStatus.FAILED
+    assert _status(lost.id).status == JobStatus.FAILED
+    assert _status(running.id).status == JobStatus.RUNNING
+    assert _status(busy.id).status == JobStatus.RUNNING
+    assert _status(unknown.id).status == JobStatus.FAILED
+    
+    # 다시 제출된 작업은 정상 실행되고, 한 번 더 복구해도 중복 제출되지 않음
+    run_job(str(pending.id))
+    assert _status(pending.id).status == JobStatus.SUCCEEDED
+    assert recover_jobs(RecordingBackend(), timedelta(minutes=30)) == (0, 0)
+
+
+def test_running_job_keeps_heartbeat(db, user, backend, monkeypatch):
+    monkeypatch.setattr(get_settings(), "JOB_HEARTBEAT_SECONDS", 0.05)
+    job = JobService.create_job(db, user, "test_wait")
+    worker = threading.Thread(target=run_job, args=(str(job.id),))
+    worker.start()
+    assert started.wait(timeout=30)
+    assert _status(job.id).worker_id == worker_id()
+    
+    # 오래된 heartbeat 로 바꿔 두면 실행 중인 워커가 다시 갱신함
+    with shard_session(0) as session:
+        session.query(Job).filter(Job.id == job.id).update(
+            {Job.heartbeat_at: datetime.now(timezone.utc) - timedelta(hours=1)}, synchronize_session=False
+        )
+        session.commit()
+    old = _status(job.id).heartbeat_at
+    deadline = time.monotonic() + 30
+    while _status(job.id).heartbeat_at == old and time.monotonic() < deadline:
+        time.sleep(0.05)
+    assert _status(job.id).heartbeat_at != old
+    
+    # 다른 워커가 시작하며 복구해도 실행 중인 작업은 그대로
+    assert recover_jobs(RecordingBackend(), timedelta(minutes=30)) == (0, 0)
+    assert _status(job.id).status == JobStatus.RUNNING
+    
+    resume.set()
+    worker.join(timeout=30)
+    assert _status(job.id).status == JobStatus.SUCCEEDED
+
+
+def test_backend_must_implement_submit():
+    class Incomplete(JobBackend):
+        pass
+    
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_startup_recovers_jobs_after_db_comes_back(user, backend, tmp_path, monkeypatch):
+    pending = Job(user_id=user.id, kind="test_count", status=JobStatus.PENDING)
+    with shard_session(0) as db:
+        db.add(pending)
+        db.commit()
+        pending_id = pending.id
+    
+    for name, value in [("_pool_warmed", threading.Event()), ("_pool_warmup_error", []),
+                        ("_jobs_recovered", threading.Event()), ("_job_recovery_error", []),
+                        ("JOB_RECOVERY_RETRY_SECONDS", 0.05)]:
+        monkeypatch.setattr(readiness, name, value)
+    
+    # 시작할 때 DB 에 연결할 수 없음 -> 워커는 시작하고 /ready 는 503
+    working = shard_engines[0]
+    down = _create_engine(f"sqlite:///{tmp_path}/missing/down.db")
+    shard_engines[0] = down
+    try:
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            deadline = time.monotonic() + 30
+            while not readiness._job_recovery_error and time.monotonic() < deadline:
+                time.sleep(0.01)
+            response = client.get("/ready")
+            assert response.status_code == 503
+            assert response.json()["jobs"]["ready"] is False
+            assert response.json()["jobs"]["error"].startswith("OperationalError")
+            
+            # DB 가 돌아오면 다시 시도해 남은 작업을 제출
+            shard_engines[0] = working
+            assert readiness._jobs_recovered.wait(timeout=30)
+            assert client.get("/ready").json()["jobs"] == {"ready": True}
+            assert backend.submitted == [pending_id]
+    finally:
+        shard_engines[0] = working
+        for thread in threading.enumerate():
+            if thread.name in ("db-pool-warmup", "job-recovery"):
+                thread.join(timeout=30)
+        down.dispose()
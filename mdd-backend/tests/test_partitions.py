@@ -0,0 +1,112 @@
+"""transactions 범위 파티션 (PostgreSQL 전용)
+
+- 기간 조건이 있는 조회는 해당 기간의 파티션만 읽는지 (partition pruning)
+- 새 파티션을 만들 때 DEFAULT 파티션에 쌓인 행을 옮긴 뒤 ATTACH 하는지
+- 파티션 생성을 반복 실행해도 결과가 같은지
+"""
+import re
+from datetime import date
+import pytest
+from sqlalchemy import event, text
+from app.utils.partitions import DEFAULT_PARTITION, existing_partitions, ensure_transaction_partitions
+
+_TRANSACTIONS = re.compile(r"\b(FROM|JOIN)\s+transactions\b", re.IGNORECASE)
+_SCANNED = re.compile(r"\bon (transactions_\w+)")
+
+
+@pytest.fixture
+def partitioned(postgres_database):
+    """테스트가 만든 파티션은 끝난 뒤 삭제"""
+    database = postgres_database
+    with database.connect() as conn:
+        before = existing_partitions(conn)
+    yield database
+    with database.begin() as conn:
+        for name in existing_partitions(conn) - before:
+            conn.execute(text(f'DROP TABLE "{name}"'))
+
+
+def ensure(engine, since: date, ahead: int) -> list[str]:
+    with engine.begin() as conn:
+        return ensure_transaction_partitions(conn, "month", ahead, since=since, today=since)
+
+
+def create_transaction(client, headers, day: date) -> None:
+    response = client.post(
+        "/api/transactions",
+        json={"date": day.isoformat(), "type": "expense", "category": "food", "amount": "10"},
+        headers=headers
+    )
+    assert response.status_code == 201, response.text
+
+
+def count(engine, table: str) -> int:
+    with engine.connect() as conn:
+        return conn.execute(text(f'SELECT count(*) FROM "{table}"')).scalar()
+
+
+def scanned_partitions(engine, client, headers, url: str) -> set[str]:
+    """url 요청이 실행한 transactions 조회의 EXPLAIN 에 나오는 파티션"""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")) and _TRANSACTIONS.search(statement):
+            statements.append((statement, parameters))
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = client.get(url, headers=headers)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200, response.text
+    assert statements, f"{url}: transactions 조회가 없음"
+    
+    scanned = set()
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = [row[0] for row in conn.exec_driver_sql("EXPLAIN " + statement, parameters)]
+            scanned |= {match.group(1) for line in plan for match in _SCANNED.finditer(line)}
+    return scanned
+
+
+@pytest.mark.parametrize("url", [
+    "/api/transactions?start_date=2030-02-01&end_date=2030-02-28",
+    "/api/stats/daily?start_date=2030-02-01&end_date=2030-02-28",
+    "/api/stats/monthly?year=2030&month=2",
+    "/api/stats/category?start_date=2030-02-01&end_date=2030-02-28",
+    "/api/stats/mood?start_date=2030-02-01&end_date=2030-02-28",
+    "/api/stats/query?dimensions=category&start_date=2030-02-01&end_date=2030-02-28",
+])
+def test_date_range_query_prunes_partitions(partitioned, client, signup, url):
+    ensure(partitioned, date(2030, 1, 1), 2)
+    headers = signup()
+    for day in (date(2030, 1, 15), date(2030, 2, 15), date(2030, 3, 15), date(2030, 6, 15)):
+        create_transaction(client, headers, day)
+    
+    assert scanned_partitions(partitioned, client, headers, url) == {"transactions_p2030_02"}
+
+
+def test_new_partition_takes_rows_from_default(partitioned, client, signup):
+    headers = signup()
+    create_transaction(client, headers, date(2031, 6, 10))
+    create_transaction(client, headers, date(2031, 7, 10))
+    assert count(partitioned, DEFAULT_PARTITION) == 2
+    
+    # DEFAULT 에 같은 범위의 행이 있어도 생성되고, 그 행은 새 파티션으로 옮겨짐
+    assert ensure(partitioned, date(2031, 6, 1), 0) == ["transactions_p2031_06"]
+    assert count(partitioned, "transactions_p2031_06") == 1
+    assert count(partitioned, DEFAULT_PARTITION) == 1
+    
+    response = client.get("/api/transactions?start_date=2031-06-01&end_date=2031-07-31", headers=headers)
+    assert [t["date"] for t in response.json()] == ["2031-07-10", "2031-06-10"]
+
+
+def test_ensure_partitions_is_idempotent(partitioned):
+    assert ensure(partitioned, date(2032, 1, 1), 2) == [
+        "transactions_p2032_01", "transactions_p2032_02", "transactions_p2032_03"
+    ]
+    assert ensure(partitioned, date(2032, 1, 1), 2) == []
+    assert ensure(partitioned, date(2032, 2, 1), 2) == ["transactions_p2032_04"]
+    
+    with partitioned.connect() as conn:
+        assert {"transactions_p2032_01", "transactions_p2032_04", DEFAULT_PARTITION} <= existing_partitions(conn)
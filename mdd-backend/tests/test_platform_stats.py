@@ -0,0 +1,118 @@
+"""전체 사용자 집계 (파티션 결과를 합치면 전체 집계와 같음, 지문이 같은 파티션은 재사용)"""
+from datetime import date, datetime
+from decimal import Decimal
+from uuid import UUID
+import numpy as np
+import pytest
+from app.commands import platform_stats
+from app.commands.platform_stats import load_partition, partition_path, run_partition
+from app.models.user import User
+from app.schemas.entry import EntryCreate
+from app.schemas.transaction import TransactionCreate
+from app.services.entry_service import EntryService
+from app.services.finance_service import FinanceService
+from app.services.platform_stats_service import PlatformStatsService, merge, user_ranges
+
+START, END = date(2026, 1, 1), date(2026, 4, 1)
+
+
+def _user(db, index: int, created_at: datetime, offset: int = 0) -> User:
+    """UUID 공간의 index / 8 지점 근처 사용자 (파티션마다 고르게 나뉘도록)"""
+    user = User(
+        id=UUID(int=(index << 125) + offset), email=f"user{index}-{offset}@example.com", username=f"user{index}",
+        password_hash="x", created_at=created_at
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _expense(db, user: User, day: date, category: str, amount: str) -> None:
+    FinanceService.create_transaction(
+        db, TransactionCreate(date=day, type="expense", category=category, amount=Decimal(amount)), user
+    )
+
+
+def _entry(db, user: User, day: date) -> None:
+    EntryService.create_entry(db, EntryCreate(date=day, title="일기"), user)
+
+
+@pytest.fixture
+def users(db):
+    """8개 구간에 한 명씩, 가입 월 / 활동이 서로 다른 사용자"""
+    users = [_user(db, i, datetime(2025, 11 + i % 3, 1) if i % 3 < 2 else datetime(2026, 1, 15)) for i in range(8)]
+    for i, user in enumerate(users):
+        if i % 4 == 3:
+            continue  # 기간 중 활동 없음
+        _expense(db, user, date(2026, 1, 5), "식비", str(10 ** (i % 4)))
+        _expense(db, user, date(2026, 2 + i % 2, 10), "교통" if i % 2 else "식비", "2.5")
+        _expense(db, user, date(2025, 12, 31), "식비", "999")  # 기간 밖
+        for day in range(1, 1 + i % 3):
+            _entry(db, user, date(2026, 1 + i % 3, day))
+    return users
+
+
+def _assert_same(left: dict[str, np.ndarray], right: dict[str, np.ndarray]) -> None:
+    assert left.keys() == right.keys()
+    for name in left:
+        assert np.array_equal(left[name], right[name]), name
+
+
+@pytest.mark.parametrize("count", [2, 3, 8, 16])
+def test_partitions_merge_to_whole(db, users, count):
+    whole = PlatformStatsService.aggregate(db, user_ranges(1)[0], START, END)
+    parts = [PlatformStatsService.aggregate(db, user_range, START, END) for user_range in user_ranges(count)]
+    _assert_same(merge(parts), whole)
+    
+    # 파티션마다 나눠 합쳐도 사용자 수 / 금액이 실제와 같음
+    assert whole["total.users"].tolist() == [8] and whole["total.active_users"].tolist() == [6]
+    assert dict(zip(whole["category.category"], whole["category.amount"])) == {
+        "식비": (100 + 1000 + 10000) * 2 + 250 * 4, "교통": 250 * 2
+    }
+    assert dict(zip(whole["category.category"], whole["category.users"])) == {"식비": 6, "교통": 2}
+    assert whole["user_spend.users"].sum() == 6
+    assert dict(zip(whole["cohort.cohort"].astype(str), whole["cohort.users"])) == {
+        "2025-11-01": 3, "2025-12-01": 3, "2026-01-01": 2
+    }
+    assert whole["cohort_entries.entries"].sum() == 6
+
+
+def test_merge_is_associative(db, users):
+    parts = [PlatformStatsService.aggregate(db, user_range, START, END) for user_range in user_ranges(4)]
+    _assert_same(merge([merge(parts[:2]), merge(parts[2:])]), merge(parts))
+
+
+@pytest.fixture
+def partitions(db, users, tmp_path):
+    """파티션 2개를 집계하는 함수 -> [재사용 여부]"""
+    def run(force: bool = False) -> list[bool]:
+        return [run_partition(0, index, 2, START, END, str(tmp_path), force, 1)[0] for index in range(2)]
+    
+    return run
+
+
+def test_unchanged_partitions_are_reused(db, users, partitions, tmp_path, monkeypatch):
+    assert partitions() == [False, False]
+    saved = [load_partition(partition_path(tmp_path, 0, index, 2)) for index in range(2)]
+    assert partitions() == [True, True]
+    
+    # 저장된 결과를 합치면 전체 집계와 같음
+    _assert_same(
+        merge([columns for _, columns in saved]),
+        PlatformStatsService.aggregate(db, user_ranges(1)[0], START, END)
+    )
+    
+    # 두 번째 구간 사용자의 기록 -> 두 번째 파티션만 다시 집계
+    _expense(db, users[6], date(2026, 3, 1), "카페", "4")
+    assert partitions() == [True, False]
+    meta, columns = load_partition(partition_path(tmp_path, 0, 1, 2))
+    assert meta["fingerprint"] != saved[1][0]["fingerprint"]
+    assert "카페" in columns["category.category"]
+    
+    # 새 가입자 -> 해당 파티션의 지문이 바뀜
+    _user(db, 1, datetime(2026, 3, 1), offset=1)
+    assert partitions() == [False, True]
+    
+    assert partitions(force=True) == [False, False]
+    monkeypatch.setattr(platform_stats, "FORMAT_VERSION", platform_stats.FORMAT_VERSION + 1)
+    assert partitions() == [False, False]
@@ -0,0 +1,84 @@
+"""요청 프로파일링 (요청 시 / 느린 요청만 저장, 그 외 요청은 샘플링하지 않음)"""
+import time
+import pytest
+from app.config import get_settings
+from app.services.stats_service import StatsService
+from app.middleware import profiling as profiling_middleware
+from app.utils import profiling
+
+
+@pytest.fixture
+def profiles(database, tmp_path, monkeypatch):
+    """프로파일 저장 위치를 임시 디렉터리로, 끝나면 느린 요청 저장을 끔"""
+    monkeypatch.setattr(get_settings(), "PROFILE_DIR", str(tmp_path))
+    profiling.set_slow_request_ms(None)
+    yield tmp_path
+    profiling.set_slow_request_ms(None)
+
+
+@pytest.fixture
+def slow_stats(monkeypatch):
+    """/api/stats/daily 가 동기 스레드에서 0.2초 동안 CPU 를 쓰도록"""
+    get_daily_stats = StatsService.get_daily_stats
+    
+    def busy_daily_stats(*args):
+        deadline = time.perf_counter() + 0.2
+        while time.perf_counter() < deadline:
+            pass
+        return get_daily_stats(*args)
+    
+    monkeypatch.setattr(StatsService, "get_daily_stats", staticmethod(busy_daily_stats))
+
+
+def test_unprofiled_request_is_not_sampled(client, signup, profiles, admin_headers, monkeypatch):
+    headers = signup()
+    started = []
+    monkeypatch.setattr(profiling_middleware, "start_profile", lambda *args, **kwargs: started.append(args))
+    
+    # 운영용 토큰 없이 보낸 X-Profile 은 무시
+    response = client.get("/api/entries", headers={**headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    assert "x-profile-id" not in response.headers
+    assert started == [] and list(profiles.iterdir()) == []
+
+
+def test_on_demand_profile_samples_threadpool_code(client, signup, profiles, admin_headers, slow_stats):
+    headers = signup()
+    response = client.get("/api/stats/daily", headers={**headers, **admin_headers, "X-Profile": "1"})
+    assert response.status_code == 200
+    profile_id = response.headers["x-profile-id"]
+    
+    [metadata] = client.get("/api/admin/profiles", headers=admin_headers).json()
+    assert metadata["id"] == profile_id and metadata["reason"] == "on_demand"
+    assert metadata["path"] == "/api/stats/daily" and metadata["status"] == 200
+    assert metadata["samples"] > 0 and metadata["duration_ms"] >= 200
+    
+    # 동기 엔드포인트가 도는 스레드 풀 스레드의 스택도 샘플링됨
+    folded = client.get(f"/api/admin/profiles/{profile_id}", headers=admin_headers).text
+    assert "busy_daily_stats" in folded
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in folded.splitlines())
+
+
+def test_slow_request_threshold(client, signup, profiles, slow_stats):
+    headers = signup()
+    
+    profiling.set_slow_request_ms(10_000)
+    client.get("/api/stats/daily", headers=headers)
+    assert list(profiles.iterdir()) == []
+    
+    profiling.set_slow_request_ms(100)
+    client.get("/api/entries", headers=headers)  # 빠른 요청은 저장하지 않음
+    response = client.get("/api/stats/daily?start_date=2026-01-01", headers=headers)
+    assert "x-profile-id" not in response.headers
+    
+    [metadata] = profiling.list_profiles()
+    assert metadata["reason"] == "slow" and metadata["path"] == "/api/stats/daily"
+
+
+def test_old_profiles_are_pruned(client, profiles, admin_headers, monkeypatch):
+    monkeypatch.setattr(get_settings(), "PROFILE_MAX_FILES", 2)
+    for _ in range(3):
+        assert client.get("/health", headers={**admin_headers, "X-Profile": "1"}).headers["x-profile-id"]
+    assert len(profiling.list_profiles()) == 2
+    assert len(list(profiles.glob("*.folded"))) == 2
+    assert profiling.profile_path("../etc") is None
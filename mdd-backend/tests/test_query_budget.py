@@ -0,0 +1,77 @@
+"""요청별 SQL 수 (N+1 회귀 방지)
+
+거래 수가 늘어도 요청 하나의 SQL 수가 늘지 않는지 query_budget 픽스처로 확인한다.
+"""
+
+TRANSACTION_COUNT = 30
+
+
+def _transactions(count: int, categories: int = 3) -> list[dict]:
+    return [
+        {
+            "date": f"2026-10-{i % 28 + 1:02d}",
+            "type": "expense",
+            "category": f"category{i % categories}",
+            "amount": "1.50",
+            "payment_method": f"method{i % 2}"
+        }
+        for i in range(count)
+    ]
+
+
+def _create(client, headers, transactions: list[dict]) -> dict:
+    response = client.post(
+        "/api/entries/with-transactions",
+        json={"entry": {"date": "2026-10-01", "mood": "happy", "tags": ["a"]}, "transactions": transactions},
+        headers=headers
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def test_signup_and_login(client, query_budget):
+    with query_budget(3):
+        response = client.post(
+            "/api/auth/signup", json={"email": "budget@example.com", "username": "budget", "password": "password1"}
+        )
+    assert response.status_code == 201, response.text
+    
+    with query_budget(1):
+        response = client.post("/api/auth/login", json={"email": "budget@example.com", "password": "password1"})
+    assert response.status_code == 200, response.text
+
+
+def test_create_entry_with_transactions(client, signup, query_budget):
+    headers = signup()
+    # 카테고리 / 결제 수단 사전을 먼저 채움 (새 이름은 이름마다 생성 SQL 이 필요함)
+    _create(client, headers, _transactions(3))
+    
+    with query_budget(8):
+        created = _create(client, headers, _transactions(TRANSACTION_COUNT))
+    assert len(created["transactions"]) == TRANSACTION_COUNT
+
+
+def test_entry_detail(client, signup, query_budget):
+    headers = signup()
+    entry_id = _create(client, headers, _transactions(TRANSACTION_COUNT))["entry"]["id"]
+    
+    with query_budget(2):
+        response = client.get(f"/api/entries/{entry_id}", headers=headers)
+    assert response.status_code == 200, response.text
+    
+    with query_budget(3):
+        response = client.get(f"/api/entries/{entry_id}/full", headers=headers)
+    assert response.status_code == 200, response.text
+    assert len(response.json()["transactions"]) == TRANSACTION_COUNT
+
+
+def test_transaction_list(client, signup, query_budget):
+    headers = signup()
+    _create(client, headers, _transactions(TRANSACTION_COUNT, categories=TRANSACTION_COUNT))
+    
+    with query_budget(3):
+        response = client.get("/api/transactions", params={"limit": 100}, headers=headers)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert len(body) == TRANSACTION_COUNT
+    assert {t["category"] for t in body} == {f"category{i}" for i in range(TRANSACTION_COUNT)}
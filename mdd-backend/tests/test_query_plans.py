@@ -0,0 +1,127 @@
+"""실행 계획 회귀 테스트 (user_id 선두 복합 인덱스)
+
+데이터를 넣고 API 요청이 실행한 entries / transactions 조회를 같은 파라미터로 EXPLAIN 해서
+전체 스캔이 없는지, 목록 조회는 정렬까지 인덱스로 처리하는지 확인한다.
+
+- PostgreSQL: enable_seqscan / enable_sort 를 끄고 계획에 Seq Scan / Sort 가 남는지 확인 (인덱스로 처리할 수
+  있으면 planner 가 반드시 피하므로 데이터 양과 통계에 좌우되지 않음)
+- SQLite: EXPLAIN QUERY PLAN 의 SCAN(전체 스캔) / USE TEMP B-TREE FOR ORDER BY(정렬)
+"""
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+import pytest
+from sqlalchemy import event
+
+# entries / transactions (파티션 포함) 를 읽는 SQL 만 검사
+_TABLES = re.compile(r"\b(FROM|JOIN)\s+(entries|transactions)\b", re.IGNORECASE)
+
+_PG_SEQ_SCAN = re.compile(r"Seq Scan on (entries|transactions)")
+_PG_SORT = re.compile(r"(^|->\s+)(Incremental )?Sort\s+\(")
+_SQLITE_SCAN = re.compile(r"^SCAN (entries|transactions)")
+_SQLITE_SORT = re.compile(r"USE TEMP B-TREE FOR (RIGHT PART OF )?ORDER BY")
+
+DAYS = 90
+START = date(2026, 7, 1)
+
+
+@contextmanager
+def captured_selects(engine):
+    """블록 안에서 실행된 entries / transactions 조회 (SQL, 파라미터)"""
+    statements = []
+    
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")) and _TABLES.search(statement):
+            statements.append((statement, parameters))
+    
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def explain(engine, statement: str, parameters) -> list[str]:
+    """실행 계획 (줄 목록)"""
+    with engine.connect() as conn:
+        if engine.dialect.name == "postgresql":
+            with conn.begin():
+                conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+                conn.exec_driver_sql("SET LOCAL enable_sort = off")
+                return [row[0] for row in conn.exec_driver_sql("EXPLAIN " + statement, parameters)]
+        return [row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)]
+
+
+def plan_problems(engine, plan: list[str], ordered: bool) -> list[str]:
+    """전체 스캔 (ordered 면 정렬도) 이 있는 줄"""
+    if engine.dialect.name == "postgresql":
+        patterns = [_PG_SEQ_SCAN] + ([_PG_SORT] if ordered else [])
+    else:
+        patterns = [_SQLITE_SCAN] + ([_SQLITE_SORT] if ordered else [])
+    return [line for line in plan if any(p.search(line.strip()) for p in patterns)]
+
+
+@pytest.fixture
+def seeded(client, signup):
+    """두 사용자의 일기 (10일마다) 와 거래 (하루 한 건, DAYS 일) -> (인증 헤더, 일기 id)"""
+    users = [signup(), signup()]
+    for headers in users:
+        for i in range(0, DAYS, 10):
+            days = [START + timedelta(days=i + j) for j in range(10)]
+            response = client.post(
+                "/api/entries/with-transactions",
+                json={
+                    "entry": {"date": days[0].isoformat(), "mood": ["happy", "sad"][i % 20 // 10], "tags": ["t"]},
+                    "transactions": [
+                        {
+                            "date": day.isoformat(),
+                            "type": ["expense", "income"][day.day % 5 == 0],
+                            "category": f"category{day.day % 4}",
+                            "amount": "12.50",
+                            "payment_method": "card"
+                        }
+                        for day in days
+                    ]
+                },
+                headers=headers
+            )
+            assert response.status_code == 201, response.text
+    headers = users[0]
+    entry_id = client.get("/api/entries", headers=headers).json()["entries"][0]["id"]
+    return headers, entry_id
+
+
+# (URL, 정렬도 인덱스로 처리해야 하는지) - 집계 결과 정렬은 허용
+CASES = [
+    ("/api/entries", True),
+    ("/api/entries?start_date=2026-08-01&end_date=2026-08-31", True),
+    ("/api/entries/{entry_id}", True),
+    ("/api/entries/{entry_id}/full", True),
+    ("/api/transactions", True),
+    ("/api/transactions?start_date=2026-08-01&end_date=2026-08-31", True),
+    ("/api/transactions?category=category1", True),
+    ("/api/transactions?transaction_type=expense&start_date=2026-08-01", False),
+    ("/api/stats/daily?start_date=2026-08-01&end_date=2026-08-31", False),
+    ("/api/stats/monthly?year=2026", False),
+    ("/api/stats/category?start_date=2026-08-01&end_date=2026-08-31", False),
+    ("/api/stats/mood?start_date=2026-08-01&end_date=2026-08-31", False),
+    ("/api/stats/balance?start_date=2026-07-01&end_date=2026-09-30", False),
+    ("/api/stats/query?dimensions=month&dimensions=category&start_date=2026-08-01", False),
+    ("/api/calendar/2026", False),
+]
+
+
+@pytest.mark.parametrize("url, ordered", CASES)
+def test_query_plan_uses_user_indexes(client, database, seeded, url, ordered):
+    headers, entry_id = seeded
+    url = url.format(entry_id=entry_id)
+    
+    with captured_selects(database) as statements:
+        response = client.get(url, headers=headers)
+    assert response.status_code == 200, response.text
+    assert statements, f"{url}: entries / transactions 조회가 없음"
+    
+    for statement, parameters in statements:
+        plan = explain(database, statement, parameters)
+        problems = plan_problems(database, plan, ordered)
+        assert not problems, f"{url}\n{statement}\n\n" + "\n".join(plan)
@@ -0,0 +1,99 @@
+"""/ready (스키마 버전, 커넥션 풀 예열, 작업 복구)"""
+import threading
+import pytest
+from sqlalchemy import text
+from app.database import _create_engine
+from app.utils import readiness
+from app.utils.readiness import known_revisions
+
+
+@pytest.fixture
+def warmed(client):
+    """시작 이벤트의 백그라운드 풀 예열이 끝날 때까지 대기
+    
+    이전 테스트에서 이미 set 된 이벤트가 아니라 예열 스레드 자체를 기다린다
+    (늦게 끝난 스레드가 테스트에서 바꿔 둔 이벤트를 set 하지 않도록).
+    """
+    for thread in threading.enumerate():
+        if thread.name == "db-pool-warmup":
+            thread.join(timeout=30)
+    assert readiness._pool_warmed.wait(timeout=30)
+    return client
+
+
+@pytest.fixture
+def schema_db(tmp_path):
+    """alembic_version 만 있는 SQLite DB 를 만드는 함수 -> 엔진 (None 이면 테이블도 없음)"""
+    engines = []
+    
+    def make(*revisions):
+        engine = _create_engine(f"sqlite:///{tmp_path}/schema{len(engines)}.db")
+        engines.append(engine)
+        if revisions != (None,):
+            with engine.begin() as conn:
+                conn.execute(text("CREATE TABLE alembic_version (version_num VARCHAR(32) PRIMARY KEY)"))
+                for revision in revisions:
+                    conn.execute(text("INSERT INTO alembic_version VALUES (:revision)"), {"revision": revision})
+        return engine
+    
+    yield make
+    for engine in engines:
+        engine.dispose()
+
+
+def _older_revision() -> str:
+    heads, revisions = known_revisions()
+    return sorted(revisions - heads)[-1]
+
+
+def test_ready_when_schema_is_current(warmed):
+    response = warmed.get("/ready")
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "ready"
+    assert body["schema"]["state"] == "current"
+    assert body["schema"]["current"] == sorted(known_revisions()[0])
+    assert body["pool"]["ready"] is True
+    assert body["jobs"]["ready"] is True
+
+
+@pytest.mark.parametrize("revisions, state, status_code", [
+    ((None,), "missing", 503),  # alembic_version 테이블 없음
+    ((), "missing", 503),  # 테이블은 있지만 비어 있음
+    (("behind",), "behind", 503),
+    (("9999_from_newer_release",), "ahead", 200),
+])
+def test_ready_depends_on_schema_revision(warmed, schema_db, monkeypatch, revisions, state, status_code):
+    revisions = tuple(_older_revision() if revision == "behind" else revision for revision in revisions)
+    monkeypatch.setattr(readiness, "shard_engines", [schema_db(*revisions)])
+    
+    response = warmed.get("/ready")
+    assert response.status_code == status_code, response.text
+    assert response.json()["schema"]["state"] == state
+    assert response.json()["status"] == ("ready" if status_code == 200 else "not_ready")
+
+
+def test_sharded_ready_requires_every_shard(warmed, schema_db, monkeypatch):
+    heads = known_revisions()[0]
+    monkeypatch.setattr(readiness, "shard_engines", [schema_db(*heads), schema_db(_older_revision())])
+    monkeypatch.setattr(readiness, "is_sharded", lambda: True)
+    
+    response = warmed.get("/ready")
+    assert response.status_code == 503
+    assert [shard["state"] for shard in response.json()["schema"]["shards"]] == ["current", "behind"]
+
+
+def test_not_ready_until_pool_is_warmed(warmed, monkeypatch):
+    monkeypatch.setattr(readiness, "_pool_warmed", type(readiness._pool_warmed)())
+    response = warmed.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["pool"]["ready"] is False
+    assert response.json()["schema"]["ready"] is True
+    
+    readiness._pool_warmed.set()
+    assert warmed.get("/ready").status_code == 200
+    
+    monkeypatch.setattr(readiness, "_pool_warmup_error", ["OperationalError: 연결 실패"])
+    response = warmed.get("/ready")
+    assert response.status_code == 503
+    assert response.json()["pool"]["error"] == "OperationalError: 연결 실패"
@@ -0,0 +1,143 @@
+"""반복 거래 (월말 발생일, 밀린 기간 따라잡기, 재실행 시 중복 없음, 멈췄다가 재개, 잠긴 규칙 건너뛰기)"""
+from datetime import date
+from decimal import Decimal
+import pytest
+from app.database import shard_session
+from app.models.recurring_rule import RecurringRule
+from app.models.transaction import Transaction
+from app.models.user import User
+from app.schemas.recurring import RecurringRuleCreate, RecurringRuleUpdate
+from app.services import recurring_service
+from app.services.recurring_service import RecurringService
+from app.utils.recurrence import due_occurrences, occurrence_date
+
+# 생성 시점(오늘) 에는 아직 도래하지 않은 시작일
+START = date(2030, 1, 31)
+
+
+@pytest.mark.parametrize("start, frequency, expected", [
+    (date(2030, 1, 31), "monthly", [date(2030, 1, 31), date(2030, 2, 28), date(2030, 3, 31), date(2030, 4, 30)]),
+    (date(2028, 1, 31), "monthly", [date(2028, 1, 31), date(2028, 2, 29), date(2028, 3, 31), date(2028, 4, 30)]),
+    (date(2028, 2, 29), "yearly", [date(2028, 2, 29), date(2029, 2, 28), date(2030, 2, 28), date(2031, 2, 28)]),
+])
+def test_month_end_occurrences_do_not_drift(start, frequency, expected):
+    assert [occurrence_date(start, frequency, 1, index) for index in range(4)] == expected
+
+
+def test_due_occurrences_respects_end_date_and_limit():
+    assert due_occurrences(START, "monthly", 1, 1, date(2030, 12, 31), end_date=date(2030, 4, 29)) == [
+        (1, date(2030, 2, 28)), (2, date(2030, 3, 31))
+    ]
+    assert len(due_occurrences(START, "daily", 1, 0, date(2031, 12, 31), limit=10)) == 10
+
+
+def _user(db) -> User:
+    user = User(email="recurring@example.com", username="recurring", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _rule(db, user: User, **fields) -> RecurringRule:
+    data = {"type": "expense", "category": "월세", "amount": Decimal("500"), "frequency": "monthly", "start_date": START}
+    return RecurringService.create_rule(db, RecurringRuleCreate(**{**data, **fields}), user)
+
+
+def _dates(db, rule: RecurringRule) -> list[date]:
+    return [
+        day for (day,) in
+        db.query(Transaction.date).filter(Transaction.recurring_rule_id == rule.id).order_by(Transaction.date)
+    ]
+
+
+def test_catch_up_creates_each_missed_occurrence_once(db, monkeypatch):
+    user = _user(db)
+    rule = _rule(db, user)
+    assert _dates(db, rule) == []
+    
+    # 배치마다 규칙당 2건씩만 만들어도 반복해서 끝까지 따라잡음
+    monkeypatch.setattr(recurring_service, "MAX_OCCURRENCES_PER_RULE", 2)
+    assert RecurringService.materialize(db, today=date(2030, 6, 30), batch_size=1) == 6
+    assert _dates(db, rule) == [
+        date(2030, 1, 31), date(2030, 2, 28), date(2030, 3, 31),
+        date(2030, 4, 30), date(2030, 5, 31), date(2030, 6, 30)
+    ]
+    db.refresh(rule)
+    assert (rule.next_index, rule.next_date) == (6, date(2030, 7, 31))
+    
+    assert RecurringService.materialize(db, today=date(2030, 6, 30)) == 0
+    assert RecurringService.materialize(db, today=date(2030, 8, 31)) == 2
+    assert len(_dates(db, rule)) == 8
+
+
+def test_rerun_after_lost_progress_is_idempotent(db):
+    """거래는 저장됐지만 next_index 가 옮겨지지 않은 상황에서 다시 실행해도 중복 없음"""
+    user = _user(db)
+    rule = _rule(db, user)
+    assert RecurringService.materialize(db, today=date(2030, 4, 30)) == 4
+    
+    rule.next_index, rule.next_date = 1, date(2030, 2, 28)
+    db.commit()
+    assert RecurringService.materialize(db, today=date(2030, 5, 31)) == 1
+    assert _dates(db, rule) == [
+        date(2030, 1, 31), date(2030, 2, 28), date(2030, 3, 31), date(2030, 4, 30), date(2030, 5, 31)
+    ]
+    db.refresh(rule)
+    assert (rule.next_index, rule.next_date) == (5, date(2030, 6, 30))
+
+
+def test_rule_stops_at_end_date(db):
+    user = _user(db)
+    rule = _rule(db, user, end_date=date(2030, 3, 15))
+    
+    assert RecurringService.materialize(db, today=date(2030, 12, 31)) == 2
+    db.refresh(rule)
+    assert rule.next_date is None
+    assert RecurringService.materialize(db, today=date(2031, 12, 31)) == 0
+
+
+def _set_active(db, user: User, rule: RecurringRule, active: bool, today: date) -> RecurringRule:
+    return RecurringService.update_rule(db, rule.id, RecurringRuleUpdate(active=active), user, today=today)
+
+
+def test_resumed_rule_skips_occurrences_while_paused(db):
+    user = _user(db)
+    rule = _rule(db, user)
+    assert RecurringService.materialize(db, today=date(2030, 2, 28)) == 2
+    
+    rule = _set_active(db, user, rule, False, date(2030, 3, 1))
+    assert RecurringService.materialize(db, today=date(2030, 6, 20)) == 0
+    
+    # 멈춘 동안(3~5월)의 발생분은 만들지 않고 재개일 이후 첫 발생(6월)부터
+    rule = _set_active(db, user, rule, True, date(2030, 6, 20))
+    assert (rule.next_index, rule.next_date) == (5, date(2030, 6, 30))
+    assert _dates(db, rule) == [date(2030, 1, 31), date(2030, 2, 28)]
+    
+    assert RecurringService.materialize(db, today=date(2030, 7, 31)) == 2
+    assert _dates(db, rule) == [date(2030, 1, 31), date(2030, 2, 28), date(2030, 6, 30), date(2030, 7, 31)]
+
+
+def test_resumed_on_occurrence_day_creates_it(db):
+    user = _user(db)
+    rule = _set_active(db, user, _rule(db, user), False, date(2030, 1, 1))
+    
+    rule = _set_active(db, user, rule, True, date(2030, 4, 30))
+    assert _dates(db, rule) == [date(2030, 4, 30)]
+    assert (rule.next_index, rule.next_date) == (4, date(2030, 5, 31))
+    
+    # 이미 켜진 규칙에 active=True 를 다시 보내도 밀린 발생분은 그대로 따라잡음
+    rule = _set_active(db, user, rule, True, date(2030, 6, 30))
+    assert _dates(db, rule)[-2:] == [date(2030, 5, 31), date(2030, 6, 30)]
+
+
+def test_locked_rule_is_skipped(db, postgres_database):
+    """다른 실행기가 잠근 규칙은 기다리지 않고 건너뜀 (SKIP LOCKED)"""
+    user = _user(db)
+    rule = _rule(db, user)
+    
+    with shard_session(0) as other:
+        other.query(RecurringRule.id).filter(RecurringRule.id == rule.id).with_for_update().one()
+        assert RecurringService.materialize(db, today=date(2030, 3, 31)) == 0
+        other.rollback()
+    
+    assert RecurringService.materialize(db, today=date(2030, 3, 31)) == 3
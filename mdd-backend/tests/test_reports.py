@@ -0,0 +1,75 @@
+"""리포트 스냅샷 (마감 기간 저장, 소급 기록 시 무효화)"""
+import threading
+import time
+from datetime import date
+from decimal import Decimal
+from app.database import shard_session
+from app.models.report import ReportSnapshot
+from app.models.user import User
+from app.schemas.report import ReportPeriod
+from app.schemas.transaction import TransactionCreate
+from app.services.finance_service import FinanceService
+from app.services.report_service import ReportService
+
+# 이미 마감된 달
+START = date(2020, 1, 1)
+
+
+def _expense(day: date, amount: str) -> TransactionCreate:
+    return TransactionCreate(date=day, type="expense", category="food", amount=Decimal(amount))
+
+
+def _user(db) -> User:
+    user = User(email="report@example.com", username="report", password_hash="x")
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_snapshot_is_reused_and_invalidated(db):
+    user = _user(db)
+    FinanceService.create_transaction(db, _expense(date(2020, 1, 10), "10"), user)
+    
+    first = ReportService.get_report(db, user, ReportPeriod.MONTH, START)
+    assert first.snapshot and first.total_expense == Decimal("10")
+    assert ReportService.get_report(db, user, ReportPeriod.MONTH, START).generated_at == first.generated_at
+    
+    # 소급 기록 -> 월 / 연 스냅샷 삭제 -> 다시 계산
+    FinanceService.create_transaction(db, _expense(date(2020, 1, 20), "5"), user)
+    assert db.query(ReportSnapshot).filter(ReportSnapshot.user_id == user.id).count() == 0
+    assert ReportService.get_report(db, user, ReportPeriod.MONTH, START).total_expense == Decimal("15")
+
+
+def test_backdated_write_during_snapshot_compute(db, monkeypatch):
+    """계산과 저장 사이에 커밋된 소급 기록이 오래된 스냅샷을 남기지 않음"""
+    user = _user(db)
+    FinanceService.create_transaction(db, _expense(date(2020, 1, 10), "10"), user)
+    user_id = user.id
+    compute = ReportService.compute
+    writer_errors = []
+    
+    def write_backdated():
+        with shard_session(0) as writer_db:
+            try:
+                writer = writer_db.get(User, user_id)
+                FinanceService.create_transaction(writer_db, _expense(date(2020, 1, 20), "5"), writer)
+            except Exception as e:  # 스레드 예외는 테스트 스레드에서 확인
+                writer_errors.append(e)
+    
+    writer = threading.Thread(target=write_backdated)
+    
+    def compute_then_write(*args):
+        data = compute(*args)
+        # 계산이 끝난 뒤(저장 전) 다른 세션이 소급 기록을 씀. 잠금이 없으면 여기서 커밋까지 끝남
+        writer.start()
+        time.sleep(0.5)
+        return data
+    
+    monkeypatch.setattr(ReportService, "compute", staticmethod(compute_then_write))
+    ReportService.get_report(db, user, ReportPeriod.MONTH, START)
+    writer.join(timeout=30)
+    assert not writer.is_alive() and not writer_errors
+    monkeypatch.setattr(ReportService, "compute", staticmethod(compute))
+    
+    db.expire_all()
+    assert ReportService.get_report(db, user, ReportPeriod.MONTH, START).total_expense == Decimal("15")
@@ -0,0 +1,237 @@
+"""사용자 샤딩 (샤드 배치, 샤드에 걸친 이메일 중복, 사용자 이동 후 로그인 / 데이터, 이동 실패 시 되돌리기)
+
+shards 픽스처의 SQLite 파일 3개에서만 실행한다.
+"""
+from decimal import Decimal
+from uuid import UUID
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+from app.config import get_settings
+from app.database import shard_engines, shard_session
+from app.main import app
+from app.models.user import User
+from app.models.user_directory import UserDirectory
+from app.services import shard_service
+from app.services.shard_service import ShardService, _user_tables
+
+
+@pytest.fixture
+def client(shards):
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def place(monkeypatch):
+    """다음 회원가입을 배치할 샤드를 고정하는 함수"""
+    def _place(*shards: int) -> None:
+        monkeypatch.setattr(get_settings(), "SHARD_NEW_USER_SHARDS", list(shards))
+    
+    return _place
+
+
+def _signup(client, email: str) -> tuple[UUID, dict[str, str]]:
+    response = client.post(
+        "/api/auth/signup", json={"email": email, "username": email.split("@")[0], "password": "password1"}
+    )
+    assert response.status_code == 201, response.text
+    body = response.json()
+    return UUID(body["user"]["id"]), {"Authorization": f"Bearer {body['access_token']}"}
+
+
+def _directory() -> dict[UUID, int]:
+    with shard_session(0) as directory:
+        return dict(directory.query(UserDirectory.user_id, UserDirectory.shard).all())
+
+
+def _row_counts(shard: int, user_id: UUID) -> dict[str, int]:
+    """샤드에 있는 사용자의 테이블별 행 수 (0 인 테이블 제외)"""
+    users = User.__table__
+    with shard_engines[shard].connect() as conn:
+        counts = {users.name: conn.scalar(select(func.count()).where(users.c.id == user_id))}
+        for table in _user_tables():
+            counts[table.name] = conn.scalar(select(func.count()).select_from(table).where(table.c.user_id == user_id))
+    return {name: count for name, count in counts.items() if count}
+
+
+def _fill(client, headers) -> None:
+    """정수 id 를 쓰는 테이블(카테고리 / 결제 수단 / 예산 / 리포트 스냅샷)까지 채움"""
+    entry = client.post("/api/entries", json={"date": "2020-01-10", "title": "이사", "mood": "happy"}, headers=headers)
+    assert entry.status_code == 201, entry.text
+    for category, payment_method, amount in [("식비", "card", "12.5"), ("교통", "cash", "3"), ("식비", None, "7")]:
+        response = client.post("/api/transactions", json={
+            "date": "2020-01-10", "type": "expense", "category": category, "amount": amount,
+            "payment_method": payment_method, "entry_id": entry.json()["id"],
+        }, headers=headers)
+        assert response.status_code == 201, response.text
+    for category in ("식비", "교통"):
+        response = client.post("/api/budgets", json={"category": category, "amount": "100"}, headers=headers)
+        assert response.status_code == 201, response.text
+    response = client.post("/api/recurring", json={
+        "type": "expense", "category": "월세", "amount": "500", "frequency": "monthly",
+        "start_date": "2030-01-31", "payment_method": "transfer",
+    }, headers=headers)
+    assert response.status_code == 201, response.text
+    assert client.get("/api/reports/monthly/2020/1", headers=headers).json()["snapshot"]
+
+
+def _snapshot(client, headers) -> dict:
+    """사용자 데이터를 API 로 읽은 결과 (예산 id 는 이동하면 바뀌므로 제외)"""
+    budgets = client.get("/api/budgets?year=2020&month=1", headers=headers).json()
+    for budget in budgets["budgets"]:
+        budget.pop("id")
+    return {
+        "me": client.get("/api/auth/me", headers=headers).json(),
+        "entries": client.get("/api/entries", headers=headers).json(),
+        "transactions": client.get("/api/transactions", headers=headers).json(),
+        "recurring": client.get("/api/recurring", headers=headers).json(),
+        "budgets": budgets,
+        "report": client.get("/api/reports/monthly/2020/1", headers=headers).json(),
+    }
+
+
+def test_signup_places_users_by_directory(client, place):
+    users = [_signup(client, f"user{i}@example.com")[0] for i in range(9)]
+    directory = _directory()
+    for user_id in users:
+        shard = directory[user_id]
+        assert shard == ShardService.placement(user_id)
+        assert [s for s in range(3) if _row_counts(s, user_id)] == [shard]
+    
+    # SHARD_NEW_USER_SHARDS 로 배치할 샤드를 제한
+    for shard in range(3):
+        place(shard)
+        user_id, headers = _signup(client, f"placed{shard}@example.com")
+        assert _directory()[user_id] == shard and _row_counts(shard, user_id) == {"users": 1}
+        assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+
+def test_duplicate_email_on_another_shard_is_rejected(client, place):
+    place(1)
+    _signup(client, "dup@example.com")
+    
+    place(2)
+    response = client.post(
+        "/api/auth/signup", json={"email": "dup@example.com", "username": "dup", "password": "password1"}
+    )
+    assert response.status_code == 400
+    assert list(_directory().values()) == [1]
+    with shard_engines[2].connect() as conn:
+        assert conn.scalar(select(func.count()).select_from(User.__table__)) == 0
+
+
+@pytest.mark.parametrize("source, target", [(1, 2), (0, 2), (2, 0)])
+def test_moved_user_keeps_data_and_can_log_in(client, place, source, target):
+    place(source)
+    user_id, headers = _signup(client, "mover@example.com")
+    _fill(client, headers)
+    before = _snapshot(client, headers)
+    counts = _row_counts(source, user_id)
+    
+    moved = ShardService.move_user(user_id, target)
+    assert {name: count for name, count in moved.items() if count} == counts
+    assert _row_counts(target, user_id) == counts
+    assert _row_counts(source, user_id) == {}
+    assert _directory()[user_id] == target
+    
+    # 이동 전에 받은 토큰 / 다른 프로세스에 남은 오래된 샤드 캐시 / 새 로그인 모두 새 샤드를 봄
+    assert _snapshot(client, headers) == before
+    shard_service._shard_cache.set(user_id, source)
+    assert _snapshot(client, headers) == before
+    response = client.post("/api/auth/login", json={"email": "mover@example.com", "password": "password1"})
+    assert response.status_code == 200, response.text
+    assert _snapshot(client, {"Authorization": f"Bearer {response.json()['access_token']}"}) == before
+    
+    # 옮긴 뒤에도 기록이 새 샤드의 카테고리 / 예산 카운터에 반영됨
+    response = client.post("/api/transactions", json={
+        "date": "2020-01-11", "type": "expense", "category": "식비", "amount": "1"
+    }, headers=headers)
+    assert response.status_code == 201, response.text
+    budgets = client.get("/api/budgets?year=2020&month=1", headers=headers).json()["budgets"]
+    assert {budget["category"]: Decimal(str(budget["spent"])) for budget in budgets}["식비"] == Decimal("20.5")
+
+
+@pytest.mark.parametrize("source", [0, 1])
+def test_failed_move_is_rolled_back(client, place, monkeypatch, source):
+    place(source)
+    user_id, headers = _signup(client, "mover@example.com")
+    _fill(client, headers)
+    before = _snapshot(client, headers)
+    counts = _row_counts(source, user_id)
+    
+    # 복사와 디렉터리 변경 후 원본 삭제에서 실패
+    delete_user_rows = shard_service._delete_user_rows
+    calls = []
+    
+    def fail_first_delete(conn, user_id):
+        calls.append(conn)
+        if len(calls) == 1:
+            raise RuntimeError("원본 삭제 실패")
+        delete_user_rows(conn, user_id)
+    
+    monkeypatch.setattr(shard_service, "_delete_user_rows", fail_first_delete)
+    with pytest.raises(RuntimeError):
+        ShardService.move_user(user_id, 2)
+    monkeypatch.setattr(shard_service, "_delete_user_rows", delete_user_rows)
+    
+    assert _directory()[user_id] == source
+    assert _row_counts(source, user_id) == counts
+    assert _row_counts(2, user_id) == {}
+    ShardService.forget(user_id)
+    assert _snapshot(client, headers) == before
+    
+    # 되돌린 뒤 다시 옮기면 성공
+    ShardService.move_user(user_id, 2)
+    assert _row_counts(2, user_id) == counts
+    assert _snapshot(client, headers) == before
+
+
+def test_failed_copy_leaves_source_untouched(client, place):
+    place(1)
+    user_id, headers = _signup(client, "mover@example.com")
+    _fill(client, headers)
+    counts = _row_counts(1, user_id)
+    
+    # 대상 샤드에 같은 이메일의 사용자가 있어 복사 중 unique 제약 위반
+    with shard_session(2) as db:
+        db.add(User(email="mover@example.com", username="stale", password_hash="x"))
+        db.commit()
+    
+    with pytest.raises(Exception):
+        ShardService.move_user(user_id, 2)
+    assert _directory()[user_id] == 1
+    assert _row_counts(1, user_id) == counts
+    assert _row_counts(2, user_id) == {}
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
+
+
+def test_move_and_back_does_not_reuse_cached_ids(client, place):
+    place(1)
+    user_id, headers = _signup(client, "mover@example.com")
+    _fill(client, headers)
+    ShardService.move_user(user_id, 2)
+    
+    # 옮긴 사이 원래 샤드의 다른 사용자가 같은 정수 id 를 받음
+    _, other_headers = _signup(client, "other@example.com")
+    for category in ("카페", "교통", "쇼핑"):
+        response = client.post("/api/transactions", json={
+            "date": "2020-01-12", "type": "expense", "category": category, "amount": "2", "payment_method": "cash"
+        }, headers=other_headers)
+        assert response.status_code == 201, response.text
+    other_before = _snapshot(client, other_headers)
+    
+    ShardService.move_user(user_id, 1)
+    before = _snapshot(client, headers)
+    
+    # 이전에 캐시된 (샤드 1, 사용자, 이름) id 가 아니라 돌아온 뒤의 id 로 기록
+    response = client.post("/api/transactions", json={
+        "date": "2020-01-11", "type": "expense", "category": "식비", "amount": "1", "payment_method": "card"
+    }, headers=headers)
+    assert response.status_code == 201, response.text
+    assert (response.json()["category"], response.json()["payment_method"]) == ("식비", "card")
+    transactions = client.get("/api/transactions", headers=headers).json()
+    assert len(transactions) == len(before["transactions"]) + 1
+    budgets = client.get("/api/budgets?year=2020&month=1", headers=headers).json()["budgets"]
+    assert {budget["category"]: Decimal(str(budget["spent"])) for budget in budgets}["식비"] == Decimal("20.5")
+    assert _snapshot(client, other_headers) == other_before
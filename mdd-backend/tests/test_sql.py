@@ -0,0 +1,68 @@
+"""app.utils.sql 방언별 식 (SQLite / PostgreSQL)"""
+from datetime import date
+import pytest
+from sqlalchemy import Date, literal, select, true
+from app.models.entry import Entry
+from app.models.user import User
+from app.utils.sql import date_bucket, json_array_values
+
+
+@pytest.mark.parametrize("unit, value, expected", [
+    ("week", date(2026, 10, 19), date(2026, 10, 19)),  # 월요일
+    ("week", date(2026, 10, 18), date(2026, 10, 12)),  # 일요일은 앞 주
+    ("week", date(2026, 1, 1), date(2025, 12, 29)),
+    ("month", date(2026, 10, 31), date(2026, 10, 1)),
+    ("month", date(2026, 10, 1), date(2026, 10, 1)),
+    ("year", date(2026, 12, 31), date(2026, 1, 1)),
+])
+def test_date_bucket(db, unit, value, expected):
+    assert db.execute(select(date_bucket(unit, literal(value, Date)))).scalar() == expected
+
+
+def test_date_bucket_unknown_unit():
+    with pytest.raises(ValueError):
+        date_bucket("day", Entry.date)
+
+
+def test_json_array_values(db):
+    user = User(email="sql@example.com", username="sql", password_hash="x")
+    db.add(user)
+    db.flush()
+    db.add_all([
+        Entry(user_id=user.id, date=date(2026, 10, 1), tags=["a", "b"]),
+        Entry(user_id=user.id, date=date(2026, 10, 2), tags=["b"]),
+        Entry(user_id=user.id, date=date(2026, 10, 3), tags=[]),
+    ])
+    db.commit()
+    
+    tags = json_array_values(Entry.tags).table_valued("value").alias("entry_tags")
+    rows = db.execute(
+        select(tags.c.value, Entry.date).select_from(Entry).join(tags, true())
+        .order_by(Entry.date, tags.c.value)
+    ).all()
+    assert [tuple(row) for row in rows] == [("a", date(2026, 10, 1)), ("b", date(2026, 10, 1)), ("b", date(2026, 10, 2))]
+
+
+def test_analytics_week_and_tag(client, signup):
+    headers = signup()
+    entry = client.post(
+        "/api/entries", json={"date": "2026-10-18", "mood": "happy", "tags": ["food", "weekend"]}, headers=headers
+    ).json()
+    for day, amount in (("2026-10-18", "10"), ("2026-10-19", "5")):
+        response = client.post(
+            "/api/transactions",
+            json={"date": day, "type": "expense", "category": "meal", "amount": amount, "entry_id": entry["id"]},
+            headers=headers
+        )
+        assert response.status_code == 201, response.text
+    
+    response = client.get(
+        "/api/stats/query", params={"dimensions": ["week", "tag"], "measures": ["count"]}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()["rows"] == [
+        {"week": "2026-10-12", "tag": "food", "count": 1},
+        {"week": "2026-10-12", "tag": "weekend", "count": 1},
+        {"week": "2026-10-19", "tag": "food", "count": 1},
+        {"week": "2026-10-19", "tag": "weekend", "count": 1},
+    ]
@@ -0,0 +1,224 @@
+"""통계 API (기분별 지출, 누적 잔액, 데이터 버전 캐시 / ETag)"""
+import random
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import accumulate
+import pytest
+from app.utils.query_monitor import collect_queries
+
+
+def _entry(client, headers, day: str, mood=None) -> str:
+    response = client.post("/api/entries", json={"date": day, "title": "일기", "mood": mood}, headers=headers)
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _transaction(client, headers, day: str, category: str, amount: str, entry_id=None, kind="expense") -> None:
+    response = client.post("/api/transactions", json={
+        "date": day, "type": kind, "category": category, "amount": amount, "entry_id": entry_id
+    }, headers=headers)
+    assert response.status_code == 201, response.text
+
+
+@pytest.fixture
+def moods(client, signup):
+    """2026년 3월 기분별 일기 / 지출"""
+    headers = signup()
+    happy = _entry(client, headers, "2026-03-01", "happy")
+    _transaction(client, headers, "2026-03-01", "식비", "10.00", happy)
+    _transaction(client, headers, "2026-03-01", "교통", "2.50", happy)
+    _transaction(client, headers, "2026-03-01", "월급", "100", happy, kind="income")  # 수입은 제외
+    happy = _entry(client, headers, "2026-03-02", "happy")
+    _transaction(client, headers, "2026-03-02", "식비", "5.00", happy)
+    happy = _entry(client, headers, "2026-03-02", "happy")  # 같은 날 두 번째 일기
+    _transaction(client, headers, "2026-03-02", "카페", "1.25", happy)
+    
+    _entry(client, headers, "2026-03-03", "sad")  # 지출 없음
+    tired = _entry(client, headers, "2026-03-04", "tired")
+    _transaction(client, headers, "2026-04-02", "식비", "7", tired)  # 기간 밖 거래
+    
+    plain = _entry(client, headers, "2026-03-05")  # 기분 없음
+    _transaction(client, headers, "2026-03-05", "식비", "3", plain)
+    _transaction(client, headers, "2026-03-06", "식비", "4")  # 일기와 연결되지 않은 거래
+    outside = _entry(client, headers, "2026-02-28", "happy")  # 기간 밖 일기
+    _transaction(client, headers, "2026-03-01", "식비", "8", outside)
+    return headers
+
+
+def _mood_stats(client, headers, **params) -> dict[str, dict]:
+    response = client.get(
+        "/api/stats/mood", params={"start_date": "2026-03-01", "end_date": "2026-03-31", **params}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    return {row["mood"]: row for row in response.json()}
+
+
+def test_mood_without_expenses_has_zero_row(client, moods):
+    stats = _mood_stats(client, moods)
+    assert set(stats) == {"happy", "sad", "tired"}
+    for mood in ("sad", "tired"):
+        assert stats[mood] == {
+            "mood": mood, "day_count": 1, "transaction_count": 0,
+            "total_expense": "0.00", "average_expense": "0.00", "top_categories": []
+        }
+
+
+def test_mood_sums_and_averages(client, moods):
+    stats = _mood_stats(client, moods)
+    
+    # 3/1: 10.00 + 2.50, 3/2: 5.00 + 1.25 (일기 두 개) -> 2일, 4건, 18.75, 하루 평균 9.375 -> 9.38
+    happy = stats["happy"]
+    assert (happy["day_count"], happy["transaction_count"]) == (2, 4)
+    assert (happy["total_expense"], happy["average_expense"]) == ("18.75", "9.38")
+    assert happy["top_categories"] == [
+        {"category": "식비", "total_amount": "15.00"},
+        {"category": "교통", "total_amount": "2.50"},
+        {"category": "카페", "total_amount": "1.25"},
+    ]
+    
+    # 기분별 정렬은 기록한 날 수 순
+    response = client.get(
+        "/api/stats/mood", params={"start_date": "2026-03-01", "end_date": "2026-03-31"}, headers=moods
+    )
+    assert response.json()[0]["mood"] == "happy"
+    
+    assert [row["category"] for row in _mood_stats(client, moods, top_categories=1)["happy"]["top_categories"]] == [
+        "식비"
+    ]
+
+
+@pytest.fixture
+def ledger(client, signup):
+    """2026년 1~3월 중 일부 날짜의 무작위 수입 / 지출 -> (헤더, 날짜별 순수익)"""
+    headers = signup()
+    rng = random.Random(35)
+    transactions = []
+    for offset in sorted(rng.sample(range(90), 40)):
+        day = date(2026, 1, 1) + timedelta(days=offset)
+        for _ in range(rng.randint(1, 3)):
+            kind = "income" if rng.random() < 0.3 else "expense"
+            transactions.append({
+                "date": day.isoformat(), "type": kind, "category": kind, "amount": f"{rng.randint(1, 50000) / 100:.2f}"
+            })
+    response = client.post(
+        "/api/entries/with-transactions",
+        json={"entry": {"date": "2026-01-01"}, "transactions": transactions},
+        headers=headers
+    )
+    assert response.status_code == 201, response.text
+    
+    net: dict[str, Decimal] = {}
+    for transaction in transactions:
+        amount = Decimal(transaction["amount"])
+        net[transaction["date"]] = net.get(transaction["date"], Decimal(0)) + (
+            amount if transaction["type"] == "income" else -amount
+        )
+    return headers, dict(sorted(net.items()))
+
+
+def _balance(client, headers, **params) -> dict:
+    response = client.get("/api/stats/balance", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    body = response.json()
+    body["points"] = {point["date"]: Decimal(point["balance"]) for point in body["points"]}
+    return body
+
+
+def test_running_balance_matches_cumsum(client, ledger):
+    headers, net = ledger
+    expected = dict(zip(net, list(accumulate(net.values(), initial=Decimal("50")))[1:]))
+    
+    body = _balance(client, headers, opening_balance="50", max_points=1000)
+    assert body["points"] == expected
+    assert (body["total_points"], body["downsampled"]) == (len(net), False)
+    
+    # 기간 이전 거래는 시작 잔액에 합산, 기간 이후 거래는 제외
+    body = _balance(client, headers, start_date="2026-02-01", end_date="2026-02-28", opening_balance="50")
+    assert body["points"] == {day: balance for day, balance in expected.items() if "2026-02-01" <= day <= "2026-02-28"}
+
+
+@pytest.mark.parametrize("max_points", [2, 3, 7, 39, 40, 100])
+def test_downsampling_keeps_first_and_last_points(client, ledger, max_points):
+    headers, net = ledger
+    expected = dict(zip(net, accumulate(net.values())))
+    
+    body = _balance(client, headers, max_points=max_points)
+    days = list(body["points"])
+    assert len(days) == min(max_points, len(net))
+    assert body["downsampled"] is (max_points < len(net))
+    assert days[0] == next(iter(net)) and days[-1] == list(net)[-1]
+    assert days == sorted(days)
+    # 남긴 점은 원래 누적 잔액 그대로
+    assert all(body["points"][day] == expected[day] for day in days)
+
+
+def test_single_day_balance(client, signup):
+    headers = signup()
+    response = client.post("/api/transactions", json={
+        "date": "2026-01-05", "type": "income", "category": "월급", "amount": "10"
+    }, headers=headers)
+    assert response.status_code == 201, response.text
+    
+    body = _balance(client, headers, max_points=2)
+    assert body["points"] == {"2026-01-05": Decimal("10.00")}
+    assert body["downsampled"] is False
+
+
+DAILY = "/api/stats/daily?start_date=2026-05-01&end_date=2026-05-31"
+
+
+def _aggregations(client, url: str, headers) -> tuple:
+    """응답과 요청이 실행한 집계(GROUP BY) SQL 수"""
+    with collect_queries() as collector:
+        response = client.get(url, headers=headers)
+    return response, sum(n for sql, n in collector.requests[0].statements.items() if "GROUP BY" in sql)
+
+
+def test_repeat_request_gets_304(client, signup):
+    headers = signup()
+    _transaction(client, headers, "2026-05-03", "식비", "12.00")
+    
+    first, queries = _aggregations(client, DAILY, headers)
+    assert first.status_code == 200 and queries == 1
+    etag = first.headers["ETag"]
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    
+    # 같은 데이터 버전이면 집계 없이 304, If-None-Match 가 없으면 캐시된 본문
+    response, queries = _aggregations(client, DAILY, {**headers, "If-None-Match": etag})
+    assert (response.status_code, response.content, queries) == (304, b"", 0)
+    assert response.headers["ETag"] == etag
+    assert client.get(DAILY, headers={**headers, "If-None-Match": f'"other", W/{etag}'}).status_code == 304
+    response, queries = _aggregations(client, DAILY, headers)
+    assert (response.status_code, response.json(), queries) == (200, first.json(), 0)
+    
+    # 파라미터나 사용자가 다르면 다른 ETag
+    other = client.get("/api/stats/daily?start_date=2026-05-02&end_date=2026-05-31", headers=headers)
+    assert other.headers["ETag"] != etag
+    assert client.get(DAILY, headers={**signup(), "If-None-Match": etag}).status_code == 200
+
+
+@pytest.mark.parametrize("write", ["create", "update", "delete"])
+def test_transaction_write_changes_etag(client, signup, write):
+    headers = signup()
+    _transaction(client, headers, "2026-05-03", "식비", "12.00")
+    transaction_id = client.get("/api/transactions", headers=headers).json()[0]["id"]
+    first = client.get(DAILY, headers=headers)
+    etag = first.headers["ETag"]
+    assert [day["total_expense"] for day in first.json()] == ["12.00"]
+    
+    if write == "create":
+        _transaction(client, headers, "2026-05-03", "카페", "3.00")
+        expected = ["15.00"]
+    elif write == "update":
+        response = client.put(f"/api/transactions/{transaction_id}", json={"amount": "20"}, headers=headers)
+        assert response.status_code == 200, response.text
+        expected = ["20.00"]
+    else:
+        assert client.delete(f"/api/transactions/{transaction_id}", headers=headers).status_code == 204
+        expected = []
+    
+    response = client.get(DAILY, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert [day["total_expense"] for day in response.json()] == expected
+    assert client.get(DAILY, headers={**headers, "If-None-Match": response.headers["ETag"]}).status_code == 304
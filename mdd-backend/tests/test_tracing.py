@@ -0,0 +1,88 @@
+"""요청 추적 (샘플링된 요청만 span 기록, 샘플링되지 않은 요청은 아무것도 남기지 않음)"""
+import pytest
+from app.utils import tracing
+from app.utils.tracing import Trace
+
+
+@pytest.fixture
+def traces(database):
+    """추적 버퍼를 비우고, 끝나면 샘플링을 끔"""
+    tracing._buffer.clear()
+    yield tracing._buffer
+    tracing.set_sample_rate(0)
+    tracing._buffer.clear()
+
+
+def test_unsampled_request_records_nothing(client, signup, traces, monkeypatch):
+    headers = signup()
+    tracing.set_sample_rate(0)
+    
+    spans = []
+    monkeypatch.setattr(Trace, "add_span", lambda self, *args: spans.append(args))
+    response = client.get("/api/entries", headers=headers)
+    
+    assert response.status_code == 200
+    assert "x-trace-id" not in response.headers
+    assert len(traces) == 0 and spans == []
+    assert tracing.span("anything") is tracing._NOOP
+
+
+def test_sampled_request_records_layered_spans(client, signup, traces):
+    headers = signup()
+    tracing.set_sample_rate(1)
+    response = client.get("/api/entries", headers=headers)
+    
+    assert response.status_code == 200
+    trace = tracing.get_trace(response.headers["x-trace-id"])
+    assert trace["method"] == "GET" and trace["path"] == "/api/entries" and trace["status"] == 200
+    
+    spans = {span["id"]: span for span in trace["spans"]}
+    names = [span["name"] for span in trace["spans"]]
+    for name in ("request", "auth.jwt_decode", "auth.user_lookup", "endpoint", "serialize", "db.query"):
+        assert name in names, names
+    assert "EntryService.get_entries" in names, names
+    
+    # 서비스 안에서 실행된 SQL 은 서비스 span 아래, 모든 span 은 request span 아래
+    def ancestors(span):
+        while span["parent_id"] is not None:
+            span = spans[span["parent_id"]]
+            yield span["name"]
+    
+    service_queries = [
+        span for span in trace["spans"]
+        if span["name"] == "db.query" and "EntryService.get_entries" in ancestors(span)
+    ]
+    assert service_queries and all("statement" in span["attributes"] for span in service_queries)
+    assert all(list(ancestors(span))[-1:] == ["request"] for span in trace["spans"] if span["name"] != "request")
+    
+    assert tracing.get_traces()[0]["trace_id"] == trace["trace_id"]
+    
+    # 수용 제어 그룹 경로는 대기 시간도 span 으로 남음
+    response = client.get("/api/stats/daily", headers=headers)
+    assert "admission" in [span["name"] for span in tracing.get_trace(response.headers["x-trace-id"])["spans"]]
+
+
+def test_traceparent_continues_incoming_trace(client, traces):
+    tracing.set_sample_rate(1)
+    trace_id = "4bf92f3577b34da6a3ce929d0e0e4736"
+    response = client.get("/health", headers={"traceparent": f"00-{trace_id}-00f067aa0ba902b7-01"})
+    assert response.headers["x-trace-id"] == trace_id
+
+
+def test_forced_trace_requires_admin_token(client, traces, admin_headers):
+    tracing.set_sample_rate(0)
+    
+    assert "x-trace-id" not in client.get("/health", headers={"X-Trace": "1"}).headers
+    response = client.get("/health", headers={"X-Trace": "1", **admin_headers})
+    assert response.headers["x-trace-id"]
+    assert len(traces) == 1
+
+
+def test_admin_sample_rate(client, traces, admin_headers):
+    assert client.put("/api/admin/tracing", json={"sample_rate": 1}, headers=admin_headers).status_code == 200
+    client.get("/health")
+    assert client.get("/api/admin/tracing", headers=admin_headers).json() == {"sample_rate": 1.0}
+    
+    listed = client.get("/api/admin/traces", headers=admin_headers).json()
+    assert [trace["path"] for trace in listed][-1] == "/health"
+    assert client.get("/api/admin/traces/unknown", headers=admin_headers).status_code == 404
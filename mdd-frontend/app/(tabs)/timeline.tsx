@@ -39,9 +39,9 @@ export default function TimelineScreen() {
 
       {item.title && <Text style={styles.cardTitle}>{item.title}</Text>}
 
-      {item.content && (
+      {item.preview && (
         <Text style={styles.cardContent} numberOfLines={3}>
-          {item.content}
+          {item.preview}
         </Text>
       )}
 
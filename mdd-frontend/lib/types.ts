@@ -31,6 +31,7 @@ export interface Entry {
   date: string;
   title?: string;
   content?: string;
+  preview?: string;
   mood?: string;
   photos: string[];
   tags: string[];